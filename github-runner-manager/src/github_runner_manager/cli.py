@@ -4,33 +4,51 @@
 """The CLI entrypoint for github-runner-manager application."""
 
 import importlib.metadata
+import json
 import logging
+import math
+import re
 import signal
 import sys
+from datetime import datetime, timedelta, timezone
 from functools import partial
 from io import StringIO
-from threading import Lock
+from pathlib import Path
 from types import FrameType
-from typing import TextIO
+from typing import Sequence, TextIO
 
 import click
 
 from github_runner_manager.configuration import ApplicationConfiguration
-from github_runner_manager.http_server import FlaskArgs, start_http_server
-from github_runner_manager.manager.pressure_reconciler import (
-    PressureReconciler,
-    build_pressure_reconciler,
-    build_runner_manager,
+from github_runner_manager.http_server import (
+    FlaskArgs,
+    HttpServer,
+    ManagedRunners,
+    start_http_server,
 )
+from github_runner_manager.manager.pressure_reconciler import PressureReconciler
+from github_runner_manager.manager.reconciler_factory import build_pressure_reconcilers
+from github_runner_manager.metrics import events as metric_events
+from github_runner_manager.metrics.analytics import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_PERCENTILES,
+    TimeWindow,
+    analyze_metrics_log,
+)
+from github_runner_manager.operations import OperationWorker
 from github_runner_manager.thread_manager import ThreadManager
 
 version = importlib.metadata.version("github-runner-manager")
 
+_RELATIVE_TIME_PATTERN = re.compile(r"^(\d+(?:\.\d+)?)([smhdw])$")
+_RELATIVE_TIME_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
 
 def handle_shutdown(
     signum: int,
     _frame: FrameType | None,
-    pressure_reconciler: PressureReconciler,
+    pressure_reconcilers: Sequence[PressureReconciler],
+    operations: OperationWorker,
     thread_manager: ThreadManager,
 ) -> None:  # pragma: no cover
     """Stop reconciler threads on shutdown signals.
@@ -41,20 +59,24 @@ def handle_shutdown(
     Args:
         signum: Received POSIX signal number.
         _frame: Current stack frame when the signal was received.
-        pressure_reconciler: The reconciler instance to stop.
+        pressure_reconcilers: The reconcilers to stop, one per runner combination.
+        operations: The operation worker to stop.
         thread_manager: The thread manager whose threads to join before exiting.
 
     Raises:
         SystemExit: Always raised after graceful shutdown to terminate the process.
     """
-    logging.info("Received signal %s; stopping pressure reconciler", signum)
-    pressure_reconciler.stop()
+    logging.info("Received signal %s; stopping pressure reconcilers", signum)
+    for pressure_reconciler in pressure_reconcilers:
+        pressure_reconciler.stop()
+    operations.stop()
     for thread in thread_manager.threads:
         thread.join(timeout=60)
+    metric_events.stop_event_writer(timeout=60)
     raise SystemExit(0)
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option(
     "--config-file",
     type=click.File(mode="r", encoding="utf-8"),
@@ -94,57 +116,247 @@ def handle_shutdown(
     default="INFO",
     help="The log level for the application.",
 )
+@click.option(
+    "--http-server",
+    type=click.Choice([server.value for server in HttpServer]),
+    default=HttpServer.WAITRESS.value,
+    show_default=True,
+    help="The server for the HTTP API: the waitress WSGI server, or the Flask development server.",
+)
+@click.option(
+    "--http-threads",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Number of worker threads of the waitress HTTP server.",
+)
+@click.option(
+    "--http-connection-limit",
+    type=click.IntRange(min=1),
+    default=100,
+    show_default=True,
+    help="Maximum number of concurrent connections of the waitress HTTP server.",
+)
+@click.option(
+    "--http-channel-timeout",
+    type=click.IntRange(min=1),
+    default=120,
+    show_default=True,
+    help="Seconds an HTTP connection of the waitress server can be inactive before it is closed. "
+    "The processing of a request is not limited.",
+)
+@click.option(
+    "--access-log-sample",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Log one in this many HTTP requests. 0 only logs server errors.",
+)
+@click.option(
+    "--metrics-flush-interval",
+    type=click.FloatRange(min=0),
+    default=1.0,
+    show_default=True,
+    help="Maximum seconds a metric event is buffered in memory before written to the log.",
+)
+@click.option(
+    "--metrics-fsync",
+    type=click.Choice([policy.value for policy in metric_events.FsyncPolicy]),
+    default=metric_events.FsyncPolicy.NEVER.value,
+    show_default=True,
+    help="When to fsync the metrics log: never, or after every batch of events written.",
+)
+@click.pass_context
 # The entry point for the CLI will be tested with integration test.
-def main(
+def main(  # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+    ctx: click.Context,
     config_file: TextIO,
     host: str,
     port: int,
     debug: bool,
     log_level: str,
+    http_server: str,
+    http_threads: int,
+    http_connection_limit: int,
+    http_channel_timeout: int,
+    access_log_sample: int,
+    metrics_flush_interval: float,
+    metrics_fsync: str,
 ) -> None:  # pragma: no cover
-    """Start the reconcile service.
+    """Start the reconcile service, unless a subcommand is invoked.
 
     Args:
+        ctx: The click context.
         config_file: The configuration file.
         host: The hostname to listen on for the HTTP server
         port: The port to listen on the HTTP server.
         debug: Whether to start the application in debug mode.
         log_level: The log level.
+        http_server: The server for the HTTP API.
+        http_threads: Number of worker threads of the waitress HTTP server.
+        http_connection_limit: Maximum number of concurrent connections of the waitress server.
+        http_channel_timeout: Seconds an HTTP connection of the waitress server can be inactive.
+        access_log_sample: Log one in this many HTTP requests.
+        metrics_flush_interval: Maximum seconds a metric event is buffered before written.
+        metrics_fsync: The fsync policy for the metrics log.
 
     Raises:
-        ClickException: If no runner combinations are configured.
+        ClickException: If the runner combinations are missing or invalid.
     """
     logging.basicConfig(
         level=log_level,
         stream=sys.stderr,
         format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
     )
+    if ctx.invoked_subcommand is not None:
+        return
     logging.info("Starting GitHub runner manager service version: %s", version)
     config = ApplicationConfiguration.from_yaml_file(StringIO(config_file.read()))
-    lock = Lock()
 
-    combinations = config.runner_configuration.combinations
-    if not combinations:
+    if not config.runner_configuration.combinations:
         raise click.ClickException("No runner combinations configured.")
-    runner_manager = build_runner_manager(config, combinations[0])
-    pressure_reconciler = build_pressure_reconciler(config, runner_manager, lock)
+    try:
+        pressure_reconcilers = build_pressure_reconcilers(config)
+    except ValueError as exc:
+        raise click.ClickException(str(exc)) from exc
+    managed_runners = [
+        ManagedRunners(runner_manager=reconciler.runner_manager, lock=reconciler.lock)
+        for reconciler in pressure_reconcilers
+    ]
+
+    operations = OperationWorker()
 
     thread_manager = ThreadManager()
-    http_server_args = FlaskArgs(host=host, port=port, debug=debug)
+    http_server_args = FlaskArgs(
+        host=host,
+        port=port,
+        debug=debug,
+        server=HttpServer(http_server),
+        threads=http_threads,
+        connection_limit=http_connection_limit,
+        channel_timeout=http_channel_timeout,
+        access_log_sample=access_log_sample,
+    )
     thread_manager.add_thread(
-        target=partial(start_http_server, runner_manager, lock, http_server_args),
+        target=partial(start_http_server, managed_runners, operations, http_server_args),
         daemon=True,
     )
+    thread_manager.add_thread(target=operations.run, daemon=True)
 
     shutdown = partial(
         handle_shutdown,
-        pressure_reconciler=pressure_reconciler,
+        pressure_reconcilers=pressure_reconcilers,
+        operations=operations,
         thread_manager=thread_manager,
     )
     signal.signal(signal.SIGTERM, shutdown)
     signal.signal(signal.SIGINT, shutdown)
-    thread_manager.add_thread(target=pressure_reconciler.start_create_loop, daemon=True)
-    thread_manager.add_thread(target=pressure_reconciler.start_reconcile_loop, daemon=True)
+    for reconciler in pressure_reconcilers:
+        thread_manager.add_thread(target=reconciler.start_create_loop, daemon=True)
+        thread_manager.add_thread(target=reconciler.start_reconcile_loop, daemon=True)
+        thread_manager.add_thread(target=reconciler.start_reclaim_loop, daemon=True)
+        thread_manager.add_thread(target=reconciler.start_boot_watchdog_loop, daemon=True)
 
+    metric_events.start_event_writer(
+        flush_interval=metrics_flush_interval,
+        fsync_policy=metric_events.FsyncPolicy(metrics_fsync),
+    )
     thread_manager.start()
-    thread_manager.raise_on_error()
+    try:
+        thread_manager.raise_on_error()
+    finally:
+        metric_events.stop_event_writer(timeout=60)
+
+
+def _parse_time_option(
+    _ctx: click.Context, param: click.Parameter, value: str | None
+) -> float | None:
+    """Parse a time option into a UNIX timestamp.
+
+    Args:
+        _ctx: The click context.
+        param: The option being parsed.
+        value: An ISO 8601 timestamp, or a duration before now such as 7d, 12h or 30m.
+
+    Raises:
+        BadParameter: If the value is neither an ISO 8601 timestamp nor a duration.
+
+    Returns:
+        The UNIX timestamp, or None if the option is not set.
+    """
+    if value is None:
+        return None
+    if match := _RELATIVE_TIME_PATTERN.match(value):
+        delta = timedelta(**{_RELATIVE_TIME_UNITS[match.group(2)]: float(match.group(1))})
+        return (datetime.now(timezone.utc) - delta).timestamp()
+    try:
+        timestamp = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise click.BadParameter(
+            "expected an ISO 8601 timestamp or a duration such as 7d, 12h or 30m", param=param
+        ) from exc
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
+@main.command("analyze-metrics")
+@click.option(
+    "--log-path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="The metrics log to analyze. Defaults to the metrics log of the service.",
+)
+@click.option(
+    "--since",
+    callback=_parse_time_option,
+    help="Start of the time window, as an ISO 8601 timestamp or a duration before now, e.g. 7d.",
+)
+@click.option(
+    "--until",
+    callback=_parse_time_option,
+    help="End of the time window, as an ISO 8601 timestamp or a duration before now, e.g. 1h.",
+)
+@click.option(
+    "--percentile",
+    "percentiles",
+    type=click.FloatRange(min=0, max=100),
+    multiple=True,
+    default=DEFAULT_PERCENTILES,
+    show_default=True,
+    help="Percentile to report. Can be repeated.",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CHUNK_SIZE,
+    show_default=True,
+    help="Number of bytes of the log read and parsed at a time.",
+)
+def analyze_metrics(
+    log_path: Path | None,
+    since: float | None,
+    until: float | None,
+    percentiles: tuple[float, ...],
+    chunk_size: int,
+) -> None:
+    """Report percentiles and histograms of the metric events in the metrics log.
+
+    Durations of runner installation, queueing, idling, jobs and reconciliation are aggregated
+    over the time window, overall and per flavor and repository. The report is printed as JSON.
+
+    Args:
+        log_path: The metrics log to analyze.
+        since: Start of the time window as a UNIX timestamp.
+        until: End of the time window as a UNIX timestamp.
+        percentiles: The percentiles to report.
+        chunk_size: Number of bytes of the log read and parsed at a time.
+    """
+    window = TimeWindow(
+        start=since if since is not None else 0.0, end=until if until is not None else math.inf
+    )
+    report = analyze_metrics_log(
+        path=log_path or metric_events.get_metrics_log_path(),
+        window=window,
+        chunk_size=chunk_size,
+    )
+    click.echo(json.dumps(report.as_dict(percentiles=percentiles), indent=2))
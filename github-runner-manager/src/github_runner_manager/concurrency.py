@@ -0,0 +1,245 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Adaptive limits of the concurrent calls to the backends.
+
+The fan-out of calls to a backend, e.g. creating VMs or deleting GitHub runners, is bounded by an
+additive-increase/multiplicative-decrease (AIMD) limit. Each call completing within the latency
+target of the backend increases the limit by one per limit's worth of calls, and a failed or
+slow call halves it. A busy backend is thus given fewer concurrent calls, and a quiet one more.
+
+The limiters are shared by all the call sites and runner managers of the process, so the limit
+bounds the total load put on a backend.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from threading import Condition
+from typing import Callable, Iterator, TypeVar
+
+from github_runner_manager.metrics.reconcile import CONCURRENCY_IN_FLIGHT, CONCURRENCY_LIMIT
+
+logger = logging.getLogger(__name__)
+
+ReturnT = TypeVar("ReturnT")
+
+
+class Backend(str, Enum):
+    """Backend called concurrently.
+
+    Attributes:
+        NOVA: The OpenStack compute service, creating and deleting VMs.
+        NEUTRON: The OpenStack network service, ensuring the security group of new VMs.
+        GITHUB: The GitHub API, registering and deleting runners.
+        SSH: The SSH connections to the VMs, pulling metrics.
+    """
+
+    NOVA = "nova"
+    NEUTRON = "neutron"
+    GITHUB = "github"
+    SSH = "ssh"
+
+
+@dataclass(frozen=True)
+class LimiterConfig:
+    """Configuration of an adaptive limiter.
+
+    Attributes:
+        initial: The limit before any call completed.
+        minimum: The lowest limit.
+        maximum: The highest limit.
+        latency_target: Seconds a call can take before the limit is decreased.
+        decrease_factor: Factor the limit is multiplied by on a failed or slow call.
+    """
+
+    initial: int
+    minimum: int
+    maximum: int
+    latency_target: float
+    decrease_factor: float = 0.5
+
+
+class AdaptiveLimiter:
+    """AIMD limit of the concurrent calls to a backend.
+
+    Calls started before the last decrease do not decrease the limit again, so a burst of
+    failures of the calls in flight halves the limit once instead of collapsing it.
+
+    Attributes:
+        backend: The backend the calls are made to.
+        config: The configuration of the limiter.
+        limit: The current number of calls allowed concurrently.
+        in_flight: The number of calls in flight.
+    """
+
+    def __init__(self, backend: Backend, config: LimiterConfig):
+        """Construct the object.
+
+        Args:
+            backend: The backend the calls are made to.
+            config: The configuration of the limiter.
+        """
+        self.backend = backend
+        self.config = config
+        self._condition = Condition()
+        self._limit = float(config.initial)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        CONCURRENCY_LIMIT.labels(backend.value).set(self.limit)
+        CONCURRENCY_IN_FLIGHT.labels(backend.value).set_function(lambda: self._in_flight)
+
+    @property
+    def limit(self) -> int:
+        """The current number of calls allowed concurrently."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of calls in flight."""
+        return self._in_flight
+
+    def workers(self, num: int) -> int:
+        """Get the number of workers for a batch of calls.
+
+        The workers are sized for the highest limit, as the slots bound the calls in flight.
+
+        Args:
+            num: The number of calls in the batch.
+
+        Returns:
+            The number of workers.
+        """
+        return max(min(num, self.config.maximum), 1)
+
+    def _acquire(self) -> float:
+        """Wait for a slot for a call.
+
+        Returns:
+            The monotonic time the slot was acquired.
+        """
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+            return time.monotonic()
+
+    def _release(self, started_at: float, error: bool, latency: float | None = None) -> None:
+        """Free the slot of a completed call and adapt the limit to its outcome.
+
+        Args:
+            started_at: The monotonic time the call started.
+            error: Whether the call failed.
+            latency: Seconds the call took, or None if it does not reflect the load, e.g. a call
+                waiting for a deletion to complete.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            slow = latency is not None and latency > self.config.latency_target
+            if error or slow:
+                if started_at >= self._last_decrease:
+                    self._decrease(error=error, latency=latency)
+            else:
+                self._limit = min(self._limit + 1 / self._limit, float(self.config.maximum))
+            CONCURRENCY_LIMIT.labels(self.backend.value).set(self.limit)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(
+        self,
+        *,
+        ignored_errors: tuple[type[Exception], ...] = (),
+        record_latency: bool = True,
+    ) -> Iterator[None]:
+        """Make a call within a slot.
+
+        Args:
+            ignored_errors: Errors not caused by the load of the backend, e.g. deleting a busy
+                runner. They do not decrease the limit.
+            record_latency: Whether the latency of the call reflects the load of the backend.
+
+        Raises:
+            Exception: The error of the call, after the slot is freed.
+        """
+        started_at = self._acquire()
+        error = False
+        try:
+            yield
+        except Exception as exc:
+            error = not isinstance(exc, ignored_errors)
+            raise
+        finally:
+            latency = time.monotonic() - started_at if record_latency else None
+            self._release(started_at, error=error, latency=latency)
+
+    def call(
+        self,
+        func: Callable[[], ReturnT],
+        *,
+        ignored_errors: tuple[type[Exception], ...] = (),
+        record_latency: bool = True,
+    ) -> ReturnT:
+        """Call a function within a slot, e.g. as the task of a thread pool.
+
+        Args:
+            func: The function to call.
+            ignored_errors: Errors not caused by the load of the backend.
+            record_latency: Whether the latency of the call reflects the load of the backend.
+
+        Returns:
+            The return value of the function.
+        """
+        with self.slot(ignored_errors=ignored_errors, record_latency=record_latency):
+            return func()
+
+    def _decrease(self, error: bool, latency: float | None) -> None:
+        """Decrease the limit multiplicatively, with the condition held.
+
+        Args:
+            error: Whether the call failed.
+            latency: Seconds the call took, if recorded.
+        """
+        previous = self.limit
+        self._limit = max(self._limit * self.config.decrease_factor, float(self.config.minimum))
+        self._last_decrease = time.monotonic()
+        logger.info(
+            "Decreased concurrency limit of %s from %s to %s after a %s call (%s seconds)",
+            self.backend.value,
+            previous,
+            self.limit,
+            "failed" if error else "slow",
+            "n/a" if latency is None else f"{latency:.1f}",
+        )
+
+
+# The limits start at the former fixed worker pool size, so they are only lowered on failed
+# or slow calls.
+INITIAL_LIMIT = 30
+
+DEFAULT_LIMITER_CONFIGS = {
+    Backend.NOVA: LimiterConfig(initial=INITIAL_LIMIT, minimum=1, maximum=50, latency_target=30),
+    Backend.NEUTRON: LimiterConfig(
+        initial=INITIAL_LIMIT, minimum=1, maximum=50, latency_target=30
+    ),
+    Backend.GITHUB: LimiterConfig(initial=INITIAL_LIMIT, minimum=1, maximum=50, latency_target=10),
+    Backend.SSH: LimiterConfig(initial=INITIAL_LIMIT, minimum=1, maximum=50, latency_target=60),
+}
+
+_limiters = {
+    backend: AdaptiveLimiter(backend, config)
+    for backend, config in DEFAULT_LIMITER_CONFIGS.items()
+}
+
+
+def get_limiter(backend: Backend) -> AdaptiveLimiter:
+    """Get the limiter shared by the calls to a backend.
+
+    Args:
+        backend: The backend.
+
+    Returns:
+        The limiter of the backend.
+    """
+    return _limiters[backend]
@@ -5,11 +5,13 @@
 
 from github_runner_manager.configuration.base import (  # noqa: F401
     ApplicationConfiguration,
+    BootProfile,
     Flavor,
     Image,
     ProxyConfig,
     RunnerCombination,
     RunnerConfiguration,
+    ScaleDownPolicy,
     SSHDebugConnection,
     SupportServiceConfig,
     UserInfo,
@@ -5,6 +5,7 @@
 
 import logging
 from dataclasses import dataclass
+from enum import Enum
 from typing import Optional, TextIO
 
 import yaml
@@ -15,6 +16,9 @@ from github_runner_manager.openstack_cloud.configuration import OpenStackConfigu
 
 logger = logging.getLogger(__name__)
 
+# Image tag marking an image baked with the boot steps done, selecting the fast boot profile.
+FAST_BOOT_IMAGE_LABEL = "fast-boot"
+
 
 # The github-runner-manager is being refactor from a library to an application.
 # Once the charm no longer rely on the github-runner-manager as a library this will be removed.
@@ -34,6 +38,22 @@ class UserInfo:
     group: str
 
 
+class ScaleDownPolicy(str, Enum):
+    """Order of the idle runners to scale down.
+
+    The runners not deletable are ordered by the VM creation time, as the runners are single use.
+
+    Attributes:
+        BOOT_PROGRESS: Scale down the runners least far along in their boot first: the VMs still
+            building, then the runners not online yet, then the online runners, the most recent
+            VM first within each. Throws away the least boot work.
+        IDLE_LONGEST: Scale down the runners idle the longest first, the oldest VM first.
+    """
+
+    BOOT_PROGRESS = "boot-progress"
+    IDLE_LONGEST = "idle-longest"
+
+
 class ApplicationConfiguration(BaseModel):
     """Main entry point for the Application Configuration.
 
@@ -52,6 +72,19 @@ class ApplicationConfiguration(BaseModel):
         planner_url: Base URL of the planner service.
         planner_token: Bearer token to authenticate against the planner service.
         reconcile_interval: Minutes to wait between reconciliation.
+        pressure_forecast_horizon: Seconds ahead the planner pressure is forecast to create
+            runners ahead of predicted ramps. 0 disables the forecast.
+        pressure_debounce_window: Seconds to wait for further planner pressure updates before
+            acting on the latest one.
+        reclaim_interval: Seconds between the reclamations of the VMs powered off after the run
+            of their runner. 0 leaves them to the reconciliation.
+        scale_down_min_idle_age: Seconds the VM of an idle runner must be older than to be
+            scaled down. 0 disables the minimum age.
+        scale_down_cooldown: Seconds after a scale up without scaling down. 0 disables the
+            cooldown.
+        scale_down_window: Seconds of planner pressure the scale down is stabilized over. 0
+            disables the stabilization.
+        scale_down_policy: Order of the idle runners to scale down.
     """
 
     allow_external_contributor: bool = False
@@ -64,6 +97,13 @@ class ApplicationConfiguration(BaseModel):
     planner_url: Optional[AnyHttpUrl] = None
     planner_token: Optional[str] = None
     reconcile_interval: int = Field(ge=1)
+    pressure_forecast_horizon: int = Field(0, ge=0)
+    pressure_debounce_window: float = Field(0, ge=0)
+    reclaim_interval: float = Field(60, ge=0)
+    scale_down_min_idle_age: float = Field(0, ge=0)
+    scale_down_cooldown: float = Field(0, ge=0)
+    scale_down_window: float = Field(0, ge=0)
+    scale_down_policy: ScaleDownPolicy = ScaleDownPolicy.BOOT_PROGRESS
 
     @staticmethod
     def from_yaml_file(file: TextIO) -> "ApplicationConfiguration":
@@ -258,16 +298,52 @@ class RunnerCombination(BaseModel):
         return values
 
 
+class BootProfile(str, Enum):
+    """Profile of the boot steps run by the userdata of the runner VMs.
+
+    Attributes:
+        STANDARD: Run all the boot steps before starting the runner.
+        FAST: For pre-baked images. Skip waiting for snap refreshes, reload docker instead of
+            restarting it for the DockerHub mirror, and refresh the apt package lists in the
+            background after the runner has started.
+    """
+
+    STANDARD = "standard"
+    FAST = "fast"
+
+
 class Image(BaseModel):
     """Information for an image with its associated labels.
 
     Attributes:
         name: Image name or id.
         labels: List of labels associated to the image.
+        boot_profile: The boot profile of the VMs of the image. Defaults to the fast profile if
+            the image is labelled with FAST_BOOT_IMAGE_LABEL, and the standard one otherwise.
     """
 
     name: str
     labels: list[str]
+    boot_profile: BootProfile = BootProfile.STANDARD
+
+    @root_validator(pre=True)
+    @classmethod
+    def default_boot_profile(cls, values: dict) -> dict:
+        """Set the default boot profile of the image from its labels.
+
+        Args:
+            values: Values in the pydantic model.
+
+        Returns:
+            Values in the pydantic model.
+        """
+        if values.get("boot_profile") is None:
+            values["boot_profile"] = (
+                BootProfile.FAST
+                if FAST_BOOT_IMAGE_LABEL in values.get("labels", [])
+                else BootProfile.STANDARD
+            )
+        return values
 
 
 class Flavor(BaseModel):
@@ -14,6 +14,10 @@ class RunnerCreateError(RunnerError):
     """Error for runner creation failure."""
 
 
+class RunnerQuotaError(RunnerCreateError):
+    """Error for runner creation failure due to an exhausted cloud quota."""
+
+
 class MissingServerConfigError(RunnerError):
     """Error for unable to create runner due to missing server configurations."""
 
@@ -38,6 +42,10 @@ class OpenStackError(CloudError):
     """Base class for OpenStack errors."""
 
 
+class OpenStackQuotaError(OpenStackError):
+    """Represents an OpenStack request rejected as the quota of the project is exhausted."""
+
+
 class OpenStackInvalidConfigError(OpenStackError):
     """Represents an invalid OpenStack configuration."""
 
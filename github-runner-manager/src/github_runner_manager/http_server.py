@@ -3,22 +3,132 @@
 
 """The HTTP server for github-runner-manager."""
 
+import hashlib
+import itertools
 import json
+import logging
+import time
+from collections import Counter
 from dataclasses import dataclass
-from threading import Lock
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from functools import partial
+from typing import Any, Sequence
 
-from flask import Flask, request
+import waitress
+from flask import Flask, Response, g, request
 from prometheus_client import generate_latest
+from waitress.server import BaseWSGIServer, MultiSocketServer
+
+from github_runner_manager.errors import CloudError
+from github_runner_manager.locking import InstrumentedLock
+from github_runner_manager.manager.runner_manager import FlushMode, RunnerInfo, RunnerManager
+from github_runner_manager.manager.runner_snapshot import RunnerSnapshot
+from github_runner_manager.metrics.http import HTTP_REQUEST_DURATION_SECONDS
+from github_runner_manager.operations import OperationWorker
+from github_runner_manager.platform.platform_provider import PlatformRunnerState
+
+RUNNER_MANAGERS_CONFIG_NAME = "runner_managers"
+OPERATIONS_CONFIG_NAME = "operations"
+ACCESS_LOG_SAMPLE_CONFIG_NAME = "access_log_sample"
+# Values of the state filter of /runner/check. Runners without platform state are unknown.
+RUNNER_STATE_FILTERS = {
+    "busy": PlatformRunnerState.BUSY,
+    "idle": PlatformRunnerState.IDLE,
+    "offline": PlatformRunnerState.OFFLINE,
+    "unknown": None,
+}
+# Kind of the flush operations, also the call site of flushes in the lock metrics.
+FLUSH_OPERATION = "flush"
 
-from github_runner_manager.errors import CloudError, LockError
-from github_runner_manager.manager.runner_manager import FlushMode, RunnerManager
+app = Flask(__name__)
 
-RUNNER_MANAGER_CONFIG_NAME = "runner_manager"
+access_logger = logging.getLogger(f"{__name__}.access")
+# Counts requests for sampling the access log. Incrementing it is atomic under the GIL.
+_request_counter = itertools.count()
+
+
+@dataclass(frozen=True)
+class ManagedRunners:
+    """A runner manager, one per runner combination, and the lock guarding its runners.
+
+    Attributes:
+        runner_manager: The runner manager.
+        lock: The lock representing modification access to the runners of the manager.
+    """
+
+    runner_manager: RunnerManager
+    lock: InstrumentedLock
 
-app = Flask(__name__)
 
-# Pylint thinks this is a constant which needs to be upper case. This is a global variable.
-_lock = None  # pylint: disable=invalid-name
+class HttpServer(str, Enum):
+    """The server to serve the Flask app with.
+
+    Attributes:
+        DEVELOPMENT: The Flask development server.
+        WAITRESS: The waitress production WSGI server.
+    """
+
+    DEVELOPMENT = "development"
+    WAITRESS = "waitress"
+
+
+@app.before_request
+def _start_request_timer() -> None:
+    """Record the start time of the request."""
+    g.request_start = time.perf_counter()
+
+
+@app.after_request
+def _record_request(response: Response) -> Response:
+    """Observe the request latency and write the sampled access log.
+
+    Args:
+        response: The response to the request.
+
+    Returns:
+        The response unchanged.
+    """
+    _observe_request(response.status_code)
+    return response
+
+
+@app.teardown_request
+def _record_failed_request(error: BaseException | None) -> None:
+    """Observe and log a request failed with an unhandled exception.
+
+    The after request functions are skipped when the exception propagates out of the app.
+
+    Args:
+        error: The unhandled exception, if any.
+    """
+    if error is not None and not g.get("request_recorded", False):
+        _observe_request(500)
+
+
+def _observe_request(status_code: int) -> None:
+    """Observe the request latency and write the access log if sampled.
+
+    Args:
+        status_code: The status code of the response.
+    """
+    g.request_recorded = True
+    duration = time.perf_counter() - g.get("request_start", time.perf_counter())
+    endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+    HTTP_REQUEST_DURATION_SECONDS.labels(endpoint, request.method, status_code).observe(duration)
+    sample_interval = app.config.get(ACCESS_LOG_SAMPLE_CONFIG_NAME, 1)
+    # Server errors are always logged.
+    if status_code >= 500 or (
+        sample_interval > 0 and next(_request_counter) % sample_interval == 0
+    ):
+        access_logger.info(
+            "%s %s %s %s %.3fs",
+            request.remote_addr,
+            request.method,
+            request.full_path if request.query_string else request.path,
+            status_code,
+            duration,
+        )
 
 
 @app.route("/health", methods=["GET"])
@@ -32,75 +142,170 @@ def get_health() -> tuple[str, int]:
 
 
 @app.route("/runner/check", methods=["GET"])
-def check_runner() -> tuple[str, int]:
-    """Check the runners.
+def check_runner() -> tuple[str, int] | Response:
+    """Check the runners of all runner managers.
+
+    The runners are served from the snapshot kept up to date by the reconcile loop. The response
+    carries ETag and Last-Modified headers, and conditional requests are answered with 304.
+
+    HTTP path args:
+        max_age(float): Maximum age in seconds of the snapshot. Older snapshots are refreshed
+            with a live listing. 0 forces a live listing. Defaults to any age.
+        state(str): Only include runners in these states: busy, idle, offline or unknown. Can be
+            repeated or comma separated.
 
     Returns:
         Information on the runners in JSON format.
     """
-    runner_manager: RunnerManager = app.config[RUNNER_MANAGER_CONFIG_NAME]
+    managed_runners: Sequence[ManagedRunners] = app.config[RUNNER_MANAGERS_CONFIG_NAME]
     app.logger.info("Checking runners...")
+
+    max_age_str = request.args.get("max_age")
+    max_age = None
+    if max_age_str is not None:
+        try:
+            max_age = float(max_age_str)
+        except ValueError:
+            return (f"Invalid max_age: {max_age_str}", 400)
+        if max_age < 0:
+            return (f"Invalid max_age: {max_age_str}", 400)
+
+    state_names = {
+        name.strip().lower()
+        for value in request.args.getlist("state")
+        for name in value.split(",")
+        if name.strip()
+    }
+    if invalid_states := state_names - RUNNER_STATE_FILTERS.keys():
+        return (f"Invalid state: {', '.join(sorted(invalid_states))}", 400)
+
     try:
-        runner_info = runner_manager.get_runner_info()
+        snapshot = _get_runners_snapshot(managed_runners, max_age=max_age)
     except CloudError as err:
         app.logger.exception("Cloud error encountered while getting runner info")
         return (str(err), 500)
 
-    response = {
-        "online": runner_info.online,
-        "busy": runner_info.busy,
-        "offline": runner_info.offline,
-        "unknown": runner_info.unknown,
-        "runners": list(runner_info.runners),
-        "busy_runners": list(runner_info.busy_runners),
-    }
-    return (json.dumps(response), 200)
+    runner_list = snapshot.runners
+    if state_names:
+        states = {RUNNER_STATE_FILTERS[name] for name in state_names}
+        runner_list = tuple(runner for runner in runner_list if runner.platform_state in states)
+    runner_info = RunnerInfo.from_runners(runner_list)
+
+    body = json.dumps(
+        {
+            "online": runner_info.online,
+            "busy": runner_info.busy,
+            "offline": runner_info.offline,
+            "unknown": runner_info.unknown,
+            "runners": list(runner_info.runners),
+            "busy_runners": list(runner_info.busy_runners),
+        }
+    )
+    response = Response(body, status=200, mimetype="application/json")
+    response.set_etag(hashlib.sha256(body.encode("utf-8")).hexdigest())
+    response.last_modified = datetime.fromtimestamp(snapshot.taken_at, tz=timezone.utc)
+    response.age = timedelta(seconds=int(snapshot.age))
+    response.make_conditional(request)
+    return response
+
+
+def _get_runners_snapshot(
+    managed_runners: Sequence[ManagedRunners], max_age: float | None
+) -> RunnerSnapshot:
+    """Get the runners of all runner managers.
+
+    Args:
+        managed_runners: The runner managers.
+        max_age: Maximum age in seconds of the snapshot of each runner manager.
+
+    Returns:
+        The runners of all runner managers, as old as the oldest snapshot.
+    """
+    snapshots = [
+        managed.runner_manager.get_runners_snapshot(max_age=max_age) for managed in managed_runners
+    ]
+    if len(snapshots) == 1:
+        return snapshots[0]
+    return RunnerSnapshot(
+        runners=tuple(runner for snapshot in snapshots for runner in snapshot.runners),
+        taken_at=min((snapshot.taken_at for snapshot in snapshots), default=time.time()),
+    )
 
 
 @app.route("/runner/flush", methods=["POST"])
-def flush_runner() -> tuple[str, int]:
-    """Flush the runners.
+def flush_runner() -> tuple[str, int, dict[str, str]]:
+    """Queue a flush of the runners of all runner managers.
+
+    The flush runs in the background. Its progress and result are available at the
+    /operations/<id> path returned in the Location header.
 
     HTTP path args:
         flush-busy(bool): Whether to flush busy runners.
 
     Returns:
-        A empty response.
+        The queued operation in JSON format, with status code 202.
     """
-    runner_manager: RunnerManager = app.config[RUNNER_MANAGER_CONFIG_NAME]
+    managed_runners: Sequence[ManagedRunners] = app.config[RUNNER_MANAGERS_CONFIG_NAME]
+    operations: OperationWorker = app.config[OPERATIONS_CONFIG_NAME]
 
     flush_busy_str = request.args.get("flush-busy")
     flush_busy = False
     if flush_busy_str in ("True", "true"):
         flush_busy = True
 
-    lock = _get_lock()
-    with lock:
-        app.logger.info("Flushing runners...")
-        app.logger.info("Flushing busy: %s", flush_busy)
-        flush_mode = FlushMode.FLUSH_BUSY if flush_busy else FlushMode.FLUSH_IDLE
-        try:
-            runner_manager.flush_runners(flush_mode)
-        except CloudError as err:
-            app.logger.exception("Cloud error encountered while flushing runners")
-            return (str(err), 500)
-    return ("", 204)
+    app.logger.info("Queuing flush of runners, flush busy: %s", flush_busy)
+    flush_mode = FlushMode.FLUSH_BUSY if flush_busy else FlushMode.FLUSH_IDLE
+    operation = operations.submit(
+        kind=FLUSH_OPERATION,
+        params={"flush_busy": flush_busy},
+        func=partial(_flush_runners, managed_runners, flush_mode),
+    )
+    return (
+        json.dumps(operation.as_dict()),
+        202,
+        {"Location": f"/operations/{operation.id}", "Content-Type": "application/json"},
+    )
 
 
-def _get_lock() -> Lock:
-    """Get the lock representing modification access to the set of runners.
+def _flush_runners(
+    managed_runners: Sequence[ManagedRunners], flush_mode: FlushMode
+) -> dict[str, Any]:
+    """Flush the runners of all runner managers.
 
-    Raises:
-        LockError: The lock is missing.
+    The lock of each runner manager is held with priority while flushing its runners, so the
+    flush does not queue behind the next periodic reconcile.
+
+    Args:
+        managed_runners: The runner managers.
+        flush_mode: The runners to flush.
 
     Returns:
-        The lock.
+        The number of metric events issued by type.
     """
-    if _lock is not None:
-        lock_state = "locked" if _lock.locked() else "unlocked"
-        app.logger.info("Attempting to acquire the lock: %s", lock_state)
-        return _lock
-    raise LockError("Lock not configured")
+    app.logger.info("Flushing runners, mode: %s", flush_mode)
+    issued_events: Counter[str] = Counter()
+    for managed in managed_runners:
+        with managed.lock.hold(FLUSH_OPERATION, priority=True):
+            issued = managed.runner_manager.flush_runners(flush_mode)
+        issued_events.update({event_type.__name__: count for event_type, count in issued.items()})
+    return {"issued_metric_events": dict(issued_events)}
+
+
+@app.route("/operations/<operation_id>", methods=["GET"])
+def get_operation(operation_id: str) -> tuple[str, int, dict[str, str]]:
+    """Get the progress and result of an operation.
+
+    Args:
+        operation_id: The operation ID.
+
+    Returns:
+        The operation in JSON format, or 404 if the operation is unknown.
+    """
+    operations: OperationWorker = app.config[OPERATIONS_CONFIG_NAME]
+    operation = operations.get(operation_id)
+    if operation is None:
+        return (f"Unknown operation: {operation_id}", 404, {})
+    return (json.dumps(operation.as_dict()), 200, {"Content-Type": "application/json"})
 
 
 @app.route("/metrics", methods=["GET"])
@@ -114,37 +319,71 @@ def metrics() -> bytes:
 
 
 @dataclass
-class FlaskArgs:
+class FlaskArgs:  # pylint: disable=too-many-instance-attributes
     """Arguments for Flask HTTP server.
 
     Attributes:
         host: The hostname to listen on for the HTTP server.
         port: The port to listen on for the HTTP server.
         debug: Start the flask HTTP server in debug mode.
+        server: The server to serve the Flask app with.
+        threads: Number of worker threads of the waitress server.
+        connection_limit: Maximum number of concurrent connections of the waitress server.
+        channel_timeout: Seconds a connection of the waitress server can be inactive before it
+            is closed. It does not limit the processing of a request.
+        access_log_sample: Log one in this many requests. 0 disables the access log except for
+            server errors.
     """
 
     host: str
     port: int
     debug: bool
+    server: HttpServer = HttpServer.WAITRESS
+    threads: int = 8
+    connection_limit: int = 100
+    channel_timeout: int = 120
+    access_log_sample: int = 1
+
+
+def create_waitress_server(flask_args: FlaskArgs) -> BaseWSGIServer | MultiSocketServer:
+    """Create the waitress server serving the Flask app.
+
+    Args:
+        flask_args: The arguments for the HTTP server.
+
+    Returns:
+        The server, not yet running.
+    """
+    return waitress.create_server(
+        app,
+        host=flask_args.host,
+        port=flask_args.port,
+        threads=flask_args.threads,
+        connection_limit=flask_args.connection_limit,
+        channel_timeout=flask_args.channel_timeout,
+        ident="github-runner-manager",
+    )
 
 
 def start_http_server(
-    runner_manager: RunnerManager,
-    lock: Lock,
+    managed_runners: Sequence[ManagedRunners],
+    operations: OperationWorker,
     flask_args: FlaskArgs,
 ) -> None:
     """Start the HTTP server for interacting with the github-runner-manager service.
 
     Args:
-        runner_manager: The runner manager for managing runners.
-        lock: The lock representing modification access to the managed set of runners.
+        managed_runners: The runner managers, one per runner combination.
+        operations: The worker running operations requested through the HTTP server.
         flask_args: The arguments for the flask HTTP server.
     """
-    app.logger.info("Starting the server...")
-    # The lock is passed from the caller, hence the need to update the global variable.
-    global _lock  # pylint: disable=global-statement
-    _lock = lock
-    app.config[RUNNER_MANAGER_CONFIG_NAME] = runner_manager
+    app.logger.info("Starting the %s server...", flask_args.server.value)
+    app.config[RUNNER_MANAGERS_CONFIG_NAME] = managed_runners
+    app.config[OPERATIONS_CONFIG_NAME] = operations
+    app.config[ACCESS_LOG_SAMPLE_CONFIG_NAME] = flask_args.access_log_sample
+    if flask_args.server == HttpServer.WAITRESS:
+        create_waitress_server(flask_args).run()
+        return
     app.run(
         host=flask_args.host,
         port=flask_args.port,
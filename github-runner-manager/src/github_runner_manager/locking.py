@@ -0,0 +1,258 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Locks guarding modification access to the set of runners."""
+
+import logging
+import sys
+import time
+import traceback
+from contextlib import contextmanager
+from threading import Condition, Event, Lock, Thread, get_ident
+from typing import Any, Iterator
+from weakref import WeakSet
+
+from github_runner_manager.metrics.reconcile import (
+    LOCK_ACQUIRED_TIMESTAMP,
+    LOCK_HOLD_SECONDS,
+    LOCK_HOLDER,
+    LOCK_WAIT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds of holding a lock after which a warning is logged.
+HOLD_WARNING_THRESHOLD = 5 * 60
+# Maximum seconds between two checks of the lock holds by the hold monitor.
+HOLD_CHECK_INTERVAL = 30
+
+
+class PriorityLock:
+    """Mutual exclusion lock letting priority acquirers go before normal ones.
+
+    It is a drop-in replacement of threading.Lock. While a priority acquirer is waiting, normal
+    acquirers, e.g. the periodic reconcile, wait even if the lock is free, so user requested
+    operations such as flush do not queue behind the next reconcile.
+    """
+
+    def __init__(self) -> None:
+        """Construct the object."""
+        self._condition = Condition()
+        self._locked = False
+        self._priority_waiters = 0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1, priority: bool = False) -> bool:
+        """Acquire the lock.
+
+        Args:
+            blocking: Whether to wait for the lock.
+            timeout: Maximum seconds to wait for the lock. -1 waits without limit.
+            priority: Whether to go before normal acquirers.
+
+        Returns:
+            Whether the lock was acquired.
+        """
+        deadline = None if timeout < 0 else time.monotonic() + timeout
+        with self._condition:
+            if priority:
+                self._priority_waiters += 1
+            try:
+                while self._locked or (not priority and self._priority_waiters):
+                    if not blocking:
+                        return False
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                self._locked = True
+                return True
+            finally:
+                if priority:
+                    self._priority_waiters -= 1
+                    # Normal acquirers blocked only by this waiter need to re-check.
+                    self._condition.notify_all()
+
+    def release(self) -> None:
+        """Release the lock.
+
+        Raises:
+            RuntimeError: If the lock is not locked.
+        """
+        with self._condition:
+            if not self._locked:
+                raise RuntimeError("release unlocked lock")
+            self._locked = False
+            self._condition.notify_all()
+
+    def locked(self) -> bool:
+        """Whether the lock is held.
+
+        Returns:
+            Whether the lock is held.
+        """
+        return self._locked
+
+    @contextmanager
+    def priority(self) -> Iterator[None]:
+        """Hold the lock, going before normal acquirers."""
+        self.acquire(priority=True)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def __enter__(self) -> bool:
+        """Acquire the lock.
+
+        Returns:
+            True, as the lock is acquired blocking.
+        """
+        return self.acquire()
+
+    def __exit__(self, *_args: Any) -> None:
+        """Release the lock.
+
+        Args:
+            _args: The exception information, if any.
+        """
+        self.release()
+
+
+class InstrumentedLock(PriorityLock):
+    """Priority lock measuring the contention on it per call site.
+
+    The time waited for the lock and the time it is held are observed per call site, e.g. the
+    create loop, the reconcile loop or a flush. The current holder and the time it acquired the
+    lock are exported as gauges. A hold passing a threshold is logged with the stack of the
+    holder while it still holds the lock, so a hold stuck for good is reported too. The holds
+    are checked by a monitor thread shared by all the instrumented locks, so an acquisition
+    only records the time it acquired the lock.
+
+    Attributes:
+        name: The name of the lock in the metrics.
+        flavor: The runner manager the lock belongs to, in the metrics.
+        hold_warning_threshold: Seconds of holding the lock after which a warning is logged.
+        holder: The call site holding the lock, if any.
+    """
+
+    def __init__(
+        self, name: str, flavor: str, hold_warning_threshold: float = HOLD_WARNING_THRESHOLD
+    ):
+        """Construct the object.
+
+        Args:
+            name: The name of the lock in the metrics.
+            flavor: The runner manager the lock belongs to, in the metrics.
+            hold_warning_threshold: Seconds of holding the lock after which a warning is logged.
+        """
+        super().__init__()
+        self.name = name
+        self.flavor = flavor
+        self.hold_warning_threshold = hold_warning_threshold
+        # The call site, the thread and the monotonic time of the current hold, replaced as a
+        # whole so the hold monitor reads a consistent hold.
+        self._hold: tuple[str, int, float] | None = None
+        self._warned_hold: tuple[str, int, float] | None = None
+        _HOLD_MONITOR.register(self)
+
+    @property
+    def holder(self) -> str | None:
+        """The call site holding the lock, if any."""
+        hold = self._hold
+        return hold[0] if hold is not None else None
+
+    @contextmanager
+    def hold(self, site: str, priority: bool = False) -> Iterator[None]:
+        """Hold the lock on behalf of a call site.
+
+        Args:
+            site: The call site acquiring the lock, e.g. create_loop.
+            priority: Whether to go before normal acquirers.
+        """
+        start = time.perf_counter()
+        self.acquire(priority=priority)
+        acquired = time.perf_counter()
+        self._hold = (site, get_ident(), time.monotonic())
+        LOCK_WAIT_SECONDS.labels(self.flavor, self.name, site).observe(acquired - start)
+        LOCK_HOLDER.labels(self.flavor, self.name, site).set(1)
+        LOCK_ACQUIRED_TIMESTAMP.labels(self.flavor, self.name).set(time.time())
+        try:
+            yield
+        finally:
+            held = time.perf_counter() - acquired
+            LOCK_HOLD_SECONDS.labels(self.flavor, self.name, site).observe(held)
+            LOCK_HOLDER.labels(self.flavor, self.name, site).set(0)
+            LOCK_ACQUIRED_TIMESTAMP.labels(self.flavor, self.name).set(0)
+            self._hold = None
+            self.release()
+            if held > self.hold_warning_threshold:
+                logger.warning(
+                    "Lock %s of %s released by %s after %.1f seconds",
+                    self.name,
+                    self.flavor,
+                    site,
+                    held,
+                )
+
+    def check_hold(self) -> None:
+        """Log the current hold once it passes the threshold, with the stack of the holder."""
+        hold = self._hold
+        if hold is None or hold is self._warned_hold:
+            return
+        site, thread_id, acquired = hold
+        if time.monotonic() - acquired <= self.hold_warning_threshold:
+            return
+        self._warned_hold = hold
+        # The private function is the only way to get the stack of another thread.
+        frame = sys._current_frames().get(thread_id)  # pylint: disable=protected-access
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "unavailable"
+        logger.warning(
+            "Lock %s of %s held by %s for more than %s seconds, stack of the holder:\n%s",
+            self.name,
+            self.flavor,
+            site,
+            self.hold_warning_threshold,
+            stack,
+        )
+
+
+class _HoldMonitor:  # pylint: disable=too-few-public-methods
+    """Daemon thread periodically checking the holds of the instrumented locks."""
+
+    def __init__(self) -> None:
+        """Construct the object."""
+        self._mutex = Lock()
+        self._locks: WeakSet[InstrumentedLock] = WeakSet()
+        self._wakeup = Event()
+        self._thread: Thread | None = None
+
+    def register(self, lock: InstrumentedLock) -> None:
+        """Check the holds of a lock, starting the monitor thread if needed.
+
+        Args:
+            lock: The lock to check.
+        """
+        with self._mutex:
+            self._locks.add(lock)
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="lock-hold-monitor", daemon=True)
+                self._thread.start()
+        # The lock may need shorter intervals between the checks.
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        """Check the holds of the locks until the process exits."""
+        while True:
+            self._wakeup.clear()
+            with self._mutex:
+                locks = list(self._locks)
+            for lock in locks:
+                lock.check_hold()
+            interval = min(
+                [HOLD_CHECK_INTERVAL] + [lock.hold_warning_threshold / 2 for lock in locks]
+            )
+            del locks
+            self._wakeup.wait(interval)
+
+
+_HOLD_MONITOR = _HoldMonitor()
@@ -0,0 +1,166 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Backoff of the creation of runners after failed creations, by class of failure.
+
+Retrying a creation that failed right away fails again and loads the cloud, while waiting for
+the next reconcile leaves the runners missing for minutes. The creation is paused for a jittered
+exponential backoff instead, short after transient cloud errors and longer once the quota is
+exhausted, as the quota is only freed by the runners finishing. A configuration error does not go
+away by retrying, so the creation is stopped until resumed by the reconcile.
+"""
+
+import logging
+import math
+from typing import Mapping
+
+from github_runner_manager.manager.runner_creation import CreationFailure
+from github_runner_manager.metrics.reconcile import CREATION_PAUSED_SECONDS_TOTAL
+from github_runner_manager.utilities import ExponentialBackoff
+
+logger = logging.getLogger(__name__)
+
+# Base and cap in seconds of the backoff of the creation, by class of failure. The configuration
+# errors stop the creation.
+CREATION_BACKOFF_SCHEDULES: Mapping[CreationFailure, tuple[float, float]] = {
+    CreationFailure.TRANSIENT: (15, 2 * 60),
+    CreationFailure.QUOTA: (60, 10 * 60),
+}
+
+
+class CreationBackoff:
+    """Pause of the creation of runners after failed creations.
+
+    Not thread-safe, the callers serialize the calls. The times are monotonic times given by the
+    caller.
+
+    Attributes:
+        failure: Class of the failure of the last failed creation, None after a success.
+    """
+
+    def __init__(
+        self,
+        flavor: str,
+        schedules: Mapping[CreationFailure, tuple[float, float]] | None = None,
+    ):
+        """Construct the object.
+
+        Args:
+            flavor: The flavor of the runners, to label the metrics.
+            schedules: Base and cap in seconds of the backoff by class of failure, by default
+                CREATION_BACKOFF_SCHEDULES. The classes not given stop the creation.
+        """
+        self._flavor = flavor
+        self._schedules = CREATION_BACKOFF_SCHEDULES if schedules is None else schedules
+        self._backoff: ExponentialBackoff | None = None
+        self.failure: CreationFailure | None = None
+        self._paused_at: float | None = None
+        self._resume_at = 0.0
+
+    def record_failure(self, failure: CreationFailure, now: float) -> float:
+        """Pause the creation after a creation failed.
+
+        The backoff grows with the consecutive failures of the same class, and restarts from
+        the base delay when the class changes.
+
+        Args:
+            failure: Class of the failure.
+            now: The current time.
+
+        Returns:
+            The seconds the creation is paused for, infinite if stopped.
+        """
+        self._end_pause(now)
+        if failure != self.failure:
+            self._backoff = None
+            if (schedule := self._schedules.get(failure)) is not None:
+                self._backoff = ExponentialBackoff(base=schedule[0], cap=schedule[1])
+        self.failure = failure
+        delay = self._backoff.next_delay() if self._backoff is not None else math.inf
+        self._paused_at = now
+        self._resume_at = now + delay
+        return delay
+
+    def record_success(self, now: float) -> None:
+        """Resume the creation and reset the backoff after a creation succeeded.
+
+        Args:
+            now: The current time.
+        """
+        self._end_pause(now)
+        self._backoff = None
+        self.failure = None
+
+    def is_paused(self, now: float) -> bool:
+        """Check whether the creation is paused, ending the pause if it expired.
+
+        Args:
+            now: The current time.
+
+        Returns:
+            Whether the creation is paused.
+        """
+        if self._paused_at is None:
+            return False
+        if now < self._resume_at:
+            return True
+        self._end_pause(now)
+        return False
+
+    def resume_stopped(self, now: float) -> bool:
+        """Resume a creation stopped, to retry it.
+
+        Args:
+            now: The current time.
+
+        Returns:
+            Whether the creation was stopped.
+        """
+        if self._paused_at is None or self._resume_at != math.inf:
+            return False
+        self._end_pause(now)
+        return True
+
+    def remaining(self, now: float) -> float:
+        """Get the seconds until the creation resumes.
+
+        Args:
+            now: The current time.
+
+        Returns:
+            The seconds, infinite if stopped and 0 if not paused.
+        """
+        if self._paused_at is None:
+            return 0.0
+        return max(self._resume_at - now, 0.0)
+
+    def paused_seconds(self, now: float) -> float:
+        """Get the seconds the current pause has lasted.
+
+        Args:
+            now: The current time.
+
+        Returns:
+            The seconds, 0 if not paused.
+        """
+        paused_at = self._paused_at
+        if paused_at is None or now >= self._resume_at:
+            return 0.0
+        return now - paused_at
+
+    def _end_pause(self, now: float) -> None:
+        """End the current pause, if any, and count its duration.
+
+        Args:
+            now: The current time.
+        """
+        if self._paused_at is None or self.failure is None:
+            return
+        duration = min(now, self._resume_at) - self._paused_at
+        CREATION_PAUSED_SECONDS_TOTAL.labels(self._flavor, self.failure.value).inc(duration)
+        logger.info(
+            "Creation resumed after a pause of %.1f seconds (%s failure)",
+            duration,
+            self.failure.value,
+        )
+        self._paused_at = None
@@ -0,0 +1,189 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Forecast of the planner pressure for predictive scale-up.
+
+The planner pressure only reflects demand that has already arrived, so runners start booting
+after the jobs are queued. The forecaster fits a Holt-Winters model on the pressure updates: an
+exponentially smoothed level and trend, plus an additive time-of-day seasonal component, so that
+recurring ramps, e.g. the start of the working day, are anticipated.
+
+The updates of the pressure stream are irregularly spaced, so the trend is kept per second and
+the seasonal component is indexed by the time-of-day bucket of the update.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+
+SECONDS_PER_DAY = 24 * 60 * 60
+# Number of updates to observe before forecasting.
+MIN_OBSERVATIONS = 10
+# Maximum number of forecasts kept for comparison with the actual pressure.
+MAX_PENDING_FORECASTS = 1000
+# Upper bound of the forecast as a multiple of the highest pressure observed.
+MAX_PEAK_MULTIPLE = 2.0
+
+
+@dataclass(frozen=True)
+class ForecastSample:
+    """A past forecast compared with the actual pressure.
+
+    Attributes:
+        timestamp: UNIX timestamp the forecast was made for.
+        forecast: The forecast pressure.
+        actual: The actual pressure observed at or after the timestamp.
+        error: The forecast minus the actual pressure.
+    """
+
+    timestamp: float
+    forecast: float
+    actual: int
+
+    @property
+    def error(self) -> float:
+        """The forecast minus the actual pressure."""
+        return self.forecast - self.actual
+
+
+class PressureForecaster:  # pylint: disable=too-many-instance-attributes
+    """Holt-Winters forecaster of the pressure with time-of-day seasonality.
+
+    The forecaster is thread-safe: updates are observed by the create loop and forecasts are
+    read by both reconciler loops.
+
+    Attributes:
+        horizon: Seconds ahead the pressure is forecast.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        horizon: float,
+        *,
+        alpha: float = 0.3,
+        beta: float = 0.05,
+        gamma: float = 0.1,
+        season_buckets: int = 24,
+    ):
+        """Construct the object.
+
+        Args:
+            horizon: Seconds ahead the pressure is forecast, e.g. the boot time of a runner.
+            alpha: Smoothing factor of the level.
+            beta: Smoothing factor of the trend.
+            gamma: Smoothing factor of the time-of-day seasonal component.
+            season_buckets: Number of time-of-day buckets of the seasonal component.
+        """
+        self.horizon = horizon
+        self._lock = Lock()
+        self._alpha = alpha
+        self._beta = beta
+        self._gamma = gamma
+        self._season = [0.0] * season_buckets
+        self._level: float | None = None
+        self._trend = 0.0
+        self._last_timestamp = 0.0
+        self._peak = 0
+        self._observations = 0
+        # Forecasts waiting for the actual pressure at their timestamp, in timestamp order.
+        self._pending: deque[tuple[float, float]] = deque(maxlen=MAX_PENDING_FORECASTS)
+
+    def observe(self, timestamp: float, pressure: int) -> list[ForecastSample]:
+        """Update the model with a pressure update.
+
+        Args:
+            timestamp: UNIX timestamp of the update.
+            pressure: The pressure.
+
+        Returns:
+            The past forecasts for timestamps up to this update, compared with the pressure.
+        """
+        with self._lock:
+            return self._observe(timestamp, pressure)
+
+    def _observe(self, timestamp: float, pressure: int) -> list[ForecastSample]:
+        """Update the model with a pressure update, with the lock held.
+
+        Args:
+            timestamp: UNIX timestamp of the update.
+            pressure: The pressure.
+
+        Returns:
+            The past forecasts for timestamps up to this update, compared with the pressure.
+        """
+        samples = []
+        while self._pending and self._pending[0][0] <= timestamp:
+            target, forecast = self._pending.popleft()
+            samples.append(ForecastSample(timestamp=target, forecast=forecast, actual=pressure))
+
+        bucket = self._bucket(timestamp)
+        deseasonalized = pressure - self._season[bucket]
+        if self._level is None:
+            level = deseasonalized
+        else:
+            # Updates closer than a second apart would blow up the trend per second.
+            elapsed = max(timestamp - self._last_timestamp, 1.0)
+            level = self._alpha * deseasonalized + (1 - self._alpha) * (
+                self._level + self._trend * elapsed
+            )
+            self._trend = (
+                self._beta * (level - self._level) / elapsed + (1 - self._beta) * self._trend
+            )
+        self._level = level
+        self._season[bucket] = (
+            self._gamma * (pressure - level) + (1 - self._gamma) * self._season[bucket]
+        )
+        self._last_timestamp = max(timestamp, self._last_timestamp)
+        self._peak = max(pressure, self._peak)
+        self._observations += 1
+
+        if (prediction := self._forecast(timestamp)) is not None:
+            self._pending.append((timestamp + self.horizon, prediction))
+        return samples
+
+    def forecast(self, timestamp: float) -> float | None:
+        """Forecast the pressure `horizon` seconds after a timestamp.
+
+        Args:
+            timestamp: UNIX timestamp to forecast from.
+
+        Returns:
+            The forecast pressure, or None if too few updates were observed or the last update
+            is older than the horizon.
+        """
+        with self._lock:
+            return self._forecast(timestamp)
+
+    def _forecast(self, timestamp: float) -> float | None:
+        """Forecast the pressure `horizon` seconds after a timestamp, with the lock held.
+
+        The trend is not extrapolated from stale updates, and the forecast is capped at a
+        multiple of the highest pressure observed.
+
+        Args:
+            timestamp: UNIX timestamp to forecast from.
+
+        Returns:
+            The forecast pressure, or None if too few updates were observed or the last update
+            is older than the horizon.
+        """
+        if self._level is None or self._observations < MIN_OBSERVATIONS:
+            return None
+        staleness = max(timestamp - self._last_timestamp, 0.0)
+        if staleness > self.horizon:
+            return None
+        elapsed = staleness + self.horizon
+        target = timestamp + self.horizon
+        forecast = self._level + self._trend * elapsed + self._season[self._bucket(target)]
+        return min(max(forecast, 0.0), MAX_PEAK_MULTIPLE * self._peak)
+
+    def _bucket(self, timestamp: float) -> int:
+        """Get the time-of-day bucket of a timestamp.
+
+        Args:
+            timestamp: UNIX timestamp.
+
+        Returns:
+            The index of the seasonal bucket.
+        """
+        return int(timestamp % SECONDS_PER_DAY * len(self._season) // SECONDS_PER_DAY)
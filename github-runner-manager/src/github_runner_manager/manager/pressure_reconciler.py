@@ -5,55 +5,78 @@
 
 Creates or deletes runners based on pressure signals from the planner
 service. Runs in two independent loops (create/delete) and coordinates
-access to the underlying RunnerManager via the provided lock.
+access to the underlying RunnerManager via the provided lock and an
+internal state lock.
 """
 
 from __future__ import annotations
 
-import getpass
-import grp
 import logging
-import os
+import math
 import time
 from dataclasses import dataclass
-from threading import Event, Lock
+from threading import Condition, Event, Thread, Timer
 from typing import Optional
 
-from github_runner_manager.configuration import ApplicationConfiguration
-from github_runner_manager.configuration.base import RunnerCombination, UserInfo
-from github_runner_manager.errors import IssueMetricEventError, MissingServerConfigError
+from github_runner_manager.errors import (
+    IssueMetricEventError,
+    MissingServerConfigError,
+    OpenStackError,
+)
+from github_runner_manager.locking import InstrumentedLock
+from github_runner_manager.manager.creation_backoff import CreationBackoff
+from github_runner_manager.manager.pressure_forecast import PressureForecaster
+from github_runner_manager.manager.runner_creation import CreationFailure
 from github_runner_manager.manager.runner_manager import (
     RunnerInstance,
     RunnerManager,
     RunnerMetadata,
 )
+from github_runner_manager.manager.scale_down import ScaleDownHysteresis
 from github_runner_manager.manager.vm_manager import HealthState
 from github_runner_manager.metrics import events as metric_events
 from github_runner_manager.metrics.reconcile import (
     BUSY_RUNNERS_COUNT,
+    CREATION_PAUSE_SECONDS,
     EXPECTED_RUNNERS_COUNT,
     IDLE_RUNNERS_COUNT,
+    PLANNER_STREAM_UPTIME_SECONDS,
+    PRESSURE_FORECAST,
+    PRESSURE_FORECAST_ABSOLUTE_ERROR,
+    PRESSURE_FORECAST_ERROR,
+    PRESSURE_UPDATE_AGE_SECONDS,
+    PRESSURE_UPDATES_ACTED_TOTAL,
+    PRESSURE_UPDATES_RECEIVED_TOTAL,
     RECONCILE_DURATION_SECONDS,
-)
-from github_runner_manager.openstack_cloud.models import OpenStackServerConfig
-from github_runner_manager.openstack_cloud.openstack_runner_manager import (
-    OpenStackRunnerManager,
-    OpenStackRunnerManagerConfig,
+    RUNNER_COUNT_DRIFT_TOTAL,
 )
 from github_runner_manager.planner_client import (
     PlannerApiError,
     PlannerClient,
-    PlannerConfiguration,
     PlannerConnectionError,
 )
-from github_runner_manager.platform.github_provider import GitHubRunnerPlatform
-from github_runner_manager.platform.platform_provider import PlatformRunnerState
+from github_runner_manager.platform.platform_provider import PlatformApiError, PlatformRunnerState
+from github_runner_manager.utilities import ExponentialBackoff
 
 logger = logging.getLogger(__name__)
 
+# Jittered exponential backoff in seconds between attempts to reopen the pressure stream.
+STREAM_BACKOFF_BASE = 1
+STREAM_BACKOFF_CAP = 5 * 60
+# Seconds between the polls of the pressure while the pressure stream is down.
+PRESSURE_POLL_INTERVAL = 5
+# Seconds between the checks of the boots of the runners, well within the boot stall timeout.
+BOOT_WATCHDOG_INTERVAL = 60
+
+# Call sites of the reconciler loops in the lock metrics.
+CREATE_LOOP_SITE = "create_loop"
+RECONCILE_LOOP_SITE = "reconcile_loop"
+RECLAIM_LOOP_SITE = "reclaim_loop"
+BOOT_WATCHDOG_LOOP_SITE = "boot_watchdog_loop"
+
 
 @dataclass(frozen=True)
-class PressureReconcilerConfig:
+class PressureReconcilerConfig:  # pylint: disable=too-many-instance-attributes
     """Configuration for pressure reconciliation.
 
     Attributes:
@@ -62,24 +85,52 @@ class PressureReconcilerConfig:
         min_pressure: Minimum desired runner count (floor) for the flavor.
             Also used as fallback when the planner is unavailable.
         max_pressure: Maximum desired runner count (ceiling). 0 means no cap.
+        forecast_horizon: Seconds ahead the pressure is forecast to create runners ahead of
+            predicted ramps. 0 disables the forecast.
+        debounce_window: Seconds the create loop waits for further pressure updates before
+            acting on the latest one.
+        reclaim_interval: Seconds between the reclamations of the VMs of finished runners and
+            recounts of the runners. 0 disables them, the VMs are then deleted and the runners
+            counted by the reconcile loop.
+        scale_down_min_idle_age: Seconds the VM of an idle runner must be older than to be
+            scaled down.
+        scale_down_cooldown: Seconds after a scale up without scaling down.
+        scale_down_window: Seconds of desired totals the scale down is stabilized over, the
+            runners are only scaled down to the highest desired total within the window.
     """
 
     flavor_name: str
     reconcile_interval: int = 5
     min_pressure: int = 0
     max_pressure: int = 0
+    forecast_horizon: int = 0
+    debounce_window: float = 0.0
+    reclaim_interval: float = 0.0
+    scale_down_min_idle_age: float = 0.0
+    scale_down_cooldown: float = 0.0
+    scale_down_window: float = 0.0
 
 
 class PressureReconciler:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """Continuously reconciles runner count against planner pressure.
 
     This reconciler keeps the total number of runners near the desired level
-    indicated by the planner's pressure for a given flavor. It operates in two
+    indicated by the planner's pressure for a given flavor. It operates in three
     threads:
     - create loop: scales up when desired exceeds current total
     - reconcile loop: cleans up stale runners, syncs state, scales up/down as needed
-
-    Concurrency with any other reconcile loop is protected by a shared lock.
+    - reclaim loop: deletes the VMs powered off after the run of their runner, and
+      corrects the in-memory count downwards from the VMs listed, so the runners gone
+      are replaced right away
+    - boot watchdog loop: deletes the runners whose VM boot is stuck, so they are replaced
+      without waiting for the reconcile loop
+
+    The reconcile loop and flushes are serialized by a shared lock. The
+    in-memory state is guarded by a separate state lock that is never held
+    during cloud or platform API calls, so pressure spikes arriving during a
+    reconcile are acted upon without waiting for it. Runners to create are
+    reserved in the in-memory count before being created, and the reconcile
+    neither syncs the count nor scales down while runners are being created.
 
     The create loop tracks runners via an in-memory count rather than calling
     get_runners() on every pressure event, avoiding expensive OpenStack and
@@ -89,24 +140,54 @@ class PressureReconciler:  # pylint: disable=too-few-public-methods,too-many-ins
     failures (e.g. VMs that fail to boot): the in-memory count stays high
     and prevents further creation attempts until the reconcile loop runs,
     queries the real OpenStack state via get_runners(), and syncs the count
-    back down. API-level creation failures (where no IDs are returned) pause
-    the create loop entirely until the next reconcile loop run, which
-    re-enables creation and creates if still needed.
+    back down. The reclaim loop lowers the count to the VMs listed between
+    reconciles, still counting the VMs in error until they are cleaned up, so
+    the backoff holds. API-level creation failures (where no IDs are returned) pause
+    the creation for a backoff depending on the class of the failure, after which
+    the creation is retried, see CreationBackoff. Configuration errors stop the
+    creation until the next reconcile loop run, which retries it if still needed.
+
+    The scale down is held off by a hysteresis, see ScaleDownHysteresis, so the
+    runners deleted on a dip of the pressure are not created again right after.
 
     The reconcile loop uses the last pressure seen by the create loop rather than
     fetching a fresh value, so it may act on a stale reading if pressure changed
     between stream events. This is an accepted trade-off: the window is bounded
     by the stream update frequency.
 
+    When the forecast is enabled, the pressure updates are fed to a forecaster and
+    both loops raise the desired total to the pressure forecast `forecast_horizon`
+    seconds ahead, capped by `max_pressure`, so runners boot ahead of predicted ramps.
+
     Attributes:
+        runner_manager: The runner manager of the reconciler.
+        lock: The lock serializing the reconcile with flushes of the runner manager.
         _manager: Runner manager used to list, create, and clean up runners.
         _planner: Client used to stream pressure updates.
         _config: Reconciler configuration.
-        _lock: Shared lock to serialize operations with other reconcile loops.
+        _lock: Shared lock to serialize the reconcile with flushes.
+        _state_lock: Lock guarding the in-memory state: _last_pressure,
+            _runner_count, _creating, _create_backoff, _scale_down and
+            _reservation_generation. Never held during cloud or platform API calls.
         _stop: Event used to signal streaming loops to stop gracefully.
         _last_pressure: Last pressure value seen in the create stream.
-        _runner_count: In-memory runner count used by the create loop.
-        _create_paused: True when creation returned zero IDs, cleared by reconcile loop.
+        _runner_count: In-memory runner count used by the create loop, including
+            runners reserved for creation.
+        _creating: Number of runners reserved for creation and being created.
+        _create_backoff: Pause of the creation after creations returned zero IDs.
+        _retry_timer: Timer retrying the creation once the pause ends, None if not scheduled.
+        _scale_down: Hysteresis of the scale down, fed with the desired totals.
+        _reservation_generation: Number of reservations of runners to create, to detect the
+            creations concurrent with a recount.
+        _forecaster: Forecaster of the pressure, None if the forecast is disabled.
+        _pressure_updated: Condition notified when a pressure update is received or the
+            reconciler is stopped.
+        _pending_pressure: Latest pressure received from the stream and not acted on yet.
+        _stream_error: Unexpected error of the stream consumer, raised by the create loop.
+        _stream_connected_at: Monotonic time of the first update of the current stream, None
+            while the stream is down.
+        _last_update_at: Monotonic time of the last pressure update from the planner, or of
+            the start of the reconciler.
     """
 
     def __init__(
@@ -114,7 +195,7 @@ class PressureReconciler:  # pylint: disable=too-few-public-methods,too-many-ins
         manager: RunnerManager,
         planner_client: PlannerClient | None,
         config: PressureReconcilerConfig,
-        lock: Lock,
+        lock: InstrumentedLock,
     ) -> None:
         """Initialize reconciler state and dependencies.
 
@@ -131,18 +212,71 @@ class PressureReconciler:  # pylint: disable=too-few-public-methods,too-many-ins
         self._config = config
         self._lock = lock
 
+        self._state_lock = InstrumentedLock("state", manager.manager_name)
+
         self._stop = Event()
         self._last_pressure: Optional[int] = None
         self._runner_count: int = 0
-        self._create_paused: bool = False
+        self._creating: int = 0
+        self._create_backoff = CreationBackoff(manager.manager_name)
+        self._retry_timer: Timer | None = None
+        self._scale_down = ScaleDownHysteresis(
+            manager.manager_name,
+            cooldown=config.scale_down_cooldown,
+            window=config.scale_down_window,
+        )
+        self._reservation_generation: int = 0
+        self._forecaster = (
+            PressureForecaster(horizon=config.forecast_horizon)
+            if config.forecast_horizon > 0
+            else None
+        )
+        self._pressure_updated = Condition()
+        self._pending_pressure: Optional[int] = None
+        self._stream_error: Exception | None = None
+        self._stream_connected_at: float | None = None
+        self._last_update_at = time.monotonic()
+        PLANNER_STREAM_UPTIME_SECONDS.labels(manager.manager_name).set_function(
+            lambda: (
+                0.0
+                if (connected_at := self._stream_connected_at) is None
+                else time.monotonic() - connected_at
+            )
+        )
+        PRESSURE_UPDATE_AGE_SECONDS.labels(manager.manager_name).set_function(
+            lambda: time.monotonic() - self._last_update_at
+        )
+        CREATION_PAUSE_SECONDS.labels(manager.manager_name).set_function(
+            lambda: self._create_backoff.paused_seconds(time.monotonic())
+        )
+
+    @property
+    def runner_manager(self) -> RunnerManager:
+        """The runner manager of the reconciler."""
+        return self._manager
+
+    @property
+    def lock(self) -> InstrumentedLock:
+        """The lock serializing the reconcile with flushes of the runner manager."""
+        return self._lock
 
     def start_create_loop(self) -> None:
-        """Continuously create runners to satisfy planner pressure."""
-        with self._lock:
-            self._runner_count = len(self._manager.get_runners())
+        """Continuously create runners to satisfy planner pressure.
+
+        The pressure stream is consumed by a separate thread, which keeps only the latest
+        pressure, so updates received while runners are being created are coalesced.
+
+        Raises:
+            error: The unexpected error of the pressure stream consumer.
+        """
+        with self._lock.hold(CREATE_LOOP_SITE):
+            runner_count = len(self._manager.get_runners()) + self._manager.pending_creations
+        with self._state_lock.hold(CREATE_LOOP_SITE):
+            self._runner_count = runner_count
         logger.info("Create loop: initial sync, _runner_count=%s", self._runner_count)
         if self._planner is None:
-            self._last_pressure = self._config.min_pressure
+            with self._state_lock.hold(CREATE_LOOP_SITE):
+                self._last_pressure = self._config.min_pressure
             logger.info(
                 "Create loop: no planner configured, using min_pressure=%s",
                 self._config.min_pressure,
@@ -150,35 +284,171 @@ class PressureReconciler:  # pylint: disable=too-few-public-methods,too-many-ins
             self._handle_create_runners(self._config.min_pressure)
             self._stop.wait()
             return
-        while not self._stop.is_set():
-            try:
-                for update in self._planner.stream_pressure(self._config.flavor_name):
-                    if self._stop.is_set():
-                        return
-                    self._handle_create_runners(update.pressure)
-            except PlannerConnectionError as exc:
-                fallback = max(self._last_pressure or 0, self._config.min_pressure)
-                logger.warning(
-                    "Pressure stream interrupted for flavor %s (%s), falling back to %s runners.",
-                    self._config.flavor_name,
-                    exc,
-                    fallback,
-                )
+        consumer = Thread(
+            target=self._consume_pressure_stream,
+            args=(self._planner,),
+            name=f"pressure-stream-{self._config.flavor_name}",
+            daemon=True,
+        )
+        consumer.start()
+        while (pressure := self._next_pressure()) is not None:
+            PRESSURE_UPDATES_ACTED_TOTAL.labels(self._manager.manager_name).inc()
+            self._handle_create_runners(pressure)
+        if (error := self._stream_error) is not None:
+            raise error
+
+    def _consume_pressure_stream(self, planner: PlannerClient) -> None:
+        """Read the planner pressure stream, keeping only the latest pressure for the create loop.
+
+        When the stream is interrupted, the pressure is polled at a fixed interval instead and
+        the stream is reopened after a jittered exponential backoff, reset once the stream
+        delivers updates. A failed poll stops the polling until the next reopening, so the
+        planner is only called at the pace of the backoff while it is down.
+
+        Args:
+            planner: Client used to stream pressure updates.
+        """
+        backoff = ExponentialBackoff(base=STREAM_BACKOFF_BASE, cap=STREAM_BACKOFF_CAP)
+        try:
+            while not self._stop.is_set():
+                if self._stream_pressure_updates(planner):
+                    backoff.reset()
                 if self._stop.is_set():
                     return
-                self._handle_create_runners(fallback)
-                self._stop.wait(5)
-            except PlannerApiError:
-                fallback = max(self._last_pressure or 0, self._config.min_pressure)
-                logger.exception(
-                    "Error in pressure stream loop for flavor %s, falling back to %s runners.",
+                delay = backoff.next_delay()
+                logger.info(
+                    "Reopening pressure stream for flavor %s in %.1f seconds",
                     self._config.flavor_name,
-                    fallback,
+                    delay,
                 )
+                self._poll_pressure_for(planner, delay)
+        # The error is raised by the create loop, which is watched by the thread manager.
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._stream_error = exc
+            self.stop()
+
+    def _stream_pressure_updates(self, planner: PlannerClient) -> bool:
+        """Publish the pressure updates of a stream until it is interrupted.
+
+        Args:
+            planner: Client used to stream pressure updates.
+
+        Returns:
+            Whether the stream delivered any update.
+        """
+        received = False
+        try:
+            for update in planner.stream_pressure(self._config.flavor_name):
                 if self._stop.is_set():
-                    return
-                self._handle_create_runners(fallback)
-                self._stop.wait(5)
+                    break
+                if not received:
+                    received = True
+                    self._stream_connected_at = time.monotonic()
+                self._receive_pressure(update.pressure)
+        except PlannerConnectionError as exc:
+            logger.warning(
+                "Pressure stream interrupted for flavor %s: %s", self._config.flavor_name, exc
+            )
+        except PlannerApiError:
+            logger.exception(
+                "Error in pressure stream loop for flavor %s", self._config.flavor_name
+            )
+        finally:
+            self._stream_connected_at = None
+        return received
+
+    def _poll_pressure_for(self, planner: PlannerClient, duration: float) -> None:
+        """Poll the pressure at a fixed interval for a duration, or until stopped or a poll fails.
+
+        Args:
+            planner: Client used to get the pressure.
+            duration: Seconds to poll the pressure for.
+        """
+        remaining = duration
+        while True:
+            if not self._poll_pressure(planner):
+                self._stop.wait(remaining)
+                return
+            wait = min(PRESSURE_POLL_INTERVAL, remaining)
+            if self._stop.wait(wait):
+                return
+            remaining -= wait
+            if remaining <= 0:
+                return
+
+    def _poll_pressure(self, planner: PlannerClient) -> bool:
+        """Poll the pressure while the stream is down, falling back if the planner is down too.
+
+        Args:
+            planner: Client used to get the pressure.
+
+        Returns:
+            Whether the pressure was polled.
+        """
+        try:
+            pressure = planner.get_pressure(self._config.flavor_name).pressure
+        except PlannerApiError as exc:
+            fallback = max(self._last_pressure or 0, self._config.min_pressure)
+            logger.warning(
+                "Unable to poll pressure for flavor %s (%s), falling back to %s runners.",
+                self._config.flavor_name,
+                exc,
+                fallback,
+            )
+            self._publish_pressure(fallback)
+            return False
+        logger.info("Polled pressure %s for flavor %s", pressure, self._config.flavor_name)
+        self._receive_pressure(pressure)
+        return True
+
+    def _receive_pressure(self, pressure: int) -> None:
+        """Handle a pressure update received from the planner.
+
+        Args:
+            pressure: The pressure value.
+        """
+        self._last_update_at = time.monotonic()
+        self._observe_pressure(pressure)
+        self._publish_pressure(pressure)
+
+    def _publish_pressure(self, pressure: int) -> None:
+        """Hand a pressure update to the create loop, replacing any update not acted on yet.
+
+        Args:
+            pressure: The pressure value.
+        """
+        PRESSURE_UPDATES_RECEIVED_TOTAL.labels(self._manager.manager_name).inc()
+        with self._pressure_updated:
+            if self._pending_pressure is not None:
+                logger.debug(
+                    "Create loop: pressure %s replaces pressure %s not acted on",
+                    pressure,
+                    self._pending_pressure,
+                )
+            self._pending_pressure = pressure
+            self._pressure_updated.notify_all()
+
+    def _next_pressure(self) -> int | None:
+        """Wait for the latest pressure update, debounced by the configured window.
+
+        Updates received during the debounce window replace the pending one, so a burst of
+        updates results in a single creation batch for the newest pressure. An update received
+        before stopping is still returned.
+
+        Returns:
+            The latest pressure, or None if the reconciler is stopped.
+        """
+        with self._pressure_updated:
+            self._pressure_updated.wait_for(
+                lambda: self._pending_pressure is not None or self._stop.is_set()
+            )
+            if self._pending_pressure is None:
+                return None
+        if self._config.debounce_window > 0:
+            self._stop.wait(self._config.debounce_window)
+        with self._pressure_updated:
+            pressure, self._pending_pressure = self._pending_pressure, None
+        return pressure
 
     def start_reconcile_loop(self) -> None:
         """Periodically reconcile runners: sync state, scale up/down, and clean up."""
@@ -191,27 +461,151 @@ class PressureReconciler:  # pylint: disable=too-few-public-methods,too-many-ins
                 continue
             self._handle_timer_reconcile(self._last_pressure)
 
+    def start_reclaim_loop(self) -> None:
+        """Periodically reclaim the VMs of the finished runners between reconciles."""
+        interval_seconds = self._config.reclaim_interval
+        if interval_seconds <= 0:
+            logger.info("Reclaim loop: disabled")
+            return
+        while not self._stop.wait(interval_seconds):
+            self._handle_reclaim()
+
+    def start_boot_watchdog_loop(self) -> None:
+        """Periodically replace the runners whose VM boot is stuck, between reconciles."""
+        while not self._stop.wait(BOOT_WATCHDOG_INTERVAL):
+            self._handle_boot_watchdog()
+
+    def _handle_boot_watchdog(self) -> None:
+        """Delete the runners whose VM boot is stuck, and request their replacement.
+
+        The shared lock serializes the deletion with the reconcile and flushes.
+        """
+        with self._lock.hold(BOOT_WATCHDOG_LOOP_SITE):
+            try:
+                deleted = self._manager.replace_stuck_boots()
+            except (OpenStackError, PlatformApiError):
+                logger.exception("Boot watchdog loop: failed to replace stuck boots")
+                return
+        if not deleted:
+            return
+        with self._state_lock.hold(BOOT_WATCHDOG_LOOP_SITE):
+            self._runner_count = max(self._runner_count - deleted, 0)
+            last_pressure = self._last_pressure
+        logger.info("Boot watchdog loop: deleted %s runners with a stuck boot", deleted)
+        if last_pressure is not None:
+            self._request_creation(last_pressure)
+
+    def _handle_reclaim(self) -> None:
+        """Reclaim the VMs of the finished runners and correct the in-memory count downwards.
+
+        The in-memory count only goes up between reconciles, while the runners that finish are
+        gone. The reclaimed runners are subtracted from the count, and the count is lowered to
+        the runners counted from the VMs listed, so the create loop replaces them right away.
+        The count is never raised, as runners may be created concurrently, and is not lowered
+        to the listing if runners were reserved for creation since, as the listing may not
+        include them.
+
+        The shared lock serializes the reclamation with the reconcile and flushes, which delete
+        the VMs of the finished runners and sync the count too.
+        """
+        with self._lock.hold(RECLAIM_LOOP_SITE):
+            with self._state_lock.hold(RECLAIM_LOOP_SITE):
+                generation_before = self._reservation_generation
+            try:
+                result = self._manager.reclaim_finished_runners()
+            except OpenStackError:
+                logger.exception("Reclaim loop: failed to reclaim finished runners")
+                return
+            with self._state_lock.hold(RECLAIM_LOOP_SITE):
+                previous_count = self._runner_count
+                runner_count = max(previous_count - result.reclaimed, 0)
+                if not self._creating and self._reservation_generation == generation_before:
+                    runner_count = min(runner_count, result.runner_count)
+                self._runner_count = runner_count
+                last_pressure = self._last_pressure
+        if runner_count >= previous_count:
+            return
+        if (drift := previous_count - result.reclaimed - runner_count) > 0:
+            RUNNER_COUNT_DRIFT_TOTAL.labels(self._manager.manager_name).inc(drift)
+        logger.info(
+            "Reclaim loop: reclaimed %s finished runners, runner count corrected from %s to %s",
+            result.reclaimed,
+            previous_count,
+            runner_count,
+        )
+        if last_pressure is not None:
+            self._request_creation(last_pressure)
+
+    def _request_creation(self, pressure: int) -> None:
+        """Create the runners missing for a pressure, from outside of the create loop.
+
+        Args:
+            pressure: The pressure value.
+        """
+        if self._planner is None:
+            # Without a planner, the create loop only creates the initial runners.
+            self._handle_create_runners(pressure)
+        else:
+            self._wake_create_loop(pressure)
+
+    def _wake_create_loop(self, pressure: int) -> None:
+        """Make the create loop act on a pressure, unless a newer update is pending.
+
+        Args:
+            pressure: The pressure value.
+        """
+        with self._pressure_updated:
+            if self._pending_pressure is None:
+                self._pending_pressure = pressure
+                self._pressure_updated.notify_all()
+
+    def _schedule_creation_retry(self, delay: float) -> None:
+        """Retry the creation for the last pressure once paused for a delay.
+
+        Args:
+            delay: Seconds the creation is paused for.
+        """
+        if self._retry_timer is not None:
+            self._retry_timer.cancel()
+        self._retry_timer = Timer(delay, self._retry_creation)
+        self._retry_timer.daemon = True
+        self._retry_timer.start()
+
+    def _retry_creation(self) -> None:
+        """Create the runners still missing for the last pressure after a pause."""
+        if self._stop.is_set() or (pressure := self._last_pressure) is None:
+            return
+        logger.info("Retrying creation after pause, pressure=%s", pressure)
+        self._request_creation(pressure)
+
     def stop(self) -> None:
         """Signal the reconciler loops to stop gracefully."""
         self._stop.set()
+        if self._retry_timer is not None:
+            self._retry_timer.cancel()
+        with self._pressure_updated:
+            self._pressure_updated.notify_all()
 
     def _handle_create_runners(self, pressure: int) -> None:
         """Create runners when desired exceeds current total.
 
         Uses an in-memory runner count instead of calling get_runners() to
         avoid expensive OpenStack and GitHub API calls on every pressure event.
+        The runners to create are reserved in the count under the state lock, and
+        created outside of it, so the create loop never waits on a reconcile.
 
         Args:
             pressure: Current pressure value used to compute desired total.
         """
-        desired_total = self._desired_total_from_pressure(pressure)
+        desired_total = self._desired_total_from_pressure(self._forecast_pressure(pressure))
         logger.debug(
             "Create loop: pressure=%s, desired=%s, updating _last_pressure",
             pressure,
             desired_total,
         )
-        self._last_pressure = pressure
-        with self._lock:
+        with self._state_lock.hold(CREATE_LOOP_SITE):
+            self._last_pressure = pressure
+            self._scale_down.observe(desired_total, time.monotonic())
             current_total = self._runner_count
             to_create = max(desired_total - current_total, 0)
             if to_create <= 0:
@@ -221,41 +615,81 @@ class PressureReconciler:  # pylint: disable=too-few-public-methods,too-many-ins
                     current_total,
                 )
                 return
-            if self._create_paused:
+            if self._create_backoff.is_paused(now := time.monotonic()):
                 logger.warning(
-                    "Create loop: paused after zero-create, waiting for reconcile"
+                    "Create loop: creation paused for %.1f more seconds after failure"
                     " (desired=%s current=%s)",
+                    self._create_backoff.remaining(now),
                     desired_total,
                     current_total,
                 )
                 return
-            logger.info(
-                "Create loop: creating %s runners (desired=%s current=%s)",
-                to_create,
-                desired_total,
-                current_total,
+            self._reserve_creation(to_create)
+        logger.info(
+            "Create loop: creating %s runners (desired=%s current=%s)",
+            to_create,
+            desired_total,
+            current_total,
+        )
+        self._create_reserved(to_create, loop_name="Create loop", site=CREATE_LOOP_SITE)
+
+    def _reserve_creation(self, num: int) -> None:
+        """Reserve runners to create in the in-memory count.
+
+        Must be called with the state lock held.
+
+        Args:
+            num: Number of runners to create.
+        """
+        self._runner_count += num
+        self._creating += num
+        self._reservation_generation += 1
+        self._scale_down.record_scale_up(time.monotonic())
+
+    def _create_reserved(self, num: int, loop_name: str, site: str) -> None:
+        """Create reserved runners, then settle the reservation in the in-memory count.
+
+        Args:
+            num: Number of runners reserved to create.
+            loop_name: Name of the calling loop for logging.
+            site: Call site of the calling loop in the lock metrics.
+        """
+        created = 0
+        failure: CreationFailure | None = None
+        try:
+            result = self._manager.create_runners(num=num, metadata=RunnerMetadata())
+            created, failure = len(result.instance_ids), result.failure
+        except MissingServerConfigError:
+            logger.exception(
+                "Unable to create runners due to missing server configuration (image/flavor)."
             )
-            try:
-                created_ids = self._manager.create_runners(
-                    num=to_create, metadata=RunnerMetadata()
-                )
-            except MissingServerConfigError:
-                logger.exception(
-                    "Unable to create runners due to missing server configuration"
-                    " (image/flavor)."
-                )
+            failure = CreationFailure.CONFIG
+        finally:
+            with self._state_lock.hold(site):
+                self._runner_count = max(self._runner_count - (num - created), 0)
+                self._creating -= num
+        if created < num:
+            logger.error("%s: only %s/%s runners created", loop_name, created, num)
+        with self._state_lock.hold(site):
+            if created:
+                self._create_backoff.record_success(time.monotonic())
                 return
-            actually_created = len(created_ids)
-            if actually_created < to_create:
-                logger.error(
-                    "Create loop: only %s/%s runners created",
-                    actually_created,
-                    to_create,
-                )
-            self._runner_count = current_total + actually_created
-            if actually_created == 0:
-                self._create_paused = True
-                logger.warning("Create loop: pausing until next reconcile after zero-create")
+            failure = failure or CreationFailure.TRANSIENT
+            delay = self._create_backoff.record_failure(failure, time.monotonic())
+        if math.isinf(delay):
+            logger.warning(
+                "%s: stopping creation until next reconcile after %s failure",
+                loop_name,
+                failure.value,
+            )
+            return
+        logger.warning(
+            "%s: pausing creation for %.1f seconds after %s failure",
+            loop_name,
+            delay,
+            failure.value,
+        )
+        self._schedule_creation_retry(delay)
 
     def _handle_timer_reconcile(self, pressure: int) -> None:
         """Clean up stale runners, sync in-memory count, then scale up or down.
@@ -264,60 +698,75 @@ class PressureReconciler:  # pylint: disable=too-few-public-methods,too-many-ins
         from get_runners(), creates runners if current falls below desired,
         and soft-deletes idle runners if current exceeds desired.
 
+        The shared lock serializes the reconcile with flushes. The in-memory
+        state is only touched under the state lock, so the create loop keeps
+        running during the slow cleanup and listing. Runners created but not
+        listed yet are counted through the manager's pending creations. While
+        the create loop is creating runners, the count is not synced and no
+        runners are scaled down, as the listing may not include them yet.
+
         Args:
             pressure: Current pressure value used to compute desired total.
         """
-        desired_total = self._desired_total_from_pressure(pressure)
+        desired_total = self._desired_total_from_pressure(self._forecast_pressure(pressure))
         runner_list: tuple[RunnerInstance, ...] = ()
-        with self._lock:
+        with self._lock.hold(RECONCILE_LOOP_SITE):
             start_timestamp = time.time()
             try:
                 self._manager.cleanup()
                 runner_list = self._manager.get_runners()
-                current_total = len(runner_list)
-                self._runner_count = current_total
-                if self._create_paused:
-                    logger.info("Reconcile loop: unpausing create loop after state sync")
-                self._create_paused = False
-                if current_total < desired_total:
-                    to_create = desired_total - current_total
+                to_create = 0
+                to_delete = 0
+                with self._state_lock.hold(RECONCILE_LOOP_SITE):
+                    if self._create_backoff.resume_stopped(time.monotonic()):
+                        logger.info("Reconcile loop: retrying creation stopped after failure")
+                    creation_paused = self._create_backoff.is_paused(time.monotonic())
+                    if self._creating:
+                        logger.info(
+                            "Reconcile loop: %s runners being created, skipping count sync"
+                            " and scaling",
+                            self._creating,
+                        )
+                        return
+                    current_total = len(runner_list) + self._manager.pending_creations
+                    self._runner_count = current_total
+                    if current_total < desired_total and not creation_paused:
+                        to_create = desired_total - current_total
+                        self._reserve_creation(to_create)
+                    else:
+                        to_delete = self._scale_down.to_delete(
+                            current_total, desired_total, time.monotonic()
+                        )
+                if to_create:
                     logger.info(
                         "Reconcile loop: scaling up %s runners (desired=%s current=%s)",
                         to_create,
                         desired_total,
                         current_total,
                     )
-                    try:
-                        created_ids = self._manager.create_runners(
-                            num=to_create, metadata=RunnerMetadata()
-                        )
-                    except MissingServerConfigError:
-                        logger.exception(
-                            "Unable to create runners due to missing server configuration"
-                            " (image/flavor)."
-                        )
-                        return
-                    actually_created = len(created_ids)
-                    if actually_created < to_create:
-                        logger.error(
-                            "Reconcile loop: only %s/%s runners created",
-                            actually_created,
-                            to_create,
-                        )
-                    self._runner_count += actually_created
-                    if actually_created == 0:
-                        self._create_paused = True
-                        logger.warning("Reconcile loop: re-pausing create loop after zero-create")
-                elif current_total > desired_total:
-                    to_delete = current_total - desired_total
+                    self._create_reserved(
+                        to_create, loop_name="Reconcile loop", site=RECONCILE_LOOP_SITE
+                    )
+                elif to_delete:
                     logger.info(
                         "Reconcile loop: scaling down %s runners (desired=%s current=%s)",
                         to_delete,
                         desired_total,
                         current_total,
                     )
-                    actually_deleted = self._manager.soft_delete_runners(num=to_delete)
-                    self._runner_count = max(current_total - actually_deleted, 0)
+                    # The runners stay in the count until deleted, so the create loop does
+                    # not replace them while they are being deleted.
+                    actually_deleted = self._manager.soft_delete_runners(
+                        num=to_delete, min_age=self._config.scale_down_min_idle_age
+                    )
+                    with self._state_lock.hold(RECONCILE_LOOP_SITE):
+                        self._runner_count = max(self._runner_count - actually_deleted, 0)
+                elif current_total < desired_total:
+                    logger.warning(
+                        "Reconcile loop: creation paused, not scaling up (desired=%s current=%s)",
+                        desired_total,
+                        current_total,
+                    )
                 else:
                     logger.info(
                         "Reconcile loop: at desired count (desired=%s current=%s)",
@@ -380,6 +829,47 @@ class PressureReconciler:  # pylint: disable=too-few-public-methods,too-many-ins
         except IssueMetricEventError:
             logger.exception("Failed to issue Reconciliation metric")
 
+    def _observe_pressure(self, pressure: int) -> None:
+        """Feed a pressure update to the forecaster and export the forecast error.
+
+        Args:
+            pressure: Pressure value from the planner stream.
+        """
+        if self._forecaster is None:
+            return
+        manager_name = self._manager.manager_name
+        for sample in self._forecaster.observe(time.time(), pressure):
+            PRESSURE_FORECAST_ERROR.labels(manager_name).set(sample.error)
+            PRESSURE_FORECAST_ABSOLUTE_ERROR.labels(manager_name).observe(abs(sample.error))
+
+    def _forecast_pressure(self, pressure: int) -> int:
+        """Raise the pressure to the forecast pressure ahead of predicted ramps.
+
+        The forecast never lowers the pressure, so runners are not deleted on a predicted drop.
+
+        Args:
+            pressure: Current pressure value from planner.
+
+        Returns:
+            The higher of the pressure and the forecast pressure.
+        """
+        if self._forecaster is None:
+            return pressure
+        forecast = self._forecaster.forecast(time.time())
+        if forecast is None:
+            return pressure
+        PRESSURE_FORECAST.labels(self._manager.manager_name).set(forecast)
+        forecast_pressure = math.ceil(forecast)
+        if forecast_pressure <= pressure:
+            return pressure
+        logger.info(
+            "Forecast pressure %s in %ss exceeds pressure %s, scaling ahead",
+            forecast_pressure,
+            self._forecaster.horizon,
+            pressure,
+        )
+        return forecast_pressure
+
     def _desired_total_from_pressure(self, pressure: int) -> int:
         """Compute desired runner total from planner pressure.
 
@@ -402,82 +892,3 @@ class PressureReconciler:  # pylint: disable=too-few-public-methods,too-many-ins
             )
             total = self._config.max_pressure
         return total
-
-
-def build_pressure_reconciler(
-    config: ApplicationConfiguration, manager: RunnerManager, lock: Lock
-) -> PressureReconciler:
-    """Construct a PressureReconciler from application configuration.
-
-    Args:
-        config: Application configuration.
-        manager: The runner manager to use for creating, cleaning up, and listing runners.
-        lock: Shared lock to serialize operations with other reconcile loops.
-
-    Raises:
-        ValueError: If planner configuration is partial (only one of URL/token set).
-
-    Returns:
-        A fully constructed PressureReconciler.
-    """
-    first = config.runner_configuration.combinations[0]
-    planner_client: PlannerClient | None = None
-    has_url = bool(config.planner_url)
-    has_token = bool(config.planner_token)
-    if has_url != has_token:
-        raise ValueError(
-            "Partial planner configuration: both planner_url and planner_token must be set"
-            " or both unset."
-        )
-    if has_url and has_token:
-        planner_client = PlannerClient(
-            PlannerConfiguration(base_url=config.planner_url, token=config.planner_token)
-        )
-    return PressureReconciler(
-        manager=manager,
-        planner_client=planner_client,
-        config=PressureReconcilerConfig(
-            flavor_name=config.name,
-            reconcile_interval=config.reconcile_interval,
-            min_pressure=first.base_virtual_machines,
-            max_pressure=first.max_total_virtual_machines,
-        ),
-        lock=lock,
-    )
-
-
-def build_runner_manager(
-    config: ApplicationConfiguration, combination: RunnerCombination
-) -> RunnerManager:
-    """Build a RunnerManager from application config and a flavor/image combination.
-
-    Args:
-        config: Application configuration.
-        combination: The flavor/image combination to use for OpenStack VMs.
-
-    Returns:
-        A configured RunnerManager instance.
-    """
-    user = UserInfo(getpass.getuser(), grp.getgrgid(os.getgid()).gr_name)
-    return RunnerManager(
-        manager_name=config.name,
-        platform_provider=GitHubRunnerPlatform.build(
-            prefix=config.openstack_configuration.vm_prefix,
-            github_configuration=config.github_config,
-        ),
-        cloud_runner_manager=OpenStackRunnerManager(
-            config=OpenStackRunnerManagerConfig(
-                allow_external_contributor=config.allow_external_contributor,
-                prefix=config.openstack_configuration.vm_prefix,
-                credentials=config.openstack_configuration.credentials,
-                server_config=OpenStackServerConfig(
-                    image=combination.image.name,
-                    flavor=combination.flavor.name,
-                    network=config.openstack_configuration.network,
-                ),
-                service_config=config.service_config,
-            ),
-            user=user,
-        ),
-        labels=list(config.extra_labels) + combination.image.labels + combination.flavor.labels,
-    )
@@ -0,0 +1,217 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Construction of the pressure reconcilers and their runner managers from the configuration."""
+
+import getpass
+import grp
+import os
+import re
+
+from github_runner_manager.configuration import ApplicationConfiguration
+from github_runner_manager.configuration.base import (
+    FAST_BOOT_IMAGE_LABEL,
+    RunnerCombination,
+    UserInfo,
+)
+from github_runner_manager.github_client import GithubClient
+from github_runner_manager.locking import InstrumentedLock
+from github_runner_manager.manager.pressure_reconciler import (
+    PressureReconciler,
+    PressureReconcilerConfig,
+)
+from github_runner_manager.manager.runner_manager import RunnerManager
+from github_runner_manager.openstack_cloud.models import OpenStackServerConfig
+from github_runner_manager.openstack_cloud.openstack_runner_manager import (
+    OpenStackRunnerManager,
+    OpenStackRunnerManagerConfig,
+)
+from github_runner_manager.planner_client import PlannerClient, PlannerConfiguration
+from github_runner_manager.platform.github_provider import GitHubRunnerPlatform
+
+
+def build_pressure_reconcilers(config: ApplicationConfiguration) -> list[PressureReconciler]:
+    """Construct one PressureReconciler per runner combination of the application configuration.
+
+    Each combination has its own runner manager, lock and in-memory state, so the combinations
+    scale independently. The GitHub and planner clients are shared.
+
+    A single combination keeps the name and VM prefix of the application and the planner flavor
+    of the application name, so existing runners and metrics carry over. With several
+    combinations, each is named after its flavor, its VMs use the `<vm_prefix>_<flavor>` prefix
+    and its pressure is requested for its flavor. Depending on the flavor only, the prefix
+    of a combination does not change when the combinations are reordered, added or removed.
+
+    Args:
+        config: Application configuration.
+
+    Raises:
+        ValueError: If two combinations would have the same name or VM prefix.
+
+    Returns:
+        The reconcilers, in the order of the combinations.
+    """
+    planner_client = build_planner_client(config)
+    github_client = GithubClient(config.github_config.auth)
+    vm_prefix = config.openstack_configuration.vm_prefix
+    combinations = config.runner_configuration.combinations
+    reconcilers: list[PressureReconciler] = []
+    prefixes: set[str] = set()
+    for combination in combinations:
+        if len(combinations) == 1:
+            name, prefix, planner_flavor = config.name, vm_prefix, config.name
+        else:
+            name = f"{config.name}-{combination.flavor.name}"
+            prefix = f"{vm_prefix}_{_prefix_safe(combination.flavor.name)}"
+            planner_flavor = combination.flavor.name
+        if prefix in prefixes:
+            raise ValueError(f"Runner combinations must use distinct flavors: {name}")
+        prefixes.add(prefix)
+        manager = build_runner_manager(
+            config, combination, name=name, prefix=prefix, github_client=github_client
+        )
+        reconcilers.append(
+            build_pressure_reconciler(
+                config,
+                combination,
+                manager,
+                InstrumentedLock("shared", name),
+                planner_client,
+                planner_flavor=planner_flavor,
+            )
+        )
+    return reconcilers
+
+
+def _prefix_safe(flavor: str) -> str:
+    """Make a flavor name safe to use in a VM prefix.
+
+    The runners of a prefix are matched by the prefix followed by a hyphen. Replacing the
+    characters other than letters and digits keeps the prefix of a flavor from matching the
+    runners of another flavor starting with the same name, e.g. `small` and `small-arm`.
+
+    Args:
+        flavor: The flavor name.
+
+    Returns:
+        The flavor name with the characters other than letters and digits replaced by `_`.
+    """
+    return re.sub(r"[^A-Za-z0-9]", "_", flavor)
+
+
+def build_planner_client(config: ApplicationConfiguration) -> PlannerClient | None:
+    """Construct the planner client from application configuration.
+
+    Args:
+        config: Application configuration.
+
+    Raises:
+        ValueError: If planner configuration is partial (only one of URL/token set).
+
+    Returns:
+        The planner client, or None if no planner is configured.
+    """
+    has_url = bool(config.planner_url)
+    has_token = bool(config.planner_token)
+    if has_url != has_token:
+        raise ValueError(
+            "Partial planner configuration: both planner_url and planner_token must be set"
+            " or both unset."
+        )
+    if not has_url:
+        return None
+    return PlannerClient(
+        PlannerConfiguration(base_url=config.planner_url, token=config.planner_token)
+    )
+
+
+def build_pressure_reconciler(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    config: ApplicationConfiguration,
+    combination: RunnerCombination,
+    manager: RunnerManager,
+    lock: InstrumentedLock,
+    planner_client: PlannerClient | None,
+    planner_flavor: str | None = None,
+) -> PressureReconciler:
+    """Construct a PressureReconciler for a runner combination.
+
+    Args:
+        config: Application configuration.
+        combination: The flavor/image combination to reconcile.
+        manager: The runner manager to use for creating, cleaning up, and listing runners.
+        lock: Lock to serialize the reconcile with flushes of the runner manager.
+        planner_client: Client used to stream pressure updates, None without a planner.
+        planner_flavor: The flavor to request the pressure of from the planner, by default the
+            name of the runner manager.
+
+    Returns:
+        A fully constructed PressureReconciler.
+    """
+    return PressureReconciler(
+        manager=manager,
+        planner_client=planner_client,
+        config=PressureReconcilerConfig(
+            flavor_name=planner_flavor or manager.manager_name,
+            reconcile_interval=config.reconcile_interval,
+            min_pressure=combination.base_virtual_machines,
+            max_pressure=combination.max_total_virtual_machines,
+            forecast_horizon=config.pressure_forecast_horizon,
+            debounce_window=config.pressure_debounce_window,
+            reclaim_interval=config.reclaim_interval,
+            scale_down_min_idle_age=config.scale_down_min_idle_age,
+            scale_down_cooldown=config.scale_down_cooldown,
+            scale_down_window=config.scale_down_window,
+        ),
+        lock=lock,
+    )
+
+
+def build_runner_manager(
+    config: ApplicationConfiguration,
+    combination: RunnerCombination,
+    *,
+    name: str,
+    prefix: str,
+    github_client: GithubClient,
+) -> RunnerManager:
+    """Build a RunnerManager from application config and a flavor/image combination.
+
+    Args:
+        config: Application configuration.
+        combination: The flavor/image combination to use for OpenStack VMs.
+        name: Name of the runner manager, used for metrics.
+        prefix: Prefix of the names of the VMs and runners of the manager.
+        github_client: GitHub client shared between the runner managers.
+
+    Returns:
+        A configured RunnerManager instance.
+    """
+    user = UserInfo(getpass.getuser(), grp.getgrgid(os.getgid()).gr_name)
+    return RunnerManager(
+        manager_name=name,
+        platform_provider=GitHubRunnerPlatform(
+            prefix=prefix,
+            path=config.github_config.path,
+            github_client=github_client,
+        ),
+        cloud_runner_manager=OpenStackRunnerManager(
+            config=OpenStackRunnerManagerConfig(
+                allow_external_contributor=config.allow_external_contributor,
+                prefix=prefix,
+                credentials=config.openstack_configuration.credentials,
+                server_config=OpenStackServerConfig(
+                    image=combination.image.name,
+                    flavor=combination.flavor.name,
+                    network=config.openstack_configuration.network,
+                ),
+                service_config=config.service_config,
+                boot_profile=combination.image.boot_profile,
+            ),
+            user=user,
+        ),
+        # The fast boot tag selects the boot profile of the image, it is not a runner label.
+        labels=list(config.extra_labels)
+        + [label for label in combination.image.labels if label != FAST_BOOT_IMAGE_LABEL]
+        + combination.flavor.labels,
+        scale_down_policy=config.scale_down_policy,
+    )
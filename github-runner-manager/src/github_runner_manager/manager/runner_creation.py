@@ -0,0 +1,298 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Spawning of the runners of a creation batch, with the classification of the failures.
+
+The creation of a runner failing with a transient error is retried within the batch after a
+jittered backoff, so a batch is not left short by a few transient failures. The failures over the
+quota or due to the configuration are not retried, as they would fail again.
+"""
+
+import dataclasses
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing.pool import ThreadPool
+from typing import Callable, Sequence
+
+from github_runner_manager.concurrency import Backend, get_limiter
+from github_runner_manager.errors import MissingServerConfigError, RunnerError, RunnerQuotaError
+from github_runner_manager.manager.models import InstanceID, RunnerIdentity, RunnerMetadata
+from github_runner_manager.manager.vm_manager import CloudRunnerManager
+from github_runner_manager.metrics import creation as creation_metrics
+from github_runner_manager.metrics.creation import CreationTimings
+from github_runner_manager.platform.platform_provider import PlatformApiError, PlatformProvider
+from github_runner_manager.utilities import ExponentialBackoff
+
+logger = logging.getLogger(__name__)
+
+# Attempts to create a runner within a batch.
+CREATE_ATTEMPTS = 3
+# Jittered exponential backoff in seconds between the attempts to create a runner.
+CREATE_RETRY_BACKOFF_BASE = 2
+CREATE_RETRY_BACKOFF_CAP = 10
+
+
+class CreationFailure(str, Enum):
+    """Class of the failure of a runner creation, from the least to the most severe.
+
+    Attributes:
+        TRANSIENT: The cloud or the platform failed, e.g. a Nova error or timeout.
+        QUOTA: The quota of the cloud is exhausted.
+        CONFIG: The configuration does not allow creating runners, e.g. no image.
+    """
+
+    TRANSIENT = "transient"
+    QUOTA = "quota"
+    CONFIG = "config"
+
+
+_SEVERITY = tuple(CreationFailure)
+
+
+@dataclass(frozen=True)
+class CreationResult:
+    """Result of the creation of a batch of runners.
+
+    Attributes:
+        instance_ids: The instance IDs of the runners created.
+        failure: The most severe failure of the runners not created, None if all were created.
+    """
+
+    instance_ids: tuple[InstanceID, ...]
+    failure: CreationFailure | None = None
+
+
+def classify_creation_error(error: Exception) -> CreationFailure:
+    """Classify the error of a runner creation.
+
+    Args:
+        error: The error raised by the creation.
+
+    Returns:
+        The class of the failure.
+    """
+    if isinstance(error, MissingServerConfigError):
+        return CreationFailure.CONFIG
+    if isinstance(error, RunnerQuotaError):
+        return CreationFailure.QUOTA
+    return CreationFailure.TRANSIENT
+
+
+def is_retryable(error: Exception) -> bool:
+    """Check whether the creation of a runner can be retried after an error.
+
+    Args:
+        error: The error raised by the creation.
+
+    Returns:
+        Whether the error is transient.
+    """
+    return classify_creation_error(error) == CreationFailure.TRANSIENT
+
+
+def most_severe(failures: Sequence[CreationFailure]) -> CreationFailure | None:
+    """Get the most severe of failures.
+
+    Args:
+        failures: The failures.
+
+    Returns:
+        The most severe failure, None if there is no failure.
+    """
+    return max(failures, key=_SEVERITY.index, default=None)
+
+
+@dataclass
+class CreateRunnerArgs:  # pylint: disable=too-many-instance-attributes
+    """Arguments for the create_runner function.
+
+    The creation threads fill in the timings and attempts, read by the caller once the batch is
+    done.
+
+    Attrs:
+        cloud_runner_manager: For managing the cloud instance of the runner.
+        platform_provider: To manage self-hosted runner on the Platform side.
+        instance_id: Instance ID of the runner to create.
+        metadata: Metadata for the runner to create.
+        labels: List of labels to add to the runners.
+        timings: Durations of the phases of the creation, filled by create_runner.
+        attempts: Number of attempts to create the runner, filled by create_runner_with_retries.
+        renew_reservation: Called with the previous and the new instance ID when an attempt is
+            retried under a new instance ID.
+    """
+
+    cloud_runner_manager: CloudRunnerManager
+    platform_provider: PlatformProvider
+    instance_id: InstanceID
+    metadata: RunnerMetadata
+    labels: list[str]
+    timings: CreationTimings = dataclasses.field(default_factory=CreationTimings)
+    attempts: int = 0
+    renew_reservation: Callable[[InstanceID, InstanceID], None] | None = None
+
+
+def spawn_runners(create_runner_args_sequence: Sequence[CreateRunnerArgs]) -> CreationResult:
+    """Spawn runners in parallel using a thread pool.
+
+    The thread pool is only used if there are more than one runner to spawn.
+
+    The length of the create_runner_args is number create_runner invocation, and therefore the
+    number of runner spawned.
+
+    Args:
+        create_runner_args_sequence: Sequence of args for invoking create_runner.
+
+    Returns:
+        The instance IDs of the runners spawned and the most severe failure.
+    """
+    num = len(create_runner_args_sequence)
+
+    if num == 1:
+        try:
+            return CreationResult(
+                instance_ids=(create_runner_with_retries(create_runner_args_sequence[0]),)
+            )
+        except (RunnerError, PlatformApiError) as exc:
+            logger.exception("Failed to spawn a runner.")
+            return CreationResult(instance_ids=(), failure=classify_creation_error(exc))
+
+    return _spawn_runners_in_threads(create_runner_args_sequence, num)
+
+
+def _spawn_runners_in_threads(
+    create_runner_args_sequence: Sequence[CreateRunnerArgs], num: int
+) -> CreationResult:
+    """Parallel spawn of runners in a thread pool.
+
+    The runners are created in threads rather than processes, as create_runner fills in the
+    arguments in place for the caller.
+
+    The length of the create_runner_args is number create_runner invocation, and therefore the
+    number of runner spawned.
+
+    Args:
+        create_runner_args_sequence: Sequence of args for invoking create_runner.
+        num: The number of runners to spawn.
+
+    Returns:
+        The instance IDs of the runners spawned and the most severe failure.
+    """
+    instance_id_list = []
+    failures = []
+    # The creations within the pool are bounded by the adaptive limits of the backends.
+    with ThreadPool(processes=get_limiter(Backend.NOVA).workers(num)) as pool:
+        jobs = pool.imap_unordered(
+            func=create_runner_with_retries, iterable=create_runner_args_sequence
+        )
+        for _ in range(num):
+            try:
+                instance_id = next(jobs)
+            except (RunnerError, PlatformApiError) as exc:
+                logger.exception("Failed to spawn a runner.")
+                failures.append(classify_creation_error(exc))
+            except StopIteration:
+                break
+            else:
+                instance_id_list.append(instance_id)
+    return CreationResult(instance_ids=tuple(instance_id_list), failure=most_severe(failures))
+
+
+def create_runner_with_retries(args: CreateRunnerArgs) -> InstanceID:
+    """Create a single runner, retrying the transient failures.
+
+    Each attempt registers a new runner on the platform, as the registration of a failed attempt
+    is deleted. Each retry uses a new instance ID, as the server of a failed attempt may still
+    be created or deleted in the cloud, and is left to the cleanup.
+
+    Args:
+        args: The arguments.
+
+    Returns:
+        The instance ID of the runner created, by the last attempt.
+
+    Raises:
+        RunnerError: On error creating OpenStack runner on the last attempt, or not retryable.
+        PlatformApiError: On error registering the runner on the last attempt.
+    """
+    backoff = ExponentialBackoff(base=CREATE_RETRY_BACKOFF_BASE, cap=CREATE_RETRY_BACKOFF_CAP)
+    runner_id = args.metadata.runner_id
+    while True:
+        args.attempts += 1
+        args.metadata.runner_id = runner_id
+        try:
+            return create_runner(args)
+        except (RunnerError, PlatformApiError) as exc:
+            if args.attempts >= CREATE_ATTEMPTS or not is_retryable(exc):
+                raise
+            delay = backoff.next_delay()
+            logger.warning(
+                "Retrying the creation of runner %s in %.1f seconds after attempt %s failed: %s",
+                args.instance_id,
+                delay,
+                args.attempts,
+                exc,
+            )
+            time.sleep(delay)
+            previous = args.instance_id
+            args.instance_id = InstanceID.build(previous.prefix)
+            if args.renew_reservation is not None:
+                args.renew_reservation(previous, args.instance_id)
+
+
+def create_runner(args: CreateRunnerArgs) -> InstanceID:
+    """Create a single runner.
+
+    This is a function for usage with a ThreadPool.
+
+    Args:
+        args: The arguments.
+
+    Returns:
+        The instance ID of the runner created.
+
+    Raises:
+        RunnerError: On error creating OpenStack runner.
+    """
+    instance_id = args.instance_id
+    with creation_metrics.record_creation(args.timings):
+        runner_context, runner_info = args.platform_provider.get_runner_context(
+            instance_id=instance_id, metadata=args.metadata, labels=args.labels
+        )
+
+        # Update the runner id if necessary
+        if not args.metadata.runner_id:
+            args.metadata.runner_id = str(runner_info.id)
+
+        runner_identity = RunnerIdentity(instance_id=instance_id, metadata=args.metadata)
+        try:
+            args.cloud_runner_manager.create_runner(
+                runner_identity=runner_identity,
+                runner_context=runner_context,
+            )
+        except RunnerError:
+            _delete_registration(args)
+            raise
+    return instance_id
+
+
+def _delete_registration(args: CreateRunnerArgs) -> None:
+    """Delete the platform registration of a runner whose creation failed.
+
+    A registration not deleted is cleaned up as a dangling runner by the next cleanup, so a
+    failure to delete it is not raised over the creation error.
+
+    Args:
+        args: The arguments of the creation.
+    """
+    logger.warning("Deleting runner %s from platform after creation failed", args.instance_id)
+    try:
+        deleted = args.platform_provider.delete_runners(runner_ids=[args.metadata.runner_id])
+    except PlatformApiError:
+        logger.exception("Failed to delete runner %s from platform", args.instance_id)
+        return
+    if args.metadata.runner_id not in deleted:
+        logger.warning(
+            "Runner %s not deleted from platform, left to the cleanup", args.instance_id
+        )
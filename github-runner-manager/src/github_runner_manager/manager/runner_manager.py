@@ -4,17 +4,33 @@
 """Module for managing the GitHub self-hosted runners hosted on cloud instances."""
 
 import copy
+import dataclasses
 import logging
+import math
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
-from multiprocessing.pool import ThreadPool as Pool
-from typing import Iterator, Sequence, Type
+from threading import Lock
+from typing import Iterable, Iterator, Sequence, Type
 
 from github_runner_manager import constants
-from github_runner_manager.errors import GithubMetricsError, RunnerError
-from github_runner_manager.manager.models import InstanceID, RunnerIdentity, RunnerMetadata
+from github_runner_manager.configuration import ScaleDownPolicy
+from github_runner_manager.errors import GithubMetricsError
+from github_runner_manager.manager.models import InstanceID, RunnerMetadata
+from github_runner_manager.manager.runner_creation import (
+    CreateRunnerArgs,
+    CreationFailure,
+    CreationResult,
+    spawn_runners,
+)
+from github_runner_manager.manager.runner_snapshot import RunnerSnapshot, RunnerSnapshotCache
+from github_runner_manager.manager.scale_down import (
+    MIN_IDLE_AGE_CAUSE,
+    exclude_young_runners,
+    order_scale_down_candidates,
+)
 from github_runner_manager.manager.vm_manager import VM, CloudRunnerManager, HealthState, VMState
+from github_runner_manager.metrics import creation as creation_metrics
 from github_runner_manager.metrics import events as metric_events
 from github_runner_manager.metrics import github as github_metrics
 from github_runner_manager.metrics import reconcile as reconcile_metrics
@@ -22,7 +38,6 @@ from github_runner_manager.metrics import runner as runner_metrics
 from github_runner_manager.metrics.runner import RunnerMetrics
 from github_runner_manager.openstack_cloud.constants import CREATE_SERVER_TIMEOUT
 from github_runner_manager.platform.platform_provider import (
-    PlatformApiError,
     PlatformProvider,
     PlatformRunnerHealth,
     PlatformRunnerState,
@@ -41,8 +56,30 @@ RUNNER_CREATION_WAITING_TIMES = (60, 60, 120, 240, 480)
 # times in creation plus an extra buffer.
 RUNNER_MAXIMUM_CREATION_TIME = CREATE_SERVER_TIMEOUT + sum(RUNNER_CREATION_WAITING_TIMES) + 120
 
+# Seconds a created runner is reserved while waiting to be listed in the cloud. The reservation
+# is released earlier once the VM is listed.
+RESERVATION_TIMEOUT = 10 * 60
+
 IssuedMetricEventsStats = dict[Type[metric_events.Event], int]
 
+# States of the VMs not counted as runners between reconciles. The VMs in error are counted until
+# cleaned up, so the VMs failing to boot are not replaced in a loop.
+_NOT_RUNNER_VM_STATES = (VMState.STOPPED, VMState.DELETED)
+
+
+@dataclass(frozen=True)
+class ReclaimResult:
+    """Result of the reclamation of the VMs of finished runners.
+
+    Attributes:
+        reclaimed: Number of VMs deleted.
+        runner_count: Number of runners counted from the same listing of the VMs: the VMs not
+            finished, and the runners being created.
+    """
+
+    reclaimed: int
+    runner_count: int
+
 
 @dataclass(frozen=True)
 class RunnerInfo:
@@ -64,6 +101,45 @@ class RunnerInfo:
     runners: tuple[str, ...]
     busy_runners: tuple[str, ...]
 
+    @classmethod
+    def from_runners(cls, runner_list: Sequence["RunnerInstance"]) -> "RunnerInfo":
+        """Aggregate the information on a list of runners.
+
+        Args:
+            runner_list: The runners to aggregate.
+
+        Returns:
+            Aggregated runner counts and names.
+        """
+        online = 0
+        busy = 0
+        offline = 0
+        unknown = 0
+        online_runners: list[str] = []
+        busy_runners: list[str] = []
+        for runner in runner_list:
+            match runner.platform_state:
+                case PlatformRunnerState.BUSY:
+                    online += 1
+                    online_runners.append(runner.name)
+                    busy += 1
+                    busy_runners.append(runner.name)
+                case PlatformRunnerState.IDLE:
+                    online += 1
+                    online_runners.append(runner.name)
+                case PlatformRunnerState.OFFLINE:
+                    offline += 1
+                case _:
+                    unknown += 1
+        return cls(
+            online=online,
+            busy=busy,
+            offline=offline,
+            unknown=unknown,
+            runners=tuple(online_runners),
+            busy_runners=tuple(busy_runners),
+        )
+
 
 class FlushMode(Enum):
     """Strategy for flushing runners.
@@ -138,12 +214,13 @@ class RunnerInstance:
         )
 
 
-class RunnerManager:
+class RunnerManager:  # pylint: disable=too-many-instance-attributes
     """Manage the runners.
 
     Attributes:
         manager_name: A name to identify this manager.
         name_prefix: The name prefix of the runners.
+        pending_creations: Number of runners being created or not listed in the cloud yet.
     """
 
     def __init__(
@@ -152,6 +229,7 @@ class RunnerManager:
         platform_provider: PlatformProvider,
         cloud_runner_manager: CloudRunnerManager,
         labels: list[str],
+        scale_down_policy: ScaleDownPolicy = ScaleDownPolicy.BOOT_PROGRESS,
     ):
         """Construct the object.
 
@@ -160,14 +238,20 @@ class RunnerManager:
             platform_provider: Platform provider.
             cloud_runner_manager: For managing the cloud instance of the runner.
             labels: Labels for the runners created.
+            scale_down_policy: Order of the idle runners to scale down.
         """
         self.manager_name = manager_name
         self._cloud = cloud_runner_manager
         self.name_prefix = self._cloud.name_prefix
         self._platform: PlatformProvider = platform_provider
         self._labels = labels
+        self._scale_down_policy = scale_down_policy
+        self._snapshots = RunnerSnapshotCache(fetch=self._list_runners)
+        self._reservations_lock = Lock()
+        # Instances being created, or created but not listed in the cloud yet, by expiry time.
+        self._reservations: dict[InstanceID, float] = {}
 
-    def create_runners(self, num: int, metadata: RunnerMetadata) -> tuple[InstanceID, ...]:
+    def create_runners(self, num: int, metadata: RunnerMetadata) -> CreationResult:
         """Create runners.
 
         Args:
@@ -175,98 +259,92 @@ class RunnerManager:
             metadata: Metadata information for the runner.
 
         Returns:
-            List of instance ID of the runners.
+            The instance IDs of the runners created, and the most severe failure of the others.
         """
+        if (headroom := self._cloud.get_creation_headroom()) is not None:
+            reconcile_metrics.QUOTA_HEADROOM.labels(self.manager_name).set(headroom)
+            if num > headroom:
+                logger.warning(
+                    "Creating %s runners instead of %s, capped by the cloud quota", headroom, num
+                )
+                num = headroom
+                if num <= 0:
+                    return CreationResult(instance_ids=(), failure=CreationFailure.QUOTA)
+        if num <= 0:
+            return CreationResult(instance_ids=())
         logger.info("Creating %s runners", num)
 
         labels = list(self._labels)
         # This labels are added by default by the github agent, but with JIT tokens
         # we have to add them manually.
         labels += constants.GITHUB_DEFAULT_LABELS
+        instance_ids = [InstanceID.build(self._cloud.name_prefix) for _ in range(num)]
         create_runner_args = [
-            RunnerManager._CreateRunnerArgs(
+            CreateRunnerArgs(
                 cloud_runner_manager=self._cloud,
                 platform_provider=self._platform,
+                instance_id=instance_id,
                 # The metadata may be manipulated when creating the runner, as the platform may
                 # assign for example the id of the runner if it was not provided.
                 metadata=copy.copy(metadata),
                 labels=labels,
+                renew_reservation=self._renew_reservation,
             )
-            for _ in range(num)
+            for instance_id in instance_ids
         ]
-        return RunnerManager._spawn_runners(create_runner_args)
-
-    @staticmethod
-    def _spawn_runners(
-        create_runner_args_sequence: Sequence["RunnerManager._CreateRunnerArgs"],
-    ) -> tuple[InstanceID, ...]:
-        """Spawn runners in parallel using multiprocessing.
-
-        Multiprocessing is only used if there are more than one runner to spawn.
-
-        The length of the create_runner_args is number _create_runner invocation, and therefore the
-        number of runner spawned.
-
-        Args:
-            create_runner_args_sequence: Sequence of args for invoking _create_runner method.
-
-        Returns:
-            A tuple of instance ID's of runners spawned.
-        """
-        num = len(create_runner_args_sequence)
-
-        if num == 1:
-            try:
-                return (RunnerManager._create_runner(create_runner_args_sequence[0]),)
-            except (RunnerError, PlatformApiError):
-                logger.exception("Failed to spawn a runner.")
-                return tuple()
-
-        return RunnerManager._spawn_runners_using_multiprocessing(create_runner_args_sequence, num)
-
-    @staticmethod
-    def _spawn_runners_using_multiprocessing(
-        create_runner_args_sequence: Sequence["RunnerManager._CreateRunnerArgs"], num: int
-    ) -> tuple[InstanceID, ...]:
-        """Parallel spawn of runners.
+        # Reserve the instances so cleanups running concurrently do not delete their platform
+        # runners before the VMs are listed, and so they are counted until listed.
+        with self._reservations_lock:
+            self._reservations.update((instance_id, math.inf) for instance_id in instance_ids)
+        result = CreationResult(instance_ids=())
+        start = time.perf_counter()
+        try:
+            result = spawn_runners(create_runner_args)
+        finally:
+            logger.info(
+                "Created %s of %s runners in %.1f seconds, phases: %s",
+                len(result.instance_ids),
+                num,
+                time.perf_counter() - start,
+                creation_metrics.observe_batch(
+                    self.manager_name, [args.timings for args in create_runner_args]
+                ),
+            )
+            creation_metrics.observe_attempts(
+                self.manager_name,
+                [
+                    args.attempts
+                    for args in create_runner_args
+                    if args.instance_id in result.instance_ids
+                ],
+            )
+            expiry = time.monotonic() + RESERVATION_TIMEOUT
+            with self._reservations_lock:
+                for instance_id in (args.instance_id for args in create_runner_args):
+                    if instance_id in result.instance_ids and instance_id in self._reservations:
+                        self._reservations[instance_id] = expiry
+                    else:
+                        self._reservations.pop(instance_id, None)
+        return result
 
-        The length of the create_runner_args is number _create_runner invocation, and therefore the
-        number of runner spawned.
+    def get_runners(self) -> tuple[RunnerInstance, ...]:
+        """Get runners with health information.
 
-        Args:
-            create_runner_args_sequence: Sequence of args for invoking _create_runner method.
-            num: The number of runners to spawn.
+        The listing is published as the latest runner snapshot.
 
         Returns:
-            A tuple of instance ID's of runners spawned.
+            Information on the runners.
         """
-        instance_id_list = []
-        with Pool(processes=min(num, 30)) as pool:
-            jobs = pool.imap_unordered(
-                func=RunnerManager._create_runner, iterable=create_runner_args_sequence
-            )
-            for _ in range(num):
-                try:
-                    instance_id = next(jobs)
-                except (RunnerError, PlatformApiError):
-                    logger.exception("Failed to spawn a runner.")
-                except StopIteration:
-                    break
-                else:
-                    instance_id_list.append(instance_id)
-        return tuple(instance_id_list)
+        return self._snapshots.refresh().runners
 
-    def get_runners(self) -> tuple[RunnerInstance, ...]:
-        """Get runners with health information.
+    def _list_runners(self) -> tuple[RunnerInstance, ...]:
+        """List runners with health information from the cloud and the platform.
 
         Returns:
             Information on the runners.
         """
         logger.debug("runner_manager::get_runners")
-        vms = self._cloud.get_vms()
-        logger.info("list vms response: %s", vms)
-        runners_health_response = self._platform.get_runners_health(vms)
-        logger.info("runner health response %s", runners_health_response)
+        vms, runners_health_response = self._get_vms_and_health()
         runners_health = runners_health_response.requested_runners
         health_runners_map = {runner.identity.instance_id: runner for runner in runners_health}
         return tuple(
@@ -277,41 +355,95 @@ class RunnerManager:
             for vm in vms
         )
 
+    def _get_vms_and_health(self) -> tuple[Sequence[VM], RunnersHealthResponse]:
+        """List the VMs and the health of their runners on the platform.
+
+        Reservations of the VMs listed are released, as the VMs are now counted in the listing.
+        Platform runners of reserved instances are left out of the non-requested runners, so
+        that runners still being created are not cleaned up as dangling.
+
+        Returns:
+            The VMs and the health of the runners.
+        """
+        vms = self._cloud.get_vms()
+        logger.info("VMs: %s", vms)
+        self._release_reservations(vm.instance_id for vm in vms)
+        delete_progress = self._cloud.pop_delete_progress()
+        reconcile_metrics.PENDING_DELETE_VMS.labels(self.manager_name).set(delete_progress.pending)
+        for latency in delete_progress.completion_latencies:
+            reconcile_metrics.DELETE_VM_COMPLETION_SECONDS.labels(self.manager_name).observe(
+                latency
+            )
+        runners_health_response = self._platform.get_runners_health(requested_runners=vms)
+        logger.info("Runner health: %s", runners_health_response)
+        with self._reservations_lock:
+            reserved = set(self._reservations)
+        if reserved:
+            runners_health_response = dataclasses.replace(
+                runners_health_response,
+                non_requested_runners=[
+                    runner
+                    for runner in runners_health_response.non_requested_runners
+                    if runner.instance_id not in reserved
+                ],
+            )
+        return vms, runners_health_response
+
+    @property
+    def pending_creations(self) -> int:
+        """Number of runners being created or created but not listed in the cloud yet."""
+        with self._reservations_lock:
+            now = time.monotonic()
+            expired = [
+                instance_id for instance_id, expiry in self._reservations.items() if expiry <= now
+            ]
+            for instance_id in expired:
+                del self._reservations[instance_id]
+            return len(self._reservations)
+
+    def _renew_reservation(self, previous: InstanceID, instance_id: InstanceID) -> None:
+        """Move the reservation of a runner being created to its new instance ID.
+
+        Args:
+            previous: The instance ID of the failed attempt.
+            instance_id: The instance ID of the next attempt.
+        """
+        with self._reservations_lock:
+            self._reservations.pop(previous, None)
+            self._reservations[instance_id] = math.inf
+
+    def _release_reservations(self, instance_ids: Iterable[InstanceID]) -> None:
+        """Release the reservations of instances.
+
+        Args:
+            instance_ids: The instances to release.
+        """
+        with self._reservations_lock:
+            for instance_id in instance_ids:
+                self._reservations.pop(instance_id, None)
+
     def get_runner_info(self) -> RunnerInfo:
         """Get aggregated information on the runners.
 
         Returns:
             Aggregated runner counts and names.
         """
-        runner_list = self.get_runners()
-        online = 0
-        busy = 0
-        offline = 0
-        unknown = 0
-        online_runners: list[str] = []
-        busy_runners: list[str] = []
-        for runner in runner_list:
-            match runner.platform_state:
-                case PlatformRunnerState.BUSY:
-                    online += 1
-                    online_runners.append(runner.name)
-                    busy += 1
-                    busy_runners.append(runner.name)
-                case PlatformRunnerState.IDLE:
-                    online += 1
-                    online_runners.append(runner.name)
-                case PlatformRunnerState.OFFLINE:
-                    offline += 1
-                case _:
-                    unknown += 1
-        return RunnerInfo(
-            online=online,
-            busy=busy,
-            offline=offline,
-            unknown=unknown,
-            runners=tuple(online_runners),
-            busy_runners=tuple(busy_runners),
-        )
+        return RunnerInfo.from_runners(self.get_runners())
+
+    def get_runners_snapshot(self, max_age: float | None = None) -> RunnerSnapshot:
+        """Get the runners from the snapshot of the last listing.
+
+        The snapshot is refreshed whenever the runners are listed, e.g. by the reconcile loop. A
+        live listing is only done if the snapshot is older than `max_age`, and concurrent live
+        listings are coalesced.
+
+        Args:
+            max_age: Maximum age in seconds of the snapshot. None accepts any snapshot.
+
+        Returns:
+            The snapshot of the runners.
+        """
+        return self._snapshots.get(max_age=max_age)
 
     def delete_runners(self, num: int) -> IssuedMetricEventsStats:
         """Delete up to `num` runners, preferring idle ones over busy.
@@ -330,36 +462,39 @@ class RunnerManager:
         _, extracted_metrics = self._delete_runners_core(num=num, soft=False)
         return self._issue_runner_metrics(metrics=iter(extracted_metrics))
 
-    def soft_delete_runners(self, num: int) -> int:
+    def soft_delete_runners(self, num: int, min_age: float = 0.0) -> int:
         """Delete up to `num` idle runners, never targeting busy ones.
 
         Args:
             num: The maximum number of runners to delete.
+            min_age: Seconds the VM of an idle runner must be older than to be deleted, so the
+                runners just booted are not deleted. The runners are single use, so an idle
+                runner has been idle for at most the age of its VM.
 
         Returns:
             The number of VMs actually deleted.
         """
-        deleted_vms, extracted_metrics = self._delete_runners_core(num=num, soft=True)
+        deleted_vms, extracted_metrics = self._delete_runners_core(
+            num=num, soft=True, min_age=min_age
+        )
         self._issue_runner_metrics(metrics=iter(extracted_metrics))
         return len(deleted_vms)
 
     def _delete_runners_core(
-        self, num: int, soft: bool
+        self, num: int, soft: bool, min_age: float = 0.0
     ) -> tuple[list[InstanceID], list[RunnerMetrics]]:
         """Core deletion logic shared by delete_runners and soft_delete_runners.
 
         Args:
             num: The maximum number of runners to delete.
             soft: When True, exclude busy runners from the scale-down pool.
+            min_age: Seconds the VM of an online runner must be older than to be scaled down.
 
         Returns:
             Tuple of (deleted VM instance IDs, extracted runner metrics).
         """
         logger.info("runner_manager::delete_runners Deleting %s runners (soft=%s)", num, soft)
-        vms = self._cloud.get_vms()
-        logger.info("VMs: %s", vms)
-        runners_health_response = self._platform.get_runners_health(requested_runners=vms)
-        logger.info("Runner health: %s", runners_health_response)
+        vms, runners_health_response = self._get_vms_and_health()
 
         platform_runner_ids_to_cleanup = _get_platform_runners_to_cleanup(
             runners=runners_health_response, vms=vms
@@ -371,11 +506,12 @@ class RunnerManager:
             if runner.identity.metadata.runner_id
             and runner.identity.metadata.runner_id not in platform_runner_ids_to_cleanup
         ]
-        num_runners_to_scale_down = max(num - len(platform_runner_ids_to_cleanup), 0)
-        platform_runner_ids_to_scaledown = _get_platform_runners_to_scale_down(
+        platform_runner_ids_to_scaledown = self._select_runners_to_scale_down(
             runners=runners_not_marked_for_cleanup,
-            num=num_runners_to_scale_down,
+            vms=vms,
+            num=max(num - len(platform_runner_ids_to_cleanup), 0),
             soft=soft,
+            min_age=min_age,
         )
         logger.info("Runners to scale down: %s", platform_runner_ids_to_scaledown)
         platform_runner_ids_to_delete = list(
@@ -404,6 +540,42 @@ class RunnerManager:
 
         return deleted_vms, extracted_metrics
 
+    def _select_runners_to_scale_down(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        runners: Sequence[PlatformRunnerHealth],
+        vms: Sequence[VM],
+        num: int,
+        soft: bool,
+        min_age: float,
+    ) -> set[str]:
+        """Select the runners to scale down, counting the runners kept as their VM is too young.
+
+        Args:
+            runners: pool of runners to select to scale down.
+            vms: cloud VM state.
+            num: number of runners to scale down by.
+            soft: When True, exclude busy runners from the candidate pool.
+            min_age: Seconds the VM of an online runner must be older than.
+
+        Returns:
+            The runner IDs to scale down.
+        """
+        old_enough_runners = exclude_young_runners(runners, vms, min_age)
+        selected = _get_platform_runners_to_scale_down(
+            runners=old_enough_runners, vms=vms, num=num, soft=soft, policy=self._scale_down_policy
+        )
+        if len(old_enough_runners) < len(runners):
+            unrestricted = _get_platform_runners_to_scale_down(
+                runners=runners, vms=vms, num=num, soft=soft, policy=self._scale_down_policy
+            )
+            if (kept := len(unrestricted) - len(selected)) > 0:
+                logger.info("Keeping %s runners with a VM too young to scale down", kept)
+                reconcile_metrics.SCALE_DOWN_AVOIDED_TOTAL.labels(
+                    self.manager_name, MIN_IDLE_AGE_CAUSE
+                ).inc(kept)
+        return selected
+
     def flush_runners(
         self, flush_mode: FlushMode = FlushMode.FLUSH_IDLE
     ) -> IssuedMetricEventsStats:
@@ -416,10 +588,7 @@ class RunnerManager:
             Stats on metrics events issued during the deletion of runners.
         """
         logger.info("runner_manager::flush_runners. mode %s", flush_mode)
-        vms = self._cloud.get_vms()
-        logger.info("VMs: %s", vms)
-        runners_health_response = self._platform.get_runners_health(requested_runners=vms)
-        logger.info("Runner health: %s", runners_health_response)
+        vms, runners_health_response = self._get_vms_and_health()
 
         platform_runner_ids_to_cleanup = _get_platform_runners_to_cleanup(
             runners=runners_health_response, vms=vms
@@ -465,14 +634,12 @@ class RunnerManager:
             Stats on metrics events issued during the cleanup of runners.
         """
         logger.info("runner_manager::cleanup")
-        vms = self._cloud.get_vms()
-        logger.info("VMs: %s", vms)
-        runners_health_response = self._platform.get_runners_health(requested_runners=vms)
-        logger.info("Runner health: %s", runners_health_response)
+        vms, runners_health_response = self._get_vms_and_health()
 
         self._cloud.cleanup()
         platform_runner_ids_to_cleanup = list(
             _get_platform_runners_to_cleanup(runners=runners_health_response, vms=vms)
+            | self._get_stuck_boot_runners(runners=runners_health_response, vms=vms)
         )
         logger.info("Cleaning up platform runners: %s", platform_runner_ids_to_cleanup)
         cleanedup_runner_ids = self._delete_runners(runner_ids=platform_runner_ids_to_cleanup)
@@ -492,6 +659,92 @@ class RunnerManager:
 
         return self._issue_runner_metrics(metrics=iter(extracted_metrics))
 
+    def reclaim_finished_runners(self) -> ReclaimResult:
+        """Delete the VMs powered off after the run of their runner, and issue their metrics.
+
+        This is cheap enough to run between reconciles, so the capacity of the runners that
+        finished is freed right away. Their runners are deregistered by the platform. The
+        runners are counted from the same listing of the VMs, without the platform. Only the VMs
+        powered off by the userdata after the run are deleted, the others are left to the cleanup.
+
+        Returns:
+            The number of VMs deleted and of runners counted.
+        """
+        vms = self._cloud.get_vms()
+        self._release_reservations(vm.instance_id for vm in vms)
+        runner_count = (
+            sum(1 for vm in vms if vm.state not in _NOT_RUNNER_VM_STATES) + self.pending_creations
+        )
+        stopped_vms = [vm for vm in vms if vm.state == VMState.STOPPED]
+        finished_vm_ids = list(self._cloud.check_finished(stopped_vms)) if stopped_vms else []
+        if not finished_vm_ids:
+            return ReclaimResult(reclaimed=0, runner_count=runner_count)
+        logger.info("Extracting metrics from finished VMs: %s", finished_vm_ids)
+        extracted_metrics = self._cloud.extract_metrics(instance_ids=finished_vm_ids)
+        logger.info("Reclaiming finished VMs: %s", finished_vm_ids)
+        reclaimed_vms = self._delete_vms(vm_ids=finished_vm_ids)
+        logger.info("Reclaimed finished VMs: %s", reclaimed_vms)
+        reconcile_metrics.RECLAIMED_VMS_TOTAL.labels(self.manager_name).inc(len(reclaimed_vms))
+        self._issue_runner_metrics(metrics=iter(extracted_metrics))
+        return ReclaimResult(reclaimed=len(reclaimed_vms), runner_count=runner_count)
+
+    def replace_stuck_boots(self) -> int:
+        """Delete the runners whose VM boot is stuck, and their VMs, between the cleanups.
+
+        The boots are checked more often than the cleanups run, so the stuck runners are
+        replaced within the boot stall timeout.
+
+        Returns:
+            The number of VMs deleted.
+        """
+        vms, runners_health_response = self._get_vms_and_health()
+        runner_ids = self._get_stuck_boot_runners(runners=runners_health_response, vms=vms)
+        if not runner_ids:
+            return 0
+        deleted_runner_ids = self._delete_runners(runner_ids=list(runner_ids))
+        vm_ids = [vm.instance_id for vm in vms if vm.metadata.runner_id in deleted_runner_ids]
+        extracted_metrics = self._cloud.extract_metrics(instance_ids=vm_ids)
+        deleted_vms = self._delete_vms(vm_ids=vm_ids)
+        logger.info("Deleted runners with a stuck boot: %s", deleted_vms)
+        self._issue_runner_metrics(metrics=iter(extracted_metrics))
+        return len(deleted_vms)
+
+    def _get_stuck_boot_runners(
+        self, *, runners: RunnersHealthResponse, vms: Sequence[VM]
+    ) -> set[str]:
+        """Determine the runners whose VM boot is stuck, before the maximum creation time.
+
+        Args:
+            runners: platform runners health information.
+            vms: cloud VM state.
+
+        Returns:
+            The runner IDs to delete.
+        """
+        booting_runners = {
+            runner.identity.instance_id: runner.identity.metadata.runner_id
+            for runner in runners.requested_runners
+            if runner.identity.metadata.runner_id and not runner.online and not runner.busy
+        }
+        booting_vms = [
+            vm
+            for vm in vms
+            if vm.instance_id in booting_runners
+            and vm.state in (VMState.CREATED, VMState.ACTIVE)
+            and not vm.is_older_than(RUNNER_MAXIMUM_CREATION_TIME)
+        ]
+        if not booting_vms:
+            return set()
+        failures = self._cloud.check_boots(booting_vms)
+        for cause in failures.values():
+            reconcile_metrics.BOOT_FAILURES_TOTAL.labels(self.manager_name, cause).inc()
+        logger.debug("Stuck boot runners: %s", failures)
+        return {
+            runner_id
+            for instance_id in failures
+            if (runner_id := booting_runners.get(instance_id)) is not None
+        }
+
     def _delete_runners(self, runner_ids: list[str]) -> list[str]:
         """Delete runners from platform.
 
@@ -579,60 +832,6 @@ class RunnerManager:
 
         return total_stats
 
-    @dataclass
-    class _CreateRunnerArgs:
-        """Arguments for the _create_runner function.
-
-        These arguments are used in the forked processes and should be reviewed.
-
-        Attrs:
-            cloud_runner_manager: For managing the cloud instance of the runner.
-            platform_provider: To manage self-hosted runner on the Platform side.
-            metadata: Metadata for the runner to create.
-            labels: List of labels to add to the runners.
-        """
-
-        cloud_runner_manager: CloudRunnerManager
-        platform_provider: PlatformProvider
-        metadata: RunnerMetadata
-        labels: list[str]
-
-    @staticmethod
-    def _create_runner(args: _CreateRunnerArgs) -> InstanceID:
-        """Create a single runner.
-
-        This is a staticmethod for usage with multiprocess.Pool.
-
-        Args:
-            args: The arguments.
-
-        Returns:
-            The instance ID of the runner created.
-
-        Raises:
-            RunnerError: On error creating OpenStack runner.
-        """
-        instance_id = InstanceID.build(args.cloud_runner_manager.name_prefix)
-        runner_context, runner_info = args.platform_provider.get_runner_context(
-            instance_id=instance_id, metadata=args.metadata, labels=args.labels
-        )
-
-        # Update the runner id if necessary
-        if not args.metadata.runner_id:
-            args.metadata.runner_id = str(runner_info.id)
-
-        runner_identity = RunnerIdentity(instance_id=instance_id, metadata=args.metadata)
-        try:
-            args.cloud_runner_manager.create_runner(
-                runner_identity=runner_identity,
-                runner_context=runner_context,
-            )
-        except RunnerError:
-            logger.warning("Deleting runner %s from platform after creation failed", instance_id)
-            args.platform_provider.delete_runners(runner_ids=[args.metadata.runner_id])
-            raise
-        return instance_id
-
 
 def _get_platform_runners_to_cleanup(
     *, runners: RunnersHealthResponse, vms: Sequence[VM]
@@ -732,20 +931,25 @@ def _get_platform_runners_to_flush(
 
 
 def _get_platform_runners_to_scale_down(
-    runners: Sequence[PlatformRunnerHealth], num: int, soft: bool = False
+    *,
+    runners: Sequence[PlatformRunnerHealth],
+    vms: Sequence[VM],
+    num: int,
+    soft: bool = False,
+    policy: ScaleDownPolicy = ScaleDownPolicy.BOOT_PROGRESS,
 ) -> set[str]:
     """Determine the number of runners to scale down.
 
     Args:
         runners: pool of runners to select to scale down.
+        vms: cloud VM state.
         num: number of runners to scale down by.
         soft: When True, exclude busy runners from the candidate pool.
+        policy: Order of the idle runners to scale down.
     """
     candidates = [runner for runner in runners if not runner.busy] if soft else runners
-    # prioritize deletable --> idle --> busy (busy unreachable when soft=True)
-    sorted_runners = sorted(
-        candidates, key=lambda runner: 1 if runner.deletable else 2 if not runner.busy else 3
-    )
+    # prioritize deletable --> idle by policy --> busy (busy unreachable when soft=True)
+    sorted_runners = order_scale_down_candidates(candidates, vms, policy)
     return set(
         runner.identity.metadata.runner_id
         for runner in sorted_runners[:num]
@@ -0,0 +1,130 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Cached snapshot of the runner state.
+
+Listing the runners requires a full OpenStack listing and GitHub pagination. The snapshot keeps
+the latest listing so that read-only callers, e.g. the /runner/check endpoint, do not hit the
+upstream APIs on every request. Concurrent live fetches are coalesced into a single upstream
+call.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from github_runner_manager.manager.runner_manager import RunnerInstance
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RunnerSnapshot:
+    """The runners listed at a point in time.
+
+    Attributes:
+        runners: The runners listed.
+        taken_at: UNIX timestamp of the start of the listing.
+        age: Seconds since the listing.
+    """
+
+    runners: tuple[RunnerInstance, ...]
+    taken_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the listing."""
+        return max(time.time() - self.taken_at, 0.0)
+
+
+class RunnerSnapshotCache:
+    """Keep the latest runner snapshot and coalesce live fetches.
+
+    The snapshot is published by whoever lists the runners, e.g. the reconcile loop. Readers
+    accept the snapshot if it is recent enough, otherwise they fetch it live. Readers arriving
+    while a live fetch is in flight wait for it instead of starting another.
+    """
+
+    def __init__(self, fetch: Callable[[], tuple[RunnerInstance, ...]]):
+        """Construct the object.
+
+        Args:
+            fetch: Lists the runners from the upstream APIs.
+        """
+        self._fetch = fetch
+        self._lock = Lock()
+        self._snapshot: RunnerSnapshot | None = None
+        self._inflight: Future[RunnerSnapshot] | None = None
+
+    def publish(self, runners: tuple[RunnerInstance, ...], taken_at: float) -> RunnerSnapshot:
+        """Publish a fresh listing of the runners.
+
+        The listing is not published if a listing started later was already published.
+
+        Args:
+            runners: The runners listed.
+            taken_at: UNIX timestamp of the start of the listing.
+
+        Returns:
+            The snapshot of the listing.
+        """
+        snapshot = RunnerSnapshot(runners=runners, taken_at=taken_at)
+        with self._lock:
+            # A slow listing finishing after a faster, later one must not replace it.
+            if self._snapshot is None or snapshot.taken_at >= self._snapshot.taken_at:
+                self._snapshot = snapshot
+        return snapshot
+
+    def refresh(self) -> RunnerSnapshot:
+        """List the runners and publish the listing.
+
+        Returns:
+            The snapshot of the listing.
+        """
+        taken_at = time.time()
+        return self.publish(self._fetch(), taken_at)
+
+    def get(self, max_age: float | None = None) -> RunnerSnapshot:
+        """Get a snapshot no older than `max_age`, fetching it live if needed.
+
+        Args:
+            max_age: Maximum age in seconds of the snapshot. None accepts any published
+                snapshot.
+
+        Raises:
+            BaseException: The error of the live fetch, to the caller fetching and to the callers
+                waiting for it.
+
+        Returns:
+            The snapshot.
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and (max_age is None or snapshot.age <= max_age):
+                return snapshot
+            future = self._inflight
+            if future is not None:
+                leader = False
+            else:
+                leader = True
+                future = self._inflight = Future()
+        if not leader:
+            logger.debug("Waiting for the in-flight runner listing")
+            return future.result()
+        try:
+            snapshot = self.refresh()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(snapshot)
+        finally:
+            with self._lock:
+                self._inflight = None
+        return snapshot
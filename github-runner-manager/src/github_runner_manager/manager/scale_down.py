@@ -0,0 +1,185 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Hysteresis of the scale down of the runners.
+
+Deleting the runners as soon as the pressure drops wastes their boot when the pressure goes back
+up a few seconds later, and the create loop boots new runners. The scale down is held off for a
+cooldown after a scale up, and only goes down to the highest desired total seen over a
+stabilization window, so a dip of the pressure does not delete runners.
+
+The runners scaled down are chosen by a policy, by default throwing away the least boot work.
+"""
+
+import logging
+from collections import deque
+from typing import Sequence
+
+from github_runner_manager.configuration import ScaleDownPolicy
+from github_runner_manager.manager.vm_manager import VM, VMState
+from github_runner_manager.metrics.reconcile import SCALE_DOWN_AVOIDED_TOTAL
+from github_runner_manager.platform.platform_provider import PlatformRunnerHealth
+
+logger = logging.getLogger(__name__)
+
+# Causes of the runners kept instead of scaled down in the metrics.
+COOLDOWN_CAUSE = "cooldown"
+WINDOW_CAUSE = "window"
+MIN_IDLE_AGE_CAUSE = "min_idle_age"
+
+
+class ScaleDownHysteresis:
+    """Number of runners to scale down, held off after scale ups and pressure dips.
+
+    Not thread-safe, the callers serialize the calls. The times are monotonic times given by the
+    caller.
+    """
+
+    def __init__(self, flavor: str, cooldown: float, window: float):
+        """Construct the object.
+
+        Args:
+            flavor: The flavor of the runners, to label the metrics.
+            cooldown: Seconds after a scale up without scaling down. 0 disables the cooldown.
+            window: Seconds of desired totals the scale down is stabilized over. 0 disables
+                the stabilization.
+        """
+        self._flavor = flavor
+        self._cooldown = cooldown
+        self._window = window
+        self._last_scale_up: float | None = None
+        self._desired: deque[tuple[float, int]] = deque()
+
+    def observe(self, desired_total: int, now: float) -> None:
+        """Record a desired total of runners.
+
+        Args:
+            desired_total: The desired total.
+            now: The current time.
+        """
+        if self._window <= 0:
+            return
+        self._desired.append((now, desired_total))
+        while self._desired and now - self._desired[0][0] > self._window:
+            self._desired.popleft()
+
+    def record_scale_up(self, now: float) -> None:
+        """Record a scale up, starting the cooldown.
+
+        Args:
+            now: The current time.
+        """
+        self._last_scale_up = now
+
+    def to_delete(self, current_total: int, desired_total: int, now: float) -> int:
+        """Get the number of runners to scale down, counting the runners kept.
+
+        Args:
+            current_total: The current total of runners.
+            desired_total: The desired total of runners.
+            now: The current time.
+
+        Returns:
+            The number of runners to scale down.
+        """
+        excess = current_total - desired_total
+        if excess <= 0:
+            return 0
+        if self._last_scale_up is not None and now - self._last_scale_up < self._cooldown:
+            logger.info(
+                "Keeping %s runners, scaled up %.1f seconds ago",
+                excess,
+                now - self._last_scale_up,
+            )
+            SCALE_DOWN_AVOIDED_TOTAL.labels(self._flavor, COOLDOWN_CAUSE).inc(excess)
+            return 0
+        self.observe(desired_total, now)
+        stabilized_total = max(desired for _, desired in self._desired) if self._desired else 0
+        to_delete = min(excess, max(current_total - stabilized_total, 0))
+        if (kept := excess - to_delete) > 0:
+            logger.info(
+                "Keeping %s runners, %s desired within the last %s seconds",
+                kept,
+                stabilized_total,
+                self._window,
+            )
+            SCALE_DOWN_AVOIDED_TOTAL.labels(self._flavor, WINDOW_CAUSE).inc(kept)
+        return to_delete
+
+
+def order_scale_down_candidates(
+    runners: Sequence[PlatformRunnerHealth], vms: Sequence[VM], policy: ScaleDownPolicy
+) -> list[PlatformRunnerHealth]:
+    """Order the runners to scale down, the first to scale down first.
+
+    The deletable runners come first and the busy runners last. The idle runners in between are
+    ordered by the policy. The VM creation time stands in for the boot progress and the idle time
+    of the runners, as the runners are single use.
+
+    Args:
+        runners: The runners to order.
+        vms: The VMs of the runners.
+        policy: The order of the idle runners.
+
+    Returns:
+        The runners ordered.
+    """
+    vm_instance_id_map = {vm.instance_id: vm for vm in vms}
+
+    def _key(runner: PlatformRunnerHealth) -> tuple[int, int, float]:
+        """Get the sort key of a runner.
+
+        Args:
+            runner: The runner.
+
+        Returns:
+            The sort key.
+        """
+        if runner.deletable:
+            return (0, 0, 0.0)
+        if runner.busy:
+            return (2, 0, 0.0)
+        vm = vm_instance_id_map.get(runner.identity.instance_id)
+        if vm is None:
+            return (1, 0, -float("inf"))
+        created_at = vm.created_at.timestamp()
+        if policy == ScaleDownPolicy.IDLE_LONGEST:
+            return (1, 0, created_at)
+        if vm.state != VMState.ACTIVE:
+            boot_stage = 0
+        else:
+            boot_stage = 2 if runner.online else 1
+        return (1, boot_stage, -created_at)
+
+    return sorted(runners, key=_key)
+
+
+def exclude_young_runners(
+    runners: Sequence[PlatformRunnerHealth], vms: Sequence[VM], min_age: float
+) -> list[PlatformRunnerHealth]:
+    """Exclude the online runners with a VM not older than a minimum age, or not listed.
+
+    The runners not online yet, e.g. with a VM still building, are left to the scale down policy,
+    which deletes them first under boot progress.
+
+    Args:
+        runners: pool of runners to select to scale down.
+        vms: cloud VM state.
+        min_age: Seconds the VM of an online runner must be older than.
+
+    Returns:
+        The runners deletable, not online or old enough.
+    """
+    if min_age <= 0:
+        return list(runners)
+    vm_instance_id_map = {vm.instance_id: vm for vm in vms}
+    return [
+        runner
+        for runner in runners
+        if runner.deletable
+        or not runner.online
+        or (
+            (vm := vm_instance_id_map.get(runner.identity.instance_id)) is not None
+            and vm.is_older_than(min_age)
+        )
+    ]
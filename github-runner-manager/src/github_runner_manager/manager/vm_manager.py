@@ -85,6 +85,8 @@ class VMState(str, Enum):
                 state = VMState.ERROR
             case "STOPPED":
                 state = VMState.STOPPED
+            case "SHUTOFF":
+                state = VMState.STOPPED
             case "DELETED":
                 state = VMState.DELETED
             case "UNKNOWN":
@@ -123,6 +125,20 @@ class VM:
         return (now - self.created_at).total_seconds() > seconds
 
 
+@dataclass(frozen=True)
+class DeleteProgress:
+    """Progress of the VM deletions requested without waiting for them to complete.
+
+    Attributes:
+        pending: Number of VMs with a deletion requested but not completed.
+        completion_latencies: Seconds from the request of each deletion completed since the last
+            progress to the VM no longer listed.
+    """
+
+    pending: int
+    completion_latencies: tuple[float, ...] = ()
+
+
 class PreJobMetrics(BaseModel):
     """Metrics for the pre-job phase of a runner.
 
@@ -189,6 +205,8 @@ class RunnerMetrics(Protocol):
         installation_end_timestamp: The UNIX timestamp of in which the VM setup ended.
         pre_job: The metrics for the pre-job phase.
         post_job: The metrics for the post-job phase.
+        boot_phase_durations: Seconds taken by each phase of the VM boot, in boot order.
+        boot_profile: The boot profile of the VM.
     """
 
     @property
@@ -218,6 +236,16 @@ class RunnerMetrics(Protocol):
     def installation_end_timestamp(self) -> NonNegativeFloat | None:
         """UNIX timestamp of in which the VM setup ended."""
 
+    @property
+    # Ignore no return implementation because this is a protocol class.
+    def boot_phase_durations(self) -> dict[str, NonNegativeFloat]:  # type: ignore
+        """Seconds taken by each phase of the VM boot, in boot order."""
+
+    @property
+    # Ignore no return implementation because this is a protocol class.
+    def boot_profile(self) -> str:  # type: ignore
+        """Boot profile of the VM."""
+
 
 class CloudRunnerManager(abc.ABC):
     """Manage runner instance on cloud.
@@ -244,9 +272,53 @@ class CloudRunnerManager(abc.ABC):
             runner_context: Context information needed to spawn the runner.
         """
 
+    def get_creation_headroom(self) -> int | None:
+        """Get the number of runners the cloud has capacity to create, e.g. by its quota.
+
+        Returns:
+            The number of runners, or None if the capacity is unlimited or unknown.
+        """
+        return None
+
+    def pop_delete_progress(self) -> DeleteProgress:
+        """Get the progress of the VM deletions, and reset the latencies of the completed ones.
+
+        Returns:
+            The progress of the deletions.
+        """
+        return DeleteProgress(pending=0)
+
+    def check_finished(self, vms: Sequence[VM]) -> set[InstanceID]:
+        """Check which of the VMs powered off did so after the run of their runner.
+
+        Args:
+            vms: The VMs powered off.
+
+        Returns:
+            The instance IDs of the VMs powered off after the run of their runner.
+        """
+        return {vm.instance_id for vm in vms}
+
+    def check_boots(  # pylint: disable=unused-argument
+        self, vms: Sequence[VM]
+    ) -> dict[InstanceID, str]:
+        """Check the boot of VMs with their runner not online yet, to replace the stuck ones early.
+
+        Args:
+            vms: The VMs booting.
+
+        Returns:
+            The cause of the stuck boots by instance ID.
+        """
+        return {}
+
     @abc.abstractmethod
     def get_vms(self) -> Sequence[VM]:
-        """Get cloud self-hosted runners."""
+        """Get cloud self-hosted runners.
+
+        VMs with a deletion requested but not completed are not returned, as they are not
+        capacity.
+        """
 
     @abc.abstractmethod
     # Abstract methods do not have a return value, ignore the docstring error DCO031
@@ -0,0 +1,367 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Streaming analytics over the metric events log.
+
+The metrics log is read in fixed-size chunks. Each chunk is parsed into columns (timestamps,
+values and grouping keys) per event field, and the columns are folded into fixed-size histograms
+with logarithmically spaced buckets. Memory use therefore depends on the number of distinct
+flavors and repositories, not on the size of the log.
+"""
+
+import bisect
+import itertools
+import json
+import logging
+import math
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_PERCENTILES = (50.0, 90.0, 95.0, 99.0)
+
+# The numeric fields aggregated for each event type.
+EVENT_VALUE_FIELDS: dict[str, tuple[str, ...]] = {
+    "runner_installed": ("duration",),
+    "runner_start": ("queue_duration", "idle"),
+    "runner_stop": ("job_duration",),
+    "reconciliation": ("duration",),
+}
+# The event fields the aggregated values are broken down by, when the event has them.
+GROUP_BY_FIELDS = ("flavor", "repo")
+
+# Coarse bucket bounds in seconds used to report histograms.
+REPORT_HISTOGRAM_BOUNDS = (5.0, 30.0, 60.0, 300.0, 600.0, 1800.0, 3600.0, 4 * 3600.0, math.inf)
+# Bucket upper bounds in seconds, growing by 5% from 10ms to over 10 days. The relative error of
+# an estimated percentile is bounded by the bucket growth factor. The finite report bounds are
+# bucket bounds too, so the reported histograms are exact.
+_BUCKET_GROWTH = 1.05
+_BUCKET_BOUNDS: tuple[float, ...] = tuple(
+    sorted(
+        {
+            0.01 * _BUCKET_GROWTH**i
+            for i in range(math.ceil(math.log(10 * 24 * 3600 / 0.01, _BUCKET_GROWTH)) + 1)
+        }
+        | {bound for bound in REPORT_HISTOGRAM_BOUNDS if bound != math.inf}
+    )
+)
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """Half-open range of UNIX timestamps [start, end).
+
+    Attributes:
+        start: Start of the window, inclusive.
+        end: End of the window, exclusive.
+    """
+
+    start: float = 0.0
+    end: float = math.inf
+
+
+class LogHistogram:
+    """Histogram with a fixed number of logarithmically spaced buckets.
+
+    Attributes:
+        count: Number of values added.
+    """
+
+    def __init__(self) -> None:
+        """Construct the object."""
+        # The last bucket holds values above the largest bound.
+        self._counts = array("Q", bytes(8 * (len(_BUCKET_BOUNDS) + 1)))
+        self.count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def add_many(self, values: Sequence[float]) -> None:
+        """Add a column of values.
+
+        Args:
+            values: The values to add.
+        """
+        if not values:
+            return
+        counts = self._counts
+        for value in values:
+            counts[bisect.bisect_left(_BUCKET_BOUNDS, value)] += 1
+        self.count += len(values)
+        self._sum += math.fsum(values)
+        self._min = min(self._min, *values)
+        self._max = max(self._max, *values)
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a percentile by interpolating inside the bucket holding it.
+
+        Args:
+            percent: The percentile to estimate, between 0 and 100.
+
+        Returns:
+            The estimated percentile, or NaN if the histogram is empty.
+        """
+        if not self.count:
+            return math.nan
+        rank = percent / 100 * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            if not bucket_count or cumulative + bucket_count < rank:
+                cumulative += bucket_count
+                continue
+            lower = _BUCKET_BOUNDS[index - 1] if index > 0 else 0.0
+            upper = _BUCKET_BOUNDS[index] if index < len(_BUCKET_BOUNDS) else self._max
+            estimate = lower + (upper - lower) * (rank - cumulative) / bucket_count
+            return min(max(estimate, self._min), self._max)
+        return self._max
+
+    def histogram(self, bounds: Sequence[float] = REPORT_HISTOGRAM_BOUNDS) -> dict[str, int]:
+        """Re-bucket the values into coarser cumulative buckets.
+
+        Fine buckets are assigned by their lower bound, as their values are above it. A count is
+        exact for a coarse bound which is a fine bucket bound, such as the report bounds, and may
+        otherwise include values up to one fine bucket above the coarse bound.
+
+        Args:
+            bounds: Ascending upper bounds of the coarse buckets, ending with infinity.
+
+        Returns:
+            Cumulative counts keyed by the coarse upper bounds, as Prometheus `le` buckets.
+        """
+        coarse_counts = [0] * len(bounds)
+        for index, bucket_count in enumerate(self._counts):
+            if not bucket_count:
+                continue
+            lower = _BUCKET_BOUNDS[index - 1] if index > 0 else -math.inf
+            coarse_index = min(bisect.bisect_right(bounds, lower), len(bounds) - 1)
+            coarse_counts[coarse_index] += bucket_count
+        return {
+            "+Inf" if bound == math.inf else f"{bound:g}": cumulative
+            for bound, cumulative in zip(bounds, itertools.accumulate(coarse_counts))
+        }
+
+    def summary(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> dict:
+        """Summarize the histogram.
+
+        Args:
+            percentiles: The percentiles to estimate.
+
+        Returns:
+            The count, mean, min, max, percentiles and a coarse histogram of the values.
+        """
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self._sum / self.count,
+            "min": self._min,
+            "max": self._max,
+            **{f"p{percent:g}": self.percentile(percent) for percent in percentiles},
+            "histogram": self.histogram(),
+        }
+
+
+@dataclass
+class _FieldColumns:
+    """Columnar values of one event field parsed from a chunk of the metrics log.
+
+    Attributes:
+        timestamps: Timestamps of the events.
+        values: Values of the field.
+        groups: Grouping keys of the events, by group-by field.
+    """
+
+    timestamps: array = field(default_factory=lambda: array("d"))
+    values: array = field(default_factory=lambda: array("d"))
+    groups: dict[str, list[str | None]] = field(
+        default_factory=lambda: {group_by: [] for group_by in GROUP_BY_FIELDS}
+    )
+
+
+@dataclass
+class FieldAggregate:
+    """Aggregated values of one event field.
+
+    Attributes:
+        overall: Histogram of all values.
+        breakdowns: Histograms of the values per group-by field and grouping key.
+    """
+
+    overall: LogHistogram = field(default_factory=LogHistogram)
+    breakdowns: dict[str, dict[str, LogHistogram]] = field(
+        default_factory=lambda: {group_by: {} for group_by in GROUP_BY_FIELDS}
+    )
+
+    def add(self, columns: _FieldColumns, window: TimeWindow) -> None:
+        """Fold the values of a chunk falling in the time window into the histograms.
+
+        Args:
+            columns: The parsed columns of the chunk.
+            window: The time window to aggregate.
+        """
+        selected = [
+            index
+            for index, timestamp in enumerate(columns.timestamps)
+            if window.start <= timestamp < window.end
+        ]
+        if not selected:
+            return
+        values = columns.values
+        self.overall.add_many([values[index] for index in selected])
+        for group_by, keys in columns.groups.items():
+            grouped: dict[str, list[float]] = {}
+            for index in selected:
+                if (key := keys[index]) is not None:
+                    grouped.setdefault(key, []).append(values[index])
+            histograms = self.breakdowns[group_by]
+            for key, group_values in grouped.items():
+                histograms.setdefault(key, LogHistogram()).add_many(group_values)
+
+    def summary(self, percentiles: Sequence[float]) -> dict:
+        """Summarize the aggregated values.
+
+        Args:
+            percentiles: The percentiles to estimate.
+
+        Returns:
+            The summary of all values and of each breakdown.
+        """
+        result = {"all": self.overall.summary(percentiles)}
+        for group_by, histograms in self.breakdowns.items():
+            if histograms:
+                result[f"by_{group_by}"] = {
+                    key: histogram.summary(percentiles)
+                    for key, histogram in sorted(histograms.items())
+                }
+        return result
+
+
+@dataclass
+class MetricsReport:
+    """Aggregated metric events of a time window.
+
+    Attributes:
+        window: The time window aggregated.
+        events_read: Number of events read from the log.
+        malformed_lines: Number of log lines that could not be parsed.
+        event_counts: Number of events in the time window per event type.
+        fields: Aggregates per event type and field.
+    """
+
+    window: TimeWindow
+    events_read: int = 0
+    malformed_lines: int = 0
+    event_counts: dict[str, int] = field(default_factory=dict)
+    fields: dict[str, dict[str, FieldAggregate]] = field(default_factory=dict)
+
+    def as_dict(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> dict:
+        """Convert the report into a JSON serializable dictionary.
+
+        Args:
+            percentiles: The percentiles to estimate.
+
+        Returns:
+            The report as a dictionary.
+        """
+        return {
+            "window": {
+                "start": self.window.start,
+                "end": None if self.window.end == math.inf else self.window.end,
+            },
+            "events_read": self.events_read,
+            "malformed_lines": self.malformed_lines,
+            "event_counts": dict(sorted(self.event_counts.items())),
+            "events": {
+                event: {name: value.summary(percentiles) for name, value in fields.items()}
+                for event, fields in sorted(self.fields.items())
+            },
+        }
+
+
+def iter_log_chunks(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[list[bytes]]:
+    """Stream the lines of a log in chunks of roughly `chunk_size` bytes.
+
+    Args:
+        path: The log file path.
+        chunk_size: Number of bytes read at a time.
+
+    Yields:
+        The complete lines of each chunk.
+    """
+    remainder = b""
+    with path.open("rb") as log_file:
+        while data := log_file.read(chunk_size):
+            lines = (remainder + data).split(b"\n")
+            remainder = lines.pop()
+            yield lines
+    if remainder:
+        yield [remainder]
+
+
+def _parse_chunk(
+    lines: list[bytes], report: MetricsReport, window: TimeWindow
+) -> dict[tuple[str, str], _FieldColumns]:
+    """Parse a chunk of log lines into columns per event type and field.
+
+    Args:
+        lines: The log lines of the chunk.
+        report: The report to count read, malformed and in-window events in.
+        window: The time window to count events for.
+
+    Returns:
+        The columns keyed by event type and field name.
+    """
+    columns: dict[tuple[str, str], _FieldColumns] = {}
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            event = json.loads(line)
+            event_name = event["event"]
+            timestamp = float(event["timestamp"])
+        except (ValueError, KeyError, TypeError):
+            report.malformed_lines += 1
+            continue
+        report.events_read += 1
+        if window.start <= timestamp < window.end:
+            report.event_counts[event_name] = report.event_counts.get(event_name, 0) + 1
+        for field_name in EVENT_VALUE_FIELDS.get(event_name, ()):
+            value = event.get(field_name)
+            if not isinstance(value, (int, float)) or not math.isfinite(value):
+                continue
+            field_columns = columns.setdefault((event_name, field_name), _FieldColumns())
+            field_columns.timestamps.append(timestamp)
+            field_columns.values.append(value)
+            for group_by, keys in field_columns.groups.items():
+                key = event.get(group_by)
+                keys.append(str(key) if key is not None else None)
+    return columns
+
+
+def analyze_metrics_log(
+    path: Path, window: TimeWindow = TimeWindow(), chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> MetricsReport:
+    """Aggregate the metric events of a time window from the metrics log.
+
+    Args:
+        path: The metrics log path.
+        window: The time window to aggregate.
+        chunk_size: Number of bytes read and parsed at a time.
+
+    Returns:
+        The aggregated report.
+    """
+    report = MetricsReport(window=window)
+    for lines in iter_log_chunks(path, chunk_size):
+        for (event_name, field_name), columns in _parse_chunk(lines, report, window).items():
+            aggregate = report.fields.setdefault(event_name, {}).setdefault(
+                field_name, FieldAggregate()
+            )
+            aggregate.add(columns, window)
+    if report.malformed_lines:
+        logger.warning("Skipped %s malformed lines in %s", report.malformed_lines, path)
+    return report
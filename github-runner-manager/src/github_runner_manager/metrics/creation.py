@@ -0,0 +1,131 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Module for collecting metrics related to the phases of the runner creation.
+
+The phases run in different layers, the platform provider, the cloud runner manager and the
+OpenStack cloud. The creation of a runner records its phases in a context variable, which the
+layers time their phase into, so the timings are collected without passing them through the
+layers.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Iterator, Sequence
+
+from prometheus_client import Histogram
+
+from github_runner_manager.metrics import labels
+
+RUNNER_CREATION_PHASE_DURATION_SECONDS = Histogram(
+    name="runner_creation_phase_duration_seconds",
+    documentation="Time taken in seconds by a phase of the creation of a runner.",
+    labelnames=[labels.FLAVOR, labels.PHASE],
+    buckets=[0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, float("inf")],
+)
+RUNNER_CREATION_ATTEMPTS = Histogram(
+    name="runner_creation_attempts",
+    documentation="Number of attempts taken to create a runner, for the runners created.",
+    labelnames=[labels.FLAVOR],
+    buckets=[1, 2, 3, 5, float("inf")],
+)
+
+
+class Phase(str, Enum):
+    """Phase of the creation of a runner.
+
+    Attributes:
+        JIT: Requesting the JIT configuration of the runner from the platform.
+        SECGROUP: Ensuring the security group of the VM.
+        KEYPAIR: Setting up the SSH keypair of the VM.
+        RENDER: Rendering the cloud-init userdata.
+        NOVA_CREATE: Requesting the creation of the VM.
+    """
+
+    JIT = "jit"
+    SECGROUP = "secgroup"
+    KEYPAIR = "keypair"
+    RENDER = "render"
+    NOVA_CREATE = "nova_create"
+
+
+@dataclass
+class CreationTimings:
+    """Durations of the phases of the creation of a runner.
+
+    Attributes:
+        durations: Seconds taken by each phase run.
+    """
+
+    durations: dict[Phase, float] = field(default_factory=dict)
+
+
+_current_timings: ContextVar[CreationTimings | None] = ContextVar("creation_timings", default=None)
+
+
+@contextmanager
+def record_creation(timings: CreationTimings) -> Iterator[None]:
+    """Record the phases timed within the context into the timings.
+
+    Args:
+        timings: The timings of the creation.
+    """
+    token = _current_timings.set(timings)
+    try:
+        yield
+    finally:
+        _current_timings.reset(token)
+
+
+@contextmanager
+def phase(name: Phase) -> Iterator[None]:
+    """Time a phase of the creation being recorded, if any.
+
+    Args:
+        name: The phase.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if (timings := _current_timings.get()) is not None:
+            timings.durations[name] = (
+                timings.durations.get(name, 0.0) + time.perf_counter() - start
+            )
+
+
+def observe_batch(flavor: str, batch: Sequence[CreationTimings]) -> str:
+    """Observe the phases of a batch of creations and summarize them.
+
+    Args:
+        flavor: The flavor of the runners created.
+        batch: The timings of the creations of the batch.
+
+    Returns:
+        The mean and maximum duration of each phase in the batch, for logging.
+    """
+    summary = []
+    for name in Phase:
+        durations = [t.durations[name] for t in batch if name in t.durations]
+        for duration in durations:
+            RUNNER_CREATION_PHASE_DURATION_SECONDS.labels(flavor, name.value).observe(duration)
+        if durations:
+            summary.append(
+                f"{name.value} mean {sum(durations) / len(durations):.2f}s"
+                f" max {max(durations):.2f}s"
+            )
+    return ", ".join(summary) or "no phase run"
+
+
+def observe_attempts(flavor: str, attempts: Sequence[int]) -> None:
+    """Observe the number of attempts taken to create the runners of a batch.
+
+    Args:
+        flavor: The flavor of the runners created.
+        attempts: The number of attempts of each runner created.
+    """
+    for count in attempts:
+        RUNNER_CREATION_ATTEMPTS.labels(flavor).observe(count)
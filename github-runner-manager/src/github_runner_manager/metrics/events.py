@@ -5,8 +5,12 @@
 
 import logging
 import os
+import queue
+import threading
+import time
+from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Optional
 
 from pydantic import BaseModel, NonNegativeFloat
 
@@ -14,6 +18,11 @@ from github_runner_manager.errors import IssueMetricEventError
 from github_runner_manager.manager.vm_manager import CodeInformation
 
 _DEFAULT_METRICS_LOG_PATH = "/var/log/github-runner-metrics.log"
+_DEFAULT_FLUSH_INTERVAL = 1.0
+_DEFAULT_MAX_QUEUE_SIZE = 10000
+_DEFAULT_MAX_BATCH_SIZE = 1000
+# Seconds between attempts of a flush to queue its request in a full queue.
+_FLUSH_RETRY_INTERVAL = 0.05
 
 logger = logging.getLogger(__name__)
 
@@ -68,10 +77,12 @@ class RunnerInstalled(Event):
         flavor: Describes the characteristics of the runner.
           The flavor could be for example "small".
         duration: The duration of the installation in seconds.
+        boot_phases: The duration in seconds of each phase of the VM boot, if recorded.
     """
 
     flavor: str
     duration: NonNegativeFloat
+    boot_phases: Optional[dict[str, NonNegativeFloat]] = None
 
 
 class RunnerStart(Event):
@@ -143,10 +154,294 @@ class Reconciliation(Event):
     duration: NonNegativeFloat
 
 
+class FsyncPolicy(str, Enum):
+    """Policy for syncing the metrics log to disk.
+
+    Attributes:
+        NEVER: Leave syncing to the operating system.
+        BATCH: Call fsync after every batch written.
+    """
+
+    NEVER = "never"
+    BATCH = "batch"
+
+
+class _FlushRequest:  # pylint: disable=too-few-public-methods
+    """Marker queued to request the writer thread to write out everything before it.
+
+    Attributes:
+        done: Set by the writer thread once the preceding events are written.
+    """
+
+    def __init__(self) -> None:
+        """Construct the object."""
+        self.done = threading.Event()
+
+
+class EventWriter:  # pylint: disable=too-many-instance-attributes
+    """Write metric events to the metrics log in batches from a background thread.
+
+    Events are queued in memory and serialized by the writer thread, which appends them to the
+    metrics log with a single write per batch. The log file is kept open between batches and
+    reopened when it has been moved or removed, e.g. by logrotate.
+
+    Attributes:
+        stopped: Whether the writer was stopped and rejects new events.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        flush_interval: float = _DEFAULT_FLUSH_INTERVAL,
+        fsync_policy: FsyncPolicy = FsyncPolicy.NEVER,
+        max_queue_size: int = _DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = _DEFAULT_MAX_BATCH_SIZE,
+    ):
+        """Construct the object.
+
+        Args:
+            path: The metrics log file path.
+            flush_interval: Maximum seconds an event waits in memory before it is written.
+            fsync_policy: Policy for syncing the metrics log to disk.
+            max_queue_size: Maximum number of events held in memory.
+            max_batch_size: Maximum number of events written in a single write.
+        """
+        self._path = path
+        self._flush_interval = flush_interval
+        self._fsync_policy = fsync_policy
+        self._max_batch_size = max_batch_size
+        self._queue: queue.Queue[Event | _FlushRequest | None] = queue.Queue(
+            maxsize=max_queue_size
+        )
+        self._file: IO[str] | None = None
+        self._thread = threading.Thread(target=self._run, name="metric-event-writer", daemon=True)
+        # Serializes the queueing with the stop, so nothing is queued after the stop sentinel.
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread.start()
+
+    @property
+    def stopped(self) -> bool:
+        """Whether the writer was stopped and rejects new events.
+
+        Returns:
+            Whether the writer was stopped.
+        """
+        return self._stopped
+
+    def put(self, event: Event) -> None:
+        """Queue a metric event to be written.
+
+        Args:
+            event: The metric event to write.
+
+        Raises:
+            IssueMetricEventError: If the writer is stopped or not running, or its queue is full.
+        """
+        with self._lock:
+            if self._stopped:
+                raise IssueMetricEventError("Metric event writer is stopped")
+            if not self._thread.is_alive():
+                raise IssueMetricEventError("Metric event writer is not running")
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full as exc:
+                raise IssueMetricEventError("Metric event queue is full") from exc
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all events queued before the call are written.
+
+        Args:
+            timeout: Maximum seconds to wait, including waiting for room in a full queue.
+
+        Returns:
+            Whether the events were written within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        request = _FlushRequest()
+        while True:
+            # The lock is not held while waiting for room, so events and the stop are not
+            # blocked by a flush.
+            with self._lock:
+                queued = not self._stopped and self._thread.is_alive()
+                if not queued:
+                    break
+                try:
+                    self._queue.put_nowait(request)
+                    break
+                except queue.Full:
+                    pass
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(_FLUSH_RETRY_INTERVAL)
+        if not queued:
+            # A stopping writer writes out everything queued before finishing.
+            if self._thread.is_alive():
+                self._thread.join(timeout)
+            return not self._thread.is_alive() and self._queue.empty()
+        return request.done.wait(None if deadline is None else max(deadline - time.monotonic(), 0))
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Write out the queued events and stop the writer thread.
+
+        New events are rejected from the call on.
+
+        Args:
+            timeout: Maximum seconds to wait for the writer thread to finish.
+        """
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        """Collect queued events into batches and write them until stopped."""
+        stopping = False
+        while not stopping:
+            batch: list[Event] = []
+            flush_requests: list[_FlushRequest] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self._flush_interval
+            while True:
+                if item is None:
+                    stopping = True
+                    break
+                if isinstance(item, _FlushRequest):
+                    flush_requests.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self._max_batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+            for request in flush_requests:
+                request.done.set()
+        self._drain()
+        self._close()
+
+    def _drain(self) -> None:
+        """Write out the items left in the queue after the stop sentinel."""
+        batch: list[Event] = []
+        flush_requests: list[_FlushRequest] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _FlushRequest):
+                flush_requests.append(item)
+            elif item is not None:
+                batch.append(item)
+        self._write_batch(batch)
+        for request in flush_requests:
+            request.done.set()
+
+    def _write_batch(self, batch: list[Event]) -> None:
+        """Serialize and append a batch of events to the metrics log.
+
+        Args:
+            batch: The events to write.
+        """
+        if not batch:
+            return
+        lines = "".join(f"{event.json(exclude_none=True)}\n" for event in batch)
+        try:
+            metrics_file = self._open()
+            metrics_file.write(lines)
+            metrics_file.flush()
+            if self._fsync_policy == FsyncPolicy.BATCH:
+                os.fsync(metrics_file.fileno())
+        except OSError:
+            logger.exception(
+                "Cannot write %s metric events to %s, dropping them", len(batch), self._path
+            )
+            self._close()
+
+    def _open(self) -> IO[str]:
+        """Get the open metrics log, reopening it if the file was moved or removed.
+
+        Returns:
+            The metrics log file opened for appending.
+        """
+        if self._file is not None:
+            try:
+                path_stat = self._path.stat()
+                file_stat = os.fstat(self._file.fileno())
+                if (path_stat.st_dev, path_stat.st_ino) != (file_stat.st_dev, file_stat.st_ino):
+                    logger.info("Metrics log %s was rotated, reopening it", self._path)
+                    self._close()
+            except FileNotFoundError:
+                logger.info("Metrics log %s was removed, reopening it", self._path)
+                self._close()
+        if self._file is None:
+            self._file = self._path.open(mode="a", encoding="utf-8")
+        return self._file
+
+    def _close(self) -> None:
+        """Close the metrics log if it is open."""
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+        except OSError:
+            logger.warning("Failed to close metrics log %s", self._path, exc_info=True)
+        self._file = None
+
+
+# Pylint thinks this is a constant which needs to be upper case. This is a global variable.
+_writer: EventWriter | None = None  # pylint: disable=invalid-name
+
+
+def start_event_writer(
+    flush_interval: float = _DEFAULT_FLUSH_INTERVAL,
+    fsync_policy: FsyncPolicy = FsyncPolicy.NEVER,
+) -> EventWriter:
+    """Start writing issued metric events through a buffered background writer.
+
+    Args:
+        flush_interval: Maximum seconds an event waits in memory before it is written.
+        fsync_policy: Policy for syncing the metrics log to disk.
+
+    Returns:
+        The started event writer.
+    """
+    global _writer  # pylint: disable=global-statement
+    stop_event_writer()
+    writer = EventWriter(
+        path=get_metrics_log_path(), flush_interval=flush_interval, fsync_policy=fsync_policy
+    )
+    writer.start()
+    _writer = writer
+    return writer
+
+
+def stop_event_writer(timeout: float | None = None) -> None:
+    """Write out the buffered metric events and go back to writing them synchronously.
+
+    Args:
+        timeout: Maximum seconds to wait for the buffered events to be written.
+    """
+    global _writer  # pylint: disable=global-statement
+    writer, _writer = _writer, None
+    if writer is not None:
+        writer.stop(timeout)
+
+
 def issue_event(event: Event) -> None:
     """Issue a metric event.
 
-    The metric event is logged to the metrics log.
+    The metric event is logged to the metrics log. If an event writer was started, the event is
+    queued to be written in the background, otherwise it is written before returning.
 
     Args:
         event: The metric event to log.
@@ -154,6 +449,14 @@ def issue_event(event: Event) -> None:
     Raises:
         IssueMetricEventError: If the event cannot be logged.
     """
+    if (writer := _writer) is not None:
+        try:
+            writer.put(event)
+            return
+        except IssueMetricEventError:
+            # An event racing with stop_event_writer is written synchronously instead.
+            if not writer.stopped:
+                raise
     metrics_log_path = get_metrics_log_path()
     try:
         with metrics_log_path.open(mode="a", encoding="utf-8") as metrics_file:
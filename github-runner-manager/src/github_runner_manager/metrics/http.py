@@ -0,0 +1,15 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Module for collecting metrics related to the HTTP server."""
+
+from prometheus_client import Histogram
+
+from github_runner_manager.metrics import labels
+
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    name="http_request_duration_seconds",
+    documentation="Duration of HTTP requests served by the runner manager (seconds).",
+    labelnames=[labels.ENDPOINT, labels.METHOD, labels.STATUS],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, float("inf")],
+)
@@ -11,3 +11,10 @@ CONCLUSION = "conclusion"
 STATUS = "status"
 METHOD = "method"
 ERROR_TYPE = "error_type"
+ENDPOINT = "endpoint"
+LOCK = "lock"
+SITE = "site"
+BACKEND = "backend"
+PHASE = "phase"
+CAUSE = "cause"
+BOOT_PROFILE = "boot_profile"
@@ -46,6 +46,36 @@ TIMED_OUT_RUNNERS_TOTAL = Counter(
     documentation="The number of GitHub runners that are older than maximum creation time but has"
     "not yet come online nor taken a job.",
 )
+RECLAIMED_VMS_TOTAL = Counter(
+    name="reclaimed_vms_total",
+    documentation="The number of VMs deleted between reconciles as they powered off after the run"
+    " of their runner.",
+    labelnames=[labels.FLAVOR],
+)
+RUNNER_COUNT_DRIFT_TOTAL = Counter(
+    name="runner_count_drift_total",
+    documentation="The number of runners subtracted from the in-memory runner count between"
+    " reconciles, as they were no longer listed, besides the VMs reclaimed.",
+    labelnames=[labels.FLAVOR],
+)
+CREATION_PAUSED_SECONDS_TOTAL = Counter(
+    name="creation_paused_seconds_total",
+    documentation="The seconds the creation of runners was paused after creations failed, by"
+    " class of failure, counted when the pause ends.",
+    labelnames=[labels.FLAVOR, labels.CAUSE],
+)
+SCALE_DOWN_AVOIDED_TOTAL = Counter(
+    name="runner_scale_down_avoided_total",
+    documentation="The number of runners kept by a reconcile instead of scaled down, by cause of"
+    " the scale down hysteresis.",
+    labelnames=[labels.FLAVOR, labels.CAUSE],
+)
+BOOT_FAILURES_TOTAL = Counter(
+    name="runner_boot_failures_total",
+    documentation="The number of runners replaced before the maximum creation time as the boot of"
+    " their VM is stuck, by cause.",
+    labelnames=[labels.FLAVOR, labels.CAUSE],
+)
 FLUSHED_ONLINE_IDLE_RUNNERS_TOTAL = Counter(
     name="flush_online_idle_runner_requests_total",
     documentation="The number of online/idle runners that are requested to be flushed.",
@@ -69,3 +99,98 @@ DELETE_VM_DURATION_SECONDS = Histogram(
     documentation="Time taken in seconds for vms to be deleted.",
     labelnames=[labels.FLAVOR],
 )
+PENDING_DELETE_VMS = Gauge(
+    name="pending_delete_vms",
+    documentation="Number of VMs with a deletion requested but still listed by the cloud, not"
+    " counted as capacity.",
+    labelnames=[labels.FLAVOR],
+)
+DELETE_VM_COMPLETION_SECONDS = Histogram(
+    name="delete_vm_completion_seconds",
+    documentation="Time taken in seconds from the request of a VM deletion to the VM no longer"
+    " listed by the cloud, as of the listing.",
+    labelnames=[labels.FLAVOR],
+    buckets=[5, 10, 30, 60, 120, 300, 600, float("inf")],
+)
+LOCK_WAIT_SECONDS = Histogram(
+    name="reconcile_lock_wait_seconds",
+    documentation="Time waited in seconds to acquire a lock of the reconciler.",
+    labelnames=[labels.FLAVOR, labels.LOCK, labels.SITE],
+    buckets=[0.001, 0.01, 0.1, 0.5, 1, 5, 10, 30, 60, 2 * 60, 5 * 60, 10 * 60, float("inf")],
+)
+LOCK_HOLD_SECONDS = Histogram(
+    name="reconcile_lock_hold_seconds",
+    documentation="Time in seconds a lock of the reconciler is held.",
+    labelnames=[labels.FLAVOR, labels.LOCK, labels.SITE],
+    buckets=[0.001, 0.01, 0.1, 0.5, 1, 5, 10, 30, 60, 2 * 60, 5 * 60, 10 * 60, float("inf")],
+)
+LOCK_HOLDER = Gauge(
+    name="reconcile_lock_holder",
+    documentation="Whether a call site holds a lock of the reconciler.",
+    labelnames=[labels.FLAVOR, labels.LOCK, labels.SITE],
+)
+LOCK_ACQUIRED_TIMESTAMP = Gauge(
+    name="reconcile_lock_acquired_timestamp_seconds",
+    documentation="UNIX timestamp of the acquisition of a lock of the reconciler, 0 if not held.",
+    labelnames=[labels.FLAVOR, labels.LOCK],
+)
+PRESSURE_FORECAST = Gauge(
+    name="pressure_forecast",
+    documentation="Forecast planner pressure at the forecast horizon.",
+    labelnames=[labels.FLAVOR],
+)
+PRESSURE_FORECAST_ERROR = Gauge(
+    name="pressure_forecast_error",
+    documentation="Latest forecast minus actual planner pressure.",
+    labelnames=[labels.FLAVOR],
+)
+PRESSURE_FORECAST_ABSOLUTE_ERROR = Histogram(
+    name="pressure_forecast_absolute_error",
+    documentation="Absolute difference between the forecast and the actual planner pressure.",
+    labelnames=[labels.FLAVOR],
+    buckets=[0.5, 1, 2, 5, 10, 20, 50, 100, float("inf")],
+)
+PRESSURE_UPDATES_RECEIVED_TOTAL = Counter(
+    name="pressure_updates_received_total",
+    documentation="The number of planner pressure updates received by the create loop.",
+    labelnames=[labels.FLAVOR],
+)
+PRESSURE_UPDATES_ACTED_TOTAL = Counter(
+    name="pressure_updates_acted_total",
+    documentation="The number of planner pressure updates acted on by the create loop, after"
+    " coalescing.",
+    labelnames=[labels.FLAVOR],
+)
+PLANNER_STREAM_UPTIME_SECONDS = Gauge(
+    name="planner_stream_uptime_seconds",
+    documentation="Seconds since the planner pressure stream delivered its first update, 0 while"
+    " the stream is down.",
+    labelnames=[labels.FLAVOR],
+)
+PRESSURE_UPDATE_AGE_SECONDS = Gauge(
+    name="planner_pressure_update_age_seconds",
+    documentation="Seconds since the last pressure update from the planner, streamed or polled.",
+    labelnames=[labels.FLAVOR],
+)
+CREATION_PAUSE_SECONDS = Gauge(
+    name="creation_pause_seconds",
+    documentation="Seconds the creation of runners has been paused after creations failed, 0"
+    " while creating.",
+    labelnames=[labels.FLAVOR],
+)
+CONCURRENCY_LIMIT = Gauge(
+    name="backend_concurrency_limit",
+    documentation="Adaptive limit of the concurrent calls to a backend.",
+    labelnames=[labels.BACKEND],
+)
+CONCURRENCY_IN_FLIGHT = Gauge(
+    name="backend_concurrency_in_flight",
+    documentation="Number of calls in flight to a backend.",
+    labelnames=[labels.BACKEND],
+)
+QUOTA_HEADROOM = Gauge(
+    name="cloud_quota_headroom_runners",
+    documentation="Number of runners of the flavor the cloud quota has room for, as of the last"
+    " creation.",
+    labelnames=[labels.FLAVOR],
+)
@@ -3,14 +3,18 @@
 
 """Classes and function to extract the metrics from storage and issue runner metrics events."""
 
+import base64
+import binascii
 import concurrent.futures
 import io
 import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Optional, Sequence, Type
+from typing import Mapping, Optional, Sequence, Type
 
 import paramiko
 import paramiko.ssh_exception
@@ -18,7 +22,14 @@ from fabric import Connection as SSHConnection
 from prometheus_client import Gauge, Histogram
 from pydantic import NonNegativeFloat, ValidationError
 
-from github_runner_manager.errors import IssueMetricEventError, RunnerMetricsError, SSHError
+from github_runner_manager.concurrency import Backend, get_limiter
+from github_runner_manager.configuration import BootProfile
+from github_runner_manager.errors import (
+    IssueMetricEventError,
+    OpenStackError,
+    RunnerMetricsError,
+    SSHError,
+)
 from github_runner_manager.manager.models import InstanceID
 from github_runner_manager.manager.vm_manager import (
     PostJobMetrics,
@@ -30,6 +41,8 @@ from github_runner_manager.metrics import events as metric_events
 from github_runner_manager.metrics import labels
 from github_runner_manager.metrics.type import GithubJobMetrics
 from github_runner_manager.openstack_cloud.constants import (
+    BOOT_PHASES_FILE_PATH,
+    CONSOLE_METRICS_MARKER,
     POST_JOB_METRICS_FILE_PATH,
     PRE_JOB_METRICS_FILE_PATH,
     RUNNER_INSTALLED_TS_FILE_PATH,
@@ -39,6 +52,17 @@ from github_runner_manager.openstack_cloud.openstack_cloud import OpenstackCloud
 logger = logging.getLogger(__name__)
 
 MAX_METRICS_FILE_SIZE = 1024
+METRICS_FILE_PATHS = (
+    RUNNER_INSTALLED_TS_FILE_PATH,
+    PRE_JOB_METRICS_FILE_PATH,
+    POST_JOB_METRICS_FILE_PATH,
+    BOOT_PHASES_FILE_PATH,
+)
+# Number of lines of the console log fetched from a VM powered off after its run, enough to span
+# the metrics and the shutdown messages following them.
+CONSOLE_METRICS_LINES = 500
+# Nova status of a VM powered off.
+SHUTOFF_STATUS = "SHUTOFF"
 MINUTE_IN_SECONDS = 60
 HOURS_IN_SECONDS = MINUTE_IN_SECONDS * 60
 DAYS_IN_SECONDS = HOURS_IN_SECONDS * 24
@@ -46,7 +70,7 @@ DAYS_IN_SECONDS = HOURS_IN_SECONDS * 24
 RUNNER_SPAWN_DURATION_SECONDS = Histogram(
     name="runner_spawn_duration_seconds",
     documentation="Time in seconds to initialize the VM and register the runner on GitHub.",
-    labelnames=[labels.FLAVOR],
+    labelnames=[labels.FLAVOR, labels.BOOT_PROFILE],
     buckets=[
         5,
         10,
@@ -60,6 +84,12 @@ RUNNER_SPAWN_DURATION_SECONDS = Histogram(
         float("inf"),
     ],
 )
+RUNNER_BOOT_PHASE_DURATION_SECONDS = Histogram(
+    name="runner_boot_phase_duration_seconds",
+    documentation="Time in seconds taken by a phase of the VM boot, up to the runner start.",
+    labelnames=[labels.FLAVOR, labels.PHASE],
+    buckets=[1, 2.5, 5, 10, 15, 30, MINUTE_IN_SECONDS, MINUTE_IN_SECONDS * 2, float("inf")],
+)
 RUNNER_IDLE_DURATION_SECONDS = Histogram(
     name="runner_idle_duration_seconds",
     documentation="Time in seconds to runner waiting idle for the job to be picked up.",
@@ -148,6 +178,28 @@ class PullFileError(Exception):
     """Represents an error while pulling a file from the runner instance."""
 
 
+class BootPhase(str, Enum):
+    """Phase of the VM boot, named after the userdata step ending it.
+
+    Attributes:
+        VM_BOOT: From the creation of the VM to the start of the userdata.
+        SNAP: Holding the snap refreshes and waiting for an ongoing refresh.
+        APROXY: Setting up aproxy.
+        APT_UPDATE: The apt-get update retry loop.
+        DOCKER_MIRROR: Configuring the DockerHub mirror and restarting docker.
+        PRE_JOB_SETUP: Setting up the user groups and the pre-job script.
+        RUNNER_START: From the end of the setup to the runner listening for jobs.
+    """
+
+    VM_BOOT = "vm_boot"
+    SNAP = "snap"
+    APROXY = "aproxy"
+    APT_UPDATE = "apt_update"
+    DOCKER_MIRROR = "docker_mirror"
+    PRE_JOB_SETUP = "pre_job_setup"
+    RUNNER_START = "runner_start"
+
+
 @dataclass
 class _PullRunnerMetricsConfig:
     """Configurations for pulling runner metrics from a VM.
@@ -155,14 +207,21 @@ class _PullRunnerMetricsConfig:
     Attributes:
         cloud_service: The OpenStack cloud service.
         instance_id: The instance ID to fetch the runner metric from.
+        boot_profile: The boot profile of the VM.
+        console_output: The console log already fetched of the VM powered off, if any.
     """
 
     cloud_service: OpenstackCloud
     instance_id: InstanceID
+    boot_profile: str
+    console_output: str | None = None
 
 
 def pull_runner_metrics(
-    cloud_service: OpenstackCloud, instance_ids: Sequence[InstanceID]
+    cloud_service: OpenstackCloud,
+    instance_ids: Sequence[InstanceID],
+    boot_profile: str = BootProfile.STANDARD.value,
+    console_outputs: Mapping[InstanceID, str] | None = None,
 ) -> "list[PulledMetrics]":
     """Pull metrics from runner.
 
@@ -171,6 +230,9 @@ def pull_runner_metrics(
     Args:
         cloud_service: The OpenStack cloud service.
         instance_ids: The instance IDs to fetch the metrics from.
+        boot_profile: The boot profile of the VMs.
+        console_outputs: The console logs already fetched of VMs powered off, by instance ID.
+            They are not fetched again.
 
     Returns:
         Metrics pulled from the instance.
@@ -178,13 +240,21 @@ def pull_runner_metrics(
     if not instance_ids:
         return []
     pull_metrics_configs = [
-        _PullRunnerMetricsConfig(cloud_service=cloud_service, instance_id=instance_id)
+        _PullRunnerMetricsConfig(
+            cloud_service=cloud_service,
+            instance_id=instance_id,
+            boot_profile=boot_profile,
+            console_output=(console_outputs or {}).get(instance_id),
+        )
         for instance_id in instance_ids
     ]
     pulled_metrics: list[PulledMetrics] = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(instance_ids), 30)) as executor:
+    limiter = get_limiter(Backend.SSH)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=limiter.workers(len(instance_ids))
+    ) as executor:
         future_to_pull_metrics_config = {
-            executor.submit(_pull_runner_metrics, config): config
+            executor.submit(limiter.call, partial(_pull_runner_metrics, config)): config
             for config in pull_metrics_configs
         }
         for future in concurrent.futures.as_completed(future_to_pull_metrics_config):
@@ -213,15 +283,18 @@ def _pull_runner_metrics(pull_config: _PullRunnerMetricsConfig) -> "PulledMetric
         )
         return None
 
-    pulled_file_contents = _pull_file_contents(
-        cloud_service=pull_config.cloud_service,
-        instance=instance,
-        metrics_paths=(
-            RUNNER_INSTALLED_TS_FILE_PATH,
-            PRE_JOB_METRICS_FILE_PATH,
-            POST_JOB_METRICS_FILE_PATH,
-        ),
-    )
+    if instance.status == SHUTOFF_STATUS:
+        pulled_file_contents = _pull_console_contents(
+            cloud_service=pull_config.cloud_service,
+            instance=instance,
+            output=pull_config.console_output,
+        )
+    else:
+        pulled_file_contents = _pull_file_contents(
+            cloud_service=pull_config.cloud_service,
+            instance=instance,
+            metrics_paths=METRICS_FILE_PATHS,
+        )
     parsed_metrics = _parse_metrics_contents(metrics_contents_map=pulled_file_contents)
 
     return (
@@ -230,11 +303,14 @@ def _pull_runner_metrics(pull_config: _PullRunnerMetricsConfig) -> "PulledMetric
             runner_installed_timestamp=parsed_metrics.runner_installed_timestamp,
             pre_job=parsed_metrics.pre_job_metrics,
             post_job=parsed_metrics.post_job_metrics,
+            boot_timestamps=parsed_metrics.boot_timestamps,
+            boot_profile=pull_config.boot_profile,
         )
         if (
             parsed_metrics.runner_installed_timestamp
             or parsed_metrics.pre_job_metrics
             or parsed_metrics.post_job_metrics
+            or parsed_metrics.boot_timestamps
         )
         else None
     )
@@ -268,6 +344,64 @@ def _pull_file_contents(
     return metric_files_contents
 
 
+def _pull_console_contents(
+    cloud_service: OpenstackCloud, instance: OpenstackInstance, output: str | None = None
+) -> dict[Path, str | None]:
+    """Pull the metric files printed on the console by a runner powered off after its run.
+
+    Args:
+        cloud_service: The OpenStack cloud service.
+        instance: The OpenStack instance powered off.
+        output: The console log already fetched, if any.
+
+    Returns:
+        The contents of the metric files by path, empty if the console log cannot be fetched.
+    """
+    if output is not None:
+        return _parse_console_contents(output)
+    try:
+        outputs = cloud_service.get_console_outputs(
+            [instance.instance_id], length=CONSOLE_METRICS_LINES
+        )
+    except OpenStackError:
+        logger.warning("Failed to get console log for pulling metrics: %s", instance.instance_id)
+        return {}
+    return _parse_console_contents(outputs.get(instance.instance_id, ""))
+
+
+def _parse_console_contents(output: str) -> dict[Path, str | None]:
+    """Parse the metric files printed on the console, one base64 encoded file per line.
+
+    Unknown files and corrupt lines are skipped, so a VM cannot make the manager read other files.
+
+    Args:
+        output: The tail of the console log.
+
+    Returns:
+        The contents of the metric files by path.
+    """
+    paths = {path.name: path for path in METRICS_FILE_PATHS}
+    metric_files_contents: dict[Path, str | None] = {}
+    for line in output.splitlines():
+        if CONSOLE_METRICS_MARKER not in line:
+            continue
+        # The line of an empty file has no encoded contents.
+        fields = line[line.index(CONSOLE_METRICS_MARKER) :].split()
+        if len(fields) not in (2, 3) or (path := paths.get(fields[1])) is None:
+            logger.warning("Corrupt console metrics: %s", line)
+            continue
+        try:
+            contents = base64.b64decode("".join(fields[2:]), validate=True).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError):
+            logger.warning("Corrupt console metrics: %s", line)
+            continue
+        if len(contents) > MAX_METRICS_FILE_SIZE:
+            logger.warning("Console metrics of %s too large: %s", path.name, len(contents))
+            continue
+        metric_files_contents[path] = contents
+    return metric_files_contents
+
+
 @dataclass
 class _ParsedMetricContents:
     """Parsed metric contents mapping.
@@ -276,11 +410,13 @@ class _ParsedMetricContents:
         runner_installed_timestamp: The timestamp when the runner was installed.
         pre_job_metrics: Parsed pre-job metrics for the runner.
         post_job_metrics: Parsed post-job metrics for the runner.
+        boot_timestamps: The boot phases and the timestamps they ended at, in boot order.
     """
 
     runner_installed_timestamp: float | None
     pre_job_metrics: PreJobMetrics | None
     post_job_metrics: PostJobMetrics | None
+    boot_timestamps: tuple[tuple[BootPhase, float], ...] = ()
 
 
 def _parse_metrics_contents(metrics_contents_map: dict[Path, str | None]) -> _ParsedMetricContents:
@@ -317,9 +453,33 @@ def _parse_metrics_contents(metrics_contents_map: dict[Path, str | None]) -> _Pa
         runner_installed_timestamp=runner_installed_timestamp,
         pre_job_metrics=pre_job_metrics,
         post_job_metrics=post_job_metrics,
+        boot_timestamps=_parse_boot_timestamps(
+            metrics_contents_map.get(BOOT_PHASES_FILE_PATH, None)
+        ),
     )
 
 
+def _parse_boot_timestamps(contents: str | None) -> tuple[tuple[BootPhase, float], ...]:
+    """Parse the boot phases file, with a line of phase name and end timestamp per phase.
+
+    Unknown phases and corrupt lines are skipped, so a VM cannot add arbitrary metric labels.
+
+    Args:
+        contents: The contents of the boot phases file.
+
+    Returns:
+        The boot phases and the timestamps they ended at, in boot order.
+    """
+    boot_timestamps: list[tuple[BootPhase, float]] = []
+    for line in (contents or "").splitlines():
+        try:
+            name, timestamp = line.split()
+            boot_timestamps.append((BootPhase(name), float(timestamp)))
+        except ValueError:
+            logger.warning("Corrupt boot phase timestamp: %s", line)
+    return tuple(boot_timestamps)
+
+
 def _ssh_pull_file(ssh_conn: SSHConnection, remote_path: str, max_size: int) -> str:
     """Pull file from the runner instance.
 
@@ -390,16 +550,21 @@ class PulledMetrics:
         runner_installed_timestamp: The timestamp in which the runner was installed.
         pre_job: String with the pre-job-metrics file.
         post_job: String with the post-job-metrics file.
+        boot_timestamps: The boot phases and the timestamps they ended at, in boot order.
+        boot_profile: The boot profile of the VM.
         metadata: The metadata of the VM in which the metrics are fetched from.
         instance_id: The instance ID of the VM in which the metrics are fetched from.
         installation_start_timestamp: The UNIX timestamp of in which the VM setup started.
         installation_end_timestamp: The UNIX timestamp of in which the VM setup ended.
+        boot_phase_durations: Seconds taken by each phase of the VM boot, in boot order.
     """
 
     instance: OpenstackInstance
     runner_installed_timestamp: NonNegativeFloat | None = None
     pre_job: PreJobMetrics | None = None
     post_job: PostJobMetrics | None = None
+    boot_timestamps: tuple[tuple[BootPhase, float], ...] = ()
+    boot_profile: str = BootProfile.STANDARD.value
 
     @property
     def instance_id(self) -> InstanceID:
@@ -421,6 +586,21 @@ class PulledMetrics:
         """The UNIX timestamp of in which the VM setup ended."""
         return self.runner_installed_timestamp
 
+    @property
+    def boot_phase_durations(self) -> dict[str, NonNegativeFloat]:
+        """Seconds taken by each phase of the VM boot, in boot order.
+
+        A phase lasts from the end of the previous phase, or the creation of the VM for the
+        first, to its own end. The runner start phase ends when the runner listens for jobs, so
+        the phases add up to the time for the runner to come online.
+        """
+        durations: dict[str, NonNegativeFloat] = {}
+        previous_end = self.installation_start_timestamp
+        for phase, timestamp in self.boot_timestamps:
+            durations[phase.value] = max(timestamp - previous_end, 0.0)
+            previous_end = timestamp
+        return durations
+
 
 def issue_events(
     runner_metrics: RunnerMetrics,
@@ -515,12 +695,16 @@ def _issue_runner_installed(
         if runner_metrics.installation_start_timestamp
         else float("inf")
     )
+    boot_phases = runner_metrics.boot_phase_durations
     runner_installed = metric_events.RunnerInstalled(
         timestamp=installation_end_timestamp,
         flavor=flavor,
         duration=duration,
+        boot_phases=boot_phases or None,
     )
-    RUNNER_SPAWN_DURATION_SECONDS.labels(flavor).observe(duration)
+    RUNNER_SPAWN_DURATION_SECONDS.labels(flavor, runner_metrics.boot_profile).observe(duration)
+    for phase, phase_duration in boot_phases.items():
+        RUNNER_BOOT_PHASE_DURATION_SECONDS.labels(flavor, phase).observe(phase_duration)
     logger.debug("Issuing RunnerInstalled metric for runner %s", runner_metrics.instance_id)
     metric_events.issue_event(runner_installed)
 
@@ -0,0 +1,165 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Early detection of the runner VMs whose boot is stuck.
+
+A runner not online is otherwise only replaced once older than the maximum creation time. The
+userdata prints a marker on the console at the end of each boot phase, and another if it fails.
+The console of the booting VMs is checked, so a VM stuck in BUILD, whose userdata never started,
+failed or stopped progressing is replaced within minutes.
+"""
+
+import logging
+import time
+from enum import Enum
+from threading import Lock
+from typing import Callable, Iterable, Mapping, Sequence
+
+from github_runner_manager.manager.models import InstanceID
+from github_runner_manager.manager.vm_manager import VM, VMState
+from github_runner_manager.openstack_cloud.constants import CREATE_SERVER_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+BOOT_PHASE_MARKER = "github-runner-boot-phase"
+BOOT_FAILED_MARKER = "github-runner-boot-failed"
+
+# Number of lines of the console log fetched, enough to span the output of a boot phase.
+CONSOLE_OUTPUT_LINES = 1000
+# Seconds a VM is younger than before its console is checked.
+BOOT_CHECK_MIN_AGE = 2 * 60
+# Seconds a VM can be in BUILD.
+BUILD_TIMEOUT = CREATE_SERVER_TIMEOUT + 60
+# Seconds after its creation a VM must have started its userdata.
+USERDATA_START_TIMEOUT = 6 * 60
+# Seconds a VM can be without completing a boot phase.
+BOOT_STALL_TIMEOUT = 8 * 60
+
+
+class BootFailure(str, Enum):
+    """Cause of a stuck boot.
+
+    Attributes:
+        BUILD_TIMEOUT: The VM stayed in BUILD.
+        NO_USERDATA: The userdata did not start.
+        USERDATA_FAILED: The userdata exited with an error.
+        STALLED: The userdata stopped completing boot phases, or the runner never came online.
+    """
+
+    BUILD_TIMEOUT = "build_timeout"
+    NO_USERDATA = "no_userdata"
+    USERDATA_FAILED = "userdata_failed"
+    STALLED = "stalled"
+
+
+def parse_console_output(output: str) -> tuple[str | None, bool]:
+    """Parse the boot markers of the console log of a VM.
+
+    Args:
+        output: The tail of the console log.
+
+    Returns:
+        The last boot phase marker line, or None if not found, and whether the userdata failed.
+    """
+    last_phase = None
+    for line in output.splitlines():
+        if BOOT_FAILED_MARKER in line:
+            return last_phase, True
+        if BOOT_PHASE_MARKER in line:
+            last_phase = line[line.index(BOOT_PHASE_MARKER) :].strip()
+    return last_phase, False
+
+
+class BootWatchdog:  # pylint: disable=too-few-public-methods
+    """Detection of the stuck boots of the VMs.
+
+    The progress of a boot is the last boot phase marker seen on the console, with the monotonic
+    time it was first seen. The time is taken on the manager, so the clock of the VM is not
+    relied on.
+    """
+
+    def __init__(
+        self,
+        build_timeout: float = BUILD_TIMEOUT,
+        userdata_start_timeout: float = USERDATA_START_TIMEOUT,
+        stall_timeout: float = BOOT_STALL_TIMEOUT,
+    ):
+        """Construct the object.
+
+        Args:
+            build_timeout: Seconds a VM can be in BUILD.
+            userdata_start_timeout: Seconds after its creation a VM must have started its
+                userdata.
+            stall_timeout: Seconds a VM can be without completing a boot phase.
+        """
+        self._build_timeout = build_timeout
+        self._userdata_start_timeout = userdata_start_timeout
+        self._stall_timeout = stall_timeout
+        self._lock = Lock()
+        self._progress: dict[InstanceID, tuple[str, float]] = {}
+
+    def check(
+        self,
+        vms: Sequence[VM],
+        fetch_consoles: Callable[[Iterable[InstanceID]], Mapping[InstanceID, str]],
+    ) -> dict[InstanceID, BootFailure]:
+        """Check the boot of VMs with their runner not online yet.
+
+        The progress of the VMs not given is forgotten.
+
+        Args:
+            vms: The VMs booting.
+            fetch_consoles: Fetches the tail of the console log of VMs.
+
+        Returns:
+            The cause of the stuck boots by instance ID.
+        """
+        failures = {
+            vm.instance_id: BootFailure.BUILD_TIMEOUT
+            for vm in vms
+            if vm.state == VMState.CREATED and vm.is_older_than(self._build_timeout)
+        }
+        to_inspect = [
+            vm for vm in vms if vm.state == VMState.ACTIVE and vm.is_older_than(BOOT_CHECK_MIN_AGE)
+        ]
+        consoles = fetch_consoles(vm.instance_id for vm in to_inspect) if to_inspect else {}
+        now = time.monotonic()
+        with self._lock:
+            for instance_id in set(self._progress) - {vm.instance_id for vm in vms}:
+                del self._progress[instance_id]
+            for vm in to_inspect:
+                if (output := consoles.get(vm.instance_id)) is not None:
+                    if (failure := self._check_console(vm, output, now)) is not None:
+                        failures[vm.instance_id] = failure
+        for instance_id, failure in failures.items():
+            logger.warning("Boot of %s stuck: %s", instance_id, failure.value)
+        return failures
+
+    def _check_console(self, vm: VM, output: str, now: float) -> BootFailure | None:
+        """Check the boot of a VM from its console log, with the lock held.
+
+        Args:
+            vm: The VM.
+            output: The tail of the console log of the VM.
+            now: The current monotonic time.
+
+        Returns:
+            The cause of the stuck boot, or None if the boot is progressing.
+        """
+        last_phase, failed = parse_console_output(output)
+        if failed:
+            return BootFailure.USERDATA_FAILED
+        previous = self._progress.get(vm.instance_id)
+        if last_phase is None:
+            # The markers of the earlier phases can be out of the tail of the log.
+            if previous is None and vm.is_older_than(self._userdata_start_timeout):
+                return BootFailure.NO_USERDATA
+            last_phase = previous[0] if previous is not None else None
+        if last_phase is None:
+            return None
+        if previous is None or previous[0] != last_phase:
+            self._progress[vm.instance_id] = (last_phase, now)
+            return None
+        if now - previous[1] >= self._stall_timeout:
+            return BootFailure.STALLED
+        return None
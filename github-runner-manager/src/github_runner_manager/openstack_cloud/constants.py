@@ -12,6 +12,12 @@ METRICS_EXCHANGE_PATH = Path("/home/ubuntu/metrics-exchange")
 RUNNER_INSTALLED_TS_FILE_PATH = METRICS_EXCHANGE_PATH / "runner-installed.timestamp"
 PRE_JOB_METRICS_FILE_PATH = METRICS_EXCHANGE_PATH / "pre-job-metrics.json"
 POST_JOB_METRICS_FILE_PATH = METRICS_EXCHANGE_PATH / "post-job-metrics.json"
+BOOT_PHASES_FILE_PATH = METRICS_EXCHANGE_PATH / "boot-phases.timestamps"
+# Marker of the metrics files printed on the console by a VM powering off after its run, as the
+# metrics cannot be pulled over SSH from a VM powered off.
+CONSOLE_METRICS_MARKER = "github-runner-metrics"
+# Marker printed on the console by a VM right before powering off after its run, after the metrics.
+CONSOLE_POWEROFF_MARKER = "github-runner-poweroff"
 
 CREATE_SERVER_TIMEOUT = 5 * 60
 OPENSTACK_API_TIMEOUT = 5 * 60
@@ -5,7 +5,7 @@
 
 from dataclasses import dataclass
 
-from github_runner_manager.configuration import SupportServiceConfig
+from github_runner_manager.configuration import BootProfile, SupportServiceConfig
 from github_runner_manager.openstack_cloud.configuration import OpenStackCredentials
 
 
@@ -35,6 +35,7 @@ class OpenStackRunnerManagerConfig:
         credentials: The OpenStack authorization information.
         server_config: The configuration for OpenStack server.
         service_config: The configuration for supporting services.
+        boot_profile: The profile of the boot steps of the runner VMs.
     """
 
     allow_external_contributor: bool
@@ -42,3 +43,4 @@ class OpenStackRunnerManagerConfig:
     credentials: OpenStackCredentials
     server_config: OpenStackServerConfig | None
     service_config: SupportServiceConfig
+    boot_profile: BootProfile = BootProfile.STANDARD
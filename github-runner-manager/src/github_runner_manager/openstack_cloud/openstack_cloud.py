@@ -5,14 +5,13 @@
 
 import concurrent.futures
 import contextlib
-import copy
 import functools
 import logging
 import shutil
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from functools import reduce
+from functools import partial, reduce
 from pathlib import Path
 from typing import Any, Callable, Iterable, Iterator, ParamSpec, Sequence, TypeVar, cast
 
@@ -25,17 +24,32 @@ from openstack.compute.v2.keypair import Keypair as OpenstackKeypair
 from openstack.compute.v2.server import Server as OpenstackServer
 from openstack.connection import Connection as OpenstackConnection
 from openstack.network.v2.security_group import SecurityGroup as OpenstackSecurityGroup
-from openstack.network.v2.security_group_rule import SecurityGroupRule
 from paramiko.ssh_exception import NoValidConnectionsError
 
-from github_runner_manager.errors import KeyfileError, OpenStackError, SSHError
+from github_runner_manager.concurrency import Backend, get_limiter
+from github_runner_manager.errors import (
+    KeyfileError,
+    OpenStackError,
+    OpenStackQuotaError,
+    SSHError,
+)
 from github_runner_manager.manager.models import InstanceID, RunnerIdentity, RunnerMetadata
+from github_runner_manager.metrics import creation as creation_metrics
+from github_runner_manager.metrics.creation import Phase
 from github_runner_manager.openstack_cloud.configuration import OpenStackCredentials
 from github_runner_manager.openstack_cloud.constants import (
     CREATE_SERVER_TIMEOUT,
     OPENSTACK_API_TIMEOUT,
 )
 from github_runner_manager.openstack_cloud.models import OpenStackServerConfig
+from github_runner_manager.openstack_cloud.quota import (
+    FlavorResources,
+    QuotaUsage,
+    get_quota_cache,
+    is_quota_error,
+)
+from github_runner_manager.openstack_cloud.resolver import ServerConfigResolver
+from github_runner_manager.openstack_cloud.security_rules import get_missing_security_rules
 
 logger = logging.getLogger(__name__)
 
@@ -50,30 +64,6 @@ _TEST_STRING = "test_string"
 #        https://docs.openstack.org/api-ref/compute/#import-or-create-keypair
 _MAX_NOVA_COMPUTE_API_VERSION = "2.91"
 
-SecurityRuleDict = dict[str, Any]
-
-DEFAULT_SECURITY_RULES: dict[str, SecurityRuleDict] = {
-    "icmp": {
-        "protocol": "icmp",
-        "direction": "ingress",
-        "ethertype": "IPv4",
-    },
-    "ssh": {
-        "protocol": "tcp",
-        "port_range_min": 22,
-        "port_range_max": 22,
-        "direction": "ingress",
-        "ethertype": "IPv4",
-    },
-    "tmate_ssh": {
-        "protocol": "tcp",
-        "port_range_min": 10022,
-        "port_range_max": 10022,
-        "direction": "egress",
-        "ethertype": "IPv4",
-    },
-}
-
 # Keypairs younger than this value should not be deleted to avoid a race condition where
 # the openstack server is in construction but not yet returned by the API, and the keypair gets
 # deleted.
@@ -228,7 +218,7 @@ class _DeleteKeypairConfig:
     conn: OpenstackConnection
 
 
-class OpenstackCloud:
+class OpenstackCloud:  # pylint: disable=too-many-instance-attributes
     """Client to interact with OpenStack cloud.
 
     The OpenStack server name is managed by this cloud. Caller refers to the instances via
@@ -257,6 +247,9 @@ class OpenstackCloud:
         self._system_user = system_user
         self._ssh_key_dir = Path(f"~{system_user}").expanduser() / ".ssh"
         self._proxy_command = proxy_command
+        self._quota_cache = get_quota_cache(credentials)
+        self._flavor_resources: dict[str, FlavorResources] = {}
+        self._resolver = ServerConfigResolver()
 
     @_catch_openstack_errors
     def launch_instance(
@@ -276,6 +269,7 @@ class OpenstackCloud:
             ingress_tcp_ports: Ports to be allowed to connect to the new instance.
 
         Raises:
+            OpenStackQuotaError: The quota of the project is exhausted.
             OpenStackError: Unable to create OpenStack server.
 
         Returns:
@@ -286,52 +280,118 @@ class OpenstackCloud:
         metadata = runner_identity.metadata
 
         with self._get_openstack_connection() as conn:
-            security_group = OpenstackCloud._ensure_security_group(conn, ingress_tcp_ports)
-            keypair = self._setup_keypair(conn, runner_identity.instance_id)
+            with get_limiter(Backend.NEUTRON).slot(), creation_metrics.phase(Phase.SECGROUP):
+                security_group = OpenstackCloud._ensure_security_group(conn, ingress_tcp_ports)
             meta = metadata.as_dict()
             meta["prefix"] = self.prefix
-            try:
-                server = conn.create_server(
-                    name=instance_id.name,
-                    image=server_config.image,
-                    key_name=keypair.name,
-                    flavor=server_config.flavor,
-                    network=server_config.network,
-                    security_groups=[security_group.id],
-                    userdata=cloud_init,
-                    auto_ip=False,
-                    timeout=CREATE_SERVER_TIMEOUT,
-                    wait=False,
-                    meta=meta,
-                    # 2025/07/24 - This option is set to mitigate CVE-2024-6174
-                    config_drive=True,
-                )
-            except openstack.exceptions.ResourceTimeout as err:
-                logger.exception("Timeout creating openstack server %s", instance_id)
-                logger.info(
-                    "Attempting clean up of openstack server %s that timeout during creation",
-                    instance_id,
-                )
-                OpenstackCloud._delete_instance(
-                    _DeleteVMConfig(
-                        instance_id=instance_id,
-                        credentials=self._credentials,
-                        max_api_version=self._max_compute_api_version,
-                        keys_dir=self._ssh_key_dir,
+            resolved = self._resolver.resolve(conn, server_config)
+            with get_limiter(Backend.NOVA).slot():
+                with creation_metrics.phase(Phase.KEYPAIR):
+                    keypair = self._setup_keypair(conn, runner_identity.instance_id)
+                try:
+                    with creation_metrics.phase(Phase.NOVA_CREATE):
+                        server = conn.create_server(
+                            name=instance_id.name,
+                            image=resolved.image,
+                            key_name=keypair.name,
+                            flavor=resolved.flavor,
+                            nics=[{"net-id": resolved.network_id}],
+                            security_groups=[security_group.id],
+                            userdata=cloud_init,
+                            auto_ip=False,
+                            timeout=CREATE_SERVER_TIMEOUT,
+                            wait=False,
+                            meta=meta,
+                            # 2025/07/24 - This option is set to mitigate CVE-2024-6174
+                            config_drive=True,
+                        )
+                except openstack.exceptions.ResourceTimeout as err:
+                    logger.exception("Timeout creating openstack server %s", instance_id)
+                    logger.info(
+                        "Attempting clean up of openstack server %s that timeout during creation",
+                        instance_id,
                     )
-                )
-                raise OpenStackError(f"Timeout creating openstack server {instance_id}") from err
-            except openstack.exceptions.SDKException as err:
-                logger.exception("Failed to create openstack server %s", instance_id)
-                OpenstackCloud._delete_keypair(
-                    _DeleteKeypairConfig(
-                        keys_dir=self._ssh_key_dir, instance_id=instance_id, conn=conn
+                    OpenstackCloud._delete_instance(
+                        _DeleteVMConfig(
+                            instance_id=instance_id,
+                            credentials=self._credentials,
+                            max_api_version=self._max_compute_api_version,
+                            keys_dir=self._ssh_key_dir,
+                        )
                     )
-                )
-                raise OpenStackError(f"Failed to create openstack server {instance_id}") from err
+                    raise OpenStackError(
+                        f"Timeout creating openstack server {instance_id}"
+                    ) from err
+                except openstack.exceptions.SDKException as err:
+                    logger.exception("Failed to create openstack server %s", instance_id)
+                    # The resources may have been replaced, e.g. a new image with the same name.
+                    self._resolver.forget(server_config)
+                    OpenstackCloud._delete_keypair(
+                        _DeleteKeypairConfig(
+                            keys_dir=self._ssh_key_dir, instance_id=instance_id, conn=conn
+                        )
+                    )
+                    if is_quota_error(err):
+                        raise OpenStackQuotaError(
+                            f"Quota exhausted creating openstack server {instance_id}"
+                        ) from err
+                    raise OpenStackError(
+                        f"Failed to create openstack server {instance_id}"
+                    ) from err
 
             return OpenstackInstance.from_openstack_server(server, self.prefix)
 
+    @_catch_openstack_errors
+    def get_quota_headroom(self, flavor: str) -> int | None:
+        """Get the number of VMs of a flavor the quota of the project has room for.
+
+        The absolute limits and usage of the project are cached, see QuotaCache.
+
+        Args:
+            flavor: The name or ID of the flavor.
+
+        Returns:
+            The number of VMs, or None if the quota is unlimited.
+        """
+        usage = self._quota_cache.get(self._fetch_quota_usage)
+        return usage.headroom(self._get_flavor_resources(flavor))
+
+    def record_quota_usage(self, flavor: str, count: int) -> None:
+        """Account for VMs created, or deleted with a negative count, in the cached usage.
+
+        Args:
+            flavor: The name or ID of the flavor of the VMs.
+            count: The number of VMs.
+        """
+        # The flavor is known once the headroom was checked, otherwise the next fetch counts it.
+        if (resources := self._flavor_resources.get(flavor)) is not None:
+            self._quota_cache.record(resources, count)
+
+    def _fetch_quota_usage(self) -> QuotaUsage:
+        """Fetch the absolute limits and usage of the project from Nova.
+
+        Returns:
+            The limits and usage.
+        """
+        with self._get_openstack_connection() as conn:
+            return QuotaUsage.from_absolute_limits(conn.compute.get_limits().absolute)
+
+    def _get_flavor_resources(self, flavor: str) -> FlavorResources:
+        """Get the resources of a flavor, cached as flavors are immutable.
+
+        Args:
+            flavor: The name or ID of the flavor.
+
+        Returns:
+            The resources of a VM of the flavor.
+        """
+        if (resources := self._flavor_resources.get(flavor)) is None:
+            with self._get_openstack_connection() as conn:
+                found = conn.compute.find_flavor(flavor, ignore_missing=False)
+            resources = FlavorResources(vcpus=found.vcpus, ram=found.ram)
+            self._flavor_resources[flavor] = resources
+        return resources
+
     @_catch_openstack_errors
     def get_instance(self, instance_id: InstanceID) -> OpenstackInstance | None:
         """Get OpenStack instance by instance ID.
@@ -430,11 +490,17 @@ class OpenstackCloud:
             )
             for instance_id in instance_ids
         ]
+        limiter = get_limiter(Backend.NOVA)
         with concurrent.futures.ThreadPoolExecutor(
-            max_workers=min(len(instance_ids), 30)
+            max_workers=limiter.workers(len(instance_ids))
         ) as executor:
             future_to_delete_instance_config = {
-                executor.submit(OpenstackCloud._delete_instance, config): config
+                executor.submit(
+                    limiter.call,
+                    functools.partial(OpenstackCloud._delete_instance, config),
+                    # Waiting for the deletion to complete does not reflect the load of Nova.
+                    record_latency=not wait,
+                ): config
                 for config in delete_configs
             }
             for future in concurrent.futures.as_completed(future_to_delete_instance_config):
@@ -541,6 +607,32 @@ class OpenstackCloud:
                 if server is not None
             )
 
+    @_catch_openstack_errors
+    def get_console_outputs(
+        self, instance_ids: Iterable[InstanceID], length: int
+    ) -> dict[InstanceID, str]:
+        """Get the tail of the console log of OpenStack instances.
+
+        Args:
+            instance_ids: The instance IDs.
+            length: The number of lines of the console log to get.
+
+        Returns:
+            The console logs by instance ID. Instances whose log could not be fetched are left
+            out.
+        """
+        outputs = {}
+        limiter = get_limiter(Backend.NOVA)
+        with self._get_openstack_connection() as conn:
+            for instance_id in instance_ids:
+                try:
+                    outputs[instance_id] = limiter.call(
+                        partial(conn.get_server_console, instance_id.name, length=length)
+                    )
+                except openstack.exceptions.SDKException:
+                    logger.warning("Failed to get console log of %s", instance_id, exc_info=True)
+        return outputs
+
     @_catch_openstack_errors
     def delete_expired_keys(self) -> None:
         """Cleanup unused key files and openstack keypairs."""
@@ -871,49 +963,3 @@ class OpenstackCloud:
         return tuple(int(x) for x in version1.split(".")) > tuple(
             int(x) for x in version2.split(".")
         )
-
-
-def get_missing_security_rules(
-    security_group: OpenstackSecurityGroup, ingress_tcp_ports: list[int] | None
-) -> dict[str, SecurityRuleDict]:
-    """Get security rules to add to the security group.
-
-    Args:
-        security_group: The security group where rules will be added.
-        ingress_tcp_ports: Ports to create an ingress rule for.
-
-    Returns:
-        A dictionary with the rules that should be added to the security group.
-    """
-    missing_rules: dict[str, SecurityRuleDict] = {}
-
-    # We do not want to mess with the default security rules, so the deepcopy.
-    expected_rules = copy.deepcopy(DEFAULT_SECURITY_RULES)
-    if ingress_tcp_ports:
-        for tcp_port in ingress_tcp_ports:
-            expected_rules[f"tcp{tcp_port}"] = {
-                "protocol": "tcp",
-                "port_range_min": tcp_port,
-                "port_range_max": tcp_port,
-                "direction": "ingress",
-                "ethertype": "IPv4",
-            }
-
-    existing_rules = security_group.security_group_rules
-    for expected_rule_name, expected_rule in expected_rules.items():
-        expected_rule_found = False
-        for existing_rule in existing_rules:
-            if _rule_matches(existing_rule, expected_rule):
-                expected_rule_found = True
-                break
-        if not expected_rule_found:
-            missing_rules[expected_rule_name] = expected_rule
-    return missing_rules
-
-
-def _rule_matches(rule: SecurityGroupRule, expected_rule_dict: SecurityRuleDict) -> bool:
-    """Check if an expected rule matches a security rule."""
-    for condition_name, condition_value in expected_rule_dict.items():
-        if rule[condition_name] != condition_value:
-            return False
-    return True
@@ -5,6 +5,7 @@
 
 import logging
 import secrets
+from functools import partial
 from pathlib import Path
 from typing import Sequence
 
@@ -14,17 +15,30 @@ from github_runner_manager.configuration import UserInfo
 from github_runner_manager.errors import (
     MissingServerConfigError,
     OpenStackError,
+    OpenStackQuotaError,
     RunnerCreateError,
+    RunnerQuotaError,
 )
 from github_runner_manager.manager.models import InstanceID, RunnerContext, RunnerIdentity
-from github_runner_manager.manager.vm_manager import VM, CloudRunnerManager, RunnerMetrics, VMState
+from github_runner_manager.manager.vm_manager import (
+    VM,
+    CloudRunnerManager,
+    DeleteProgress,
+    RunnerMetrics,
+    VMState,
+)
+from github_runner_manager.metrics import creation as creation_metrics
 from github_runner_manager.metrics import runner as runner_metrics
+from github_runner_manager.metrics.creation import Phase
+from github_runner_manager.openstack_cloud.boot_watchdog import CONSOLE_OUTPUT_LINES, BootWatchdog
 from github_runner_manager.openstack_cloud.constants import (
+    CONSOLE_POWEROFF_MARKER,
     CREATE_SERVER_TIMEOUT,
     METRICS_EXCHANGE_PATH,
 )
 from github_runner_manager.openstack_cloud.models import OpenStackRunnerManagerConfig
 from github_runner_manager.openstack_cloud.openstack_cloud import OpenstackCloud, OpenstackInstance
+from github_runner_manager.openstack_cloud.pending_delete import PendingDeletes
 from github_runner_manager.utilities import set_env_var
 
 logger = logging.getLogger(__name__)
@@ -65,6 +79,13 @@ class OpenStackRunnerManager(CloudRunnerManager):
             system_user=user.user,
             proxy_command=config.service_config.manager_proxy_command,
         )
+        self._pending_deletes = PendingDeletes()
+        self._boot_watchdog = BootWatchdog()
+        # The console of a VM powered off does not change, so the VMs powered off without the
+        # marker are not checked again, and the console of the finished VMs is kept for their
+        # metrics.
+        self._unfinished_stopped_vms: set[InstanceID] = set()
+        self._finished_consoles: dict[InstanceID, str] = {}
         # Setting the env var to this process and any child process spawned.
         proxies = config.service_config.proxy_config
         if proxies and (no_proxy := proxies.no_proxy):
@@ -96,6 +117,7 @@ class OpenStackRunnerManager(CloudRunnerManager):
 
         Raises:
             MissingServerConfigError: Unable to create runner due to missing configuration.
+            RunnerQuotaError: Unable to create runner as the OpenStack quota is exhausted.
             RunnerCreateError: Unable to create runner due to OpenStack issues.
 
         Returns:
@@ -104,7 +126,8 @@ class OpenStackRunnerManager(CloudRunnerManager):
         if (server_config := self._config.server_config) is None:
             raise MissingServerConfigError("Missing server configuration to create runners")
 
-        cloud_init = self._generate_cloud_init(runner_context=runner_context)
+        with creation_metrics.phase(Phase.RENDER):
+            cloud_init = self._generate_cloud_init(runner_context=runner_context)
         try:
             instance = self._openstack_cloud.launch_instance(
                 runner_identity=runner_identity,
@@ -112,14 +135,33 @@ class OpenStackRunnerManager(CloudRunnerManager):
                 cloud_init=cloud_init,
                 ingress_tcp_ports=runner_context.ingress_tcp_ports,
             )
+        except OpenStackQuotaError as err:
+            raise RunnerQuotaError(
+                f"Quota exhausted creating {runner_identity} openstack runner"
+            ) from err
         except OpenStackError as err:
             raise RunnerCreateError(
                 f"Failed to create {runner_identity} openstack runner"
             ) from err
 
+        self._openstack_cloud.record_quota_usage(server_config.flavor, 1)
         logger.info("Runner %s created successfully", instance.instance_id)
         return self._build_cloud_runner_instance(instance)
 
+    def get_creation_headroom(self) -> int | None:
+        """Get the number of runners the quota of the OpenStack project has room for.
+
+        Returns:
+            The number of runners, or None if the quota is unlimited or unknown.
+        """
+        if (server_config := self._config.server_config) is None:
+            return None
+        try:
+            return self._openstack_cloud.get_quota_headroom(server_config.flavor)
+        except OpenStackError:
+            logger.warning("Failed to get the quota headroom, creation is not capped")
+            return None
+
     def get_vms(self) -> Sequence[VM]:
         """Get cloud self-hosted runners.
 
@@ -127,7 +169,87 @@ class OpenStackRunnerManager(CloudRunnerManager):
             Information on the runner instances.
         """
         instances = self._openstack_cloud.get_instances()
-        return [self._build_cloud_runner_instance(instance) for instance in instances]
+        pending_deletes = self._pending_deletes.update(
+            instance.instance_id for instance in instances
+        )
+        # The VMs count in the quota usage until their deletion completes.
+        if (completed := self._pending_deletes.pop_completed()) and (
+            server_config := self._config.server_config
+        ) is not None:
+            self._openstack_cloud.record_quota_usage(server_config.flavor, -completed)
+        return [
+            self._build_cloud_runner_instance(instance)
+            for instance in instances
+            if instance.instance_id not in pending_deletes
+        ]
+
+    def pop_delete_progress(self) -> DeleteProgress:
+        """Get the progress of the VM deletions, and reset the latencies of the completed ones.
+
+        Returns:
+            The progress of the deletions.
+        """
+        return DeleteProgress(
+            pending=len(self._pending_deletes),
+            completion_latencies=self._pending_deletes.pop_completion_latencies(),
+        )
+
+    def check_finished(self, vms: Sequence[VM]) -> set[InstanceID]:
+        """Check which of the VMs powered off did so after the run of their runner.
+
+        The userdata prints a marker on the console right before powering off after the run.
+        VMs powered off otherwise, e.g. by an operator or on a host failure, are left to the
+        cleanup. Their console is only fetched the first time they are checked, and the console
+        of the finished VMs is reused to extract their metrics.
+
+        Args:
+            vms: The VMs powered off.
+
+        Returns:
+            The instance IDs of the VMs with the power off marker on their console.
+        """
+        self._unfinished_stopped_vms &= {vm.instance_id for vm in vms}
+        self._finished_consoles = {}
+        to_check = [
+            vm.instance_id for vm in vms if vm.instance_id not in self._unfinished_stopped_vms
+        ]
+        if not to_check:
+            return set()
+        try:
+            outputs = self._openstack_cloud.get_console_outputs(
+                to_check, length=runner_metrics.CONSOLE_METRICS_LINES
+            )
+        except OpenStackError:
+            logger.warning("Failed to check the VMs powered off", exc_info=True)
+            return set()
+        self._finished_consoles = {
+            instance_id: output
+            for instance_id, output in outputs.items()
+            if CONSOLE_POWEROFF_MARKER in output
+        }
+        self._unfinished_stopped_vms |= set(outputs) - set(self._finished_consoles)
+        return set(self._finished_consoles)
+
+    def check_boots(self, vms: Sequence[VM]) -> dict[InstanceID, str]:
+        """Check the boot of VMs with their runner not online yet, to replace the stuck ones early.
+
+        Args:
+            vms: The VMs booting.
+
+        Returns:
+            The cause of the stuck boots by instance ID.
+        """
+        try:
+            failures = self._boot_watchdog.check(
+                vms,
+                fetch_consoles=partial(
+                    self._openstack_cloud.get_console_outputs, length=CONSOLE_OUTPUT_LINES
+                ),
+            )
+        except OpenStackError:
+            logger.warning("Failed to check the boot of VMs", exc_info=True)
+            return {}
+        return {instance_id: failure.value for instance_id, failure in failures.items()}
 
     def cleanup(self) -> None:
         """Cleanup runner and resource on the cloud."""
@@ -222,6 +344,7 @@ class OpenStackRunnerManager(CloudRunnerManager):
             dockerhub_mirror=service_config.dockerhub_mirror,
             ssh_debug_info=ssh_debug_info,
             runner_proxy_config=service_config.runner_proxy_config,
+            boot_profile=self._config.boot_profile.value,
         )
 
     def delete_vms(
@@ -237,9 +360,14 @@ class OpenStackRunnerManager(CloudRunnerManager):
         Returns:
             The instance IDs requested for deletion.
         """
-        return self._openstack_cloud.delete_instances(
+        deleted = self._openstack_cloud.delete_instances(
             instance_ids=instance_ids, wait=wait, timeout=timeout
         )
+        if not wait:
+            self._pending_deletes.add(deleted)
+        elif (server_config := self._config.server_config) is not None:
+            self._openstack_cloud.record_quota_usage(server_config.flavor, -len(deleted))
+        return deleted
 
     def extract_metrics(self, instance_ids: Sequence[InstanceID]) -> Sequence[RunnerMetrics]:
         """Extract metrics from cloud VMs.
@@ -251,5 +379,12 @@ class OpenStackRunnerManager(CloudRunnerManager):
             Metrics from VMs.
         """
         return runner_metrics.pull_runner_metrics(
-            cloud_service=self._openstack_cloud, instance_ids=instance_ids
+            cloud_service=self._openstack_cloud,
+            instance_ids=instance_ids,
+            boot_profile=self._config.boot_profile.value,
+            console_outputs={
+                instance_id: self._finished_consoles.pop(instance_id)
+                for instance_id in instance_ids
+                if instance_id in self._finished_consoles
+            },
         )
@@ -0,0 +1,107 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Tracking of the VMs with a deletion requested but not completed.
+
+The VMs are deleted without waiting, so a VM in the DELETING state, or still ACTIVE until Nova
+picks up the request, is listed for a while after its deletion. The VMs pending deletion are left
+out of the listing, so they are not counted as capacity by the reconciler.
+"""
+
+import logging
+import time
+from threading import Lock
+from typing import Iterable
+
+from github_runner_manager.manager.models import InstanceID
+
+logger = logging.getLogger(__name__)
+
+# Seconds a VM is left out of the listing after its deletion is requested. A VM still listed
+# afterwards is listed again, so its deletion can be retried.
+PENDING_DELETE_TTL = 10 * 60
+
+
+class PendingDeletes:
+    """VMs with a deletion requested, by monotonic time of the request."""
+
+    def __init__(self, ttl: float = PENDING_DELETE_TTL):
+        """Construct the object.
+
+        Args:
+            ttl: Seconds a VM is left out of the listing after its deletion is requested.
+        """
+        self._ttl = ttl
+        self._lock = Lock()
+        self._requested: dict[InstanceID, float] = {}
+        self._completion_latencies: list[float] = []
+        self._completed = 0
+
+    def add(self, instance_ids: Iterable[InstanceID]) -> None:
+        """Track VMs with a deletion requested.
+
+        Args:
+            instance_ids: The VMs.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for instance_id in instance_ids:
+                self._requested.setdefault(instance_id, now)
+
+    def update(self, listed: Iterable[InstanceID]) -> set[InstanceID]:
+        """Update the tracking with the VMs listed by the cloud.
+
+        The VMs no longer listed have completed their deletion. The VMs pending for longer than
+        the TTL are no longer tracked.
+
+        Args:
+            listed: The VMs listed by the cloud.
+
+        Returns:
+            The listed VMs still pending deletion.
+        """
+        listed = set(listed)
+        now = time.monotonic()
+        with self._lock:
+            for instance_id, requested_at in list(self._requested.items()):
+                if instance_id not in listed:
+                    self._completion_latencies.append(now - requested_at)
+                    self._completed += 1
+                    del self._requested[instance_id]
+                elif now - requested_at >= self._ttl:
+                    logger.warning(
+                        "Deletion of %s not completed after %s seconds", instance_id, self._ttl
+                    )
+                    del self._requested[instance_id]
+            return set(self._requested)
+
+    def __len__(self) -> int:
+        """Get the number of VMs pending deletion.
+
+        Returns:
+            The number of VMs.
+        """
+        with self._lock:
+            return len(self._requested)
+
+    def pop_completion_latencies(self) -> tuple[float, ...]:
+        """Get the latencies of the deletions completed since the last call.
+
+        Returns:
+            The seconds from the request of each deletion to the VM no longer listed.
+        """
+        with self._lock:
+            latencies = tuple(self._completion_latencies)
+            self._completion_latencies.clear()
+        return latencies
+
+    def pop_completed(self) -> int:
+        """Get the number of deletions completed since the last call.
+
+        Returns:
+            The number of VMs no longer listed.
+        """
+        with self._lock:
+            completed = self._completed
+            self._completed = 0
+        return completed
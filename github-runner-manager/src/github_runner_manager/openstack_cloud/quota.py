@@ -0,0 +1,205 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Cache of the Nova absolute limits and usage of the OpenStack project.
+
+Creating more VMs than the quota of the project allows fails most of the creations. The absolute
+limits and usage are fetched from Nova and cached, and the cache is updated by the VMs created
+and deleted by the application in between fetches, so the creation can be capped at the
+remaining headroom without querying Nova for each batch.
+
+The cache is shared by the runner managers of a project, as the quota is per project.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Callable
+
+from openstack.compute.v2.limits import AbsoluteLimits
+from openstack.exceptions import HttpException, SDKException
+
+from github_runner_manager.openstack_cloud.configuration import OpenStackCredentials
+
+logger = logging.getLogger(__name__)
+
+# Seconds the limits and usage are cached before fetched again.
+QUOTA_CACHE_TTL = 60
+# HTTP statuses of the requests rejected by Nova over the quota.
+_QUOTA_ERROR_STATUSES = (403, 413)
+
+
+@dataclass(frozen=True)
+class FlavorResources:
+    """Resources of a VM of a flavor counted against the quota.
+
+    Attributes:
+        vcpus: Number of vCPUs.
+        ram: RAM in MiB.
+    """
+
+    vcpus: int
+    ram: int
+
+
+@dataclass(frozen=True)
+class QuotaUsage:
+    """Nova absolute limits and usage of a project. A negative limit is unlimited.
+
+    Attributes:
+        max_instances: Maximum number of instances.
+        max_cores: Maximum number of vCPUs.
+        max_ram: Maximum RAM in MiB.
+        instances: Number of instances used.
+        cores: Number of vCPUs used.
+        ram: RAM used in MiB.
+    """
+
+    max_instances: int
+    max_cores: int
+    max_ram: int
+    instances: int
+    cores: int
+    ram: int
+
+    @classmethod
+    def from_absolute_limits(cls, limits: AbsoluteLimits) -> "QuotaUsage":
+        """Create the usage from the Nova absolute limits.
+
+        Args:
+            limits: The absolute limits of the project.
+
+        Returns:
+            The limits and usage.
+        """
+        return cls(
+            max_instances=limits.instances,
+            max_cores=limits.total_cores,
+            max_ram=limits.total_ram,
+            instances=limits.instances_used,
+            cores=limits.total_cores_used,
+            ram=limits.total_ram_used,
+        )
+
+    def headroom(self, flavor: FlavorResources) -> int | None:
+        """Get the number of VMs of a flavor the quota has room for.
+
+        Args:
+            flavor: The resources of the flavor.
+
+        Returns:
+            The number of VMs, or None if the quota is unlimited.
+        """
+        rooms = [
+            (limit - used) // per_vm
+            for limit, used, per_vm in (
+                (self.max_instances, self.instances, 1),
+                (self.max_cores, self.cores, flavor.vcpus),
+                (self.max_ram, self.ram, flavor.ram),
+            )
+            if limit >= 0 and per_vm > 0
+        ]
+        return max(min(rooms), 0) if rooms else None
+
+    def add(self, flavor: FlavorResources, count: int) -> "QuotaUsage":
+        """Account for VMs created, or deleted with a negative count.
+
+        Args:
+            flavor: The resources of the flavor of the VMs.
+            count: The number of VMs.
+
+        Returns:
+            The updated usage.
+        """
+        return replace(
+            self,
+            instances=max(self.instances + count, 0),
+            cores=max(self.cores + count * flavor.vcpus, 0),
+            ram=max(self.ram + count * flavor.ram, 0),
+        )
+
+
+class QuotaCache:
+    """Cache of the absolute limits and usage of a project, updated by the application's VMs."""
+
+    def __init__(self, ttl: float = QUOTA_CACHE_TTL):
+        """Construct the object.
+
+        Args:
+            ttl: Seconds the limits and usage are cached before fetched again.
+        """
+        self._ttl = ttl
+        self._lock = Lock()
+        self._usage: QuotaUsage | None = None
+        self._fetched_at = 0.0
+
+    def get(self, fetch: Callable[[], QuotaUsage]) -> QuotaUsage:
+        """Get the limits and usage, fetching them if the cache expired.
+
+        Args:
+            fetch: Fetches the limits and usage from Nova.
+
+        Returns:
+            The limits and usage.
+        """
+        with self._lock:
+            if self._usage is not None and time.monotonic() - self._fetched_at < self._ttl:
+                return self._usage
+        # Fetched without the lock, so the creations of other runner managers are not blocked.
+        usage = fetch()
+        with self._lock:
+            self._usage = usage
+            self._fetched_at = time.monotonic()
+        logger.debug("Fetched quota usage: %s", usage)
+        return usage
+
+    def record(self, flavor: FlavorResources, count: int) -> None:
+        """Account for VMs created, or deleted with a negative count, until the next fetch.
+
+        Args:
+            flavor: The resources of the flavor of the VMs.
+            count: The number of VMs.
+        """
+        with self._lock:
+            if self._usage is not None:
+                self._usage = self._usage.add(flavor, count)
+
+
+_caches: dict[tuple[str, str, str, str], QuotaCache] = {}
+_caches_lock = Lock()
+
+
+def get_quota_cache(credentials: OpenStackCredentials) -> QuotaCache:
+    """Get the quota cache shared by the runner managers of a project.
+
+    Args:
+        credentials: The credentials of the project.
+
+    Returns:
+        The quota cache of the project.
+    """
+    key = (
+        credentials.auth_url,
+        credentials.region_name,
+        credentials.project_domain_name,
+        credentials.project_name,
+    )
+    with _caches_lock:
+        return _caches.setdefault(key, QuotaCache())
+
+
+def is_quota_error(error: SDKException) -> bool:
+    """Check whether an OpenStack error is a request rejected over the quota of the project.
+
+    Args:
+        error: The OpenStack error.
+
+    Returns:
+        Whether the quota of the project is exhausted.
+    """
+    return (
+        isinstance(error, HttpException)
+        and error.status_code in _QUOTA_ERROR_STATUSES
+        and "quota" in str(error).lower()
+    )
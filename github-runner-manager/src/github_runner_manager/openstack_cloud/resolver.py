@@ -0,0 +1,117 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Resolution of the image, flavor and network names of the server configuration.
+
+Passed by name, the image, flavor and network are looked up by openstacksdk with Glance, Nova
+and Neutron calls on every VM creation. They are resolved once and reused for a while instead.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from threading import Lock
+
+from openstack.compute.v2.flavor import Flavor as OpenstackFlavor
+from openstack.connection import Connection as OpenstackConnection
+from openstack.image.v2.image import Image as OpenstackImage
+
+from github_runner_manager.openstack_cloud.models import OpenStackServerConfig
+
+logger = logging.getLogger(__name__)
+
+# Seconds a resolution is reused before resolved again.
+RESOLVE_TTL = 10 * 60
+
+
+@dataclass(frozen=True)
+class ResolvedServerConfig:
+    """Resources of a server configuration resolved from their names.
+
+    The image and flavor are passed to the create call as resources, and the network as a NIC
+    by ID, so openstacksdk does not look them up again.
+
+    Attributes:
+        image: The image.
+        flavor: The flavor.
+        network_id: The ID of the network.
+        resolved_at: Monotonic time of the resolution.
+    """
+
+    image: OpenstackImage
+    flavor: OpenstackFlavor
+    network_id: str
+    resolved_at: float
+
+
+class ServerConfigResolver:
+    """Resolve server configurations, reusing the resolutions for RESOLVE_TTL seconds.
+
+    The resolutions are keyed by the names, so a configuration changed by the charm, e.g. a new
+    image from the image integration, is resolved anew.
+    """
+
+    def __init__(self, ttl: float = RESOLVE_TTL):
+        """Construct the object.
+
+        Args:
+            ttl: Seconds a resolution is reused before resolved again.
+        """
+        self._ttl = ttl
+        self._lock = Lock()
+        self._resolved: dict[tuple[str, str, str], ResolvedServerConfig] = {}
+
+    def resolve(
+        self, conn: OpenstackConnection, server_config: OpenStackServerConfig
+    ) -> ResolvedServerConfig:
+        """Resolve the image, flavor and network of a server configuration.
+
+        Args:
+            conn: The OpenStack connection.
+            server_config: The server configuration.
+
+        Returns:
+            The resolved resources.
+        """
+        key = _key(server_config)
+        with self._lock:
+            resolved = self._resolved.get(key)
+        if resolved is not None and time.monotonic() - resolved.resolved_at < self._ttl:
+            return resolved
+        image = conn.image.find_image(server_config.image, ignore_missing=False)
+        flavor = conn.compute.find_flavor(server_config.flavor, ignore_missing=False)
+        network = conn.network.find_network(server_config.network, ignore_missing=False)
+        resolved = ResolvedServerConfig(
+            image=image, flavor=flavor, network_id=network.id, resolved_at=time.monotonic()
+        )
+        logger.info(
+            "Resolved server configuration %s to image %s, flavor %s and network %s",
+            key,
+            image.id,
+            flavor.id,
+            network.id,
+        )
+        with self._lock:
+            self._resolved[key] = resolved
+        return resolved
+
+    def forget(self, server_config: OpenStackServerConfig) -> None:
+        """Resolve a server configuration anew on the next creation, e.g. after a failure.
+
+        Args:
+            server_config: The server configuration.
+        """
+        with self._lock:
+            self._resolved.pop(_key(server_config), None)
+
+
+def _key(server_config: OpenStackServerConfig) -> tuple[str, str, str]:
+    """Get the key of the resolution of a server configuration.
+
+    Args:
+        server_config: The server configuration.
+
+    Returns:
+        The names of the image, flavor and network.
+    """
+    return (server_config.image, server_config.flavor, server_config.network)
@@ -0,0 +1,80 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Security group rules of the runner VMs."""
+
+import copy
+from typing import Any
+
+from openstack.network.v2.security_group import SecurityGroup as OpenstackSecurityGroup
+from openstack.network.v2.security_group_rule import SecurityGroupRule
+
+SecurityRuleDict = dict[str, Any]
+
+DEFAULT_SECURITY_RULES: dict[str, SecurityRuleDict] = {
+    "icmp": {
+        "protocol": "icmp",
+        "direction": "ingress",
+        "ethertype": "IPv4",
+    },
+    "ssh": {
+        "protocol": "tcp",
+        "port_range_min": 22,
+        "port_range_max": 22,
+        "direction": "ingress",
+        "ethertype": "IPv4",
+    },
+    "tmate_ssh": {
+        "protocol": "tcp",
+        "port_range_min": 10022,
+        "port_range_max": 10022,
+        "direction": "egress",
+        "ethertype": "IPv4",
+    },
+}
+
+
+def get_missing_security_rules(
+    security_group: OpenstackSecurityGroup, ingress_tcp_ports: list[int] | None
+) -> dict[str, SecurityRuleDict]:
+    """Get security rules to add to the security group.
+
+    Args:
+        security_group: The security group where rules will be added.
+        ingress_tcp_ports: Ports to create an ingress rule for.
+
+    Returns:
+        A dictionary with the rules that should be added to the security group.
+    """
+    missing_rules: dict[str, SecurityRuleDict] = {}
+
+    # We do not want to mess with the default security rules, so the deepcopy.
+    expected_rules = copy.deepcopy(DEFAULT_SECURITY_RULES)
+    if ingress_tcp_ports:
+        for tcp_port in ingress_tcp_ports:
+            expected_rules[f"tcp{tcp_port}"] = {
+                "protocol": "tcp",
+                "port_range_min": tcp_port,
+                "port_range_max": tcp_port,
+                "direction": "ingress",
+                "ethertype": "IPv4",
+            }
+
+    existing_rules = security_group.security_group_rules
+    for expected_rule_name, expected_rule in expected_rules.items():
+        expected_rule_found = False
+        for existing_rule in existing_rules:
+            if _rule_matches(existing_rule, expected_rule):
+                expected_rule_found = True
+                break
+        if not expected_rule_found:
+            missing_rules[expected_rule_name] = expected_rule
+    return missing_rules
+
+
+def _rule_matches(rule: SecurityGroupRule, expected_rule_dict: SecurityRuleDict) -> bool:
+    """Check if an expected rule matches a security rule."""
+    for condition_name, condition_value in expected_rule_dict.items():
+        if rule[condition_name] != condition_value:
+            return False
+    return True
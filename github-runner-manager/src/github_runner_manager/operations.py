@@ -0,0 +1,188 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Asynchronous operations on the set of runners requested through the HTTP server.
+
+Operations such as flush may wait minutes for the locks of the runner managers. Instead of
+holding the HTTP request open, the operation is queued and run by a worker, and its progress and
+result are tracked by an operation ID.
+"""
+
+import dataclasses
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from queue import Queue
+from threading import Lock
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# Number of finished operations kept for querying.
+MAX_FINISHED_OPERATIONS = 100
+
+
+class OperationStatus(str, Enum):
+    """Status of an operation.
+
+    Attributes:
+        PENDING: Waiting to be run.
+        RUNNING: Running.
+        SUCCEEDED: Finished successfully.
+        FAILED: Finished with an error.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class Operation:  # pylint: disable=too-many-instance-attributes
+    """State of an operation.
+
+    Attributes:
+        id: The operation ID.
+        kind: The kind of operation, e.g. flush.
+        params: The parameters of the operation.
+        status: The status of the operation.
+        created_at: UNIX timestamp of the request.
+        started_at: UNIX timestamp of the start of the run.
+        finished_at: UNIX timestamp of the end of the run.
+        result: The result of a succeeded operation.
+        error: The error of a failed operation.
+        finished: Whether the operation has finished.
+    """
+
+    id: str
+    kind: str
+    params: dict[str, Any]
+    status: OperationStatus = OperationStatus.PENDING
+    created_at: float = dataclasses.field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the operation has finished."""
+        return self.status in (OperationStatus.SUCCEEDED, OperationStatus.FAILED)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert the operation into a JSON serializable dictionary.
+
+        Returns:
+            The operation as a dictionary.
+        """
+        operation = dataclasses.asdict(self)
+        operation["status"] = self.status.value
+        return operation
+
+
+class OperationWorker:
+    """Queue operations and run them one at a time.
+
+    Operations acquire the locks of the runner managers they modify themselves.
+    """
+
+    def __init__(self) -> None:
+        """Construct the object."""
+        self._operations_lock = Lock()
+        self._operations: OrderedDict[str, Operation] = OrderedDict()
+        self._queue: Queue[tuple[str, Callable[[], dict[str, Any]]] | None] = Queue()
+
+    def submit(
+        self, kind: str, params: dict[str, Any], func: Callable[[], dict[str, Any]]
+    ) -> Operation:
+        """Queue an operation.
+
+        An identical operation still pending is returned instead of queuing another.
+
+        Args:
+            kind: The kind of operation, e.g. flush.
+            params: The parameters of the operation.
+            func: Runs the operation and returns its JSON serializable result.
+
+        Returns:
+            The queued operation.
+        """
+        with self._operations_lock:
+            for operation in self._operations.values():
+                if (
+                    operation.status == OperationStatus.PENDING
+                    and operation.kind == kind
+                    and operation.params == params
+                ):
+                    logger.info("Coalescing %s operation into pending %s", kind, operation.id)
+                    return operation
+            operation = Operation(id=uuid.uuid4().hex, kind=kind, params=params)
+            self._operations[operation.id] = operation
+            self._prune()
+        logger.info("Queued %s operation %s: %s", kind, operation.id, params)
+        self._queue.put((operation.id, func))
+        return operation
+
+    def get(self, operation_id: str) -> Operation | None:
+        """Get the state of an operation.
+
+        Args:
+            operation_id: The operation ID.
+
+        Returns:
+            The operation, or None if it is unknown or was pruned.
+        """
+        with self._operations_lock:
+            return self._operations.get(operation_id)
+
+    def run(self) -> None:
+        """Run queued operations until stopped."""
+        while (item := self._queue.get()) is not None:
+            operation_id, func = item
+            self._update(operation_id, status=OperationStatus.RUNNING, started_at=time.time())
+            logger.info("Running operation %s", operation_id)
+            try:
+                result = func()
+            # The error is reported through the operation status.
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                logger.exception("Operation %s failed", operation_id)
+                self._update(
+                    operation_id,
+                    status=OperationStatus.FAILED,
+                    finished_at=time.time(),
+                    error=str(err) or type(err).__name__,
+                )
+            else:
+                logger.info("Operation %s succeeded", operation_id)
+                self._update(
+                    operation_id,
+                    status=OperationStatus.SUCCEEDED,
+                    finished_at=time.time(),
+                    result=result,
+                )
+
+    def stop(self) -> None:
+        """Stop the worker after the operations already queued."""
+        self._queue.put(None)
+
+    def _update(self, operation_id: str, **changes: Any) -> None:
+        """Update the state of an operation.
+
+        Args:
+            operation_id: The operation ID.
+            changes: The fields to change.
+        """
+        with self._operations_lock:
+            self._operations[operation_id] = dataclasses.replace(
+                self._operations[operation_id], **changes
+            )
+
+    def _prune(self) -> None:
+        """Forget the oldest finished operations beyond MAX_FINISHED_OPERATIONS."""
+        finished = [op_id for op_id, op in self._operations.items() if op.finished]
+        for operation_id in finished[: max(len(finished) - MAX_FINISHED_OPERATIONS, 0)]:
+            del self._operations[operation_id]
@@ -35,11 +35,14 @@ class PlannerConfiguration(BaseModel):
         base_url: Base URL of the planner service.
         token: Bearer token used to authenticate against the planner service.
         timeout: Default timeout in seconds for HTTP requests.
+        stream_idle_timeout: Seconds without data, including blank heartbeat lines, after which
+            the pressure stream is considered stalled.
     """
 
     base_url: AnyHttpUrl
     token: str
     timeout: int = 5 * 60
+    stream_idle_timeout: int = 60
 
 
 class PlannerApiError(Exception):
@@ -63,9 +66,43 @@ class PlannerClient:  # pylint: disable=too-few-public-methods
         self._session = self._create_session()
         self._config = config
 
+    def get_pressure(self, name: str) -> PressureInfo:
+        """Get the current pressure for the given flavor.
+
+        Args:
+            name: Flavor name.
+
+        Returns:
+            The current pressure.
+
+        Raises:
+            PlannerConnectionError: On transient connection errors or timeouts.
+            PlannerApiError: On other HTTP errors or a malformed response.
+        """
+        url = urljoin(
+            str(self._config.base_url).rstrip("/") + "/", f"api/v1/flavors/{name}/pressure"
+        )
+        try:
+            response = self._session.get(
+                url,
+                headers={"Authorization": f"Bearer {self._config.token}"},
+                timeout=self._config.timeout,
+            )
+            response.raise_for_status()
+            return PressureInfo(pressure=int(response.json()[name]))
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            raise PlannerConnectionError(str(exc)) from exc
+        except requests.RequestException as exc:
+            raise PlannerApiError(str(exc)) from exc
+        except (ValueError, KeyError, TypeError) as exc:
+            raise PlannerApiError(f"Malformed pressure response: {exc}") from exc
+
     def stream_pressure(self, name: str) -> Iterable[PressureInfo]:
         """Stream pressure updates for the given flavor.
 
+        The stream is considered stalled, and a PlannerConnectionError is raised, when no data,
+        including blank heartbeat lines, is received for `stream_idle_timeout` seconds.
+
         Args:
             name: Flavor name.
 
@@ -82,7 +119,7 @@ class PlannerClient:  # pylint: disable=too-few-public-methods
             with self._session.get(
                 url,
                 headers={"Authorization": f"Bearer {self._config.token}"},
-                timeout=self._config.timeout,
+                timeout=(self._config.timeout, self._config.stream_idle_timeout),
                 stream=True,
             ) as response:
                 response.raise_for_status()
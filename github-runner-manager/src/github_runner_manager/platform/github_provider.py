@@ -7,9 +7,11 @@ import concurrent.futures
 import logging
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 
 from pydantic import HttpUrl
 
+from github_runner_manager.concurrency import Backend, get_limiter
 from github_runner_manager.configuration.github import GitHubConfiguration, GitHubPath, GitHubRepo
 from github_runner_manager.github_client import (
     DeleteRunnerBusyError,
@@ -22,6 +24,8 @@ from github_runner_manager.manager.models import (
     RunnerIdentity,
     RunnerMetadata,
 )
+from github_runner_manager.metrics import creation as creation_metrics
+from github_runner_manager.metrics.creation import Phase
 from github_runner_manager.platform.platform_provider import (
     JobInfo,
     PlatformProvider,
@@ -185,11 +189,16 @@ class GitHubRunnerPlatform(PlatformProvider):
             for runner_id in runner_ids
         ]
         deleted_runner_ids: list[str] = []
+        limiter = get_limiter(Backend.GITHUB)
         with concurrent.futures.ThreadPoolExecutor(
-            max_workers=min(len(runner_ids), 30)
+            max_workers=limiter.workers(len(runner_ids))
         ) as executor:
             future_to_delete_runner_config = {
-                executor.submit(GitHubRunnerPlatform._delete_runner, config): config
+                executor.submit(
+                    limiter.call,
+                    partial(GitHubRunnerPlatform._delete_runner, config),
+                    ignored_errors=(DeleteRunnerBusyError,),
+                ): config
                 for config in delete_configs
             }
             for future in concurrent.futures.as_completed(future_to_delete_runner_config):
@@ -233,9 +242,10 @@ class GitHubRunnerPlatform(PlatformProvider):
         Returns:
             The registration token and the runner.
         """
-        token, runner = self._client.get_runner_registration_jittoken(
-            self._path, instance_id, labels
-        )
+        with get_limiter(Backend.GITHUB).slot(), creation_metrics.phase(Phase.JIT):
+            token, runner = self._client.get_runner_registration_jittoken(
+                self._path, instance_id, labels
+            )
         command_to_run = (
             "su - ubuntu -c "
             f'"cd ~/actions-runner && /home/ubuntu/actions-runner/run.sh --jitconfig {token}"'
@@ -6,6 +6,7 @@
 import functools
 import logging
 import os
+import random
 import subprocess  # nosec B404
 import time
 from typing import Any, Callable, Optional, Sequence, Type, TypeVar
@@ -156,3 +157,42 @@ def set_env_var(env_var: str, value: str) -> None:
     """
     os.environ[env_var.upper()] = value
     os.environ[env_var.lower()] = value
+
+
+class ExponentialBackoff:
+    """Jittered exponential backoff between retries.
+
+    The delay doubles, by default, with each attempt up to a cap. Half of the delay is random,
+    so that clients failing together do not retry together.
+
+    Attributes:
+        attempts: Number of delays given since the last reset.
+    """
+
+    def __init__(self, base: float, cap: float, factor: float = 2):
+        """Construct the object.
+
+        Args:
+            base: Delay in seconds of the first attempt, before jitter.
+            cap: Maximum delay in seconds.
+            factor: Factor to increase the delay by each attempt.
+        """
+        self._base = base
+        self._cap = cap
+        self._factor = factor
+        self.attempts = 0
+
+    def next_delay(self) -> float:
+        """Get the delay before the next attempt.
+
+        Returns:
+            The delay in seconds.
+        """
+        delay = min(self._cap, self._base * self._factor**self.attempts)
+        self.attempts += 1
+        # The jitter is not used for security.
+        return delay / 2 + random.uniform(0, delay / 2)  # nosec B311
+
+    def reset(self) -> None:
+        """Restart from the base delay, e.g. after a success."""
+        self.attempts = 0
@@ -0,0 +1,71 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Load benchmark of the HTTP server.
+
+Binds a local port and depends on the timing of the host, so it is run by the benchmark tox
+environment rather than with the unit tests.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import requests
+
+from github_runner_manager.locking import InstrumentedLock
+from src.github_runner_manager.http_server import (
+    ACCESS_LOG_SAMPLE_CONFIG_NAME,
+    RUNNER_MANAGERS_CONFIG_NAME,
+    FlaskArgs,
+    HttpServer,
+    ManagedRunners,
+    app,
+    create_waitress_server,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def test_waitress_concurrent_scrapes_benchmark() -> None:
+    """
+    arrange: Start the waitress server on a free port with a bounded worker pool.
+    act: Scrape /metrics concurrently from more clients than worker threads.
+    assert: All scrapes succeed. The throughput is logged as the load benchmark.
+    """
+    app.config[RUNNER_MANAGERS_CONFIG_NAME] = [
+        ManagedRunners(MagicMock(), InstrumentedLock("shared", "benchmark"))
+    ]
+    app.config[ACCESS_LOG_SAMPLE_CONFIG_NAME] = 0
+    server = create_waitress_server(
+        FlaskArgs(host="127.0.0.1", port=0, debug=False, server=HttpServer.WAITRESS, threads=4)
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    url = f"http://127.0.0.1:{server.effective_port}/metrics"
+    clients, scrapes_per_client = 16, 25
+
+    def scrape(_: int) -> list[int]:
+        """Scrape the metrics with a keep-alive session."""
+        with requests.Session() as session:
+            return [session.get(url, timeout=30).status_code for _ in range(scrapes_per_client)]
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=clients) as executor:
+            status_codes = [
+                code for codes in executor.map(scrape, range(clients)) for code in codes
+            ]
+    finally:
+        server.close()
+        server.task_dispatcher.shutdown()
+    duration = time.perf_counter() - start
+
+    assert status_codes == [200] * clients * scrapes_per_client
+    logger.info(
+        "Served %s concurrent /metrics scrapes in %.2fs (%.0f requests/s)",
+        len(status_codes),
+        duration,
+        len(status_codes) / duration,
+    )
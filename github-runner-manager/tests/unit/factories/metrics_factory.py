@@ -4,7 +4,7 @@
 """Factories for Metrics objects."""
 
 import secrets
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 import factory
@@ -185,6 +185,8 @@ class _RunnerMetricsAble:
         installation_end_timestamp: The UNIX timestamp of in which the VM setup ended.
         pre_job: The metrics for the pre-job phase.
         post_job: The metrics for the post-job phase.
+        boot_phase_durations: Seconds taken by each phase of the VM boot, in boot order.
+        boot_profile: The boot profile of the VM.
     """
 
     pre_job: PreJobMetrics | None
@@ -193,6 +195,8 @@ class _RunnerMetricsAble:
     instance_id: InstanceID
     installation_start_timestamp: NonNegativeFloat
     installation_end_timestamp: NonNegativeFloat | None
+    boot_phase_durations: dict[str, NonNegativeFloat] = field(default_factory=dict)
+    boot_profile: str = "standard"
 
 
 class RunnerMetricsFactory(factory.Factory):
@@ -0,0 +1,83 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Test for the backoff of the creation of runners after failed creations."""
+
+import math
+
+from prometheus_client import REGISTRY
+
+from github_runner_manager.manager.creation_backoff import CreationBackoff
+from github_runner_manager.manager.runner_creation import CreationFailure
+
+SCHEDULES = {CreationFailure.TRANSIENT: (10, 40), CreationFailure.QUOTA: (100, 400)}
+
+
+def test_backoff_grows_by_class():
+    """
+    arrange: A creation backoff.
+    act: Record transient failures, a quota failure, then a success and a transient failure.
+    assert: The delays grow up to the cap of the class, restart from the base when the class \
+        changes and after a success.
+    """
+    backoff = CreationBackoff("test-backoff", schedules=SCHEDULES)
+
+    transient = [backoff.record_failure(CreationFailure.TRANSIENT, now=0) for _ in range(4)]
+    quota = backoff.record_failure(CreationFailure.QUOTA, now=0)
+    backoff.record_success(now=0)
+    after_success = backoff.record_failure(CreationFailure.TRANSIENT, now=0)
+
+    for delay, maximum in zip(transient, (10, 20, 40, 40)):
+        assert maximum / 2 <= delay <= maximum
+    assert 50 <= quota <= 100
+    assert 5 <= after_success <= 10
+
+
+def test_backoff_pause_ends_and_is_counted():
+    """
+    arrange: A creation backoff after a transient failure at time 0.
+    act: Check the pause before and after the delay.
+    assert: The creation is paused until the delay elapses, and the pause is counted once \
+        over, up to the delay.
+    """
+    backoff = CreationBackoff("test-backoff-pause", schedules=SCHEDULES)
+    labels = {"flavor": "test-backoff-pause", "cause": "transient"}
+    delay = backoff.record_failure(CreationFailure.TRANSIENT, now=0)
+
+    paused_before = backoff.is_paused(delay - 1)
+    remaining = backoff.remaining(delay - 1)
+    paused_seconds = backoff.paused_seconds(delay - 1)
+    paused_after = backoff.is_paused(delay + 100)
+
+    assert paused_before
+    assert remaining == 1
+    assert paused_seconds == delay - 1
+    assert not paused_after
+    assert REGISTRY.get_sample_value("creation_paused_seconds_total", labels) == delay
+    assert backoff.failure == CreationFailure.TRANSIENT
+
+
+def test_backoff_config_failure_stops_until_resumed():
+    """
+    arrange: A creation backoff.
+    act: Record a configuration failure, then resume the stopped creation.
+    assert: The creation is stopped until resumed, and a transient pause is not resumed.
+    """
+    backoff = CreationBackoff("test-backoff-config", schedules=SCHEDULES)
+
+    delay = backoff.record_failure(CreationFailure.CONFIG, now=0)
+    paused = backoff.is_paused(10**9)
+    resumed = backoff.resume_stopped(now=100)
+    backoff.record_failure(CreationFailure.TRANSIENT, now=100)
+
+    assert math.isinf(delay)
+    assert paused
+    assert resumed
+    assert not backoff.resume_stopped(now=101)
+    assert backoff.is_paused(101)
+    assert (
+        REGISTRY.get_sample_value(
+            "creation_paused_seconds_total", {"flavor": "test-backoff-config", "cause": "config"}
+        )
+        == 100
+    )
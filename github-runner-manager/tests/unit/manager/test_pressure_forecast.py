@@ -0,0 +1,96 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Unit tests for the pressure forecaster."""
+
+import pytest
+
+from github_runner_manager.manager.pressure_forecast import (
+    MAX_PEAK_MULTIPLE,
+    MIN_OBSERVATIONS,
+    SECONDS_PER_DAY,
+    PressureForecaster,
+)
+
+
+def test_forecast_needs_observations():
+    """
+    arrange: A forecaster with fewer updates observed than required.
+    act: Forecast the pressure.
+    assert: No forecast is made.
+    """
+    forecaster = PressureForecaster(horizon=600)
+    for index in range(MIN_OBSERVATIONS - 1):
+        forecaster.observe(index * 60, 5)
+
+    assert forecaster.forecast(MIN_OBSERVATIONS * 60) is None
+
+
+def test_forecast_follows_ramp():
+    """
+    arrange: A forecaster observing a pressure rising by one every minute.
+    act: Forecast the pressure 10 minutes ahead.
+    assert: The forecast is above the latest pressure.
+    """
+    forecaster = PressureForecaster(horizon=600)
+    for index in range(30):
+        forecaster.observe(index * 60, index)
+
+    forecast = forecaster.forecast(29 * 60)
+
+    assert forecast is not None
+    assert 29 + 3 < forecast <= 29 + 10 + 1
+
+
+def test_forecast_stale_updates():
+    """
+    arrange: A forecaster observing a steep ramp, then no updates for a day.
+    act: Forecast the pressure within the horizon and a day after the last update.
+    assert: The forecast is capped at a multiple of the peak, and no forecast is made from \
+        stale updates.
+    """
+    forecaster = PressureForecaster(horizon=600)
+    for index in range(30):
+        forecaster.observe(index * 60, index * 10)
+
+    forecast = forecaster.forecast(29 * 60 + 600)
+
+    assert forecast is not None
+    assert forecast <= MAX_PEAK_MULTIPLE * 290
+    assert forecaster.forecast(29 * 60 + SECONDS_PER_DAY) is None
+
+
+def test_forecast_time_of_day_seasonality():
+    """
+    arrange: A forecaster observing two weeks of hourly pressure, high at 9:00 only.
+    act: Forecast the pressure one hour ahead at 8:00 and at 12:00.
+    assert: The 9:00 ramp is anticipated at 8:00, and no ramp is forecast at 12:00.
+    """
+    forecaster = PressureForecaster(horizon=3600)
+    now = 14 * SECONDS_PER_DAY
+    for hour in range(14 * 24 + 9):
+        forecaster.observe(hour * 3600 + 60, 20 if hour % 24 == 9 else 0)
+    forecast_at_8 = forecaster.forecast(now + 8 * 3600 + 60)
+    for hour in range(14 * 24 + 9, 14 * 24 + 13):
+        forecaster.observe(hour * 3600 + 60, 20 if hour % 24 == 9 else 0)
+    forecast_at_12 = forecaster.forecast(now + 12 * 3600 + 60)
+
+    assert forecast_at_8 is not None and forecast_at_8 > 10
+    assert forecast_at_12 is not None and forecast_at_12 < 1
+
+
+def test_observe_compares_past_forecasts():
+    """
+    arrange: A forecaster observing a constant pressure.
+    act: Observe the pressure after the forecast horizon.
+    assert: The forecast made for up to that time is compared with the pressure.
+    """
+    forecaster = PressureForecaster(horizon=60)
+    for index in range(MIN_OBSERVATIONS):
+        assert forecaster.observe(index, 4) == []
+
+    (sample,) = forecaster.observe(MIN_OBSERVATIONS + 60, 6)
+
+    assert sample.timestamp == MIN_OBSERVATIONS - 1 + 60
+    assert sample.actual == 6
+    assert sample.error == pytest.approx(-2)
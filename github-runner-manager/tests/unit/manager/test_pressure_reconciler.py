@@ -3,15 +3,25 @@
 # Copyright 2026 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-from threading import Lock
+import itertools
+import math
+import time
 from types import SimpleNamespace
 
 import pytest
+from prometheus_client import REGISTRY
 
+from github_runner_manager.errors import OpenStackError
+from github_runner_manager.locking import InstrumentedLock
 from github_runner_manager.manager.pressure_reconciler import (
+    CREATE_LOOP_SITE,
+    PRESSURE_POLL_INTERVAL,
+    RECONCILE_LOOP_SITE,
     PressureReconciler,
     PressureReconcilerConfig,
 )
+from github_runner_manager.manager.runner_creation import CreationFailure, CreationResult
+from github_runner_manager.manager.runner_manager import ReclaimResult
 from github_runner_manager.manager.vm_manager import HealthState
 from github_runner_manager.metrics import events as metric_events
 from github_runner_manager.planner_client import PlannerApiError, PlannerConnectionError
@@ -49,6 +59,11 @@ class _FakeManager:
         self.deleted_args: list[int] = []
         self.cleanup_called = 0
         self.get_runners_calls = 0
+        self.pending_creations = 0
+        self.finished = 0
+        self.stuck_boots = 0
+        self.create_failure = CreationFailure.TRANSIENT
+        self.delete_min_ages: list[float] = []
         self._create_success_ratio = create_success_ratio
 
     def get_runners(self) -> tuple:
@@ -56,17 +71,21 @@ class _FakeManager:
         self.get_runners_calls += 1
         return tuple(self._runners)
 
-    def create_runners(self, num: int, metadata: object) -> tuple[str, ...]:  # noqa: ARG002
+    def create_runners(self, num: int, metadata: object) -> CreationResult:  # noqa: ARG002
         """Record the creation request and extend the internal runner list."""
         self.created_args.append(num)
         actually_created = max(int(num * self._create_success_ratio), 0)
         if actually_created > 0:
             self._runners.extend(_FakeRunner() for _ in range(actually_created))
-        return tuple(f"instance-{i}" for i in range(actually_created))
+        return CreationResult(
+            instance_ids=tuple(f"instance-{i}" for i in range(actually_created)),
+            failure=self.create_failure if actually_created < num else None,
+        )
 
-    def soft_delete_runners(self, num: int) -> int:
+    def soft_delete_runners(self, num: int, min_age: float = 0.0) -> int:
         """Record the deletion request and shrink the internal runner list."""
         self.deleted_args.append(num)
+        self.delete_min_ages.append(min_age)
         to_remove = min(num, len(self._runners))
         if to_remove:
             self._runners = self._runners[:-to_remove]
@@ -76,6 +95,20 @@ class _FakeManager:
         """Increment the cleanup counter."""
         self.cleanup_called += 1
 
+    def reclaim_finished_runners(self) -> ReclaimResult:
+        """Remove the finished runners from the internal runner list."""
+        reclaimed, self.finished = self.finished, 0
+        self._runners = self._runners[reclaimed:]
+        return ReclaimResult(
+            reclaimed=reclaimed, runner_count=len(self._runners) + self.pending_creations
+        )
+
+    def replace_stuck_boots(self) -> int:
+        """Remove the runners with a stuck boot from the internal runner list."""
+        stuck, self.stuck_boots = self.stuck_boots, 0
+        self._runners = self._runners[stuck:]
+        return stuck
+
 
 class _FakePlanner:
     """Planner client stub supplying pressure data for tests."""
@@ -84,10 +117,28 @@ class _FakePlanner:
         self,
         stream_updates: list[int] | None = None,
         stream_exception: Exception | None = None,
+        poll_pressure: int | None = None,
     ):
-        """Initialize with configurable stream behavior."""
+        """Initialize with configurable stream and poll behavior."""
         self._stream_updates = stream_updates or []
         self._stream_exception = stream_exception
+        self._poll_pressure = poll_pressure
+        self.stream_calls = 0
+        self.poll_calls = 0
+
+    def get_pressure(self, name: str):  # noqa: ARG002
+        """Return the configured polled pressure.
+
+        Returns:
+            Namespace object with a pressure attribute.
+
+        Raises:
+            PlannerConnectionError: If no polled pressure is configured.
+        """
+        self.poll_calls += 1
+        if self._poll_pressure is None:
+            raise PlannerConnectionError("poll failed")
+        return SimpleNamespace(pressure=self._poll_pressure)
 
     def stream_pressure(self, name: str):  # noqa: ARG002
         """Yield pressure updates or raise the configured exception.
@@ -95,6 +146,7 @@ class _FakePlanner:
         Yields:
             Namespace objects with a pressure attribute.
         """
+        self.stream_calls += 1
         if self._stream_exception is not None:
             raise self._stream_exception
         for p in self._stream_updates:
@@ -119,7 +171,9 @@ def test_min_pressure_used_as_fallback_when_stream_errors(
     mgr = _FakeManager()
     planner = _FakePlanner(stream_exception=planner_error)
     cfg = PressureReconcilerConfig(flavor_name="small", min_pressure=2)
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
 
     def _stop_after_backoff(_seconds: int) -> bool:
         """Stop the reconciler after the backoff wait is triggered."""
@@ -150,7 +204,9 @@ def test_fallback_preserves_last_pressure_when_higher(
     mgr = _FakeManager()
     planner = _FakePlanner(stream_exception=planner_error)
     cfg = PressureReconcilerConfig(flavor_name="small", min_pressure=2)
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
     reconciler._last_pressure = 10
 
     def _stop_after_backoff(_seconds: int) -> bool:
@@ -173,7 +229,9 @@ def test_timer_loop_uses_cached_pressure(monkeypatch: pytest.MonkeyPatch):
     mgr = _FakeManager()
     planner = _FakePlanner()
     cfg = PressureReconcilerConfig(flavor_name="small", reconcile_interval=60)
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
     reconciler._last_pressure = 3
     wait_calls = {"count": 0}
 
@@ -198,7 +256,9 @@ def test_timer_loop_skips_when_no_cached_pressure(monkeypatch: pytest.MonkeyPatc
     mgr = _FakeManager()
     planner = _FakePlanner()
     cfg = PressureReconcilerConfig(flavor_name="small", reconcile_interval=60)
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
     wait_calls = {"count": 0}
 
     def _wait(_interval: int) -> bool:
@@ -236,7 +296,9 @@ def test_desired_total_from_pressure_respects_bounds(
     cfg = PressureReconcilerConfig(
         flavor_name="small", min_pressure=min_pressure, max_pressure=max_pressure
     )
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
 
     assert reconciler._desired_total_from_pressure(pressure) == expected
 
@@ -250,7 +312,9 @@ def test_handle_timer_reconcile_uses_desired_total_not_raw_pressure():
     mgr = _FakeManager(runners_count=4)
     planner = _FakePlanner()
     cfg = PressureReconcilerConfig(flavor_name="small", min_pressure=5)
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
 
     reconciler._handle_timer_reconcile(0)
 
@@ -267,7 +331,9 @@ def test_create_loop_uses_in_memory_count():
     mgr = _FakeManager()
     planner = _FakePlanner()
     cfg = PressureReconcilerConfig(flavor_name="small")
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
 
     reconciler._handle_create_runners(3)
     reconciler._handle_create_runners(3)
@@ -285,7 +351,9 @@ def test_in_memory_count_incremented_by_actual_successes():
     mgr = _FakeManager(create_success_ratio=0.5)
     planner = _FakePlanner()
     cfg = PressureReconcilerConfig(flavor_name="small")
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
 
     reconciler._handle_create_runners(4)
     reconciler._handle_create_runners(4)
@@ -296,80 +364,134 @@ def test_in_memory_count_incremented_by_actual_successes():
     assert reconciler._runner_count == 3
 
 
-def test_zero_create_pauses_create_loop_until_reconcile():
+def test_zero_create_pauses_create_loop(monkeypatch: pytest.MonkeyPatch):
     """
     arrange: A reconciler whose create call returns zero runners.
-    act: Call _handle_create_runners twice with the same desired pressure.
-    assert: The second call is skipped because creates are paused.
+    act: Call _handle_create_runners twice with the same desired pressure, then again once the \
+        pause is over.
+    assert: The second call is skipped because creation is paused, and the creation is retried \
+        after the pause, which is counted.
     """
+    now = [0.0]
+    monkeypatch.setattr(
+        "github_runner_manager.manager.pressure_reconciler.time.monotonic", lambda: now[0]
+    )
+    monkeypatch.setattr(PressureReconciler, "_schedule_creation_retry", lambda *_: None)
     mgr = _FakeManager(create_success_ratio=0.0)
     planner = _FakePlanner()
     cfg = PressureReconcilerConfig(flavor_name="small")
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    labels = {"flavor": "test-manager", "cause": "transient"}
+    paused_before = REGISTRY.get_sample_value("creation_paused_seconds_total", labels) or 0
 
     reconciler._handle_create_runners(4)
     reconciler._handle_create_runners(4)
-
     assert mgr.created_args == [4]
-    assert reconciler._create_paused is True
+    now[0] = reconciler._create_backoff.remaining(0) + 1
+    reconciler._handle_create_runners(4)
+
+    assert mgr.created_args == [4, 4]
+    paused_after = REGISTRY.get_sample_value("creation_paused_seconds_total", labels)
+    assert paused_after is not None and paused_after > paused_before
 
 
-def test_timer_reconcile_always_unpauses_create_loop():
+@pytest.mark.parametrize(
+    "failure, max_delay",
+    [
+        pytest.param(CreationFailure.TRANSIENT, 15, id="transient"),
+        pytest.param(CreationFailure.QUOTA, 60, id="quota"),
+        pytest.param(CreationFailure.CONFIG, math.inf, id="config"),
+    ],
+)
+def test_zero_create_schedules_retry_by_failure(
+    monkeypatch: pytest.MonkeyPatch, failure: CreationFailure, max_delay: float
+):
     """
-    arrange: A reconciler paused after zero-create, at desired count.
-    act: Run timer reconcile when current matches desired (no create needed).
-    assert: _create_paused is cleared even though no runners were created.
+    arrange: A reconciler whose create call returns zero runners with a class of failure.
+    act: Call _handle_create_runners.
+    assert: A retry is scheduled after the first delay of the class, or none is scheduled for \
+        configuration errors.
     """
+    delays: list[float] = []
+    monkeypatch.setattr(
+        PressureReconciler, "_schedule_creation_retry", lambda _, delay: delays.append(delay)
+    )
     mgr = _FakeManager(create_success_ratio=0.0)
-    planner = _FakePlanner()
+    mgr.create_failure = failure
     cfg = PressureReconcilerConfig(flavor_name="small")
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, _FakePlanner(), cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+
+    reconciler._handle_create_runners(2)
+
+    assert reconciler._create_backoff.is_paused(time.monotonic())
+    if math.isinf(max_delay):
+        assert not delays
+    else:
+        (delay,) = delays
+        assert max_delay / 2 <= delay <= max_delay
+
 
+def test_timer_reconcile_retries_creation_stopped_by_config_error():
+    """
+    arrange: A reconciler whose creation stopped after a configuration error.
+    act: Run timer reconcile once the configuration is fixed.
+    assert: The creation is retried by the reconcile and no longer paused.
+    """
+    mgr = _FakeManager(create_success_ratio=0.0)
+    mgr.create_failure = CreationFailure.CONFIG
+    cfg = PressureReconcilerConfig(flavor_name="small")
+    reconciler = PressureReconciler(
+        mgr, _FakePlanner(), cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
     reconciler._handle_create_runners(2)
-    assert reconciler._create_paused is True
 
     mgr._create_success_ratio = 1.0
-    mgr._runners = [_FakeRunner(), _FakeRunner()]
     reconciler._handle_timer_reconcile(2)
 
-    assert mgr.created_args == [2]
-    assert reconciler._create_paused is False
+    assert mgr.created_args == [2, 2]
+    assert not reconciler._create_backoff.is_paused(time.monotonic())
 
 
-def test_timer_reconcile_repauses_on_zero_create():
+def test_timer_reconcile_does_not_create_while_paused(monkeypatch: pytest.MonkeyPatch):
     """
-    arrange: A reconciler paused after zero-create, reconcile needs to scale up.
-    act: Run timer reconcile while creation still returns zero IDs.
-    assert: _create_paused is set back to True after the failed scale-up.
+    arrange: A reconciler whose creation is paused after a transient failure.
+    act: Run timer reconcile needing to scale up.
+    assert: No runner is created by the reconcile, the creation stays paused.
     """
+    monkeypatch.setattr(PressureReconciler, "_schedule_creation_retry", lambda *_: None)
     mgr = _FakeManager(create_success_ratio=0.0)
-    planner = _FakePlanner()
     cfg = PressureReconcilerConfig(flavor_name="small")
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
-
+    reconciler = PressureReconciler(
+        mgr, _FakePlanner(), cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
     reconciler._handle_create_runners(2)
-    assert reconciler._create_paused is True
 
     reconciler._handle_timer_reconcile(2)
 
-    assert mgr.created_args == [2, 2]
-    assert reconciler._create_paused is True
+    assert mgr.created_args == [2]
+    assert reconciler._create_backoff.is_paused(time.monotonic())
 
 
 def test_successful_create_does_not_pause():
     """
     arrange: A reconciler where creates succeed.
     act: Call _handle_create_runners with successful creation.
-    assert: _create_paused remains False.
+    assert: The creation is not paused.
     """
     mgr = _FakeManager(create_success_ratio=1.0)
     planner = _FakePlanner()
     cfg = PressureReconcilerConfig(flavor_name="small")
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
 
     reconciler._handle_create_runners(3)
 
-    assert reconciler._create_paused is False
+    assert not reconciler._create_backoff.is_paused(time.monotonic())
 
 
 def test_reconcile_loop_syncs_in_memory_count(monkeypatch: pytest.MonkeyPatch):
@@ -381,7 +503,9 @@ def test_reconcile_loop_syncs_in_memory_count(monkeypatch: pytest.MonkeyPatch):
     mgr = _FakeManager(runners_count=5)
     planner = _FakePlanner()
     cfg = PressureReconcilerConfig(flavor_name="small", reconcile_interval=60)
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
     reconciler._last_pressure = 5
     reconciler._runner_count = 10  # Out of sync
     wait_calls = {"count": 0}
@@ -406,7 +530,9 @@ def test_timer_reconcile_scale_up_updates_in_memory_count():
     mgr = _FakeManager(runners_count=2)
     planner = _FakePlanner()
     cfg = PressureReconcilerConfig(flavor_name="small")
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
 
     reconciler._handle_timer_reconcile(5)
 
@@ -424,7 +550,9 @@ def test_create_loop_syncs_runner_count_on_start(monkeypatch: pytest.MonkeyPatch
     mgr = _FakeManager(runners_count=3)
     planner = _FakePlanner(stream_updates=[3])
     cfg = PressureReconcilerConfig(flavor_name="small")
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
 
     # stop after stream exhausts to avoid infinite loop
     original_stream = planner.stream_pressure
@@ -450,7 +578,9 @@ def test_timer_reconcile_scales_down_with_soft_delete():
     mgr = _FakeManager(runners_count=5)
     planner = _FakePlanner()
     cfg = PressureReconcilerConfig(flavor_name="small")
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
 
     reconciler._handle_timer_reconcile(2)
 
@@ -459,6 +589,165 @@ def test_timer_reconcile_scales_down_with_soft_delete():
     assert reconciler._runner_count == 2
 
 
+def test_timer_reconcile_scale_down_passes_min_idle_age():
+    """
+    arrange: A reconciler with 5 runners and a minimum idle age of 300 seconds.
+    act: Call _handle_timer_reconcile with a desired total of 2.
+    assert: soft_delete_runners is called with the minimum idle age.
+    """
+    mgr = _FakeManager(runners_count=5)
+    cfg = PressureReconcilerConfig(flavor_name="small", scale_down_min_idle_age=300)
+    reconciler = PressureReconciler(
+        mgr, _FakePlanner(), cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+
+    reconciler._handle_timer_reconcile(2)
+
+    assert mgr.deleted_args == [3]
+    assert mgr.delete_min_ages == [300]
+
+
+def test_timer_reconcile_no_scale_down_in_cooldown():
+    """
+    arrange: A reconciler with a scale down cooldown, scaled up by the create loop.
+    act: Call _handle_timer_reconcile with a lower desired total.
+    assert: No runner is deleted.
+    """
+    mgr = _FakeManager(runners_count=2)
+    cfg = PressureReconcilerConfig(flavor_name="small", scale_down_cooldown=300)
+    reconciler = PressureReconciler(
+        mgr, _FakePlanner(), cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    reconciler._runner_count = 2
+    reconciler._handle_create_runners(5)
+
+    reconciler._handle_timer_reconcile(2)
+
+    assert mgr.created_args == [3]
+    assert mgr.deleted_args == []
+    assert reconciler._runner_count == 5
+
+
+def test_timer_reconcile_scale_down_stabilized_over_window():
+    """
+    arrange: A reconciler with a scale down window, with a desired total of 4 seen by the \
+        create loop.
+    act: Call _handle_timer_reconcile with a desired total of 2.
+    assert: The runners are only scaled down to the desired total of 4.
+    """
+    mgr = _FakeManager(runners_count=5)
+    cfg = PressureReconcilerConfig(flavor_name="small", scale_down_window=600)
+    reconciler = PressureReconciler(
+        mgr, _FakePlanner(), cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    reconciler._runner_count = 5
+    reconciler._handle_create_runners(4)
+
+    reconciler._handle_timer_reconcile(2)
+
+    assert mgr.deleted_args == [1]
+    assert reconciler._runner_count == 4
+
+
+def test_create_loop_not_blocked_by_shared_lock():
+    """
+    arrange: A reconciler whose shared lock is held, e.g. by a reconcile or a flush.
+    act: Call _handle_create_runners.
+    assert: Runners are created without waiting for the shared lock.
+    """
+    mgr = _FakeManager()
+    planner = _FakePlanner()
+    cfg = PressureReconcilerConfig(flavor_name="small")
+    lock = InstrumentedLock("shared", "test-manager")
+    reconciler = PressureReconciler(mgr, planner, cfg, lock=lock)
+    lock.acquire()
+
+    reconciler._handle_create_runners(3)
+
+    assert mgr.created_args == [3]
+    assert reconciler._runner_count == 3
+    assert reconciler._creating == 0
+    lock.release()
+
+
+def test_timer_reconcile_counts_pending_creations():
+    """
+    arrange: A reconciler with 3 listed runners and 2 created runners not listed yet.
+    act: Call _handle_timer_reconcile with a desired total of 5.
+    assert: The pending runners are counted, so no runners are created.
+    """
+    mgr = _FakeManager(runners_count=3)
+    mgr.pending_creations = 2
+    planner = _FakePlanner()
+    cfg = PressureReconcilerConfig(flavor_name="small")
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+
+    reconciler._handle_timer_reconcile(5)
+
+    assert mgr.created_args == []
+    assert reconciler._runner_count == 5
+
+
+def test_timer_reconcile_skips_scaling_while_creating():
+    """
+    arrange: A reconciler with 5 runners while the create loop is creating 2 runners.
+    act: Call _handle_timer_reconcile with a desired total of 2.
+    assert: Cleanup runs but the count is not synced and no runners are deleted.
+    """
+    mgr = _FakeManager(runners_count=5)
+    planner = _FakePlanner()
+    cfg = PressureReconcilerConfig(flavor_name="small")
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    reconciler._runner_count = 7
+    reconciler._creating = 2
+
+    reconciler._handle_timer_reconcile(2)
+
+    assert mgr.cleanup_called == 1
+    assert mgr.deleted_args == []
+    assert reconciler._runner_count == 7
+
+
+def test_lock_wait_and_hold_times_measured():
+    """
+    arrange: A reconciler.
+    act: Call _handle_create_runners and _handle_timer_reconcile.
+    assert: Wait and hold times of the locks are observed per lock and call site.
+    """
+    mgr = _FakeManager()
+    planner = _FakePlanner()
+    cfg = PressureReconcilerConfig(flavor_name="small")
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+
+    def _count(name: str, lock: str, site: str) -> float:
+        """Get the number of observations of a lock histogram."""
+        labels = {"flavor": mgr.manager_name, "lock": lock, "site": site}
+        return REGISTRY.get_sample_value(f"{name}_count", labels) or 0
+
+    acquisitions = [
+        ("state", CREATE_LOOP_SITE),
+        ("shared", RECONCILE_LOOP_SITE),
+        ("state", RECONCILE_LOOP_SITE),
+    ]
+    before = {
+        (name, lock, site): _count(name, lock, site)
+        for name in ("reconcile_lock_wait_seconds", "reconcile_lock_hold_seconds")
+        for lock, site in acquisitions
+    }
+
+    reconciler._handle_create_runners(1)
+    reconciler._handle_timer_reconcile(1)
+
+    for (name, lock, site), count in before.items():
+        assert _count(name, lock, site) > count
+
+
 def test_timer_reconcile_emits_reconciliation_metric(monkeypatch: pytest.MonkeyPatch):
     """
     arrange: A reconciler with runners in various platform states.
@@ -473,7 +762,9 @@ def test_timer_reconcile_emits_reconciliation_metric(monkeypatch: pytest.MonkeyP
     ]
     planner = _FakePlanner()
     cfg = PressureReconcilerConfig(flavor_name="small")
-    reconciler = PressureReconciler(mgr, planner, cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
 
     issued_events: list = []
     monkeypatch.setattr(metric_events, "issue_event", lambda evt: issued_events.append(evt))
@@ -491,6 +782,292 @@ def test_timer_reconcile_emits_reconciliation_metric(monkeypatch: pytest.MonkeyP
     assert event.crashed_runners == 0
 
 
+def test_forecast_raises_desired_total_capped_by_max_pressure():
+    """
+    arrange: A reconciler with the forecast enabled, observing a quickly rising pressure.
+    act: Call _handle_create_runners with the latest pressure.
+    assert: Runners are created ahead of the forecast ramp, up to max_pressure.
+    """
+    mgr = _FakeManager()
+    planner = _FakePlanner()
+    cfg = PressureReconcilerConfig(flavor_name="small", max_pressure=42, forecast_horizon=600)
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    now = time.time()
+    for index in range(20):
+        reconciler._forecaster.observe(now - 1200 + index * 60, 2 * index)
+
+    reconciler._handle_create_runners(38)
+
+    assert mgr.created_args == [42]
+
+
+def test_forecast_never_lowers_desired_total():
+    """
+    arrange: A reconciler with the forecast enabled, observing a quickly falling pressure.
+    act: Call _handle_create_runners with the latest pressure.
+    assert: Runners are created for the current pressure.
+    """
+    mgr = _FakeManager()
+    planner = _FakePlanner()
+    cfg = PressureReconcilerConfig(flavor_name="small", forecast_horizon=600)
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    now = time.time()
+    for index in range(10):
+        reconciler._forecaster.observe(now - 600 + index * 60, 20 - 2 * index)
+
+    reconciler._handle_create_runners(2)
+
+    assert mgr.created_args == [2]
+
+
+def test_create_loop_exports_forecast_error(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A reconciler with the forecast enabled and a planner streaming a constant pressure.
+    act: Run the create loop over the stream.
+    assert: The forecast error is exported.
+    """
+    mgr = _FakeManager()
+    planner = _FakePlanner(stream_updates=[3] * 20)
+    cfg = PressureReconcilerConfig(flavor_name="small", forecast_horizon=1)
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    labels = {"flavor": mgr.manager_name}
+    before = REGISTRY.get_sample_value("pressure_forecast_absolute_error_count", labels) or 0
+    original_stream = planner.stream_pressure
+
+    def _stream_once(name):
+        """Yield from original stream, then stop the reconciler."""
+        yield from original_stream(name)
+        reconciler.stop()
+
+    monkeypatch.setattr(planner, "stream_pressure", _stream_once)
+    clock = itertools.count(1000)
+    monkeypatch.setattr(time, "time", lambda: next(clock))
+    reconciler.start_create_loop()
+
+    errors = REGISTRY.get_sample_value("pressure_forecast_absolute_error_count", labels)
+    assert errors is not None and errors > before
+    assert REGISTRY.get_sample_value("pressure_forecast_error", labels) == 0
+    assert mgr.created_args == [3]
+
+
+def test_create_loop_coalesces_pressure_burst(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A reconciler with a debounce window and a planner streaming a burst of updates.
+    act: Run the create loop over the stream.
+    assert: Runners are created once, for the newest pressure, and the updates received and
+        acted on are counted.
+    """
+    mgr = _FakeManager()
+    planner = _FakePlanner(stream_updates=[1, 2, 5])
+    cfg = PressureReconcilerConfig(flavor_name="small", debounce_window=0.5)
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    labels = {"flavor": mgr.manager_name}
+
+    def _count(name: str) -> float:
+        """Get the value of a pressure update counter."""
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    received = _count("pressure_updates_received_total")
+    acted = _count("pressure_updates_acted_total")
+    original_stream = planner.stream_pressure
+
+    def _stream_until_acted(name):
+        """Yield from original stream, then stop the reconciler once it acted."""
+        yield from original_stream(name)
+        deadline = time.monotonic() + 5
+        while not mgr.created_args and time.monotonic() < deadline:
+            time.sleep(0.01)
+        reconciler.stop()
+
+    monkeypatch.setattr(planner, "stream_pressure", _stream_until_acted)
+    reconciler.start_create_loop()
+
+    assert mgr.created_args == [5]
+    assert _count("pressure_updates_received_total") - received == 3
+    assert _count("pressure_updates_acted_total") - acted == 1
+
+
+def test_next_pressure_keeps_latest_update():
+    """
+    arrange: A reconciler with pressure updates published and not acted on.
+    act: Get the next pressure, then stop the reconciler and get the next pressure again.
+    assert: The latest update is returned, then None once stopped with no update pending.
+    """
+    mgr = _FakeManager()
+    planner = _FakePlanner()
+    cfg = PressureReconcilerConfig(flavor_name="small")
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    for pressure in (4, 1, 3):
+        reconciler._publish_pressure(pressure)
+
+    assert reconciler._next_pressure() == 3
+    reconciler.stop()
+    assert reconciler._next_pressure() is None
+
+
+def test_create_loop_raises_stream_consumer_error():
+    """
+    arrange: A reconciler whose planner stream raises an unexpected error.
+    act: Call start_create_loop.
+    assert: The error is raised by the create loop.
+    """
+    mgr = _FakeManager()
+    planner = _FakePlanner(stream_exception=RuntimeError("mock error"))
+    cfg = PressureReconcilerConfig(flavor_name="small")
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+
+    with pytest.raises(RuntimeError, match="mock error"):
+        reconciler.start_create_loop()
+
+
+def test_stream_reopened_with_backoff_and_polled(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A reconciler whose planner stream is down while the pressure can be polled.
+    act: Run the create loop for three stream attempts.
+    assert: The polled pressure is acted on, and the stream is reopened after jittered delays
+        doubling each attempt.
+    """
+    mgr = _FakeManager()
+    planner = _FakePlanner(stream_exception=PlannerConnectionError("stalled"), poll_pressure=4)
+    cfg = PressureReconcilerConfig(flavor_name="small", min_pressure=1)
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    delays: list[float] = []
+
+    def _record_delay(seconds: float) -> bool:
+        """Record the backoff delay, stopping the reconciler after three attempts."""
+        delays.append(seconds)
+        if len(delays) == 3:
+            reconciler.stop()
+        return reconciler._stop.is_set()
+
+    monkeypatch.setattr(reconciler._stop, "wait", _record_delay)
+    reconciler.start_create_loop()
+
+    assert mgr.created_args == [4]
+    assert planner.stream_calls == 3
+    for attempt, delay in enumerate(delays):
+        assert 2**attempt / 2 <= delay <= 2**attempt
+
+
+def test_pressure_polled_at_interval_during_backoff(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A reconciler whose planner stream is down, with a stream backoff longer than the \
+        poll interval.
+    act: Run the create loop until the stream is reopened.
+    assert: The pressure is polled at the poll interval for the whole backoff.
+    """
+    monkeypatch.setattr(
+        "github_runner_manager.manager.pressure_reconciler.STREAM_BACKOFF_BASE", 20
+    )
+    mgr = _FakeManager()
+    planner = _FakePlanner(stream_exception=PlannerConnectionError("stalled"), poll_pressure=4)
+    cfg = PressureReconcilerConfig(flavor_name="small")
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    waits: list[float] = []
+
+    def _record_wait(seconds: float) -> bool:
+        """Record the wait, stopping the reconciler once the stream is reopened."""
+        waits.append(seconds)
+        if planner.stream_calls == 2:
+            reconciler.stop()
+        return reconciler._stop.is_set()
+
+    monkeypatch.setattr(reconciler._stop, "wait", _record_wait)
+    reconciler.start_create_loop()
+
+    first_backoff = waits[: planner.poll_calls - 1]
+    assert all(wait <= PRESSURE_POLL_INTERVAL for wait in waits)
+    assert 10 <= sum(first_backoff) <= 20
+    assert len(first_backoff) >= 2
+    assert mgr.created_args == [4]
+
+
+def test_pressure_polls_backed_off_during_planner_outage(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A reconciler whose planner stream and pressure polls both fail.
+    act: Run the create loop for an hour of simulated time.
+    assert: The pressure is polled once per reopening of the stream, and the reopenings are \
+        backed off, rather than polled at the poll interval.
+    """
+    mgr = _FakeManager()
+    planner = _FakePlanner(stream_exception=PlannerConnectionError("down"))
+    cfg = PressureReconcilerConfig(flavor_name="small", min_pressure=1)
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    elapsed = [0.0]
+
+    def _advance(seconds: float) -> bool:
+        """Advance the simulated time, stopping the reconciler after an hour."""
+        elapsed[0] += seconds
+        if elapsed[0] >= 60 * 60:
+            reconciler.stop()
+        return reconciler._stop.is_set()
+
+    monkeypatch.setattr(reconciler._stop, "wait", _advance)
+    reconciler.start_create_loop()
+
+    assert planner.poll_calls == planner.stream_calls
+    assert planner.poll_calls < 60 * 60 / PRESSURE_POLL_INTERVAL / 10
+
+
+def test_stream_gauges(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A reconciler with a planner streaming an update.
+    act: Run the create loop, reading the stream gauges during and after the stream.
+    assert: The uptime is exported while streaming and reset once the stream is down, and the
+        time since the last update is exported.
+    """
+    mgr = _FakeManager()
+    planner = _FakePlanner(stream_updates=[1], poll_pressure=1)
+    cfg = PressureReconcilerConfig(flavor_name="small")
+    reconciler = PressureReconciler(
+        mgr, planner, cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    labels = {"flavor": mgr.manager_name}
+    original_stream = planner.stream_pressure
+    uptimes: list[float] = []
+
+    def _stream_with_gauges(name):
+        """Yield from original stream, recording the uptime while streaming."""
+        for update in original_stream(name):
+            yield update
+            time.sleep(0.01)
+            uptimes.append(
+                REGISTRY.get_sample_value("planner_stream_uptime_seconds", labels) or 0.0
+            )
+
+    def _stop(_seconds: float) -> bool:
+        """Stop the reconciler instead of waiting to reopen the stream."""
+        reconciler.stop()
+        return True
+
+    monkeypatch.setattr(planner, "stream_pressure", _stream_with_gauges)
+    monkeypatch.setattr(reconciler._stop, "wait", _stop)
+    reconciler.start_create_loop()
+
+    assert uptimes[0] > 0
+    assert REGISTRY.get_sample_value("planner_stream_uptime_seconds", labels) == 0
+    update_age = REGISTRY.get_sample_value("planner_pressure_update_age_seconds", labels)
+    assert update_age is not None and 0 <= update_age < 5
+
+
 def test_create_loop_no_planner_sets_pressure_creates_runners_and_blocks(
     monkeypatch: pytest.MonkeyPatch,
 ):
@@ -501,7 +1078,9 @@ def test_create_loop_no_planner_sets_pressure_creates_runners_and_blocks(
     """
     mgr = _FakeManager(runners_count=1)
     cfg = PressureReconcilerConfig(flavor_name="small", min_pressure=3)
-    reconciler = PressureReconciler(mgr, planner_client=None, config=cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner_client=None, config=cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
 
     wait_called = {"called": False}
 
@@ -526,7 +1105,9 @@ def test_reconcile_loop_no_planner_uses_min_pressure(monkeypatch: pytest.MonkeyP
     """
     mgr = _FakeManager(runners_count=2)
     cfg = PressureReconcilerConfig(flavor_name="small", min_pressure=4, reconcile_interval=60)
-    reconciler = PressureReconciler(mgr, planner_client=None, config=cfg, lock=Lock())
+    reconciler = PressureReconciler(
+        mgr, planner_client=None, config=cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
     reconciler._last_pressure = 4
     wait_calls = {"count": 0}
 
@@ -542,27 +1123,204 @@ def test_reconcile_loop_no_planner_uses_min_pressure(monkeypatch: pytest.MonkeyP
     assert mgr.created_args == [2]
 
 
+def test_reclaim_wakes_create_loop_with_corrected_count():
+    """
+    arrange: A reconciler at a pressure of 5 with 5 runners, 2 of them finished.
+    act: Reclaim the finished runners, then create runners for the next pressure.
+    assert: The reclaimed runners are subtracted from the count, the create loop is woken with \
+        the last pressure and replaces them.
+    """
+    mgr = _FakeManager(runners_count=5)
+    cfg = PressureReconcilerConfig(flavor_name="small", reclaim_interval=1)
+    reconciler = PressureReconciler(
+        mgr, _FakePlanner(), cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    reconciler._runner_count = 5
+    reconciler._last_pressure = 5
+    mgr.finished = 2
+
+    reconciler._handle_reclaim()
+    count_after_reclaim = reconciler._runner_count
+    pressure = reconciler._next_pressure()
+    assert pressure is not None
+    reconciler._handle_create_runners(pressure)
+
+    assert count_after_reclaim == 3
+    assert pressure == 5
+    assert mgr.created_args == [2]
+
+
+def test_reclaim_no_planner_creates_directly():
+    """
+    arrange: A reconciler with no planner, min_pressure=3 and 3 runners, 1 of them finished.
+    act: Reclaim the finished runners.
+    assert: The reclaimed runner is replaced right away.
+    """
+    mgr = _FakeManager(runners_count=3)
+    cfg = PressureReconcilerConfig(flavor_name="small", min_pressure=3, reclaim_interval=1)
+    reconciler = PressureReconciler(
+        mgr, planner_client=None, config=cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    reconciler._runner_count = 3
+    reconciler._last_pressure = 3
+    mgr.finished = 1
+
+    reconciler._handle_reclaim()
+
+    assert mgr.created_args == [1]
+    assert reconciler._runner_count == 3
+
+
+def test_boot_watchdog_replaces_stuck_boots():
+    """
+    arrange: A reconciler with no planner, min_pressure=3 and 3 runners, 1 of them with a stuck \
+        boot.
+    act: Run the boot watchdog.
+    assert: The runner with the stuck boot is replaced right away, without a reconcile.
+    """
+    mgr = _FakeManager(runners_count=3)
+    cfg = PressureReconcilerConfig(flavor_name="small", min_pressure=3)
+    reconciler = PressureReconciler(
+        mgr, planner_client=None, config=cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    reconciler._runner_count = 3
+    reconciler._last_pressure = 3
+    mgr.stuck_boots = 1
+
+    reconciler._handle_boot_watchdog()
+
+    assert mgr.created_args == [1]
+    assert reconciler._runner_count == 3
+    assert mgr.cleanup_called == 0
+
+
+def test_recount_corrects_count_downwards():
+    """
+    arrange: A reconciler at a pressure of 6 counting 6 runners, with 3 runners listed.
+    act: Reclaim and recount the runners.
+    assert: The count is lowered to 3, the drift is counted and the create loop is woken.
+    """
+    mgr = _FakeManager(runners_count=3)
+    cfg = PressureReconcilerConfig(flavor_name="small", reclaim_interval=1)
+    reconciler = PressureReconciler(
+        mgr, _FakePlanner(), cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    reconciler._runner_count = 6
+    reconciler._last_pressure = 6
+    labels = {"flavor": "test-manager"}
+    drift_before = REGISTRY.get_sample_value("runner_count_drift_total", labels) or 0
+
+    reconciler._handle_reclaim()
+
+    assert reconciler._runner_count == 3
+    assert REGISTRY.get_sample_value("runner_count_drift_total", labels) == drift_before + 3
+    assert reconciler._next_pressure() == 6
+
+
+@pytest.mark.parametrize(
+    "concurrent_creation",
+    [
+        pytest.param(False, id="more runners listed than counted"),
+        pytest.param(True, id="runners reserved during the listing"),
+    ],
+)
+def test_recount_never_raises_nor_races_creation(
+    monkeypatch: pytest.MonkeyPatch, concurrent_creation: bool
+):
+    """
+    arrange: A reconciler counting 4 runners with 5 runners listed, 1 of them finished, or with \
+        2 runners listed, 1 of them finished, and runners reserved during the listing.
+    act: Reclaim and recount the runners.
+    assert: Only the reclaimed runner is subtracted from the count.
+    """
+    mgr = _FakeManager(runners_count=2 if concurrent_creation else 5)
+    mgr.finished = 1
+    cfg = PressureReconcilerConfig(flavor_name="small", reclaim_interval=1)
+    reconciler = PressureReconciler(
+        mgr, _FakePlanner(), cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    reconciler._runner_count = 4
+    if concurrent_creation:
+        reclaim = mgr.reclaim_finished_runners
+
+        def reclaim_during_creation() -> ReclaimResult:
+            """Reserve runners for creation while listing.
+
+            Returns:
+                The result of the reclamation.
+            """
+            reconciler._reservation_generation += 1
+            return reclaim()
+
+        monkeypatch.setattr(mgr, "reclaim_finished_runners", reclaim_during_creation)
+
+    reconciler._handle_reclaim()
+
+    assert reconciler._runner_count == 3
+
+
+def test_reclaim_error_keeps_count(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A reconciler whose manager fails to reclaim the finished runners.
+    act: Run the reclaim loop once.
+    assert: The error does not stop the loop and the count is unchanged.
+    """
+    mgr = _FakeManager(runners_count=2)
+    cfg = PressureReconcilerConfig(flavor_name="small", reclaim_interval=1)
+    reconciler = PressureReconciler(
+        mgr, _FakePlanner(), cfg, lock=InstrumentedLock("shared", "test-manager")
+    )
+    reconciler._runner_count = 2
+
+    def _fail() -> int:
+        """Fail to reclaim.
+
+        Raises:
+            OpenStackError: Always.
+        """
+        raise OpenStackError("mock error")
+
+    monkeypatch.setattr(mgr, "reclaim_finished_runners", _fail)
+    wait_calls = iter((False, True))
+    monkeypatch.setattr(reconciler._stop, "wait", lambda _interval: next(wait_calls))
+
+    reconciler.start_reclaim_loop()
+
+    assert reconciler._runner_count == 2
+
+
 def test_build_pressure_reconciler_no_planner_config():
     """
     arrange: An ApplicationConfiguration with planner_url=None and planner_token=None.
-    act: Call build_pressure_reconciler.
+    act: Call build_planner_client and build_pressure_reconciler.
     assert: A PressureReconciler is returned with _planner set to None.
     """
     from unittest.mock import MagicMock
 
-    from github_runner_manager.manager.pressure_reconciler import build_pressure_reconciler
+    from github_runner_manager.manager.reconciler_factory import (
+        build_planner_client,
+        build_pressure_reconciler,
+    )
 
     mock_config = MagicMock()
     mock_config.planner_url = None
     mock_config.planner_token = None
     mock_config.name = "test"
     mock_config.reconcile_interval = 5
+    mock_config.pressure_forecast_horizon = 0
+    mock_config.pressure_debounce_window = 0
     combination = MagicMock()
     combination.base_virtual_machines = 2
     combination.max_total_virtual_machines = 10
     mock_config.runner_configuration.combinations = [combination]
 
-    reconciler = build_pressure_reconciler(mock_config, MagicMock(), Lock())
+    reconciler = build_pressure_reconciler(
+        mock_config,
+        combination,
+        MagicMock(manager_name="test"),
+        InstrumentedLock("shared", "test"),
+        build_planner_client(mock_config),
+    )
 
     assert reconciler._planner is None
 
@@ -574,27 +1332,189 @@ def test_build_pressure_reconciler_no_planner_config():
         pytest.param(None, "secret-token", id="token_without_url"),
     ],
 )
-def test_build_pressure_reconciler_partial_planner_config_raises(
+def test_build_planner_client_partial_planner_config_raises(
     planner_url: str | None, planner_token: str | None
 ):
     """
     arrange: An ApplicationConfiguration with only one of planner_url/planner_token set.
-    act: Call build_pressure_reconciler.
+    act: Call build_planner_client.
     assert: A ValueError is raised for partial planner configuration.
     """
     from unittest.mock import MagicMock
 
-    from github_runner_manager.manager.pressure_reconciler import build_pressure_reconciler
+    from github_runner_manager.manager.reconciler_factory import build_planner_client
 
     mock_config = MagicMock()
     mock_config.planner_url = planner_url
     mock_config.planner_token = planner_token
-    mock_config.name = "test"
+
+    with pytest.raises(ValueError, match="[Pp]artial"):
+        build_planner_client(mock_config)
+
+
+def _mock_multi_combination_config(*flavors: str):
+    """Create an application configuration mock with a combination per flavor.
+
+    Args:
+        flavors: The flavor names of the combinations.
+
+    Returns:
+        The mocked configuration.
+    """
+    from unittest.mock import MagicMock
+
+    mock_config = MagicMock()
+    mock_config.planner_url = None
+    mock_config.planner_token = None
+    mock_config.name = "app"
+    mock_config.openstack_configuration.vm_prefix = "unit-0"
     mock_config.reconcile_interval = 5
+    mock_config.pressure_forecast_horizon = 0
+    mock_config.pressure_debounce_window = 0
+    combinations = []
+    for flavor in flavors:
+        combination = MagicMock(base_virtual_machines=0, max_total_virtual_machines=10)
+        combination.flavor.name = flavor
+        combinations.append(combination)
+    mock_config.runner_configuration.combinations = combinations
+    return mock_config
+
+
+def test_build_pressure_reconcilers_one_per_combination(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A configuration with two combinations of different flavors.
+    act: Call build_pressure_reconcilers.
+    assert: Each combination has its own runner manager, lock, VM prefix and planner flavor \
+        after its flavor, and the GitHub client is shared.
+    """
+    from unittest.mock import MagicMock
+
+    from github_runner_manager.manager import reconciler_factory as module
+
+    build_runner_manager = MagicMock(
+        side_effect=lambda _config, _combination, **kwargs: MagicMock(manager_name=kwargs["name"])
+    )
+    monkeypatch.setattr(module, "GithubClient", MagicMock())
+    monkeypatch.setattr(module, "build_runner_manager", build_runner_manager)
+
+    reconcilers = module.build_pressure_reconcilers(
+        _mock_multi_combination_config("small", "small-arm")
+    )
+
+    assert [r.runner_manager.manager_name for r in reconcilers] == ["app-small", "app-small-arm"]
+    assert [r.lock.flavor for r in reconcilers] == ["app-small", "app-small-arm"]
+    assert [r._config.flavor_name for r in reconcilers] == ["small", "small-arm"]
+    assert reconcilers[0].lock is not reconcilers[1].lock
+    prefixes = [call.kwargs["prefix"] for call in build_runner_manager.call_args_list]
+    assert prefixes == ["unit-0_small", "unit-0_small_arm"]
+    github_clients = {
+        id(call.kwargs["github_client"]) for call in build_runner_manager.call_args_list
+    }
+    assert len(github_clients) == 1
+
+
+def test_build_pressure_reconcilers_single_combination_keeps_application(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    arrange: A configuration with a single combination.
+    act: Call build_pressure_reconcilers.
+    assert: The runner manager keeps the name and VM prefix of the application, and the \
+        pressure is requested for the application name.
+    """
+    from unittest.mock import MagicMock
+
+    from github_runner_manager.manager import reconciler_factory as module
+
+    build_runner_manager = MagicMock(
+        side_effect=lambda _config, _combination, **kwargs: MagicMock(manager_name=kwargs["name"])
+    )
+    monkeypatch.setattr(module, "GithubClient", MagicMock())
+    monkeypatch.setattr(module, "build_runner_manager", build_runner_manager)
+
+    (reconciler,) = module.build_pressure_reconcilers(_mock_multi_combination_config("small"))
+
+    assert reconciler.runner_manager.manager_name == "app"
+    assert reconciler._config.flavor_name == "app"
+    assert build_runner_manager.call_args.kwargs["prefix"] == "unit-0"
+
+
+def test_build_pressure_reconcilers_prefix_independent_of_order(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: Two configurations with the same combinations in different orders.
+    act: Call build_pressure_reconcilers on both.
+    assert: Each flavor gets the same VM prefix and name in both.
+    """
+    from unittest.mock import MagicMock
+
+    from github_runner_manager.manager import reconciler_factory as module
+
+    build_runner_manager = MagicMock(
+        side_effect=lambda _config, _combination, **kwargs: MagicMock(manager_name=kwargs["name"])
+    )
+    monkeypatch.setattr(module, "GithubClient", MagicMock())
+    monkeypatch.setattr(module, "build_runner_manager", build_runner_manager)
+
+    def _prefixes_by_flavor(*flavors: str) -> dict[str, tuple[str, str]]:
+        """Build the reconcilers and get the VM prefix and name of each flavor."""
+        build_runner_manager.reset_mock()
+        module.build_pressure_reconcilers(_mock_multi_combination_config(*flavors))
+        return {
+            call.args[1].flavor.name: (call.kwargs["prefix"], call.kwargs["name"])
+            for call in build_runner_manager.call_args_list
+        }
+
+    assert _prefixes_by_flavor("small", "large", "arm") == _prefixes_by_flavor(
+        "arm", "small", "large"
+    )
+    assert (
+        _prefixes_by_flavor("small", "large")["large"]
+        == _prefixes_by_flavor("large", "arm")["large"]
+    )
+
+
+def test_build_runner_manager_excludes_fast_boot_label(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A combination with an image tagged fast-boot.
+    act: Call build_runner_manager.
+    assert: The runners get the labels of the image and flavor, without the fast-boot tag.
+    """
+    from unittest.mock import MagicMock
+
+    from github_runner_manager.manager import reconciler_factory as module
+
+    runner_manager = MagicMock()
+    monkeypatch.setattr(module, "RunnerManager", runner_manager)
+    monkeypatch.setattr(module, "GitHubRunnerPlatform", MagicMock())
+    monkeypatch.setattr(module, "OpenStackRunnerManager", MagicMock())
+    monkeypatch.setattr(module, "OpenStackRunnerManagerConfig", MagicMock())
+    monkeypatch.setattr(module, "OpenStackServerConfig", MagicMock())
+    config = MagicMock(extra_labels=["extra"])
     combination = MagicMock()
-    combination.base_virtual_machines = 2
-    combination.max_total_virtual_machines = 10
-    mock_config.runner_configuration.combinations = [combination]
+    combination.image.labels = ["noble", "fast-boot"]
+    combination.flavor.labels = ["large"]
 
-    with pytest.raises(ValueError, match="[Pp]artial"):
-        build_pressure_reconciler(mock_config, MagicMock(), Lock())
+    module.build_runner_manager(
+        config, combination, name="app", prefix="unit-0", github_client=MagicMock()
+    )
+
+    assert runner_manager.call_args.kwargs["labels"] == ["extra", "noble", "large"]
+
+
+def test_build_pressure_reconcilers_duplicate_flavor_raises(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A configuration with two combinations of the same flavor.
+    act: Call build_pressure_reconcilers.
+    assert: A ValueError is raised as the runner managers would have the same VM prefix.
+    """
+    from unittest.mock import MagicMock
+
+    from github_runner_manager.manager import reconciler_factory as module
+
+    monkeypatch.setattr(module, "GithubClient", MagicMock())
+    monkeypatch.setattr(module, "build_runner_manager", MagicMock())
+
+    with pytest.raises(ValueError, match="distinct flavors"):
+        module.build_pressure_reconcilers(
+            _mock_multi_combination_config("small", "large", "large")
+        )
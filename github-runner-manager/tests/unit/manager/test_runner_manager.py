@@ -3,19 +3,42 @@
 
 """Unit tests for the the runner_manager."""
 
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
+from prometheus_client import REGISTRY
 
-from github_runner_manager.manager.models import RunnerMetadata
+from github_runner_manager.configuration import ScaleDownPolicy
+from github_runner_manager.errors import (
+    MissingServerConfigError,
+    RunnerCreateError,
+    RunnerError,
+    RunnerQuotaError,
+)
+from github_runner_manager.manager.models import RunnerIdentity, RunnerMetadata
+from github_runner_manager.manager.runner_creation import (
+    CREATE_ATTEMPTS,
+    CreationFailure,
+    CreationResult,
+)
 from github_runner_manager.manager.runner_manager import (
     FlushMode,
+    ReclaimResult,
     RunnerInfo,
     RunnerInstance,
     RunnerManager,
 )
 from github_runner_manager.manager.vm_manager import VM, CloudRunnerManager, VMState
-from github_runner_manager.platform.platform_provider import PlatformProvider
+from github_runner_manager.metrics import creation as creation_metrics
+from github_runner_manager.metrics.creation import Phase
+from github_runner_manager.platform.platform_provider import (
+    PlatformApiError,
+    PlatformProvider,
+    RunnersHealthResponse,
+)
 from github_runner_manager.types_.github import SelfHostedRunner
 from tests.unit.factories.runner_instance_factory import (
     CloudRunnerInstanceFactory,
@@ -25,6 +48,14 @@ from tests.unit.factories.runner_instance_factory import (
 from tests.unit.fake_runner_managers import FakeCloudRunnerManager, FakeGitHubRunnerPlatform
 
 
+@pytest.fixture(autouse=True, name="no_retry_backoff")
+def no_retry_backoff_fixture(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry the creation of runners without waiting."""
+    monkeypatch.setattr(
+        "github_runner_manager.manager.runner_creation.CREATE_RETRY_BACKOFF_BASE", 0
+    )
+
+
 @pytest.mark.parametrize(
     "initial_runners, initial_cloud_runners, expected_runners, expected_cloud_runners, flush_mode",
     [
@@ -219,6 +250,114 @@ def test_runner_manager_cleanup(
     assert list(mock_cloud._cloud_runners.values()) == expected_cloud_runners
 
 
+def test_runner_manager_cleanup_stuck_boot(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: An offline idle runner with a recent VM whose boot the cloud reports stuck, and an \
+        online runner.
+    act: Call cleanup in the RunnerManager instance.
+    assert: Only the booting VM is checked, the stuck runner and its VM are cleaned up and the \
+        failure is counted by cause.
+    """
+    stuck_runner = SelfHostedRunnerFactory(status="offline", busy=False, deletable=False)
+    stuck_vm = CloudRunnerInstanceFactory.from_self_hosted_runner(self_hosted_runner=stuck_runner)
+    online_runner = SelfHostedRunnerFactory(status="online", busy=False, deletable=False)
+    online_vm = CloudRunnerInstanceFactory.from_self_hosted_runner(
+        self_hosted_runner=online_runner
+    )
+    mock_platform = FakeGitHubRunnerPlatform(initial_runners=[stuck_runner, online_runner])
+    mock_cloud = FakeCloudRunnerManager(initial_cloud_runners=[stuck_vm, online_vm])
+    check_boots = MagicMock(return_value={stuck_vm.instance_id: "stalled"})
+    monkeypatch.setattr(mock_cloud, "check_boots", check_boots)
+    manager = RunnerManager(
+        "test-stuck-boot",
+        platform_provider=mock_platform,
+        cloud_runner_manager=mock_cloud,
+        labels=[],
+    )
+
+    manager.cleanup()
+
+    check_boots.assert_called_once_with([stuck_vm])
+    assert list(mock_platform._runners.values()) == [online_runner]
+    assert list(mock_cloud._cloud_runners.values()) == [online_vm]
+    assert (
+        REGISTRY.get_sample_value(
+            "runner_boot_failures_total", {"flavor": "test-stuck-boot", "cause": "stalled"}
+        )
+        == 1
+    )
+
+
+def test_runner_manager_replace_stuck_boots(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: An offline idle runner with a recent VM whose boot the cloud reports stuck, an \
+        online runner, and a VM without a runner ID.
+    act: Replace the stuck boots.
+    assert: Only the stuck runner and its VM are deleted, and counted as replaced.
+    """
+    stuck_runner = SelfHostedRunnerFactory(status="offline", busy=False, deletable=False)
+    stuck_vm = CloudRunnerInstanceFactory.from_self_hosted_runner(self_hosted_runner=stuck_runner)
+    online_runner = SelfHostedRunnerFactory(status="online", busy=False, deletable=False)
+    online_vm = CloudRunnerInstanceFactory.from_self_hosted_runner(
+        self_hosted_runner=online_runner
+    )
+    unregistered_vm = CloudRunnerInstanceFactory(metadata=RunnerMetadata())
+    mock_platform = FakeGitHubRunnerPlatform(initial_runners=[stuck_runner, online_runner])
+    mock_cloud = FakeCloudRunnerManager(
+        initial_cloud_runners=[stuck_vm, online_vm, unregistered_vm]
+    )
+    monkeypatch.setattr(
+        mock_cloud, "check_boots", MagicMock(return_value={stuck_vm.instance_id: "failed"})
+    )
+    manager = RunnerManager(
+        "test-replace-stuck-boot",
+        platform_provider=mock_platform,
+        cloud_runner_manager=mock_cloud,
+        labels=[],
+    )
+
+    replaced = manager.replace_stuck_boots()
+
+    assert replaced == 1
+    assert list(mock_platform._runners.values()) == [online_runner]
+    assert list(mock_cloud._cloud_runners.values()) == [online_vm, unregistered_vm]
+
+
+def test_runner_manager_reclaim_finished_runners(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A VM powered off after the run of its runner, a VM powered off otherwise, an active \
+        VM and a VM in error.
+    act: Reclaim the finished runners.
+    assert: Only the VM powered off after the run is deleted and counted as reclaimed, the \
+        running VMs are counted as runners.
+    """
+    finished_vm = CloudRunnerInstanceFactory(state=VMState.STOPPED)
+    stopped_vm = CloudRunnerInstanceFactory(state=VMState.STOPPED)
+    active_vm = CloudRunnerInstanceFactory()
+    errored_vm = CloudRunnerInstanceFactory(state=VMState.ERROR)
+    mock_cloud = FakeCloudRunnerManager(
+        initial_cloud_runners=[finished_vm, stopped_vm, active_vm, errored_vm]
+    )
+    monkeypatch.setattr(
+        mock_cloud,
+        "check_finished",
+        lambda vms: {vm.instance_id for vm in vms if vm.instance_id == finished_vm.instance_id},
+    )
+    manager = RunnerManager(
+        "test-reclaim",
+        platform_provider=FakeGitHubRunnerPlatform(initial_runners=[]),
+        cloud_runner_manager=mock_cloud,
+        labels=[],
+    )
+
+    result = manager.reclaim_finished_runners()
+
+    assert result == ReclaimResult(reclaimed=1, runner_count=2)
+    assert list(mock_cloud._cloud_runners.values()) == [stopped_vm, active_vm, errored_vm]
+    assert REGISTRY.get_sample_value("reclaimed_vms_total", {"flavor": "test-reclaim"}) == 1
+    assert manager.reclaim_finished_runners() == ReclaimResult(reclaimed=0, runner_count=2)
+
+
 def test_runner_manager_create_runners() -> None:
     """
     arrange: None.
@@ -226,6 +365,7 @@ def test_runner_manager_create_runners() -> None:
     assert: The runner manager will create the runner.
     """
     cloud_runner_manager = MagicMock(spec=CloudRunnerManager)
+    cloud_runner_manager.get_creation_headroom.return_value = None
     cloud_runner_manager.name_prefix = "unit-0"
 
     platform_provider = MagicMock(spec=PlatformProvider)
@@ -240,12 +380,309 @@ def test_runner_manager_create_runners() -> None:
         labels=["label1", "label2"],
     )
 
-    (instance_id,) = runner_manager.create_runners(1, RunnerMetadata())
+    (instance_id,) = runner_manager.create_runners(1, RunnerMetadata()).instance_ids
 
     assert instance_id
     cloud_runner_manager.create_runner.assert_called_once()
 
 
+@pytest.mark.parametrize(
+    "headroom, expected_created, expected_failure",
+    [
+        pytest.param(None, 3, None, id="unlimited"),
+        pytest.param(2, 2, None, id="capped"),
+        pytest.param(0, 0, CreationFailure.QUOTA, id="exhausted"),
+    ],
+)
+def test_runner_manager_create_runners_capped_by_quota(
+    headroom: int | None, expected_created: int, expected_failure: CreationFailure | None
+) -> None:
+    """
+    arrange: A cloud with quota headroom for a number of runners.
+    act: Create 3 runners.
+    assert: The number of runners created is capped by the headroom, which is exported, and \
+        an exhausted quota is reported as the failure.
+    """
+    cloud_runner_manager = MagicMock(spec=CloudRunnerManager)
+    cloud_runner_manager.get_creation_headroom.return_value = headroom
+    cloud_runner_manager.name_prefix = "unit-0"
+    platform_provider = MagicMock(spec=PlatformProvider)
+    platform_provider.get_runner_context.return_value = (MagicMock(), MagicMock(id=1))
+    runner_manager = RunnerManager(
+        "quota-manager",
+        platform_provider=platform_provider,
+        cloud_runner_manager=cloud_runner_manager,
+        labels=[],
+    )
+
+    result = runner_manager.create_runners(3, RunnerMetadata())
+
+    assert len(result.instance_ids) == expected_created
+    assert result.failure == expected_failure
+    assert cloud_runner_manager.create_runner.call_count == expected_created
+    if headroom is not None:
+        assert (
+            REGISTRY.get_sample_value("cloud_quota_headroom_runners", {"flavor": "quota-manager"})
+            == headroom
+        )
+
+
+def test_runner_manager_create_runners_logs_phases(caplog: pytest.LogCaptureFixture) -> None:
+    """
+    arrange: A platform provider timing the JIT phase of the creation.
+    act: Create 2 runners.
+    assert: The JIT phase of both creations is observed and summarized in the log.
+    """
+    cloud_runner_manager = MagicMock(spec=CloudRunnerManager)
+    cloud_runner_manager.get_creation_headroom.return_value = None
+    cloud_runner_manager.name_prefix = "unit-0"
+    platform_provider = MagicMock(spec=PlatformProvider)
+
+    def get_runner_context(**_kwargs: Any) -> tuple[MagicMock, MagicMock]:
+        """Time the JIT phase."""
+        with creation_metrics.phase(Phase.JIT):
+            return MagicMock(), MagicMock(id=1)
+
+    platform_provider.get_runner_context.side_effect = get_runner_context
+    runner_manager = RunnerManager(
+        "phase-manager",
+        platform_provider=platform_provider,
+        cloud_runner_manager=cloud_runner_manager,
+        labels=[],
+    )
+    caplog.set_level(logging.INFO)
+
+    runner_manager.create_runners(2, RunnerMetadata())
+
+    assert (
+        REGISTRY.get_sample_value(
+            "runner_creation_phase_duration_seconds_count",
+            {"flavor": "phase-manager", "phase": "jit"},
+        )
+        == 2
+    )
+    assert any(
+        "Created 2 of 2 runners" in record.getMessage() and "jit mean" in record.getMessage()
+        for record in caplog.records
+    )
+
+
+def test_runner_manager_reserves_created_runners_until_listed() -> None:
+    """
+    arrange: A runner manager whose cloud does not list the created VM yet.
+    act: Create a runner, run cleanup, then list the runners once the cloud lists the VM.
+    assert: The runner is pending and not cleaned up as dangling until its VM is listed.
+    """
+    cloud_runner_manager = MagicMock(spec=CloudRunnerManager)
+    cloud_runner_manager.get_creation_headroom.return_value = None
+    cloud_runner_manager.name_prefix = "unit-0"
+    cloud_runner_manager.get_vms.return_value = []
+    cloud_runner_manager.extract_metrics.return_value = []
+    cloud_runner_manager.delete_vms.return_value = []
+    platform_provider = MagicMock(spec=PlatformProvider)
+    platform_provider.get_runner_context.return_value = (MagicMock(), MagicMock(id=1))
+    platform_provider.delete_runners.return_value = []
+    runner_manager = RunnerManager(
+        "managername",
+        platform_provider=platform_provider,
+        cloud_runner_manager=cloud_runner_manager,
+        labels=[],
+    )
+
+    (instance_id,) = runner_manager.create_runners(1, RunnerMetadata()).instance_ids
+    platform_provider.get_runners_health.return_value = RunnersHealthResponse(
+        non_requested_runners=[
+            RunnerIdentity(instance_id=instance_id, metadata=RunnerMetadata(runner_id="1"))
+        ]
+    )
+    runner_manager.cleanup()
+
+    assert runner_manager.pending_creations == 1
+    platform_provider.delete_runners.assert_called_once_with(runner_ids=[])
+
+    cloud_runner_manager.get_vms.return_value = [
+        CloudRunnerInstanceFactory(instance_id=instance_id)
+    ]
+    platform_provider.get_runners_health.return_value = RunnersHealthResponse()
+    runner_manager.get_runners()
+
+    assert runner_manager.pending_creations == 0
+
+
+def test_runner_manager_releases_failed_creations() -> None:
+    """
+    arrange: A runner manager whose cloud fails to create runners.
+    act: Create a runner.
+    assert: No runner is pending creation.
+    """
+    cloud_runner_manager = MagicMock(spec=CloudRunnerManager)
+    cloud_runner_manager.get_creation_headroom.return_value = None
+    cloud_runner_manager.name_prefix = "unit-0"
+    cloud_runner_manager.create_runner.side_effect = RunnerError("mock error")
+    platform_provider = MagicMock(spec=PlatformProvider)
+    platform_provider.get_runner_context.return_value = (MagicMock(), MagicMock(id=1))
+    runner_manager = RunnerManager(
+        "managername",
+        platform_provider=platform_provider,
+        cloud_runner_manager=cloud_runner_manager,
+        labels=[],
+    )
+
+    assert runner_manager.create_runners(1, RunnerMetadata()) == CreationResult(
+        instance_ids=(), failure=CreationFailure.TRANSIENT
+    )
+    assert runner_manager.pending_creations == 0
+
+
+@pytest.mark.parametrize(
+    "errors, expected_failure",
+    [
+        pytest.param(
+            [RunnerError("nova"), RunnerQuotaError("quota"), None],
+            CreationFailure.QUOTA,
+            id="quota over transient",
+        ),
+        pytest.param(
+            [RunnerQuotaError("quota"), MissingServerConfigError("image"), None],
+            CreationFailure.CONFIG,
+            id="config over quota",
+        ),
+        pytest.param(
+            [RunnerError("nova"), RunnerError("nova"), None],
+            CreationFailure.TRANSIENT,
+            id="transient",
+        ),
+    ],
+)
+def test_runner_manager_create_runners_classifies_failures(
+    errors: list[Exception | None], expected_failure: CreationFailure
+) -> None:
+    """
+    arrange: A cloud failing every attempt to create some of 3 runners with different errors.
+    act: Create 3 runners.
+    assert: The runners not failing are created and the most severe failure is reported.
+    """
+    # The attempts to create a runner share its metadata, but not its instance ID.
+    runner_errors: dict[int, Exception | None] = {}
+    next_errors = iter(errors)
+
+    def create_runner(runner_identity: RunnerIdentity, **_kwargs: Any) -> None:
+        """Fail the creation of a runner with the error assigned to it.
+
+        Args:
+            runner_identity: The identity of the runner.
+            _kwargs: Other arguments.
+
+        Raises:
+            error: The error assigned to the runner.
+        """
+        runner = id(runner_identity.metadata)
+        if runner not in runner_errors:
+            runner_errors[runner] = next(next_errors)
+        if (error := runner_errors[runner]) is not None:
+            raise error
+
+    cloud_runner_manager = MagicMock(spec=CloudRunnerManager)
+    cloud_runner_manager.get_creation_headroom.return_value = None
+    cloud_runner_manager.name_prefix = "unit-0"
+    cloud_runner_manager.create_runner.side_effect = create_runner
+    platform_provider = MagicMock(spec=PlatformProvider)
+    platform_provider.get_runner_context.return_value = (MagicMock(), MagicMock(id=1))
+    runner_manager = RunnerManager(
+        "managername",
+        platform_provider=platform_provider,
+        cloud_runner_manager=cloud_runner_manager,
+        labels=[],
+    )
+
+    result = runner_manager.create_runners(3, RunnerMetadata())
+
+    assert len(result.instance_ids) == 1
+    assert result.failure == expected_failure
+
+
+def test_runner_manager_create_runners_retries_transient_failure() -> None:
+    """
+    arrange: A cloud failing the first attempt to create a runner with a transient error.
+    act: Create a runner.
+    assert: The runner is created on the second attempt with a new instance ID and platform \
+        registration, the registration of the failed attempt is deleted and the attempts are \
+        observed.
+    """
+    cloud_runner_manager = MagicMock(spec=CloudRunnerManager)
+    cloud_runner_manager.get_creation_headroom.return_value = None
+    cloud_runner_manager.name_prefix = "unit-0"
+    cloud_runner_manager.create_runner.side_effect = [RunnerCreateError("nova"), None]
+    platform_provider = MagicMock(spec=PlatformProvider)
+    platform_provider.get_runner_context.side_effect = [
+        (MagicMock(), MagicMock(id=1)),
+        (MagicMock(), MagicMock(id=2)),
+    ]
+    platform_provider.delete_runners.return_value = ["1"]
+    runner_manager = RunnerManager(
+        "retry-manager",
+        platform_provider=platform_provider,
+        cloud_runner_manager=cloud_runner_manager,
+        labels=[],
+    )
+
+    result = runner_manager.create_runners(1, RunnerMetadata())
+
+    assert len(result.instance_ids) == 1
+    assert result.failure is None
+    platform_provider.delete_runners.assert_called_once_with(runner_ids=["1"])
+    first_identity, last_identity = (
+        call.kwargs["runner_identity"]
+        for call in cloud_runner_manager.create_runner.call_args_list
+    )
+    assert last_identity.metadata.runner_id == "2"
+    assert first_identity.instance_id != last_identity.instance_id
+    assert result.instance_ids == (last_identity.instance_id,)
+    assert runner_manager.pending_creations == 1
+    labels = {"flavor": "retry-manager"}
+    assert REGISTRY.get_sample_value("runner_creation_attempts_sum", labels) == 2
+    assert REGISTRY.get_sample_value("runner_creation_attempts_count", labels) == 1
+
+
+@pytest.mark.parametrize(
+    "error, expected_attempts",
+    [
+        pytest.param(RunnerCreateError("nova"), CREATE_ATTEMPTS, id="transient"),
+        pytest.param(RunnerQuotaError("quota"), 1, id="quota"),
+        pytest.param(MissingServerConfigError("image"), 1, id="config"),
+    ],
+)
+def test_runner_manager_create_runners_bounded_retries(
+    error: RunnerError, expected_attempts: int
+) -> None:
+    """
+    arrange: A cloud failing every attempt to create a runner, and a platform failing to delete \
+        the registrations.
+    act: Create a runner.
+    assert: Only the transient failures are retried, up to the maximum attempts, and the \
+        registration of each attempt is deleted.
+    """
+    cloud_runner_manager = MagicMock(spec=CloudRunnerManager)
+    cloud_runner_manager.get_creation_headroom.return_value = None
+    cloud_runner_manager.name_prefix = "unit-0"
+    cloud_runner_manager.create_runner.side_effect = error
+    platform_provider = MagicMock(spec=PlatformProvider)
+    platform_provider.get_runner_context.return_value = (MagicMock(), MagicMock(id=1))
+    platform_provider.delete_runners.side_effect = PlatformApiError("mock error")
+    runner_manager = RunnerManager(
+        "managername",
+        platform_provider=platform_provider,
+        cloud_runner_manager=cloud_runner_manager,
+        labels=[],
+    )
+
+    result = runner_manager.create_runners(1, RunnerMetadata())
+
+    assert result.instance_ids == ()
+    assert cloud_runner_manager.create_runner.call_count == expected_attempts
+    assert platform_provider.delete_runners.call_count == expected_attempts
+
+
 @pytest.mark.parametrize(
     "initial_runners, initial_cloud_runners, expected_runner_instances",
     [
@@ -572,3 +1009,104 @@ def test_soft_delete_runners(
     assert deleted_count == expected_deleted
     assert list(mock_platform._runners.values()) == expected_runners
     assert list(mock_cloud._cloud_runners.values()) == expected_cloud_runners
+
+
+def test_soft_delete_runners_keeps_young_runners():
+    """
+    arrange: Two idle runners, one with a VM created just now and one with a VM 10 minutes old.
+    act: Soft delete 2 runners with a minimum age of 5 minutes.
+    assert: Only the runner with the old VM is deleted, the other is counted as kept.
+    """
+    young_runner = SelfHostedRunnerFactory(busy=False, status="online")
+    old_runner = SelfHostedRunnerFactory(busy=False, status="online")
+    young_vm = CloudRunnerInstanceFactory.from_self_hosted_runner(young_runner)
+    old_vm = CloudRunnerInstanceFactory.from_self_hosted_runner(old_runner)
+    old_vm.created_at = datetime.now(timezone.utc) - timedelta(minutes=10)
+    mock_platform = FakeGitHubRunnerPlatform(initial_runners=[young_runner, old_runner])
+    mock_cloud = FakeCloudRunnerManager(initial_cloud_runners=[young_vm, old_vm])
+    manager = RunnerManager(
+        "min-age-manager",
+        platform_provider=mock_platform,
+        cloud_runner_manager=mock_cloud,
+        labels=[],
+    )
+
+    deleted_count = manager.soft_delete_runners(num=2, min_age=5 * 60)
+
+    assert deleted_count == 1
+    assert list(mock_cloud._cloud_runners.values()) == [young_vm]
+    assert (
+        REGISTRY.get_sample_value(
+            "runner_scale_down_avoided_total",
+            {"flavor": "min-age-manager", "cause": "min_idle_age"},
+        )
+        == 1
+    )
+
+
+def test_soft_delete_runners_boot_progress_with_min_age():
+    """
+    arrange: An idle online runner with a VM 10 minutes old, and an offline runner with a VM \
+        created just now still building, under the boot progress policy.
+    act: Soft delete 1 runner with a minimum age of 5 minutes.
+    assert: The booting runner is deleted, the minimum age only applies to the online runners.
+    """
+    booting_runner = SelfHostedRunnerFactory(busy=False, status="offline")
+    online_runner = SelfHostedRunnerFactory(busy=False, status="online")
+    booting_vm = CloudRunnerInstanceFactory.from_self_hosted_runner(
+        booting_runner, state=VMState.CREATED
+    )
+    online_vm = CloudRunnerInstanceFactory.from_self_hosted_runner(online_runner)
+    online_vm.created_at = datetime.now(timezone.utc) - timedelta(minutes=10)
+    mock_cloud = FakeCloudRunnerManager(initial_cloud_runners=[booting_vm, online_vm])
+    manager = RunnerManager(
+        "boot-min-age-manager",
+        platform_provider=FakeGitHubRunnerPlatform(
+            initial_runners=[booting_runner, online_runner]
+        ),
+        cloud_runner_manager=mock_cloud,
+        labels=[],
+        scale_down_policy=ScaleDownPolicy.BOOT_PROGRESS,
+    )
+
+    deleted_count = manager.soft_delete_runners(num=1, min_age=5 * 60)
+
+    assert deleted_count == 1
+    assert list(mock_cloud._cloud_runners.values()) == [online_vm]
+
+
+@pytest.mark.parametrize(
+    "policy, expected_deleted",
+    [
+        pytest.param(ScaleDownPolicy.BOOT_PROGRESS, "new", id="boot progress"),
+        pytest.param(ScaleDownPolicy.IDLE_LONGEST, "old", id="idle longest"),
+    ],
+)
+def test_soft_delete_runners_by_scale_down_policy(policy: ScaleDownPolicy, expected_deleted: str):
+    """
+    arrange: Two idle runners with VMs created 10 and 20 minutes ago, and a scale down policy.
+    act: Soft delete 1 runner.
+    assert: The runner chosen by the policy is deleted.
+    """
+    runners = {
+        "new": SelfHostedRunnerFactory(busy=False, status="online"),
+        "old": SelfHostedRunnerFactory(busy=False, status="online"),
+    }
+    vms = {
+        name: CloudRunnerInstanceFactory.from_self_hosted_runner(r) for name, r in runners.items()
+    }
+    vms["new"].created_at = datetime.now(timezone.utc) - timedelta(minutes=10)
+    vms["old"].created_at = datetime.now(timezone.utc) - timedelta(minutes=20)
+    mock_cloud = FakeCloudRunnerManager(initial_cloud_runners=list(vms.values()))
+    manager = RunnerManager(
+        "policy-manager",
+        platform_provider=FakeGitHubRunnerPlatform(initial_runners=list(runners.values())),
+        cloud_runner_manager=mock_cloud,
+        labels=[],
+        scale_down_policy=policy,
+    )
+
+    deleted_count = manager.soft_delete_runners(num=1)
+
+    assert deleted_count == 1
+    assert vms[expected_deleted] not in mock_cloud._cloud_runners.values()
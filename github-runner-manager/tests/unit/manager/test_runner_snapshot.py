@@ -0,0 +1,127 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Unit tests for the runner snapshot cache."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from github_runner_manager.errors import CloudError
+from github_runner_manager.manager.runner_snapshot import RunnerSnapshotCache
+from tests.unit.factories.runner_instance_factory import RunnerInstanceFactory
+
+
+def test_get_uses_published_snapshot():
+    """
+    arrange: A cache with a published snapshot.
+    act: Get the snapshot without a max age and with a max age it satisfies.
+    assert: The published snapshot is returned without a live fetch.
+    """
+    fetch = MagicMock()
+    cache = RunnerSnapshotCache(fetch=fetch)
+    runners = (RunnerInstanceFactory(),)
+    cache.publish(runners, taken_at=time.time())
+
+    assert cache.get().runners == runners
+    assert cache.get(max_age=60).runners == runners
+    fetch.assert_not_called()
+
+
+def test_get_fetches_stale_snapshot():
+    """
+    arrange: A cache with a published snapshot.
+    act: Get the snapshot with max age 0.
+    assert: The runners are fetched live and published.
+    """
+    runners = (RunnerInstanceFactory(),)
+    fetch = MagicMock(return_value=runners)
+    cache = RunnerSnapshotCache(fetch=fetch)
+    cache.publish((), taken_at=time.time())
+
+    assert cache.get(max_age=0).runners == runners
+    assert cache.get().runners == runners
+    fetch.assert_called_once_with()
+
+
+def test_get_coalesces_live_fetches():
+    """
+    arrange: A cache with a fetch blocking until released.
+    act: Get the snapshot from several threads at once.
+    assert: A single fetch is done and all readers get its result.
+    """
+    release = threading.Event()
+    runners = (RunnerInstanceFactory(),)
+    calls = []
+
+    def fetch():
+        """Block until released."""
+        calls.append(1)
+        release.wait(timeout=10)
+        return runners
+
+    cache = RunnerSnapshotCache(fetch=fetch)
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(cache.get, max_age=0)
+        while not calls:
+            release.wait(0.01)
+        # Until the leader publishes, there is no snapshot and these readers join its fetch.
+        followers = [executor.submit(cache.get, max_age=60) for _ in range(4)]
+        release.set()
+        results = [future.result(timeout=10) for future in (leader, *followers)]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert results[0].runners == runners
+
+
+def test_get_propagates_fetch_error():
+    """
+    arrange: A cache with a failing fetch.
+    act: Get the snapshot, then get it again after the fetch recovers.
+    assert: The error is raised, and the next get fetches again.
+    """
+    runners = (RunnerInstanceFactory(),)
+    fetch = MagicMock(side_effect=[CloudError("mock error"), runners])
+    cache = RunnerSnapshotCache(fetch=fetch)
+
+    with pytest.raises(CloudError):
+        cache.get()
+    assert cache.get().runners == runners
+
+
+def test_slow_listing_does_not_replace_later_listing():
+    """
+    arrange: A cache with a slow fetch blocking until released.
+    act: Refresh the snapshot with the slow fetch, and while it is in flight refresh it with a \
+        fast fetch started later.
+    assert: The listing of the fast fetch stays published once the slow fetch finishes.
+    """
+    release = threading.Event()
+    started = threading.Event()
+    slow_runners = (RunnerInstanceFactory(),)
+    fast_runners = (RunnerInstanceFactory(),)
+    fetches = iter([slow_runners, fast_runners])
+
+    def fetch():
+        """Block the first fetch until released."""
+        runners = next(fetches)
+        if runners is slow_runners:
+            started.set()
+            release.wait(timeout=10)
+        return runners
+
+    cache = RunnerSnapshotCache(fetch=fetch)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        slow = executor.submit(cache.refresh)
+        assert started.wait(timeout=10)
+        time.sleep(0.01)
+        fast = cache.refresh()
+        release.set()
+        slow.result(timeout=10)
+
+    assert fast.taken_at > slow.result().taken_at
+    assert cache.get().runners == fast_runners
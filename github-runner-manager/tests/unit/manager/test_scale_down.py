@@ -0,0 +1,150 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Test for the hysteresis of the scale down of the runners."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from prometheus_client import REGISTRY
+
+from github_runner_manager.configuration import ScaleDownPolicy
+from github_runner_manager.manager.models import InstanceID, RunnerIdentity, RunnerMetadata
+from github_runner_manager.manager.scale_down import (
+    ScaleDownHysteresis,
+    order_scale_down_candidates,
+)
+from github_runner_manager.manager.vm_manager import VM, VMState
+from github_runner_manager.platform.platform_provider import PlatformRunnerHealth
+
+
+def _avoided(flavor: str, cause: str) -> float:
+    """Get the number of runners kept instead of scaled down.
+
+    Args:
+        flavor: The flavor of the runners.
+        cause: The cause of the runners kept.
+
+    Returns:
+        The number of runners.
+    """
+    return (
+        REGISTRY.get_sample_value(
+            "runner_scale_down_avoided_total", {"flavor": flavor, "cause": cause}
+        )
+        or 0
+    )
+
+
+def _runner(
+    name: str, state: VMState, age: float, online: bool = False, busy: bool = False
+) -> tuple[PlatformRunnerHealth, VM]:
+    """Build a runner and its VM.
+
+    Args:
+        name: The name of the runner, used as the runner ID.
+        state: The state of the VM.
+        age: The age in seconds of the VM.
+        online: Whether the runner is online.
+        busy: Whether the runner is busy.
+
+    Returns:
+        The runner and its VM.
+    """
+    identity = RunnerIdentity(
+        instance_id=InstanceID.build(prefix="unit-0"),
+        metadata=RunnerMetadata(platform_name="github", runner_id=name),
+    )
+    vm = VM(
+        instance_id=identity.instance_id,
+        metadata=identity.metadata,
+        state=state,
+        created_at=datetime.now(timezone.utc) - timedelta(seconds=age),
+    )
+    return PlatformRunnerHealth(identity=identity, online=online, busy=busy, deletable=False), vm
+
+
+@pytest.mark.parametrize(
+    "policy, expected_order",
+    [
+        pytest.param(
+            ScaleDownPolicy.BOOT_PROGRESS,
+            ["building", "booting", "new-idle", "old-idle", "busy"],
+            id="boot progress",
+        ),
+        pytest.param(
+            ScaleDownPolicy.IDLE_LONGEST,
+            ["old-idle", "new-idle", "booting", "building", "busy"],
+            id="idle longest",
+        ),
+    ],
+)
+def test_order_scale_down_candidates(policy: ScaleDownPolicy, expected_order: list[str]):
+    """
+    arrange: Runners busy, idle for 10 and 20 minutes, booting and with a VM building.
+    act: Order the runners to scale down with the policy.
+    assert: The runners are ordered by the policy, the busy runner last.
+    """
+    runners, vms = zip(
+        _runner("busy", VMState.ACTIVE, age=30 * 60, online=True, busy=True),
+        _runner("old-idle", VMState.ACTIVE, age=20 * 60, online=True),
+        _runner("new-idle", VMState.ACTIVE, age=10 * 60, online=True),
+        _runner("building", VMState.CREATED, age=30),
+        _runner("booting", VMState.ACTIVE, age=2 * 60),
+    )
+
+    ordered = order_scale_down_candidates(runners, vms, policy)
+
+    assert [runner.identity.metadata.runner_id for runner in ordered] == expected_order
+
+
+def test_no_hysteresis():
+    """
+    arrange: A hysteresis without cooldown or window, after a scale up and a high desired total.
+    act: Get the runners to scale down from 5 runners to 2.
+    assert: The 3 runners in excess are scaled down.
+    """
+    hysteresis = ScaleDownHysteresis("test-no-hysteresis", cooldown=0, window=0)
+    hysteresis.record_scale_up(now=0)
+    hysteresis.observe(10, now=0)
+
+    assert hysteresis.to_delete(current_total=5, desired_total=2, now=1) == 3
+    assert hysteresis.to_delete(current_total=2, desired_total=5, now=1) == 0
+
+
+def test_cooldown_after_scale_up():
+    """
+    arrange: A hysteresis with a cooldown of 60 seconds, scaled up at time 0.
+    act: Get the runners to scale down from 5 runners to 2 at 30 and 61 seconds.
+    assert: No runner is scaled down during the cooldown and the runners are counted as kept.
+    """
+    hysteresis = ScaleDownHysteresis("test-cooldown", cooldown=60, window=0)
+    hysteresis.record_scale_up(now=0)
+
+    during_cooldown = hysteresis.to_delete(current_total=5, desired_total=2, now=30)
+    after_cooldown = hysteresis.to_delete(current_total=5, desired_total=2, now=61)
+
+    assert during_cooldown == 0
+    assert after_cooldown == 3
+    assert _avoided("test-cooldown", "cooldown") == 3
+
+
+def test_stabilization_window():
+    """
+    arrange: A hysteresis with a window of 60 seconds, with desired totals of 4 at time 0 and 3 \
+        at time 30.
+    act: Get the runners to scale down from 5 runners to 2 at 50 and 100 seconds.
+    assert: The runners are only scaled down to the highest desired total within the window.
+    """
+    hysteresis = ScaleDownHysteresis("test-window", cooldown=0, window=60)
+    hysteresis.observe(4, now=0)
+    hysteresis.observe(3, now=30)
+
+    within_window = hysteresis.to_delete(current_total=5, desired_total=2, now=50)
+    later = hysteresis.to_delete(current_total=5, desired_total=2, now=100)
+    after_window = hysteresis.to_delete(current_total=5, desired_total=2, now=200)
+
+    assert within_window == 1
+    assert later == 3
+    assert after_window == 3
+    assert _avoided("test-window", "window") == 2
@@ -0,0 +1,207 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+import json
+import math
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from github_runner_manager.cli import main
+from github_runner_manager.metrics import analytics
+
+
+def _write_log(path: Path, lines: list[dict | str]) -> Path:
+    """Write metric events, or raw lines, to a log file.
+
+    Args:
+        path: The log file path.
+        lines: The events or raw lines.
+
+    Returns:
+        The log file path.
+    """
+    path.write_text(
+        "".join((line if isinstance(line, str) else json.dumps(line)) + "\n" for line in lines)
+    )
+    return path
+
+
+def _installed(timestamp: float, duration: float, flavor: str = "small") -> dict:
+    """Build a runner_installed event.
+
+    Args:
+        timestamp: The event timestamp.
+        duration: The installation duration.
+        flavor: The runner flavor.
+
+    Returns:
+        The event.
+    """
+    return {
+        "event": "runner_installed",
+        "timestamp": timestamp,
+        "flavor": flavor,
+        "duration": duration,
+    }
+
+
+def test_log_histogram_percentiles_within_bucket_error():
+    """
+    arrange: A histogram of the values 1 to 1000.
+    act: Estimate percentiles.
+    assert: The estimates are within the relative error of the bucket growth factor.
+    """
+    histogram = analytics.LogHistogram()
+    histogram.add_many([float(value) for value in range(1, 1001)])
+
+    for percent in (50, 90, 99):
+        assert histogram.percentile(percent) == pytest.approx(percent * 10, rel=0.05)
+    assert histogram.percentile(100) == 1000
+    assert histogram.histogram()["+Inf"] == 1000
+    assert histogram.histogram()["300"] == pytest.approx(300, rel=0.05)
+
+
+@pytest.mark.parametrize(
+    "bounds, bound_key",
+    [
+        pytest.param(analytics.REPORT_HISTOGRAM_BOUNDS, "300", id="report bound"),
+        pytest.param((250.0, math.inf), "250", id="other bound"),
+    ],
+)
+def test_log_histogram_values_below_bound_counted(bounds: tuple[float, ...], bound_key: str):
+    """
+    arrange: A histogram of 20000 values spread just below a coarse bound, up to the bound.
+    act: Re-bucket the values into the coarse buckets.
+    assert: All values are counted in the bucket of the bound.
+    """
+    bound = float(bound_key)
+    histogram = analytics.LogHistogram()
+    histogram.add_many([bound - index * 0.001 for index in range(20000)])
+
+    assert histogram.histogram(bounds)[bound_key] == 20000
+
+
+def test_log_histogram_empty():
+    """
+    arrange: An empty histogram.
+    act: Estimate a percentile and summarize.
+    assert: The percentile is NaN and the summary only has the count.
+    """
+    histogram = analytics.LogHistogram()
+
+    assert math.isnan(histogram.percentile(50))
+    assert histogram.summary() == {"count": 0}
+
+
+def test_analyze_metrics_log_window_and_breakdowns(tmp_path: Path):
+    """
+    arrange: A log with runner_installed events of two flavors, inside and outside a window.
+    act: Analyze the log over the window.
+    assert: Only events in the window are aggregated, overall and per flavor.
+    """
+    log = _write_log(
+        tmp_path / "metrics.log",
+        [
+            _installed(timestamp=50, duration=1000),
+            _installed(timestamp=100, duration=10),
+            _installed(timestamp=110, duration=20, flavor="large"),
+            _installed(timestamp=120, duration=30),
+            _installed(timestamp=200, duration=1000),
+        ],
+    )
+
+    report = analytics.analyze_metrics_log(log, window=analytics.TimeWindow(start=100, end=200))
+
+    assert report.events_read == 5
+    assert report.event_counts == {"runner_installed": 3}
+    summary = report.as_dict()["events"]["runner_installed"]["duration"]
+    assert summary["all"]["count"] == 3
+    assert summary["all"]["max"] == 30
+    assert summary["by_flavor"]["small"]["count"] == 2
+    assert summary["by_flavor"]["large"]["count"] == 1
+    assert "by_repo" not in summary
+
+
+def test_analyze_metrics_log_skips_malformed_lines(tmp_path: Path):
+    """
+    arrange: A log with malformed lines and events without the aggregated field.
+    act: Analyze the log.
+    assert: Malformed lines are counted and skipped.
+    """
+    log = _write_log(
+        tmp_path / "metrics.log",
+        [
+            "not json",
+            {"event": "runner_installed"},
+            {"event": "runner_installed", "timestamp": 1, "flavor": "small"},
+            _installed(timestamp=2, duration=5),
+        ],
+    )
+
+    report = analytics.analyze_metrics_log(log)
+
+    assert report.malformed_lines == 2
+    assert report.events_read == 2
+    assert report.fields["runner_installed"]["duration"].overall.count == 1
+
+
+def test_analyze_metrics_log_small_chunks(tmp_path: Path):
+    """
+    arrange: A log with many events.
+    act: Analyze the log with a chunk size splitting lines.
+    assert: The report is the same as reading the log at once.
+    """
+    log = _write_log(
+        tmp_path / "metrics.log",
+        [_installed(timestamp=index, duration=index % 97 + 1) for index in range(500)],
+    )
+
+    chunked = analytics.analyze_metrics_log(log, chunk_size=37)
+    whole = analytics.analyze_metrics_log(log)
+
+    assert chunked.malformed_lines == 0
+    assert chunked.as_dict() == whole.as_dict()
+
+
+def test_analyze_metrics_command(tmp_path: Path):
+    """
+    arrange: A log with runner_installed events.
+    act: Run the analyze-metrics subcommand with a window and percentile.
+    assert: The JSON report has the requested percentile over the window.
+    """
+    log = _write_log(
+        tmp_path / "metrics.log",
+        [_installed(timestamp=1e9, duration=1), _installed(timestamp=2e9, duration=2)],
+    )
+
+    result = CliRunner().invoke(
+        main,
+        [
+            "analyze-metrics",
+            "--log-path",
+            str(log),
+            "--since",
+            "2020-01-01T00:00:00Z",
+            "--percentile",
+            "50",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert report["event_counts"] == {"runner_installed": 1}
+    assert report["events"]["runner_installed"]["duration"]["all"]["p50"] == 2
+
+
+def test_analyze_metrics_command_invalid_since(tmp_path: Path):
+    """
+    arrange: An empty log.
+    act: Run the analyze-metrics subcommand with an invalid --since.
+    assert: The command fails with a usage error.
+    """
+    log = _write_log(tmp_path / "metrics.log", [])
+
+    result = CliRunner().invoke(main, ["analyze-metrics", "--log-path", str(log), "--since", "x"])
+
+    assert result.exit_code == 2
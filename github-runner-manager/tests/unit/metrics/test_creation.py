@@ -0,0 +1,65 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Test for the metrics of the phases of the runner creation."""
+
+import threading
+
+from prometheus_client import REGISTRY
+
+from github_runner_manager.metrics import creation as creation_metrics
+from github_runner_manager.metrics.creation import CreationTimings, Phase
+
+
+def test_phases_recorded_per_creation():
+    """
+    arrange: Two creations recorded in different threads, and a phase outside of any creation.
+    act: Time phases within and outside the creations.
+    assert: Each creation has the durations of its own phases, repeated phases are summed.
+    """
+    first, second = CreationTimings(), CreationTimings()
+
+    def create(timings: CreationTimings, phases: list[Phase]) -> None:
+        """Record the phases of a creation."""
+        with creation_metrics.record_creation(timings):
+            for name in phases:
+                with creation_metrics.phase(name):
+                    pass
+
+    with creation_metrics.phase(Phase.JIT):
+        pass
+    threads = [
+        threading.Thread(target=create, args=(first, [Phase.JIT, Phase.KEYPAIR, Phase.JIT])),
+        threading.Thread(target=create, args=(second, [Phase.RENDER])),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert set(first.durations) == {Phase.JIT, Phase.KEYPAIR}
+    assert set(second.durations) == {Phase.RENDER}
+
+
+def test_observe_batch():
+    """
+    arrange: The timings of a batch of two creations.
+    act: Observe the batch.
+    assert: The phases are observed in the histogram and summarized with mean and maximum.
+    """
+    batch = [
+        CreationTimings(durations={Phase.JIT: 1.0, Phase.NOVA_CREATE: 2.0}),
+        CreationTimings(durations={Phase.JIT: 3.0}),
+    ]
+
+    summary = creation_metrics.observe_batch("test-creation", batch)
+
+    assert summary == "jit mean 2.00s max 3.00s, nova_create mean 2.00s max 2.00s"
+    assert (
+        REGISTRY.get_sample_value(
+            "runner_creation_phase_duration_seconds_count",
+            {"flavor": "test-creation", "phase": "jit"},
+        )
+        == 2
+    )
+    assert creation_metrics.observe_batch("test-creation", []) == "no phase run"
@@ -1,10 +1,13 @@
 #  Copyright 2026 Canonical Ltd.
 #  See LICENSE file for licensing details.
 import json
+import threading
+import time
 from pathlib import Path
 
 import pytest
 
+from github_runner_manager.errors import IssueMetricEventError
 from github_runner_manager.metrics import events
 
 TEST_LOKI_PUSH_API_URL = "http://loki:3100/api/prom/push"
@@ -63,3 +66,140 @@ def test_issue_events_exclude_none_values(tmp_path: Path):
         "status": "status",
         "job_duration": 456,
     }
+
+
+@pytest.fixture(name="event_writer")
+def event_writer_fixture(tmp_path: Path):
+    """Start an event writer on a temporary metrics log and stop it after the test."""
+    writer = events.EventWriter(path=tmp_path / "buffered.log", flush_interval=60)
+    writer.start()
+    yield writer
+    writer.stop(timeout=10)
+
+
+def _read_events(path: Path) -> list[dict]:
+    """Read the metric events written to a metrics log."""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_event_writer_batches_events(tmp_path: Path, event_writer: events.EventWriter):
+    """
+    arrange: Start an event writer with a long flush interval.
+    act: Queue several events and request a flush.
+    assert: All events are written in order once the flush completes.
+    """
+    for timestamp in range(5):
+        event_writer.put(events.RunnerInstalled(timestamp=timestamp, flavor="small", duration=1))
+
+    assert event_writer.flush(timeout=10)
+
+    written = _read_events(tmp_path / "buffered.log")
+    assert [event["timestamp"] for event in written] == [0, 1, 2, 3, 4]
+
+
+def test_event_writer_reopens_rotated_log(tmp_path: Path, event_writer: events.EventWriter):
+    """
+    arrange: Start an event writer and write an event to the metrics log.
+    act: Move the metrics log away as logrotate does and write another event.
+    assert: The second event is written to a new file at the metrics log path.
+    """
+    log_path = tmp_path / "buffered.log"
+    event_writer.put(events.RunnerInstalled(timestamp=1, flavor="small", duration=1))
+    assert event_writer.flush(timeout=10)
+
+    log_path.rename(tmp_path / "buffered.log.1")
+    event_writer.put(events.RunnerInstalled(timestamp=2, flavor="small", duration=1))
+    assert event_writer.flush(timeout=10)
+
+    assert [event["timestamp"] for event in _read_events(tmp_path / "buffered.log.1")] == [1]
+    assert [event["timestamp"] for event in _read_events(log_path)] == [2]
+
+
+def test_event_writer_stop_writes_queued_events(tmp_path: Path):
+    """
+    arrange: Start an event writer with a long flush interval and queue an event.
+    act: Stop the event writer.
+    assert: The queued event is written and further events are rejected.
+    """
+    writer = events.EventWriter(path=tmp_path / "buffered.log", flush_interval=60)
+    writer.start()
+    writer.put(events.RunnerInstalled(timestamp=1, flavor="small", duration=1))
+
+    writer.stop(timeout=10)
+
+    assert [event["timestamp"] for event in _read_events(tmp_path / "buffered.log")] == [1]
+    with pytest.raises(IssueMetricEventError):
+        writer.put(events.RunnerInstalled(timestamp=2, flavor="small", duration=1))
+
+
+def test_issue_event_uses_started_event_writer():
+    """
+    arrange: Start the module event writer.
+    act: Issue a metric event and stop the event writer.
+    assert: The event is written to the metrics log.
+    """
+    events.start_event_writer(flush_interval=60, fsync_policy=events.FsyncPolicy.BATCH)
+    try:
+        events.issue_event(events.RunnerInstalled(timestamp=123, flavor="small", duration=456))
+    finally:
+        events.stop_event_writer(timeout=10)
+
+    assert _read_events(events.get_metrics_log_path()) == [
+        {"event": "runner_installed", "timestamp": 123, "flavor": "small", "duration": 456}
+    ]
+
+
+def test_event_writer_flush_full_queue_times_out(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: An event writer not started, with a full queue.
+    act: Flush the event writer with a timeout.
+    assert: The flush returns without the events written instead of blocking.
+    """
+    writer = events.EventWriter(path=tmp_path / "buffered.log", max_queue_size=1)
+    writer._queue.put_nowait(events.RunnerInstalled(timestamp=1, flavor="small", duration=1))
+    monkeypatch.setattr(writer._thread, "is_alive", lambda: True)
+
+    assert not writer.flush(timeout=0.1)
+
+
+def test_issue_event_racing_stop_is_written():
+    """
+    arrange: Start the module event writer and stop it after the event is issued, as a \
+        concurrent stop_event_writer does.
+    act: Issue a metric event.
+    assert: The event is written to the metrics log.
+    """
+    writer = events.start_event_writer(flush_interval=60)
+    writer.stop(timeout=10)
+
+    try:
+        events.issue_event(events.RunnerInstalled(timestamp=123, flavor="small", duration=456))
+    finally:
+        events.stop_event_writer(timeout=10)
+
+    assert _read_events(events.get_metrics_log_path()) == [
+        {"event": "runner_installed", "timestamp": 123, "flavor": "small", "duration": 456}
+    ]
+
+
+def test_event_writer_flush_full_queue_does_not_block_put(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    arrange: An event writer not started, with a full queue and a flush waiting for room.
+    act: Queue an event while the flush waits.
+    assert: The event is rejected at once instead of waiting for the flush.
+    """
+    writer = events.EventWriter(path=tmp_path / "buffered.log", max_queue_size=1)
+    writer._queue.put_nowait(events.RunnerInstalled(timestamp=1, flavor="small", duration=1))
+    monkeypatch.setattr(writer._thread, "is_alive", lambda: True)
+    flush = threading.Thread(target=writer.flush, kwargs={"timeout": 1})
+    flush.start()
+
+    start = time.monotonic()
+    with pytest.raises(IssueMetricEventError):
+        writer.put(events.RunnerInstalled(timestamp=2, flavor="small", duration=1))
+    elapsed = time.monotonic() - start
+    flush.join()
+
+    assert elapsed < 0.5
@@ -1,5 +1,6 @@
 # Copyright 2026 Canonical Ltd.
 #  See LICENSE file for licensing details.
+import base64
 import secrets
 from datetime import datetime
 from pathlib import Path
@@ -9,6 +10,7 @@ from unittest.mock import MagicMock, call
 import pytest
 from fabric import Connection as SSHConnection
 from invoke.runners import Result
+from prometheus_client import REGISTRY
 
 from github_runner_manager.errors import IssueMetricEventError
 from github_runner_manager.manager.models import InstanceID
@@ -17,6 +19,7 @@ from github_runner_manager.metrics import runner as runner_metrics
 from github_runner_manager.metrics import type as metrics_type
 from github_runner_manager.metrics.events import Event
 from github_runner_manager.metrics.runner import (
+    BootPhase,
     PulledMetrics,
     PullFileError,
     SSHError,
@@ -24,6 +27,7 @@ from github_runner_manager.metrics.runner import (
     pull_runner_metrics,
 )
 from github_runner_manager.openstack_cloud.constants import (
+    BOOT_PHASES_FILE_PATH,
     POST_JOB_METRICS_FILE_PATH,
     PRE_JOB_METRICS_FILE_PATH,
     RUNNER_INSTALLED_TS_FILE_PATH,
@@ -211,6 +215,20 @@ class FakeOpenStackCloud(OpenstackCloud):
             ],
             id="single instance, partial metrics(RUNNER_INSTALLED_TS_FILE_PATH)",
         ),
+        pytest.param(
+            [instance := OpenstackInstanceFactory()],
+            [{str(BOOT_PHASES_FILE_PATH): "vm_boot 1.5\nunknown 2\nsnap corrupt\nsnap 3\n"}],
+            [
+                PulledMetricsFactory(
+                    instance=instance,
+                    runner_installed_timestamp=None,
+                    pre_job=None,
+                    post_job=None,
+                    boot_timestamps=((BootPhase.VM_BOOT, 1.5), (BootPhase.SNAP, 3.0)),
+                )
+            ],
+            id="single instance, partial metrics(BOOT_PHASES_FILE_PATH), corrupt lines skipped",
+        ),
         pytest.param(
             [instance := OpenstackInstanceFactory()],
             [
@@ -292,6 +310,71 @@ def test_pull_runner_metrics(
         assert pulled_metric in expected_metrics
 
 
+def test_pull_runner_metrics_powered_off():
+    """
+    arrange: given a VM powered off after its run, with its metric files printed on its console \
+        among an unknown file and a corrupt line.
+    act: when pull_runner_metrics function is called.
+    assert: the metrics are pulled from the console, without SSH.
+    """
+    instance = OpenstackInstanceFactory(status="SHUTOFF", instance_id=InstanceID.build("test"))
+    post_job = PostJobMetricsFactory.build()
+    console = "\n".join(
+        (
+            "[ 10.0] cloud-init[900]: github-runner-metrics runner-installed.timestamp "
+            + base64.b64encode(b"1").decode(),
+            "github-runner-metrics post-job-metrics.json "
+            + base64.b64encode(post_job.json().encode()).decode(),
+            "github-runner-metrics boot-phases.timestamps",
+            "github-runner-metrics passwd " + base64.b64encode(b"root").decode(),
+            "github-runner-metrics pre-job-metrics.json not-base64!",
+            "[ 11.0] reboot: Power down",
+        )
+    )
+    cloud_service = MagicMock(spec=OpenstackCloud)
+    cloud_service.get_instance.return_value = instance
+    cloud_service.get_console_outputs.return_value = {instance.instance_id: console}
+
+    pulled_metrics = pull_runner_metrics(
+        cloud_service=cloud_service, instance_ids=[instance.instance_id]
+    )
+
+    assert pulled_metrics == [
+        PulledMetricsFactory(
+            instance=instance,
+            runner_installed_timestamp=1,
+            pre_job=None,
+            post_job=post_job,
+        )
+    ]
+    cloud_service.get_ssh_connection.assert_not_called()
+
+
+def test_pull_runner_metrics_powered_off_fetched_console():
+    """
+    arrange: given a VM powered off after its run, with its console log already fetched.
+    act: when pull_runner_metrics function is called with the console log.
+    assert: the metrics are pulled from the console log given, without fetching it again.
+    """
+    instance = OpenstackInstanceFactory(status="SHUTOFF", instance_id=InstanceID.build("test"))
+    console = "github-runner-metrics runner-installed.timestamp " + base64.b64encode(b"1").decode()
+    cloud_service = MagicMock(spec=OpenstackCloud)
+    cloud_service.get_instance.return_value = instance
+
+    pulled_metrics = pull_runner_metrics(
+        cloud_service=cloud_service,
+        instance_ids=[instance.instance_id],
+        console_outputs={instance.instance_id: console},
+    )
+
+    assert pulled_metrics == [
+        PulledMetricsFactory(
+            instance=instance, runner_installed_timestamp=1, pre_job=None, post_job=None
+        )
+    ]
+    cloud_service.get_console_outputs.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "metric, flavor, job_metrics, expected_events",
     [
@@ -410,6 +493,56 @@ def test_issue_events(
     issue_event_mock.assert_has_calls([call(event) for event in expected_events], any_order=True)
 
 
+def test_issue_runner_installed_boot_phases(issue_event_mock: MagicMock):
+    """
+    arrange: Pulled metrics of a VM created at 100, with boot phases ending at 130, 140 and 160, \
+        the runner installed at 160.5 and listening for jobs at 165.25, booted with the fast \
+        profile.
+    act: Call issue_events.
+    assert: The RunnerInstalled event holds the phase durations, with the runner start from the \
+        end of the setup to the runner listening, and each phase is observed in the boot phase \
+        histogram. The spawn duration is observed under the boot profile.
+    """
+    created_at = datetime.fromtimestamp(100)
+    metric = PulledMetricsFactory(
+        instance=OpenstackInstanceFactory(created_at=created_at),
+        runner_installed_timestamp=160.5,
+        pre_job=None,
+        post_job=None,
+        boot_timestamps=(
+            (BootPhase.VM_BOOT, 130),
+            (BootPhase.SNAP, 140),
+            (BootPhase.APT_UPDATE, 160),
+            (BootPhase.RUNNER_START, 165.25),
+        ),
+        boot_profile="fast",
+    )
+    flavor = secrets.token_hex(8)
+
+    runner_metrics.issue_events(runner_metrics=metric, flavor=flavor, job_metrics=None)
+
+    issue_event_mock.assert_called_once_with(
+        RunnerInstalledFactory(
+            timestamp=160.5,
+            flavor=flavor,
+            duration=60.5,
+            boot_phases={"vm_boot": 30, "snap": 10, "apt_update": 20, "runner_start": 5.25},
+        )
+    )
+    assert (
+        REGISTRY.get_sample_value(
+            "runner_boot_phase_duration_seconds_sum", {"flavor": flavor, "phase": "apt_update"}
+        )
+        == 20
+    )
+    assert (
+        REGISTRY.get_sample_value(
+            "runner_spawn_duration_seconds_sum", {"flavor": flavor, "boot_profile": "fast"}
+        )
+        == 60.5
+    )
+
+
 def _create_metrics_data(instance_id: InstanceID) -> RunnerMetrics:
     """Create a RunnerMetrics object that is suitable for most tests.
 
@@ -0,0 +1,137 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Test for the early detection of the stuck boots of the VMs."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from github_runner_manager.manager.models import InstanceID
+from github_runner_manager.manager.vm_manager import VM, VMState
+from github_runner_manager.openstack_cloud.boot_watchdog import (
+    BootFailure,
+    BootWatchdog,
+    parse_console_output,
+)
+from tests.unit.factories.runner_instance_factory import CloudRunnerInstanceFactory
+
+
+def _vm(state: VMState, age: float) -> VM:
+    """Create a VM for the tests.
+
+    Args:
+        state: The state of the VM.
+        age: Seconds since the creation of the VM.
+
+    Returns:
+        The VM.
+    """
+    return CloudRunnerInstanceFactory(
+        instance_id=InstanceID.build("test"),
+        state=state,
+        created_at=datetime.now(timezone.utc) - timedelta(seconds=age),
+    )
+
+
+@pytest.mark.parametrize(
+    "output, expected",
+    [
+        pytest.param("", (None, False), id="empty"),
+        pytest.param(
+            "[  OK  ] Started foo\n"
+            "[ 12.3] cloud-init[900]: github-runner-boot-phase vm_boot\n"
+            "noise\n"
+            "[ 40.1] cloud-init[900]: github-runner-boot-phase snap\n",
+            ("github-runner-boot-phase snap", False),
+            id="last phase",
+        ),
+        pytest.param(
+            "github-runner-boot-phase vm_boot\ngithub-runner-boot-failed 100\n",
+            ("github-runner-boot-phase vm_boot", True),
+            id="failed",
+        ),
+    ],
+)
+def test_parse_console_output(output: str, expected: tuple[str | None, bool]):
+    """
+    arrange: A console log.
+    act: Parse the boot markers.
+    assert: The last boot phase marker and whether the userdata failed are returned.
+    """
+    assert parse_console_output(output) == expected
+
+
+def test_boot_watchdog_causes():
+    """
+    arrange: VMs stuck in BUILD, without userdata, with a failed userdata, booting normally, \
+        too young to check and still in BUILD but recent.
+    act: Check the boots.
+    assert: The stuck VMs are reported by cause, and only the console of the VMs old enough is \
+        fetched.
+    """
+    build_stuck = _vm(VMState.CREATED, age=3600)
+    no_userdata = _vm(VMState.ACTIVE, age=3600)
+    failed = _vm(VMState.ACTIVE, age=300)
+    booting = _vm(VMState.ACTIVE, age=300)
+    young = _vm(VMState.ACTIVE, age=10)
+    building = _vm(VMState.CREATED, age=60)
+    consoles = {
+        no_userdata.instance_id: "[  OK  ] Reached target Cloud-init target.\n",
+        failed.instance_id: "github-runner-boot-phase vm_boot\ngithub-runner-boot-failed 1\n",
+        booting.instance_id: "github-runner-boot-phase vm_boot\n",
+    }
+    fetched = []
+
+    def fetch_consoles(instance_ids):
+        """Get the consoles of the VMs."""
+        fetched.extend(instance_ids)
+        return consoles
+
+    failures = BootWatchdog().check(
+        [build_stuck, no_userdata, failed, booting, young, building], fetch_consoles
+    )
+
+    assert failures == {
+        build_stuck.instance_id: BootFailure.BUILD_TIMEOUT,
+        no_userdata.instance_id: BootFailure.NO_USERDATA,
+        failed.instance_id: BootFailure.USERDATA_FAILED,
+    }
+    assert set(fetched) == {no_userdata.instance_id, failed.instance_id, booting.instance_id}
+
+
+def test_boot_watchdog_stalled(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A VM booting, with a stall timeout of 60 seconds.
+    act: Check the boot at 0, at 50 with a new phase, at 100 with no marker in the tail of the \
+        log and at 120 with the same phase.
+    assert: The boot is only stalled at 120, 60 seconds after the last new phase was seen.
+    """
+    now = [0.0]
+    monkeypatch.setattr(
+        "github_runner_manager.openstack_cloud.boot_watchdog.time.monotonic", lambda: now[0]
+    )
+    vm = _vm(VMState.ACTIVE, age=300)
+    console = ["github-runner-boot-phase vm_boot\n"]
+    watchdog = BootWatchdog(stall_timeout=60)
+
+    def check() -> dict[InstanceID, BootFailure]:
+        """Check the boot of the VM.
+
+        Returns:
+            The stuck boots.
+        """
+        return watchdog.check([vm], lambda _: {vm.instance_id: console[0]})
+
+    at_0 = check()
+    now[0], console[0] = 50, "github-runner-boot-phase snap\n"
+    at_50 = check()
+    now[0], console[0] = 100, "apt output\n"
+    at_100 = check()
+    now[0], console[0] = 120, "github-runner-boot-phase snap\n"
+    at_120 = check()
+
+    assert not at_0
+    assert not at_50
+    assert not at_100
+    assert at_120 == {vm.instance_id: BootFailure.STALLED}
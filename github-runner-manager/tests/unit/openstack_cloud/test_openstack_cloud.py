@@ -21,15 +21,20 @@ from pytest import LogCaptureFixture
 
 import github_runner_manager.openstack_cloud.openstack_cloud
 from github_runner_manager.errors import OpenStackError, SSHError
+from github_runner_manager.openstack_cloud.models import OpenStackServerConfig
 from github_runner_manager.openstack_cloud.openstack_cloud import (
     _MAX_NOVA_COMPUTE_API_VERSION,
     _MIN_KEYPAIR_AGE_IN_SECONDS_BEFORE_DELETION,
     _TEST_STRING,
-    DEFAULT_SECURITY_RULES,
     InstanceID,
     OpenstackCloud,
     OpenStackCredentials,
+    OpenstackInstance,
     _DeleteKeypairConfig,
+)
+from github_runner_manager.openstack_cloud.quota import QuotaCache
+from github_runner_manager.openstack_cloud.security_rules import (
+    DEFAULT_SECURITY_RULES,
     get_missing_security_rules,
 )
 from tests.unit.fake_runner_managers import FakeOpenstackCloud
@@ -422,6 +427,61 @@ def test_delete_instances(
     assert deleted_instance_ids == [successful_delete_id]
 
 
+def test_launch_instance_passes_resolved_resources(
+    openstack_cloud: OpenstackCloud,
+    mock_openstack_conn: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    arrange: given a mocked openstack connection.
+    act: when launch_instance is called.
+    assert: the resolved image and flavor, and the network ID, are passed to create_server.
+    """
+    mock_openstack_conn.network.find_network.return_value = MagicMock(id="network-id")
+    mock_openstack_conn.create_server.return_value = MagicMock()
+    monkeypatch.setattr(openstack_cloud, "_setup_keypair", MagicMock())
+    monkeypatch.setattr(OpenstackCloud, "_ensure_security_group", MagicMock())
+    monkeypatch.setattr(OpenstackInstance, "from_openstack_server", MagicMock())
+
+    openstack_cloud.launch_instance(
+        runner_identity=MagicMock(),
+        server_config=OpenStackServerConfig(image="noble", flavor="small", network="ext"),
+        cloud_init="",
+    )
+
+    kwargs = mock_openstack_conn.create_server.call_args.kwargs
+    assert kwargs["image"] is mock_openstack_conn.image.find_image.return_value
+    assert kwargs["flavor"] is mock_openstack_conn.compute.find_flavor.return_value
+    assert kwargs["nics"] == [{"net-id": "network-id"}]
+    assert "network" not in kwargs
+
+
+def test_get_quota_headroom(openstack_cloud: OpenstackCloud, mock_openstack_conn: MagicMock):
+    """
+    arrange: given a mocked openstack connection with room for 5 instances.
+    act: when get_quota_headroom is called, a VM is recorded as created and it is called again.
+    assert: the limits and flavor are fetched once and the headroom accounts for the VM.
+    """
+    openstack_cloud._quota_cache = QuotaCache()
+    mock_openstack_conn.compute.get_limits.return_value.absolute = MagicMock(
+        instances=10,
+        instances_used=5,
+        total_cores=-1,
+        total_cores_used=10,
+        total_ram=-1,
+        total_ram_used=20480,
+    )
+    mock_openstack_conn.compute.find_flavor.return_value = MagicMock(vcpus=2, ram=4096)
+
+    headroom = openstack_cloud.get_quota_headroom("small")
+    openstack_cloud.record_quota_usage("small", 1)
+
+    assert headroom == 5
+    assert openstack_cloud.get_quota_headroom("small") == 4
+    mock_openstack_conn.compute.get_limits.assert_called_once()
+    mock_openstack_conn.compute.find_flavor.assert_called_once_with("small", ignore_missing=False)
+
+
 def test_get_instances_uses_bare_server_listing(
     openstack_cloud: OpenstackCloud, mock_openstack_conn: MagicMock
 ):
@@ -437,6 +497,27 @@ def test_get_instances_uses_bare_server_listing(
     mock_openstack_conn.list_servers.assert_called_once_with(bare=True)
 
 
+def test_get_console_outputs(openstack_cloud: OpenstackCloud, mock_openstack_conn: MagicMock):
+    """
+    arrange: given a mocked openstack connection failing to get the console of one of two servers.
+    act: when get_console_outputs is called.
+    assert: the console of the other server is returned.
+    """
+    ok_instance, failed_instance = InstanceID.build(FAKE_PREFIX), InstanceID.build(FAKE_PREFIX)
+
+    def get_server_console(name: str, length: int) -> str:
+        """Get the console of a server, failing for one of them."""
+        if name != ok_instance.name:
+            raise openstack.exceptions.SDKException("mock error")
+        return f"console of {name}, {length} lines"
+
+    mock_openstack_conn.get_server_console.side_effect = get_server_console
+
+    outputs = openstack_cloud.get_console_outputs([ok_instance, failed_instance], length=10)
+
+    assert outputs == {ok_instance: f"console of {ok_instance.name}, 10 lines"}
+
+
 @pytest.mark.parametrize(
     "max_compute_api_version, expected_version",
     [
@@ -9,13 +9,19 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from github_runner_manager.configuration import ProxyConfig, SupportServiceConfig, UserInfo
+from github_runner_manager.configuration import (
+    BootProfile,
+    ProxyConfig,
+    SupportServiceConfig,
+    UserInfo,
+)
 from github_runner_manager.manager.models import (
     InstanceID,
     RunnerContext,
     RunnerIdentity,
     RunnerMetadata,
 )
+from github_runner_manager.manager.vm_manager import DeleteProgress
 from github_runner_manager.metrics import runner
 from github_runner_manager.openstack_cloud.openstack_cloud import OpenstackCloud
 from github_runner_manager.openstack_cloud.openstack_runner_manager import (
@@ -23,6 +29,7 @@ from github_runner_manager.openstack_cloud.openstack_runner_manager import (
     OpenStackRunnerManagerConfig,
     runner_metrics,
 )
+from tests.unit.factories.runner_instance_factory import OpenstackInstanceFactory
 
 logger = logging.getLogger(__name__)
 
@@ -202,6 +209,43 @@ def test_create_runner_without_aproxy(
     )
 
 
+@pytest.mark.parametrize(
+    "boot_profile, expected_fast_boot",
+    [
+        pytest.param(BootProfile.STANDARD, False, id="standard"),
+        pytest.param(BootProfile.FAST, True, id="fast"),
+    ],
+)
+def test_create_runner_boot_profile(
+    boot_profile: BootProfile,
+    expected_fast_boot: bool,
+    runner_manager: OpenStackRunnerManager,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    arrange: Prepare the runner manager with the boot profile and a DockerHub mirror.
+    act: Create a runner.
+    assert: The fast profile skips the snap refresh wait and the docker restart, and refreshes \
+        the apt package lists in the background instead of before the runner starts.
+    """
+    runner_manager._config.boot_profile = boot_profile
+    runner_manager._config.service_config.dockerhub_mirror = "https://docker.example.com"
+    identity = RunnerIdentity(
+        instance_id=InstanceID.build(prefix="test"), metadata=RunnerMetadata()
+    )
+    openstack_cloud = MagicMock(spec=OpenstackCloud)
+    monkeypatch.setattr(runner_manager, "_openstack_cloud", openstack_cloud)
+
+    runner_manager.create_runner(identity, RunnerContext(shell_run_script="agent"))
+
+    cloud_init = openstack_cloud.launch_instance.call_args.kwargs["cloud_init"]
+    assert ("snap watch" in cloud_init) != expected_fast_boot
+    assert ("systemctl restart docker" in cloud_init) != expected_fast_boot
+    assert ("record_boot_phase apt_update" in cloud_init) != expected_fast_boot
+    assert ("(apt_update > /var/log/apt-update-background.log" in cloud_init) == expected_fast_boot
+    assert cloud_init.rstrip().endswith("poweroff")
+
+
 def test_delete_vms(runner_manager: OpenStackRunnerManager):
     """
     arrange: given a mocked cloud service.
@@ -217,6 +261,99 @@ def test_delete_vms(runner_manager: OpenStackRunnerManager):
     mock_cloud.delete_instances.assert_called_once()
 
 
+def test_get_vms_excludes_pending_deletes(runner_manager: OpenStackRunnerManager):
+    """
+    arrange: Two VMs listed by the cloud, and the first deleted without waiting.
+    act: Get the VMs, then get them again once the first is no longer listed.
+    assert: The VM pending deletion is not returned, and its completion is reported in the \
+        delete progress. The quota usage is only lowered once the VM is no longer listed.
+    """
+    first = OpenstackInstanceFactory(instance_id=InstanceID.build("test"))
+    second = OpenstackInstanceFactory(instance_id=InstanceID.build("test"))
+    mock_cloud = MagicMock()
+    mock_cloud.delete_instances.return_value = [first.instance_id]
+    mock_cloud.get_instances.return_value = (first, second)
+    runner_manager._openstack_cloud = mock_cloud
+    runner_manager.delete_vms(instance_ids=[first.instance_id])
+
+    vms_while_deleting = runner_manager.get_vms()
+    progress_while_deleting = runner_manager.pop_delete_progress()
+    mock_cloud.record_quota_usage.assert_not_called()
+    mock_cloud.get_instances.return_value = (second,)
+    runner_manager.get_vms()
+    progress_after_delete = runner_manager.pop_delete_progress()
+
+    assert [vm.instance_id for vm in vms_while_deleting] == [second.instance_id]
+    assert progress_while_deleting == DeleteProgress(pending=1)
+    assert progress_after_delete.pending == 0
+    assert len(progress_after_delete.completion_latencies) == 1
+    mock_cloud.record_quota_usage.assert_called_once_with(
+        runner_manager._config.server_config.flavor, -1
+    )
+
+
+def test_check_finished(runner_manager: OpenStackRunnerManager):
+    """
+    arrange: Two VMs powered off, only one with the power off marker on its console, and a VM \
+        whose console cannot be fetched.
+    act: Check the finished VMs.
+    assert: Only the VM with the power off marker is finished.
+    """
+    finished, stopped, unknown = (
+        OpenstackInstanceFactory(instance_id=InstanceID.build("test")) for _ in range(3)
+    )
+    mock_cloud = MagicMock()
+    mock_cloud.get_console_outputs.return_value = {
+        finished.instance_id: "github-runner-metrics pre-job-metrics.json e30=\n"
+        "github-runner-poweroff\n[  90.1] reboot: Power down\n",
+        stopped.instance_id: "github-runner-boot-phase runner_start\n"
+        "[ 300.2] reboot: Power down\n",
+    }
+    runner_manager._openstack_cloud = mock_cloud
+    vms = [
+        runner_manager._build_cloud_runner_instance(instance)
+        for instance in (finished, stopped, unknown)
+    ]
+
+    assert runner_manager.check_finished(vms) == {finished.instance_id}
+
+
+def test_check_finished_fetches_console_once(
+    runner_manager: OpenStackRunnerManager, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    arrange: A VM powered off without the power off marker, and a finished VM.
+    act: Check the finished VMs twice, and extract the metrics of the finished VM.
+    assert: The console of the VM without the marker is fetched once, and the console of the \
+        finished VM is reused for its metrics.
+    """
+    finished, stopped = (
+        OpenstackInstanceFactory(instance_id=InstanceID.build("test")) for _ in range(2)
+    )
+    finished_console = "github-runner-poweroff\n[  90.1] reboot: Power down\n"
+    mock_cloud = MagicMock()
+    mock_cloud.get_console_outputs.return_value = {
+        stopped.instance_id: "[ 300.2] reboot: Power down\n",
+    }
+    runner_manager._openstack_cloud = mock_cloud
+    vms = [runner_manager._build_cloud_runner_instance(instance) for instance in (stopped,)]
+    assert runner_manager.check_finished(vms) == set()
+    mock_cloud.get_console_outputs.return_value = {finished.instance_id: finished_console}
+    vms = [
+        runner_manager._build_cloud_runner_instance(instance) for instance in (finished, stopped)
+    ]
+    pull_metrics_mock = MagicMock(return_value=[])
+    monkeypatch.setattr(runner_metrics, "pull_runner_metrics", pull_metrics_mock)
+
+    assert runner_manager.check_finished(vms) == {finished.instance_id}
+    runner_manager.extract_metrics(instance_ids=[finished.instance_id])
+
+    assert mock_cloud.get_console_outputs.call_args_list[1].args[0] == [finished.instance_id]
+    assert pull_metrics_mock.call_args.kwargs["console_outputs"] == {
+        finished.instance_id: finished_console
+    }
+
+
 def test_extract_metrics(runner_manager: OpenStackRunnerManager, monkeypatch: pytest.MonkeyPatch):
     """
     arrange: given a mocked metrics service.
@@ -0,0 +1,43 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Test for the tracking of the VMs pending deletion."""
+
+import pytest
+
+from github_runner_manager.manager.models import InstanceID
+from github_runner_manager.openstack_cloud.pending_delete import PendingDeletes
+
+
+def test_pending_deletes_complete_and_expire(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: Two VMs with a deletion requested at 0, with a TTL of 60 seconds.
+    act: Update with both VMs listed at 10, only the second listed at 25, and at 70.
+    assert: Both are pending at 10. The first completes at 25 with a latency of 25 seconds. The \
+        second expires at 70 and is no longer pending, without completing.
+    """
+    now = [0.0]
+    monkeypatch.setattr(
+        "github_runner_manager.openstack_cloud.pending_delete.time.monotonic", lambda: now[0]
+    )
+    first, second = InstanceID.build("test"), InstanceID.build("test")
+    pending_deletes = PendingDeletes(ttl=60)
+    pending_deletes.add([first, second])
+
+    now[0] = 10
+    pending_at_10 = pending_deletes.update([first, second])
+    now[0] = 25
+    pending_at_25 = pending_deletes.update([second])
+    latencies = pending_deletes.pop_completion_latencies()
+    completed = pending_deletes.pop_completed()
+    now[0] = 70
+    pending_at_70 = pending_deletes.update([second])
+
+    assert pending_at_10 == {first, second}
+    assert pending_at_25 == {second}
+    assert latencies == (25,)
+    assert pending_deletes.pop_completion_latencies() == ()
+    assert completed == 1
+    assert pending_deletes.pop_completed() == 0
+    assert not pending_at_70
+    assert len(pending_deletes) == 0
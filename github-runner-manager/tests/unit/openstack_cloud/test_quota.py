@@ -0,0 +1,124 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Test for the cache of the Nova absolute limits and usage."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from openstack.exceptions import HttpException, ResourceTimeout, SDKException
+
+from github_runner_manager.openstack_cloud.quota import (
+    FlavorResources,
+    QuotaCache,
+    QuotaUsage,
+    is_quota_error,
+)
+
+FLAVOR = FlavorResources(vcpus=4, ram=8192)
+
+
+def _usage(**kwargs: int) -> QuotaUsage:
+    """Create a quota usage, unlimited unless specified.
+
+    Args:
+        kwargs: The limits and usage to set.
+
+    Returns:
+        The quota usage.
+    """
+    defaults = dict(max_instances=-1, max_cores=-1, max_ram=-1, instances=0, cores=0, ram=0)
+    return QuotaUsage(**{**defaults, **kwargs})
+
+
+@pytest.mark.parametrize(
+    "usage, expected_headroom",
+    [
+        pytest.param(_usage(), None, id="unlimited"),
+        pytest.param(_usage(max_instances=10, instances=7), 3, id="instances"),
+        pytest.param(_usage(max_instances=10, max_cores=20, cores=10), 2, id="cores"),
+        pytest.param(_usage(max_cores=100, max_ram=20480, ram=4096), 2, id="ram"),
+        pytest.param(_usage(max_instances=10, instances=12), 0, id="over quota"),
+    ],
+)
+def test_quota_usage_headroom(usage: QuotaUsage, expected_headroom: int | None):
+    """
+    arrange: Absolute limits and usage of a project.
+    act: Get the headroom for a flavor.
+    assert: The headroom is bounded by the most constraining limit.
+    """
+    assert usage.headroom(FLAVOR) == expected_headroom
+
+
+def test_quota_cache_updated_by_own_vms(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A quota cache with limits and usage fetched.
+    act: Record VMs created and deleted, then get the usage before and after the cache expires.
+    assert: The cached usage accounts for the VMs until fetched again.
+    """
+    now = [0.0]
+    monkeypatch.setattr(
+        "github_runner_manager.openstack_cloud.quota.time.monotonic", lambda: now[0]
+    )
+    fetch = MagicMock(return_value=_usage(max_instances=10, instances=4, cores=16, ram=32768))
+    cache = QuotaCache(ttl=60)
+    cache.get(fetch)
+
+    cache.record(FLAVOR, 3)
+    cache.record(FLAVOR, -1)
+    cached = cache.get(fetch)
+    now[0] = 61
+    fetched = cache.get(fetch)
+
+    assert (cached.instances, cached.cores, cached.ram) == (6, 24, 49152)
+    assert cached.headroom(FLAVOR) == 4
+    assert fetched.instances == 4
+    assert fetch.call_count == 2
+
+
+def _http_error(message: str, status: int) -> HttpException:
+    """Create an OpenStack HTTP error.
+
+    Args:
+        message: The message of the error.
+        status: The HTTP status of the error.
+
+    Returns:
+        The error.
+    """
+    error = HttpException(message=message)
+    error.status_code = status
+    return error
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        pytest.param(
+            _http_error(
+                "Quota exceeded for instances: Requested 1, but already used 10 of 10", 403
+            ),
+            True,
+            id="forbidden over quota",
+        ),
+        pytest.param(
+            _http_error("Quota exceeded for cores", 413),
+            True,
+            id="over limit",
+        ),
+        pytest.param(
+            _http_error("Policy does not allow", 403),
+            False,
+            id="forbidden",
+        ),
+        pytest.param(_http_error("No valid host", 500), False, id="error"),
+        pytest.param(ResourceTimeout("timeout"), False, id="timeout"),
+    ],
+)
+def test_is_quota_error(error: SDKException, expected: bool):
+    """
+    arrange: An OpenStack error.
+    act: Check whether it is a request rejected over the quota.
+    assert: Only the 403 and 413 errors mentioning the quota are.
+    """
+    assert is_quota_error(error) is expected
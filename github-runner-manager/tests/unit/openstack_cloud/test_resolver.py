@@ -0,0 +1,61 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Test for the resolution of the server configuration names."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from github_runner_manager.openstack_cloud.models import OpenStackServerConfig
+from github_runner_manager.openstack_cloud.resolver import ServerConfigResolver
+
+SERVER_CONFIG = OpenStackServerConfig(image="noble", flavor="small", network="external")
+
+
+def test_resolver_reuses_resolution(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: A resolver and a mocked OpenStack connection.
+    act: Resolve the server configuration twice, then after the TTL, then after forgetting it.
+    assert: The names are looked up on the first resolution, after the TTL and after forgetting.
+    """
+    now = [0.0]
+    monkeypatch.setattr(
+        "github_runner_manager.openstack_cloud.resolver.time.monotonic", lambda: now[0]
+    )
+    conn = MagicMock()
+    conn.network.find_network.return_value = MagicMock(id="network-id")
+    resolver = ServerConfigResolver(ttl=60)
+
+    resolved = resolver.resolve(conn, SERVER_CONFIG)
+    assert resolver.resolve(conn, SERVER_CONFIG) is resolved
+    now[0] = 61
+    resolver.resolve(conn, SERVER_CONFIG)
+    resolver.forget(SERVER_CONFIG)
+    resolver.resolve(conn, SERVER_CONFIG)
+
+    assert resolved.image is conn.image.find_image.return_value
+    assert resolved.flavor is conn.compute.find_flavor.return_value
+    assert resolved.network_id == "network-id"
+    assert conn.image.find_image.call_count == 3
+    conn.image.find_image.assert_called_with("noble", ignore_missing=False)
+    conn.compute.find_flavor.assert_called_with("small", ignore_missing=False)
+    conn.network.find_network.assert_called_with("external", ignore_missing=False)
+
+
+def test_resolver_keyed_by_names():
+    """
+    arrange: A resolver with a server configuration resolved.
+    act: Resolve a configuration with another image, e.g. from the image integration.
+    assert: The new image is looked up.
+    """
+    conn = MagicMock()
+    resolver = ServerConfigResolver()
+    resolver.resolve(conn, SERVER_CONFIG)
+
+    resolver.resolve(
+        conn, OpenStackServerConfig(image="noble-new", flavor="small", network="external")
+    )
+
+    conn.image.find_image.assert_called_with("noble-new", ignore_missing=False)
+    assert conn.image.find_image.call_count == 2
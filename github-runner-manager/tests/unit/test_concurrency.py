@@ -0,0 +1,163 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Test for the adaptive limits of the concurrent calls to the backends."""
+
+import threading
+
+import pytest
+from prometheus_client import REGISTRY
+
+from github_runner_manager.concurrency import (
+    DEFAULT_LIMITER_CONFIGS,
+    INITIAL_LIMIT,
+    AdaptiveLimiter,
+    Backend,
+    LimiterConfig,
+)
+
+
+class _BusyError(Exception):
+    """Error not caused by the load of the backend."""
+
+
+def _limiter(initial: int = 4, maximum: int = 8, latency_target: float = 60) -> AdaptiveLimiter:
+    """Create a limiter for the tests.
+
+    Args:
+        initial: The initial limit.
+        maximum: The highest limit.
+        latency_target: Seconds a call can take before the limit is decreased.
+
+    Returns:
+        The limiter.
+    """
+    return AdaptiveLimiter(
+        Backend.SSH,
+        LimiterConfig(initial=initial, minimum=1, maximum=maximum, latency_target=latency_target),
+    )
+
+
+def test_limiter_additive_increase():
+    """
+    arrange: A limiter with a limit of 4 and a maximum of 5.
+    act: Complete calls within the latency target.
+    assert: The limit increases by about one per limit's worth of calls, up to the maximum, and \
+        is exported as a gauge.
+    """
+    limiter = _limiter(initial=4, maximum=5)
+
+    for _ in range(3):
+        limiter.call(lambda: None)
+    limit_within_window = limiter.limit
+    for _ in range(20):
+        limiter.call(lambda: None)
+
+    assert limit_within_window == 4
+    assert limiter.limit == 5
+    assert limiter.in_flight == 0
+    assert REGISTRY.get_sample_value("backend_concurrency_limit", {"backend": "ssh"}) == 5
+
+
+def test_limiter_multiplicative_decrease_once_per_burst():
+    """
+    arrange: A limiter with a limit of 8 and three calls in flight.
+    act: Fail the calls in flight, then fail a call started afterwards.
+    assert: The burst of failures halves the limit once, the later failure halves it again.
+    """
+    limiter = _limiter(initial=8, maximum=8)
+    started = threading.Barrier(4)
+    fail = threading.Event()
+
+    def failing_call() -> None:
+        """Wait for the other calls to be in flight, then fail."""
+        started.wait(timeout=10)
+        fail.wait(timeout=10)
+        raise ValueError("mock error")
+
+    def run() -> None:
+        """Make a failing call in a slot."""
+        with pytest.raises(ValueError):
+            limiter.call(failing_call)
+
+    threads = [threading.Thread(target=run) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    started.wait(timeout=10)
+    fail.set()
+    for thread in threads:
+        thread.join(timeout=10)
+    limit_after_burst = limiter.limit
+    with pytest.raises(ValueError):
+        with limiter.slot():
+            raise ValueError("mock error")
+
+    assert limit_after_burst == 4
+    assert limiter.limit == 2
+
+
+def test_limiter_ignored_errors_and_unrecorded_latency():
+    """
+    arrange: A limiter with a latency target of 0 seconds.
+    act: Fail a call with an ignored error, and make a call without recording its latency.
+    assert: The limit is not decreased.
+    """
+    limiter = _limiter(initial=4, maximum=4, latency_target=0)
+
+    with pytest.raises(_BusyError):
+        with limiter.slot(ignored_errors=(_BusyError,), record_latency=False):
+            raise _BusyError()
+    limiter.call(lambda: None, record_latency=False)
+
+    assert limiter.limit == 4
+
+
+def test_limiter_slow_call_decreases():
+    """
+    arrange: A limiter with a latency target of 0 seconds.
+    act: Make a call.
+    assert: The call is slower than the target and the limit is halved.
+    """
+    limiter = _limiter(initial=4, maximum=4, latency_target=0)
+
+    limiter.call(lambda: threading.Event().wait(0.01))
+
+    assert limiter.limit == 2
+
+
+def test_limiter_bounds_calls_in_flight():
+    """
+    arrange: A limiter with a limit of 1 and a call holding the slot.
+    act: Make a second call from another thread.
+    assert: The second call waits until the slot is freed.
+    """
+    limiter = _limiter(initial=1, maximum=1)
+    second_done = threading.Event()
+
+    def second_call() -> None:
+        """Make a call in a slot."""
+        limiter.call(second_done.set)
+
+    with limiter.slot():
+        thread = threading.Thread(target=second_call)
+        thread.start()
+        assert not second_done.wait(0.1)
+        assert limiter.in_flight == 1
+    thread.join(timeout=10)
+
+    assert second_done.is_set()
+    assert limiter.workers(10) == 1
+
+
+@pytest.mark.parametrize("backend", list(Backend))
+def test_default_limiter_starts_at_former_pool_size(backend: Backend):
+    """
+    arrange: The default configuration of the limiter of a backend.
+    act: Create the limiter.
+    assert: The limit starts at the former fixed pool size of 30 workers.
+    """
+    limiter = AdaptiveLimiter(backend, DEFAULT_LIMITER_CONFIGS[backend])
+
+    assert INITIAL_LIMIT == 30
+    assert limiter.limit == 30
+    assert limiter.workers(30) == 30
@@ -12,6 +12,7 @@ import yaml
 
 from src.github_runner_manager.configuration import (
     ApplicationConfiguration,
+    BootProfile,
     Flavor,
     GitHubAppAuth,
     GitHubConfiguration,
@@ -233,6 +234,29 @@ def test_runner_combination_allows_zero_max():
     assert combo.max_total_virtual_machines == 0
 
 
+@pytest.mark.parametrize(
+    "labels, boot_profile, expected_boot_profile",
+    [
+        pytest.param(["noble"], None, BootProfile.STANDARD, id="standard by default"),
+        pytest.param(["noble", "fast-boot"], None, BootProfile.FAST, id="fast-boot image tag"),
+        pytest.param(
+            ["fast-boot"], BootProfile.STANDARD, BootProfile.STANDARD, id="configured profile"
+        ),
+    ],
+)
+def test_image_boot_profile(
+    labels: list[str], boot_profile: BootProfile | None, expected_boot_profile: BootProfile
+):
+    """
+    arrange: An image with the given labels and configured boot profile.
+    act: Construct the model.
+    assert: The configured boot profile is used, or the fast one for images tagged fast-boot.
+    """
+    image = Image(name="img", labels=labels, boot_profile=boot_profile)
+
+    assert image.boot_profile == expected_boot_profile
+
+
 def test_configuration_allows_empty_planner_fields():
     """Planner URL/token are optional for non-planner mode."""
     config = yaml.safe_load(StringIO(SAMPLE_YAML_CONFIGURATION))
@@ -4,21 +4,34 @@
 """Test for HTTP server."""
 
 import json
-from multiprocessing import Process
-from threading import Lock
+import logging
 from typing import Iterator
 from unittest.mock import MagicMock
 
 import pytest
 from flask.testing import FlaskClient
+from prometheus_client import REGISTRY
 
-from github_runner_manager.manager.runner_manager import FlushMode, RunnerInfo
-from src.github_runner_manager.http_server import RUNNER_MANAGER_CONFIG_NAME, app
+from github_runner_manager.errors import CloudError
+from github_runner_manager.locking import InstrumentedLock
+from github_runner_manager.manager.runner_manager import FlushMode
+from github_runner_manager.manager.runner_snapshot import RunnerSnapshot
+from github_runner_manager.metrics.events import RunnerStop
+from github_runner_manager.operations import OperationWorker
+from github_runner_manager.platform.platform_provider import PlatformRunnerState
+from src.github_runner_manager.http_server import (
+    ACCESS_LOG_SAMPLE_CONFIG_NAME,
+    OPERATIONS_CONFIG_NAME,
+    RUNNER_MANAGERS_CONFIG_NAME,
+    ManagedRunners,
+    app,
+)
+from tests.unit.factories.runner_instance_factory import RunnerInstanceFactory
 
 
 @pytest.fixture(name="lock", scope="function")
-def lock_fixture() -> Lock:
-    return Lock()
+def lock_fixture() -> InstrumentedLock:
+    return InstrumentedLock("shared", "test")
 
 
 @pytest.fixture(name="mock_runner_manager", scope="function")
@@ -26,100 +39,152 @@ def mock_runner_manager_fixture() -> MagicMock:
     return MagicMock()
 
 
+@pytest.fixture(name="operations", scope="function")
+def operations_fixture() -> OperationWorker:
+    return OperationWorker()
+
+
 @pytest.fixture(name="client", scope="function")
 def client_fixture(
-    lock: Lock, mock_runner_manager: MagicMock, monkeypatch
+    mock_runner_manager: MagicMock, lock: InstrumentedLock, operations: OperationWorker
 ) -> Iterator[FlaskClient]:
     app.debug = True
     app.config["TESTING"] = True
-    app.config[RUNNER_MANAGER_CONFIG_NAME] = mock_runner_manager
+    app.config[RUNNER_MANAGERS_CONFIG_NAME] = [ManagedRunners(mock_runner_manager, lock)]
+    app.config[OPERATIONS_CONFIG_NAME] = operations
+    app.config[ACCESS_LOG_SAMPLE_CONFIG_NAME] = 1
 
-    monkeypatch.setattr("src.github_runner_manager.http_server._lock", lock)
     with app.test_client() as client:
         yield client
 
 
-def test_flush_runner_default_args(
-    client: FlaskClient, lock: Lock, mock_runner_manager: MagicMock
+def _run_queued_operations(operations: OperationWorker) -> None:
+    """Run the operations queued so far.
+
+    Args:
+        operations: The operation worker.
+    """
+    operations.stop()
+    operations.run()
+
+
+@pytest.mark.parametrize(
+    "query, flush_mode",
+    [
+        pytest.param("", FlushMode.FLUSH_IDLE, id="default args"),
+        pytest.param("?flush-busy=false", FlushMode.FLUSH_IDLE, id="flush idle"),
+        pytest.param("?flush-busy=true", FlushMode.FLUSH_BUSY, id="flush busy"),
+    ],
+)
+def test_flush_runner(
+    client: FlaskClient,
+    lock: InstrumentedLock,
+    mock_runner_manager: MagicMock,
+    operations: OperationWorker,
+    query: str,
+    flush_mode: FlushMode,
 ) -> None:
     """
     arrange: Start up a test flask server with a mock runner manager.
-    act: Run flush runner with no args.
-    assert: Should flush idle runners.
+    act: Request a flush of runners, run the queued operation and get the operation.
+    assert: The flush is accepted, runs with the flush mode and succeeds.
     """
-    response = client.post("/runner/flush")
+    mock_runner_manager.flush_runners.return_value = {RunnerStop: 2}
+
+    response = client.post(f"/runner/flush{query}")
+
+    assert response.status_code == 202
+    operation_id = json.loads(response.text)["id"]
+    assert response.headers["Location"] == f"/operations/{operation_id}"
+    mock_runner_manager.flush_runners.assert_not_called()
+
+    _run_queued_operations(operations)
 
-    assert response.status_code == 204
     assert not lock.locked()
-    mock_runner_manager.flush_runners.assert_called_once_with(FlushMode.FLUSH_IDLE)
+    mock_runner_manager.flush_runners.assert_called_once_with(flush_mode)
+    operation = json.loads(client.get(f"/operations/{operation_id}").text)
+    assert operation["status"] == "succeeded"
+    assert operation["result"] == {"issued_metric_events": {"RunnerStop": 2}}
 
 
-def test_flush_runner_flush_busy(
-    client: FlaskClient, lock: Lock, mock_runner_manager: MagicMock
-) -> None:
+def test_flush_runner_coalesces_pending(client: FlaskClient) -> None:
     """
-    arrange: Start up a test flask server with a mock runner manager.
-    act: Run flush runner with flush-busy = True.
-    assert: Should flush both idle and busy runners.
+    arrange: Start up a test flask server without running the operation worker.
+    act: Request two identical flushes and a flush of busy runners.
+    assert: The identical pending flushes share one operation.
     """
-    response = client.post("/runner/flush?flush-busy=true")
+    first = json.loads(client.post("/runner/flush").text)["id"]
+    second = json.loads(client.post("/runner/flush").text)["id"]
+    busy = json.loads(client.post("/runner/flush?flush-busy=true").text)["id"]
 
-    assert response.status_code == 204
-    assert not lock.locked()
-    mock_runner_manager.flush_runners.assert_called_once_with(FlushMode.FLUSH_BUSY)
+    assert first == second
+    assert busy != first
 
 
-def test_flush_runner_unlocked(
-    client: FlaskClient, lock: Lock, mock_runner_manager: MagicMock
+def test_flush_runner_failed(
+    client: FlaskClient, mock_runner_manager: MagicMock, operations: OperationWorker
 ) -> None:
     """
-    arrange: Start up a test flask server with a mock runner manager. The lock is unlocked.
-    act: Run flush runner.
-    assert: The flush runner should run.
+    arrange: Mock runner manager to raise a cloud error on flush.
+    act: Request a flush of runners and run the queued operation.
+    assert: The operation fails with the error.
     """
-    response = client.post("/runner/flush?flush-busy=false")
+    mock_runner_manager.flush_runners.side_effect = CloudError("mock error")
 
-    assert response.status_code == 204
-    assert not lock.locked()
-    mock_runner_manager.flush_runners.assert_called_once_with(FlushMode.FLUSH_IDLE)
+    operation_id = json.loads(client.post("/runner/flush").text)["id"]
+    _run_queued_operations(operations)
 
+    operation = json.loads(client.get(f"/operations/{operation_id}").text)
+    assert operation["status"] == "failed"
+    assert operation["error"] == "mock error"
 
-def test_flush_runner_locked(client: FlaskClient, lock: Lock) -> None:
+
+def test_get_operation_unknown(client: FlaskClient) -> None:
     """
-    arrange: Start up a test flask server with client. The lock is locked.
-    act: Run flush runner.
-    assert: The flush runner call should wait on the lock indefinitely.
+    arrange: Start up a test flask server.
+    act: Get an unknown operation.
+    assert: Returns 404.
     """
-    lock.acquire()
+    response = client.get("/operations/unknown")
+
+    assert response.status_code == 404
 
-    # Due to FlaskClient.post not supporting timeout, Process is used to control the termination.
-    # Using Process means the caplog is unable to capture the logs.
-    flush = Process(target=client.post, args=("/runner/flush",))
-    flush.start()
-    assert flush.is_alive(), "The flush runner call should still be waiting on the lock"
 
-    flush.terminate()
+@pytest.fixture(name="snapshot", scope="function")
+def snapshot_fixture(mock_runner_manager: MagicMock) -> RunnerSnapshot:
+    snapshot = RunnerSnapshot(
+        runners=(
+            RunnerInstanceFactory(name="idle-runner", platform_state=PlatformRunnerState.IDLE),
+            RunnerInstanceFactory(name="busy-runner", platform_state=PlatformRunnerState.BUSY),
+            RunnerInstanceFactory(
+                name="offline-runner", platform_state=PlatformRunnerState.OFFLINE
+            ),
+            RunnerInstanceFactory(name="unknown-runner", platform_state=None),
+        ),
+        taken_at=1_000_000,
+    )
+    mock_runner_manager.get_runners_snapshot.return_value = snapshot
+    return snapshot
 
 
-def test_check_runner(client: FlaskClient, lock: Lock, mock_runner_manager: MagicMock) -> None:
+def test_check_runner(
+    client: FlaskClient,
+    lock: InstrumentedLock,
+    mock_runner_manager: MagicMock,
+    snapshot: RunnerSnapshot,
+) -> None:
     """
-    arrange: Mock runner manager to return a RunnerInfo.
+    arrange: Mock runner manager to return a runner snapshot.
     act: HTTP Get to /runner/check.
-    assert: Returns the correct status code and serialized RunnerInfo.
-    """
-    mock_runner_manager.get_runner_info.return_value = RunnerInfo(
-        online=2,
-        busy=1,
-        offline=1,
-        unknown=1,
-        runners=("idle-runner", "busy-runner"),
-        busy_runners=("busy-runner",),
-    )
-
+    assert: Returns the correct status code, cache headers and serialized RunnerInfo.
+    """
     response = client.get("/runner/check")
 
     assert response.status_code == 200
     assert not lock.locked()
+    mock_runner_manager.get_runners_snapshot.assert_called_once_with(max_age=None)
+    assert response.headers["ETag"]
+    assert response.headers["Last-Modified"] == "Mon, 12 Jan 1970 13:46:40 GMT"
     data = json.loads(response.text)
     assert data == {
         "online": 2,
@@ -129,3 +194,178 @@ def test_check_runner(client: FlaskClient, lock: Lock, mock_runner_manager: Magi
         "runners": ["idle-runner", "busy-runner"],
         "busy_runners": ["busy-runner"],
     }
+
+
+def test_check_runner_max_age(
+    client: FlaskClient, mock_runner_manager: MagicMock, snapshot: RunnerSnapshot
+) -> None:
+    """
+    arrange: Mock runner manager to return a runner snapshot.
+    act: HTTP Get to /runner/check with max_age.
+    assert: The snapshot is requested with the max age.
+    """
+    response = client.get("/runner/check?max_age=30")
+
+    assert response.status_code == 200
+    mock_runner_manager.get_runners_snapshot.assert_called_once_with(max_age=30.0)
+
+
+@pytest.mark.parametrize("query", ["max_age=abc", "max_age=-1", "state=running"])
+def test_check_runner_invalid_args(
+    client: FlaskClient, mock_runner_manager: MagicMock, query: str
+) -> None:
+    """
+    arrange: Start up a test flask server with a mock runner manager.
+    act: HTTP Get to /runner/check with an invalid argument.
+    assert: Returns 400 without listing the runners.
+    """
+    response = client.get(f"/runner/check?{query}")
+
+    assert response.status_code == 400
+    mock_runner_manager.get_runners_snapshot.assert_not_called()
+
+
+def test_check_runner_state_filter(client: FlaskClient, snapshot: RunnerSnapshot) -> None:
+    """
+    arrange: Mock runner manager to return a runner snapshot.
+    act: HTTP Get to /runner/check filtering busy and offline runners.
+    assert: Only the busy and offline runners are counted.
+    """
+    response = client.get("/runner/check?state=busy,offline")
+
+    assert response.status_code == 200
+    assert json.loads(response.text) == {
+        "online": 1,
+        "busy": 1,
+        "offline": 1,
+        "unknown": 0,
+        "runners": ["busy-runner"],
+        "busy_runners": ["busy-runner"],
+    }
+
+
+def test_check_runner_not_modified(client: FlaskClient, snapshot: RunnerSnapshot) -> None:
+    """
+    arrange: Get the runners once to obtain the ETag.
+    act: HTTP Get to /runner/check with If-None-Match set to the ETag.
+    assert: Returns 304 with no body.
+    """
+    etag = client.get("/runner/check").headers["ETag"]
+
+    response = client.get("/runner/check", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert not response.data
+
+
+def test_check_runner_cloud_error(client: FlaskClient, mock_runner_manager: MagicMock) -> None:
+    """
+    arrange: Mock runner manager to raise a cloud error on the live listing.
+    act: HTTP Get to /runner/check.
+    assert: Returns 500.
+    """
+    mock_runner_manager.get_runners_snapshot.side_effect = CloudError("mock error")
+
+    response = client.get("/runner/check?max_age=0")
+
+    assert response.status_code == 500
+
+
+def test_multiple_runner_managers(
+    client: FlaskClient,
+    mock_runner_manager: MagicMock,
+    lock: InstrumentedLock,
+    operations: OperationWorker,
+    snapshot: RunnerSnapshot,
+) -> None:
+    """
+    arrange: A second runner manager with its own lock and a runner snapshot.
+    act: HTTP Get to /runner/check, then flush the runners.
+    assert: The runners of both managers are aggregated and both managers are flushed.
+    """
+    other_manager = MagicMock()
+    other_manager.get_runners_snapshot.return_value = RunnerSnapshot(
+        runners=(
+            RunnerInstanceFactory(name="large-runner", platform_state=PlatformRunnerState.BUSY),
+        ),
+        taken_at=900_000,
+    )
+    other_lock = InstrumentedLock("shared", "test-large")
+    app.config[RUNNER_MANAGERS_CONFIG_NAME] = [
+        ManagedRunners(mock_runner_manager, lock),
+        ManagedRunners(other_manager, other_lock),
+    ]
+    mock_runner_manager.flush_runners.return_value = {RunnerStop: 2}
+    other_manager.flush_runners.return_value = {RunnerStop: 1}
+
+    response = client.get("/runner/check")
+    operation_id = json.loads(client.post("/runner/flush").text)["id"]
+    _run_queued_operations(operations)
+
+    data = json.loads(response.text)
+    assert data["busy_runners"] == ["busy-runner", "large-runner"]
+    assert response.headers["Last-Modified"] == "Sun, 11 Jan 1970 10:00:00 GMT"
+    mock_runner_manager.flush_runners.assert_called_once_with(FlushMode.FLUSH_IDLE)
+    other_manager.flush_runners.assert_called_once_with(FlushMode.FLUSH_IDLE)
+    assert not other_lock.locked()
+    operation = json.loads(client.get(f"/operations/{operation_id}").text)
+    assert operation["result"] == {"issued_metric_events": {"RunnerStop": 3}}
+
+
+def test_request_latency_histogram(client: FlaskClient) -> None:
+    """
+    arrange: Start up a test flask server.
+    act: HTTP Get to /health.
+    assert: The latency of the request is observed with the endpoint, method and status.
+    """
+    labels = {"endpoint": "/health", "method": "GET", "status": "204"}
+    before = REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) or 0
+
+    client.get("/health")
+
+    assert REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) == before + 1
+
+
+def test_access_log_sampling(client: FlaskClient, caplog: pytest.LogCaptureFixture) -> None:
+    """
+    arrange: Start up a test flask server logging one in four requests.
+    act: HTTP Get to /health eight times.
+    assert: Two requests are logged.
+    """
+    app.config[ACCESS_LOG_SAMPLE_CONFIG_NAME] = 4
+    caplog.set_level(logging.INFO, logger="src.github_runner_manager.http_server.access")
+
+    for _ in range(8):
+        client.get("/health")
+
+    access_logs = [
+        record for record in caplog.records if record.name.endswith("http_server.access")
+    ]
+    assert len(access_logs) == 2
+    assert "GET /health 204" in access_logs[0].getMessage()
+
+
+def test_unhandled_error_logged(
+    client: FlaskClient, mock_runner_manager: MagicMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """
+    arrange: Start up a test flask server with the access log disabled, and mock the runner \
+        manager to raise an unexpected error.
+    act: HTTP Get to /runner/check.
+    assert: The request is logged and observed as a server error.
+    """
+    app.config[ACCESS_LOG_SAMPLE_CONFIG_NAME] = 0
+    caplog.set_level(logging.INFO, logger="src.github_runner_manager.http_server.access")
+    mock_runner_manager.get_runners_snapshot.side_effect = RuntimeError("mock error")
+    labels = {"endpoint": "/runner/check", "method": "GET", "status": "500"}
+    before = REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) or 0
+
+    with pytest.raises(RuntimeError):
+        client.get("/runner/check")
+
+    access_logs = [
+        record for record in caplog.records if record.name.endswith("http_server.access")
+    ]
+    assert len(access_logs) == 1
+    assert "GET /runner/check 500" in access_logs[0].getMessage()
+    assert REGISTRY.get_sample_value("http_request_duration_seconds_count", labels) == before + 1
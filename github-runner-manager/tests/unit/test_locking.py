@@ -0,0 +1,183 @@
+#  Copyright 2026 Canonical Ltd.
+#  See LICENSE file for licensing details.
+
+"""Test for the locks guarding the set of runners."""
+
+import logging
+import threading
+
+import pytest
+from prometheus_client import REGISTRY
+
+from github_runner_manager.locking import InstrumentedLock, PriorityLock
+
+
+def test_priority_lock_mutual_exclusion():
+    """
+    arrange: A priority lock held by the test.
+    act: Try to acquire it without blocking and with a timeout, then release it.
+    assert: The lock is not acquired while held and is acquired once released.
+    """
+    lock = PriorityLock()
+    lock.acquire()
+
+    assert lock.locked()
+    assert not lock.acquire(blocking=False)
+    assert not lock.acquire(timeout=0.05)
+    lock.release()
+    assert lock.acquire(blocking=False)
+    lock.release()
+    with pytest.raises(RuntimeError):
+        lock.release()
+
+
+def test_priority_lock_priority_goes_first():
+    """
+    arrange: A priority lock held by the test, with a normal and a priority acquirer waiting.
+    act: Release the lock.
+    assert: The priority acquirer gets the lock before the normal one.
+    """
+    lock = PriorityLock()
+    order: list[str] = []
+    lock.acquire()
+
+    def acquire(name: str, priority: bool) -> None:
+        """Acquire the lock and record the order."""
+        lock.acquire(priority=priority)
+        order.append(name)
+        lock.release()
+
+    normal = threading.Thread(target=acquire, args=("normal", False))
+    normal.start()
+    priority = threading.Thread(target=acquire, args=("priority", True))
+    priority.start()
+    while not lock._priority_waiters:
+        threading.Event().wait(0.01)
+    lock.release()
+    normal.join(timeout=10)
+    priority.join(timeout=10)
+
+    assert order == ["priority", "normal"]
+
+
+def test_priority_lock_normal_waits_for_priority_waiter():
+    """
+    arrange: A priority lock held by the test, with a priority acquirer waiting.
+    act: Try to acquire the lock without priority and without blocking after release.
+    assert: The normal acquirer cannot go before the priority waiter.
+    """
+    lock = PriorityLock()
+    lock.acquire()
+    acquired = threading.Event()
+    done = threading.Event()
+
+    def acquire_priority() -> None:
+        """Hold the lock with priority until done."""
+        with lock.priority():
+            acquired.set()
+            done.wait(timeout=10)
+
+    thread = threading.Thread(target=acquire_priority)
+    thread.start()
+    while not lock._priority_waiters:
+        threading.Event().wait(0.01)
+
+    assert not lock.acquire(blocking=False)
+    lock.release()
+    assert acquired.wait(timeout=10)
+    assert not lock.acquire(blocking=False)
+    done.set()
+    thread.join(timeout=10)
+    assert lock.acquire(blocking=False)
+
+
+def test_instrumented_lock_tracks_holder():
+    """
+    arrange: An instrumented lock.
+    act: Hold the lock on behalf of a call site.
+    assert: The holder and acquisition time are tracked while held and reset once released.
+    """
+    lock = InstrumentedLock("test-holder", "test")
+    hold_count = REGISTRY.get_sample_value(
+        "reconcile_lock_hold_seconds_count",
+        {"flavor": "test", "lock": "test-holder", "site": "flush"},
+    )
+
+    with lock.hold("flush", priority=True):
+        assert lock.locked()
+        assert lock.holder == "flush"
+        assert (
+            REGISTRY.get_sample_value(
+                "reconcile_lock_holder", {"flavor": "test", "lock": "test-holder", "site": "flush"}
+            )
+            == 1
+        )
+        assert REGISTRY.get_sample_value(
+            "reconcile_lock_acquired_timestamp_seconds", {"flavor": "test", "lock": "test-holder"}
+        )
+
+    assert not lock.locked()
+    assert lock.holder is None
+    assert (
+        REGISTRY.get_sample_value(
+            "reconcile_lock_holder", {"flavor": "test", "lock": "test-holder", "site": "flush"}
+        )
+        == 0
+    )
+    assert (
+        REGISTRY.get_sample_value(
+            "reconcile_lock_acquired_timestamp_seconds", {"flavor": "test", "lock": "test-holder"}
+        )
+        == 0
+    )
+    assert hold_count is None
+    assert (
+        REGISTRY.get_sample_value(
+            "reconcile_lock_hold_seconds_count",
+            {"flavor": "test", "lock": "test-holder", "site": "flush"},
+        )
+        == 1
+    )
+
+
+def test_instrumented_lock_warns_on_slow_hold(caplog: pytest.LogCaptureFixture):
+    """
+    arrange: An instrumented lock with a hold warning threshold of 50ms.
+    act: Hold the lock until the warning is logged, then raise an error while holding it.
+    assert: The warning is logged while the lock is held, with the stack of the holder, and \
+        the lock is released.
+    """
+    lock = InstrumentedLock("test-slow", "test", hold_warning_threshold=0.05)
+    caplog.set_level(logging.WARNING, logger="github_runner_manager.locking")
+
+    with pytest.raises(ValueError):
+        with lock.hold("reconcile_loop"):
+            for _ in range(100):
+                if caplog.records:
+                    break
+                threading.Event().wait(0.05)
+            assert lock.locked()
+            raise ValueError("mock error")
+
+    assert not lock.locked()
+    held_record = caplog.records[0]
+    assert "held by reconcile_loop" in held_record.getMessage()
+    assert "test_instrumented_lock_warns_on_slow_hold" in held_record.getMessage()
+    assert "released by reconcile_loop" in caplog.records[-1].getMessage()
+
+
+def test_instrumented_lock_hold_starts_no_thread():
+    """
+    arrange: Instrumented locks with their hold monitor running.
+    act: Hold the locks many times.
+    assert: No thread is started by the holds.
+    """
+    locks = [InstrumentedLock(f"test-threads-{index}", "test") for index in range(2)]
+    threads = threading.active_count()
+
+    for _ in range(100):
+        for lock in locks:
+            with lock.hold("create_loop"):
+                pass
+
+    assert threading.active_count() == threads
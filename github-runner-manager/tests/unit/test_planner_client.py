@@ -25,6 +25,7 @@ class _FakeResponse:
         status_code: int = 200,
         lines: list[str] | None = None,
         iter_lines_exception: Exception | None = None,
+        body: str = "",
     ) -> None:
         """Minimal Response-like object used to stub `requests.Response`.
 
@@ -32,12 +33,22 @@ class _FakeResponse:
             status_code: HTTP status code to emulate.
             lines: Lines yielded by `iter_lines()` for streaming tests.
             iter_lines_exception: Exception raised while iterating stream lines.
+            body: Body of non-streaming responses.
         """
         self.status_code = status_code
         self._lines = lines or []
         self._iter_lines_exception = iter_lines_exception
+        self._body = body
         self._closed = False
 
+    def json(self):
+        """Parse the body as JSON.
+
+        Returns:
+            The parsed body.
+        """
+        return json.loads(self._body)
+
     def raise_for_status(self) -> None:
         """Raise an HTTPError if status is 4xx/5xx.
 
@@ -265,3 +276,67 @@ def test_stream_pressure_raises_expected_error_on_midstream_request_failures(
     assert next(stream).pressure == 2
     with pytest.raises(expected_error, match=message):
         next(stream)
+
+
+def test_stream_pressure_idle_timeout(monkeypatch):
+    """
+    arrange: A client with a stream idle timeout.
+    act: Open the pressure stream.
+    assert: The idle timeout is the read timeout of the stream request.
+    """
+    cfg = PlannerConfiguration(base_url="http://localhost:8080", token="t", stream_idle_timeout=30)
+    client = PlannerClient(cfg)
+    fake_session = _FakeSession()
+    monkeypatch.setattr(client, "_session", fake_session)
+
+    list(client.stream_pressure("small"))
+
+    last_get = fake_session.last_get
+    assert last_get is not None
+    assert last_get.timeout == (cfg.timeout, 30)
+    assert last_get.stream
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        pytest.param(_FakeResponse(body=json.dumps({"small": 7})), 7, id="success"),
+        pytest.param(_FakeResponse(body="not json"), PlannerApiError, id="malformed"),
+        pytest.param(_FakeResponse(body=json.dumps({"large": 7})), PlannerApiError, id="missing"),
+        pytest.param(_FakeResponse(status_code=500), PlannerApiError, id="http_error"),
+    ],
+)
+def test_get_pressure(monkeypatch, response, expected):
+    """
+    arrange: Fake session returning a pressure response.
+    act: Call get_pressure('small').
+    assert: The pressure is returned, or a planner error is raised.
+    """
+    client = PlannerClient(PlannerConfiguration(base_url="http://localhost:8080", token="t"))
+    monkeypatch.setattr(client, "_session", _FakeSession())
+    monkeypatch.setattr(client._session, "get", lambda url, headers, timeout: response)
+
+    if isinstance(expected, int):
+        assert client.get_pressure("small").pressure == expected
+    else:
+        with pytest.raises(expected):
+            client.get_pressure("small")
+
+
+def test_get_pressure_connection_error(monkeypatch):
+    """
+    arrange: Fake session failing to connect.
+    act: Call get_pressure('small').
+    assert: A PlannerConnectionError is raised.
+    """
+    client = PlannerClient(PlannerConfiguration(base_url="http://localhost:8080", token="t"))
+
+    def _fail(url, headers, timeout):
+        """Fail to connect."""
+        raise requests.ConnectionError("connection refused")
+
+    monkeypatch.setattr(client, "_session", _FakeSession())
+    monkeypatch.setattr(client._session, "get", _fail)
+
+    with pytest.raises(PlannerConnectionError, match="connection refused"):
+        client.get_pressure("small")
@@ -25,6 +25,7 @@ import ops
 from charms.grafana_agent.v0.cos_agent import COSAgentProvider
 from charms.operator_libs_linux.v1 import systemd
 from github_runner_manager import constants
+from github_runner_manager.configuration.base import FAST_BOOT_IMAGE_LABEL
 from github_runner_manager.metrics.events import get_metrics_log_path
 from github_runner_manager.platform.platform_provider import TokenError
 from github_runner_manager.utilities import set_env_var
@@ -594,7 +595,8 @@ class GithubRunnerCharm(CharmBase):
         image_labels = []
         image = state.runner_config.openstack_image
         if image and image.id and image.tags:
-            image_labels = image.tags
+            # The fast boot tag selects the boot profile of the image, it is not a runner label.
+            image_labels = [tag for tag in image.tags if tag != FAST_BOOT_IMAGE_LABEL]
 
         return list(state.charm_config.labels) + image_labels
 
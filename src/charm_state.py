@@ -16,7 +16,7 @@ from typing import Final, Literal, cast
 from urllib.parse import urlsplit
 
 import yaml
-from github_runner_manager.configuration import ProxyConfig, SSHDebugConnection
+from github_runner_manager.configuration import BootProfile, ProxyConfig, SSHDebugConnection
 from github_runner_manager.configuration.base import OtelCollectorConfig
 from github_runner_manager.configuration.github import (
     GitHubAppAuth,
@@ -41,6 +41,7 @@ CHARM_STATE_PATH = Path("charm_state.json")
 
 ALLOW_EXTERNAL_CONTRIBUTOR_CONFIG_NAME = "allow-external-contributor"
 BASE_VIRTUAL_MACHINES_CONFIG_NAME = "base-virtual-machines"
+BOOT_PROFILE_CONFIG_NAME = "boot-profile"
 DOCKERHUB_MIRROR_CONFIG_NAME = "dockerhub-mirror"
 FLAVOR_LABEL_COMBINATIONS_CONFIG_NAME = "flavor-label-combinations"
 GROUP_CONFIG_NAME = "group"
@@ -330,6 +331,7 @@ class CharmConfig(BaseModel):
         aproxy_redirect_ports: a list of ports to redirect to the aproxy proxy.
         custom_pre_job_script: Custom pre-job script to run before the job.
         runner_manager_log_level: The log level of the runner manager application.
+        boot_profile: The boot profile of the runner VMs, or None to select it from the image tags.
     """
 
     allow_external_contributor: bool
@@ -348,6 +350,7 @@ class CharmConfig(BaseModel):
     aproxy_redirect_ports: list[str] = []
     custom_pre_job_script: str | None
     runner_manager_log_level: LogLevel
+    boot_profile: BootProfile | None = None
 
     @property
     def auth(self) -> GitHubAuth:
@@ -632,6 +635,14 @@ class CharmConfig(BaseModel):
         runner_manager_log_level = cast(
             LogLevel, charm.config.get(RUNNER_MANAGER_LOG_LEVEL_CONFIG_NAME, "INFO")
         )
+
+        boot_profile = cast(str, charm.config.get(BOOT_PROFILE_CONFIG_NAME, "")) or None
+        try:
+            parsed_boot_profile = BootProfile(boot_profile) if boot_profile else None
+        except ValueError as exc:
+            raise CharmConfigInvalidError(
+                f"Invalid {BOOT_PROFILE_CONFIG_NAME} config: {boot_profile}"
+            ) from exc
         return cls(
             allow_external_contributor=cast(
                 bool, charm.config.get(ALLOW_EXTERNAL_CONTRIBUTOR_CONFIG_NAME, False)
@@ -656,6 +667,7 @@ class CharmConfig(BaseModel):
             ),
             custom_pre_job_script=custom_pre_job_script,
             runner_manager_log_level=runner_manager_log_level,
+            boot_profile=parsed_boot_profile,
         )
 
 
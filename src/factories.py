@@ -89,6 +89,7 @@ def _get_runner_configuration(state: CharmState) -> RunnerConfiguration:
         image = Image(
             name=openstack_image.id,
             labels=image_labels,
+            boot_profile=state.charm_config.boot_profile,
         )
         flavor = Flavor(
             name=state.runner_config.flavor_label_combinations[0].flavor,
@@ -7,7 +7,7 @@ import enum
 import functools
 import json
 import logging
-from time import sleep
+from time import monotonic, sleep
 from typing import Any, Callable
 from urllib.parse import urljoin
 
@@ -26,9 +26,11 @@ CONNECTION_ERROR_MESSAGE = "Failed request due to connection failure"
 NOT_READY_ERROR_MESSAGE = "GitHub runner manager service not ready"
 # For request that modifies the runner, GitHub runner manager service might need to wait for
 # reconcile to finish before processing the request, hence the long timeout for write-level
-# requests.
+# requests. Write-level requests are run as operations in the background and polled until
+# finished or the timeout.
 WRITE_TIMEOUT = 60 * 20
 READ_TIMEOUT = 60 * 5
+OPERATION_POLL_INTERVAL = 5
 
 
 def catch_requests_errors(func: Callable) -> Callable:
@@ -138,14 +140,55 @@ class GitHubRunnerManagerClient:
 
     @catch_requests_errors
     def flush_runner(self, busy: bool = False) -> None:
-        """Request to flush the runners.
+        """Request to flush the runners and wait for the flush to finish.
+
+        A manager service older than the flush operations flushes before answering 204 No
+        Content, so the request waits as long as a flush may take.
 
         Args:
             busy: Whether to flush the busy runners.
         """
         self.wait_till_ready()
         params = {"flush-busy": str(busy)}
-        self._request(_HTTPMethod.POST, "/runner/flush", params=params, timeout=WRITE_TIMEOUT)
+        response = self._request(
+            _HTTPMethod.POST, "/runner/flush", params=params, timeout=WRITE_TIMEOUT
+        )
+        if response.status_code == 204:
+            return
+        operation = json.loads(response.text)
+        self._wait_for_operation(operation["id"], timeout=WRITE_TIMEOUT)
+
+    def _wait_for_operation(self, operation_id: str, timeout: float) -> dict[str, Any]:
+        """Poll an operation of the manager service until it finishes.
+
+        Args:
+            operation_id: The ID of the operation.
+            timeout: Maximum seconds to wait for the operation.
+
+        Raises:
+            RunnerManagerServiceResponseError: The operation failed or did not finish in time.
+
+        Returns:
+            The finished operation.
+        """
+        deadline = monotonic() + timeout
+        while True:
+            response = self._request(
+                _HTTPMethod.GET, f"/operations/{operation_id}", timeout=READ_TIMEOUT
+            )
+            operation = json.loads(response.text)
+            if operation["status"] == "succeeded":
+                return operation
+            if operation["status"] == "failed":
+                raise RunnerManagerServiceResponseError(
+                    f"Operation {operation_id} failed: {operation['error']}"
+                )
+            if monotonic() >= deadline:
+                raise RunnerManagerServiceResponseError(
+                    f"Operation {operation_id} not finished after {timeout} seconds, status:"
+                    f" {operation['status']}"
+                )
+            sleep(OPERATION_POLL_INTERVAL)
 
     def health_check(self) -> None:
         """Request a health check on the runner manager service.
@@ -392,7 +392,7 @@ def _setup_service_file(unit_name: str, config_file: Path, log_file: Path, log_l
         Group={constants.RUNNER_MANAGER_GROUP}
         ExecStart=github-runner-manager --config-file {str(config_file)} --host \
 {GITHUB_RUNNER_MANAGER_ADDRESS} --port {http_port} \
---log-level {log_level}
+--http-server waitress --log-level {log_level}
         Restart=on-failure
         RestartSec=30
         RestartSteps=5
@@ -809,7 +809,8 @@ def test_planner_relation_changed_writes_flavor(monkeypatch: pytest.MonkeyPatch)
     """
     arrange: Set up charm with mocked _setup_state and _setup_service.
     act: Fire planner relation_changed event.
-    assert: The app data bag contains all flavor fields for the planner.
+    assert: The app data bag contains all flavor fields for the planner, without the fast-boot \
+        image tag in the labels.
     """
     harness = Harness(GithubRunnerCharm)
     harness.set_leader(True)
@@ -821,7 +822,7 @@ def test_planner_relation_changed_writes_flavor(monkeypatch: pytest.MonkeyPatch)
     state_mock.charm_config.labels = ("label1", "label2")
     state_mock.runner_config.base_virtual_machines = 3
     state_mock.runner_config.openstack_image.id = "image-id"
-    state_mock.runner_config.openstack_image.tags = ["x64", "noble"]
+    state_mock.runner_config.openstack_image.tags = ["x64", "noble", "fast-boot"]
     harness.charm._setup_state = MagicMock(return_value=state_mock)
     harness.charm._setup_service = MagicMock()
     harness.charm._check_image_ready = MagicMock()
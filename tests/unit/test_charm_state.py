@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 
 import pytest
 import yaml
+from github_runner_manager.configuration import BootProfile
 from github_runner_manager.configuration.github import GitHubOrg, GitHubRepo
 from ops.model import SecretNotFoundError
 from pydantic import BaseModel
@@ -18,6 +19,7 @@ from charm_state import (
     APROXY_EXCLUDE_ADDRESSES_CONFIG_NAME,
     APROXY_REDIRECT_PORTS_CONFIG_NAME,
     BASE_VIRTUAL_MACHINES_CONFIG_NAME,
+    BOOT_PROFILE_CONFIG_NAME,
     CUSTOM_PRE_JOB_SCRIPT_CONFIG_NAME,
     DEBUG_SSH_INTEGRATION_NAME,
     DOCKERHUB_MIRROR_CONFIG_NAME,
@@ -587,6 +589,20 @@ def test_charm_config_from_charm_invalid_labels():
     assert "Invalid labels config" in str(exc_info.value)
 
 
+def test_charm_config_from_charm_invalid_boot_profile():
+    """
+    arrange: Create a mock CharmBase instance with an unknown boot profile.
+    act: Call from_charm method with the mock CharmBase instance.
+    assert: Verify that the method raises CharmConfigInvalidError with the correct message.
+    """
+    mock_charm = MockGithubRunnerCharmFactory()
+    mock_charm.config[BOOT_PROFILE_CONFIG_NAME] = "instant"
+
+    with pytest.raises(CharmConfigInvalidError) as exc_info:
+        CharmConfig.from_charm(mock_charm)
+    assert "Invalid boot-profile config" in str(exc_info.value)
+
+
 def test_charm_config_from_charm_valid():
     """
     arrange: Create a mock CharmBase instance with valid configuration.
@@ -633,6 +649,7 @@ cat > ~/.ssh/config <<EOF
       EOF
 """),
         RUNNER_MANAGER_LOG_LEVEL_CONFIG_NAME: "INFO",
+        BOOT_PROFILE_CONFIG_NAME: "fast",
     }
 
     result = CharmConfig.from_charm(mock_charm)
@@ -646,6 +663,7 @@ cat > ~/.ssh/config <<EOF
     assert "openssl s_client" in result.manager_proxy_command
     assert result.custom_pre_job_script == custom_pre_job_script
     assert not result.allow_external_contributor
+    assert result.boot_profile == BootProfile.FAST
 
 
 def test_openstack_image_from_charm_no_connections():
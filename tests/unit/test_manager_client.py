@@ -3,6 +3,7 @@
 
 """Unit test for client to interact with github-runner-manager service."""
 
+import json
 from unittest.mock import MagicMock
 
 import pytest
@@ -105,3 +106,98 @@ def test_check_runner_connection_error(
         client.check_runner()
 
     assert CONNECTION_ERROR_MESSAGE in str(err.value)
+
+
+def _operation_response(status: str, error: str | None = None) -> MagicMock:
+    """Create a mock response of an operation.
+
+    Args:
+        status: The status of the operation.
+        error: The error of the operation.
+
+    Returns:
+        The mock response.
+    """
+    response = MagicMock()
+    response.status_code = 202 if status == "pending" else 200
+    response.text = json.dumps({"id": "mock-id", "status": status, "error": error})
+    return response
+
+
+def test_flush_runner_polls_operation(
+    client: GitHubRunnerManagerClient, mock__request: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    arrange: Setup the service to accept the flush and finish it on the second poll.
+    act: Request to flush the runners.
+    assert: The operation is polled until it succeeds.
+    """
+    monkeypatch.setattr("manager_client.sleep", MagicMock())
+    mock__request.side_effect = [
+        _operation_response("pending"),
+        _operation_response("running"),
+        _operation_response("succeeded"),
+    ]
+
+    client.flush_runner(busy=True)
+
+    assert mock__request.call_count == 3
+    assert mock__request.call_args_list[0].args == ("POST", "/runner/flush")
+    assert mock__request.call_args_list[0].kwargs["params"] == {"flush-busy": "True"}
+    assert mock__request.call_args_list[2].args == ("GET", "/operations/mock-id")
+
+
+def test_flush_runner_older_service_no_content(
+    client: GitHubRunnerManagerClient, mock__request: MagicMock
+) -> None:
+    """
+    arrange: Setup an older service answering the flush with no content once it is done.
+    act: Request to flush the runners.
+    assert: The flush is finished without polling an operation.
+    """
+    response = MagicMock()
+    response.status_code = 204
+    response.text = ""
+    mock__request.return_value = response
+
+    client.flush_runner()
+
+    mock__request.assert_called_once()
+    assert mock__request.call_args.args == ("POST", "/runner/flush")
+
+
+def test_flush_runner_operation_failed(
+    client: GitHubRunnerManagerClient, mock__request: MagicMock
+) -> None:
+    """
+    arrange: Setup the service to accept the flush and fail it.
+    act: Request to flush the runners.
+    assert: The error of the operation is raised.
+    """
+    mock__request.side_effect = [
+        _operation_response("pending"),
+        _operation_response("failed", error="mock error"),
+    ]
+
+    with pytest.raises(RunnerManagerServiceResponseError) as err:
+        client.flush_runner()
+
+    assert "mock error" in str(err.value)
+
+
+def test_flush_runner_operation_timeout(
+    client: GitHubRunnerManagerClient, mock__request: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    arrange: Setup the service to accept the flush and never finish it.
+    act: Request to flush the runners with the time passing the timeout.
+    assert: The timeout error is raised.
+    """
+    monkeypatch.setattr("manager_client.sleep", MagicMock())
+    monkeypatch.setattr("manager_client.monotonic", MagicMock(side_effect=[0, 10, 60 * 60]))
+    mock__request.return_value = _operation_response("running")
+
+    with pytest.raises(RunnerManagerServiceResponseError) as err:
+        client.flush_runner()
+
+    assert "not finished" in str(err.value)
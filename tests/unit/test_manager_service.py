@@ -112,6 +112,7 @@ def test_setup_started(
         f"ExecStart=github-runner-manager --config-file {config_path} --host 127.0.0.1 --port 55555"
         in service_content
     )
+    assert "--http-server waitress" in service_content
     assert "Restart=on-failure" in service_content
 
     config_content = (patched_paths.home_path / unit_name / "config.yaml").read_text()